@@ -3,6 +3,7 @@ Scenario Optimizer Endpoints (Engine 3)
 """
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Dict, Optional
 from decimal import Decimal
 import uuid
@@ -702,7 +703,9 @@ async def optimize_capital_stack(request: schemas.OptimizeCapitalStackRequest):
 
     This endpoint:
     1. Takes template capital structure as starting point
-    2. Uses scipy.optimize to find optimal allocations
+    2. Uses scipy.optimize to find optimal allocations (or an RBF surrogate
+       fitted to a few dozen evaluations when use_surrogate is set, or exact
+       gradients of a smooth score when use_analytic_gradient is set)
     3. Respects hard constraints
     4. Minimizes soft constraint penalties
     5. Maximizes weighted objective function
@@ -719,89 +722,8 @@ async def optimize_capital_stack(request: schemas.OptimizeCapitalStackRequest):
     try:
         from engines.scenario_optimizer.capital_stack_optimizer import CapitalStackOptimizer
         from engines.scenario_optimizer.constraint_manager import ConstraintManager
-        from models.financial_instruments import (
-            SeniorDebt, GapFinancing, MezzanineDebt, Equity, TaxIncentive, PreSale, Grant
-        )
-        from models.capital_stack import CapitalStack, CapitalComponent
-
-        # Build template CapitalStack
-        components = []
-        position = 1
-
-        if request.template_structure.senior_debt > 0:
-            inst = SeniorDebt(
-                amount=request.template_structure.senior_debt,
-                interest_rate=Decimal("7.0"),
-                term_months=60
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
-
-        if request.template_structure.gap_financing > 0:
-            inst = GapFinancing(
-                amount=request.template_structure.gap_financing,
-                interest_rate=Decimal("9.0"),
-                term_months=48,
-                minimum_presales_percentage=Decimal("30.0")
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
-
-        if request.template_structure.mezzanine_debt > 0:
-            inst = MezzanineDebt(
-                amount=request.template_structure.mezzanine_debt,
-                interest_rate=Decimal("11.0"),
-                term_months=60,
-                equity_kicker_percentage=Decimal("5.0")
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
-
-        if request.template_structure.equity > 0:
-            inst = Equity(
-                amount=request.template_structure.equity,
-                ownership_percentage=Decimal("40.0"),
-                premium_percentage=Decimal("120.0")
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
-
-        if request.template_structure.tax_incentives > 0:
-            inst = TaxIncentive(
-                amount=request.template_structure.tax_incentives,
-                jurisdiction="California",
-                qualified_spend=request.template_structure.tax_incentives * Decimal("4"),
-                credit_rate=Decimal("25.0"),
-                timing_months=18
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
-
-        if request.template_structure.presales > 0:
-            inst = PreSale(
-                amount=request.template_structure.presales,
-                territory="North America",
-                rights_description="All media",
-                mg_amount=request.template_structure.presales,
-                payment_on_delivery=Decimal("80.0")
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
-
-        if request.template_structure.grants > 0:
-            inst = Grant(
-                amount=request.template_structure.grants,
-                grantor_name="Film Fund",
-                grant_type="Cultural"
-            )
-            components.append(CapitalComponent(instrument=inst, position=position))
-            position += 1
 
-        template_stack = CapitalStack(
-            stack_name="template_stack",
-            project_budget=request.project_budget,
-            components=components
-        )
+        template_stack = _build_template_stack(request.project_budget, request.template_structure)
 
         # Initialize optimizer with constraint manager
         constraint_manager = ConstraintManager()
@@ -815,20 +737,19 @@ async def optimize_capital_stack(request: schemas.OptimizeCapitalStackRequest):
             "risk": request.objective_weights.risk_minimization / Decimal("100"),
         }
 
-        # Convert bounds if provided
-        bounds_dict = None
-        if request.bounds:
-            bounds_dict = {
-                "equity": (request.bounds.equity_min_pct, request.bounds.equity_max_pct),
-                "senior_debt": (request.bounds.senior_debt_min_pct, request.bounds.senior_debt_max_pct),
-                "mezzanine_debt": (request.bounds.mezzanine_debt_min_pct, request.bounds.mezzanine_debt_max_pct),
-                "gap_financing": (request.bounds.gap_financing_min_pct, request.bounds.gap_financing_max_pct),
-                "pre_sale": (request.bounds.pre_sale_min_pct, request.bounds.pre_sale_max_pct),
-                "tax_incentive": (request.bounds.tax_incentive_min_pct, request.bounds.tax_incentive_max_pct),
-            }
+        bounds_dict = _build_bounds_dict(request.bounds)
 
         # Run optimization
-        if request.use_convergence:
+        if request.use_surrogate:
+            result = optimizer.optimize_surrogate(
+                template_stack=template_stack,
+                project_budget=request.project_budget,
+                objective_weights=objective_weights,
+                bounds=bounds_dict,
+                scenario_name="optimized_scenario",
+                waterfall_structure=None  # Simple mode without waterfall
+            )
+        elif request.use_convergence:
             result = optimizer.optimize_with_convergence(
                 template_stack=template_stack,
                 project_budget=request.project_budget,
@@ -836,7 +757,8 @@ async def optimize_capital_stack(request: schemas.OptimizeCapitalStackRequest):
                 bounds=bounds_dict,
                 scenario_name="optimized_scenario",
                 waterfall_structure=None,  # Simple mode without waterfall
-                num_starts=3
+                num_starts=3,
+                analytic_gradient=request.use_analytic_gradient
             )
         else:
             result = optimizer.optimize(
@@ -845,7 +767,8 @@ async def optimize_capital_stack(request: schemas.OptimizeCapitalStackRequest):
                 objective_weights=objective_weights,
                 bounds=bounds_dict,
                 scenario_name="optimized_scenario",
-                waterfall_structure=None  # Simple mode without waterfall
+                waterfall_structure=None,  # Simple mode without waterfall
+                analytic_gradient=request.use_analytic_gradient
             )
 
         # Extract optimized structure
@@ -878,6 +801,84 @@ async def optimize_capital_stack(request: schemas.OptimizeCapitalStackRequest):
         )
 
 
+@router.post(
+    "/optimize-pareto",
+    response_model=schemas.OptimizeParetoResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Optimize Pareto Front",
+    description="Find the Pareto front of capital stacks trading equity IRR, cost of capital, dilution and risk",
+)
+async def optimize_pareto(request: schemas.OptimizeParetoRequest):
+    """
+    Find non-dominated capital stack allocations.
+
+    This endpoint:
+    1. Takes template capital structure as starting point
+    2. Evolves a population of allocations with NSGA-II
+    3. Ranks allocations violating hard constraints behind feasible ones
+    4. Returns every non-dominated allocation found, with its objectives
+
+    Args:
+        request: Template structure, bounds and search settings
+
+    Returns:
+        Pareto front of capital structures
+
+    Raises:
+        HTTPException: 400 if the bounds admit no allocation or none satisfies
+            the constraints, 500 if optimization fails otherwise
+    """
+    try:
+        from engines.scenario_optimizer.capital_stack_optimizer import CapitalStackOptimizer
+        from engines.scenario_optimizer.constraint_manager import ConstraintManager
+
+        template_stack = _build_template_stack(request.project_budget, request.template_structure)
+        optimizer = CapitalStackOptimizer(constraint_manager=ConstraintManager())
+
+        # CPU-bound search: keep it off the event loop
+        result = await run_in_threadpool(
+            optimizer.optimize_pareto,
+            template_stack=template_stack,
+            project_budget=request.project_budget,
+            bounds=_build_bounds_dict(request.bounds),
+            scenario_name="pareto_scenario",
+            waterfall_structure=None,  # Simple mode without waterfall
+            population_size=request.population_size,
+            generations=request.generations,
+            seed=request.seed
+        )
+
+        solutions = [
+            schemas.ParetoSolutionOutput(
+                scenario_name=solution.evaluation.scenario_name,
+                structure=_extract_capital_structure(solution.capital_stack),
+                allocations=solution.allocations,
+                objectives=solution.objectives,
+                overall_score=solution.evaluation.overall_score
+            )
+            for solution in result.solutions
+        ]
+
+        return schemas.OptimizeParetoResponse(
+            solutions=solutions,
+            objective_names=result.objective_names,
+            solve_time_seconds=result.solve_time_seconds,
+            generations=result.metadata["generations"],
+            num_evaluations=result.metadata["num_evaluations"]
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Pareto optimization failed: {str(e)}",
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Pareto optimization failed: {str(e)}",
+        )
+
+
 @router.post(
     "/analyze-tradeoffs",
     response_model=schemas.AnalyzeTradeoffsResponse,
@@ -1037,6 +1038,106 @@ def _create_sample_waterfall(project_id: str, waterfall_id: str) -> WaterfallStr
     )
 
 
+def _build_template_stack(project_budget: Decimal, template_structure: CapitalStructure) -> CapitalStack:
+    """Build the optimizer template CapitalStack from a CapitalStructure."""
+    from models.financial_instruments import (
+        SeniorDebt, GapFinancing, MezzanineDebt, Equity, TaxIncentive, PreSale, Grant
+    )
+    from models.capital_stack import CapitalComponent
+
+    components = []
+    position = 1
+
+    if template_structure.senior_debt > 0:
+        inst = SeniorDebt(
+            amount=template_structure.senior_debt,
+            interest_rate=Decimal("7.0"),
+            term_months=60
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    if template_structure.gap_financing > 0:
+        inst = GapFinancing(
+            amount=template_structure.gap_financing,
+            interest_rate=Decimal("9.0"),
+            term_months=48,
+            minimum_presales_percentage=Decimal("30.0")
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    if template_structure.mezzanine_debt > 0:
+        inst = MezzanineDebt(
+            amount=template_structure.mezzanine_debt,
+            interest_rate=Decimal("11.0"),
+            term_months=60,
+            equity_kicker_percentage=Decimal("5.0")
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    if template_structure.equity > 0:
+        inst = Equity(
+            amount=template_structure.equity,
+            ownership_percentage=Decimal("40.0"),
+            premium_percentage=Decimal("120.0")
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    if template_structure.tax_incentives > 0:
+        inst = TaxIncentive(
+            amount=template_structure.tax_incentives,
+            jurisdiction="California",
+            qualified_spend=template_structure.tax_incentives * Decimal("4"),
+            credit_rate=Decimal("25.0"),
+            timing_months=18
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    if template_structure.presales > 0:
+        inst = PreSale(
+            amount=template_structure.presales,
+            territory="North America",
+            rights_description="All media",
+            mg_amount=template_structure.presales,
+            payment_on_delivery=Decimal("80.0")
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    if template_structure.grants > 0:
+        inst = Grant(
+            amount=template_structure.grants,
+            grantor_name="Film Fund",
+            grant_type="Cultural"
+        )
+        components.append(CapitalComponent(instrument=inst, position=position))
+        position += 1
+
+    return CapitalStack(
+        stack_name="template_stack",
+        project_budget=project_budget,
+        components=components
+    )
+
+
+def _build_bounds_dict(bounds: Optional[schemas.OptimizationBounds]) -> Optional[Dict[str, tuple]]:
+    """Convert OptimizationBounds to optimizer (min%, max%) bounds by instrument type."""
+    if bounds is None:
+        return None
+    return {
+        "equity": (bounds.equity_min_pct, bounds.equity_max_pct),
+        "senior_debt": (bounds.senior_debt_min_pct, bounds.senior_debt_max_pct),
+        "mezzanine_debt": (bounds.mezzanine_debt_min_pct, bounds.mezzanine_debt_max_pct),
+        "gap_financing": (bounds.gap_financing_min_pct, bounds.gap_financing_max_pct),
+        "pre_sale": (bounds.pre_sale_min_pct, bounds.pre_sale_max_pct),
+        "tax_incentive": (bounds.tax_incentive_min_pct, bounds.tax_incentive_max_pct),
+    }
+
+
 def _extract_capital_structure(capital_stack: CapitalStack) -> CapitalStructure:
     """Extract CapitalStructure from CapitalStack."""
     from models.financial_instruments import (
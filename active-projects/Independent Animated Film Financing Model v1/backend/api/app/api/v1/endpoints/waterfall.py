@@ -19,6 +19,8 @@ from app.schemas.waterfall import (
     SensitivityResultData,
     TornadoChartDataSchema,
     SensitivityVariableInput,
+    StrategyComparisonRequest,
+    StrategyComparisonResponse,
 )
 
 # Import Engine 2 (path setup done in api.py)
@@ -30,6 +32,10 @@ from engines.waterfall_executor.sensitivity_analyzer import (
     SensitivityAnalyzer,
     SensitivityVariable,
 )
+from engines.waterfall_executor.strategy_comparison import (
+    StrategyComparator,
+    STAKEHOLDER_METRICS,
+)
 from models.capital_stack import CapitalStack
 from models.waterfall import WaterfallStructure
 from models.financial_instruments import *
@@ -163,115 +169,98 @@ async def execute_waterfall(request: WaterfallExecutionRequest):
 
 def _create_sample_capital_stack(project_id: str) -> CapitalStack:
     """Create a sample capital stack for testing."""
+    from models.capital_stack import CapitalComponent
     from models.financial_instruments import (
         SeniorDebt,
         GapFinancing,
         MezzanineDebt,
         Equity,
-        InstrumentType,
-        RecoupmentPriority,
     )
 
-    components = [
+    instruments = [
         SeniorDebt(
             amount=Decimal("12000000"),
             interest_rate=Decimal("8.0"),
             term_months=36,
-            recoupment_priority=RecoupmentPriority.SENIOR_DEBT,
         ),
         GapFinancing(
             amount=Decimal("4500000"),
             interest_rate=Decimal("12.0"),
             term_months=24,
-            recoupment_priority=RecoupmentPriority.SENIOR_DEBT,
         ),
         MezzanineDebt(
             amount=Decimal("3000000"),
             interest_rate=Decimal("15.0"),
             term_months=24,
-            recoupment_priority=RecoupmentPriority.MEZZANINE,
         ),
         Equity(
             amount=Decimal("7500000"),
-            preferred_return=Decimal("12.0"),
-            recoupment_priority=RecoupmentPriority.EQUITY,
+            ownership_percentage=Decimal("100"),
+            premium_percentage=Decimal("12.0"),
         ),
     ]
 
     return CapitalStack(
-        project_id=project_id, components=components, project_budget=Decimal("30000000")
+        project_id=project_id,
+        stack_name="Sample Stack",
+        components=[
+            CapitalComponent(instrument=instrument, position=position)
+            for position, instrument in enumerate(instruments, start=1)
+        ],
+        project_budget=Decimal("30000000"),
     )
 
 
 def _create_sample_waterfall(project_id: str, waterfall_id: str) -> WaterfallStructure:
     """Create a sample waterfall structure for testing."""
-    from models.waterfall import WaterfallNode, WaterfallStructure, PayeeType
+    from models.waterfall import WaterfallNode, WaterfallStructure, PayeeType, RecoupmentPriority
 
+    # Payee names match StakeholderAnalyzer's instrument → payee mapping
     nodes = [
         # Senior Debt
         WaterfallNode(
             node_id="senior_debt",
+            priority=RecoupmentPriority.SENIOR_DEBT,
             description="Senior Debt Recoupment",
-            payee_type=PayeeType.FINANCIER,
-            payee_name="Senior Debt",
-            recoupment_basis="senior_debt",
-            fixed_amount=None,
-            percentage_of_receipts=Decimal("100"),
-            capped_at=None,
-            waterfall_id=waterfall_id,
-            project_id=project_id,
+            payee_type=PayeeType.LENDER,
+            payee_name="Senior Lender",
+            fixed_amount=Decimal("12000000"),
         ),
         # Gap Financing
         WaterfallNode(
             node_id="gap_financing",
+            priority=RecoupmentPriority.SENIOR_DEBT,
             description="Gap Financing Recoupment",
-            payee_type=PayeeType.FINANCIER,
-            payee_name="Gap Financing",
-            recoupment_basis="gap_debt",
-            fixed_amount=None,
-            percentage_of_receipts=Decimal("100"),
-            capped_at=None,
-            waterfall_id=waterfall_id,
-            project_id=project_id,
+            payee_type=PayeeType.LENDER,
+            payee_name="Gap Lender",
+            fixed_amount=Decimal("4500000"),
         ),
         # Mezzanine
         WaterfallNode(
             node_id="mezzanine_debt",
+            priority=RecoupmentPriority.MEZZANINE_DEBT,
             description="Mezzanine Debt Recoupment",
-            payee_type=PayeeType.FINANCIER,
-            payee_name="Mezzanine Debt",
-            recoupment_basis="mezzanine_debt",
-            fixed_amount=None,
-            percentage_of_receipts=Decimal("100"),
-            capped_at=None,
-            waterfall_id=waterfall_id,
-            project_id=project_id,
+            payee_type=PayeeType.LENDER,
+            payee_name="Mezzanine Lender",
+            fixed_amount=Decimal("3000000"),
         ),
         # Equity
         WaterfallNode(
             node_id="equity",
+            priority=RecoupmentPriority.EQUITY_RECOUPMENT,
             description="Equity Recoupment",
-            payee_type=PayeeType.FINANCIER,
-            payee_name="Equity Investor",
-            recoupment_basis="equity",
-            fixed_amount=None,
-            percentage_of_receipts=Decimal("100"),
-            capped_at=None,
-            waterfall_id=waterfall_id,
-            project_id=project_id,
+            payee_type=PayeeType.INVESTOR,
+            payee_name="Equity Investors",
+            fixed_amount=Decimal("7500000"),
         ),
         # Backend/Profit participation
         WaterfallNode(
             node_id="backend",
+            priority=RecoupmentPriority.BACKEND_PARTICIPATION,
             description="Backend Participation",
-            payee_type=PayeeType.TALENT,
+            payee_type=PayeeType.PRODUCER,
             payee_name="Producer",
-            recoupment_basis=None,
-            fixed_amount=None,
             percentage_of_receipts=Decimal("50"),
-            capped_at=None,
-            waterfall_id=waterfall_id,
-            project_id=project_id,
         ),
     ]
 
@@ -479,3 +468,74 @@ async def sensitivity_analysis(request: SensitivityAnalysisRequest):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Sensitivity analysis failed: {str(e)}",
         )
+
+
+@router.post(
+    "/compare-strategies",
+    response_model=StrategyComparisonResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare Release Strategies",
+    description="Run every release strategy at every revenue level and return a matrix of stakeholder metrics",
+)
+async def compare_strategies(request: StrategyComparisonRequest):
+    """
+    Compare release strategies across revenue levels.
+
+    This endpoint:
+    1. Compiles the waterfall once for the whole comparison
+    2. Projects revenue for every strategy × revenue level
+    3. Executes the waterfall and stakeholder analysis for each cell,
+       optionally across worker processes
+    4. Returns each stakeholder metric as a strategy × revenue level matrix
+
+    Args:
+        request: Strategy comparison parameters
+
+    Returns:
+        Matrices of stakeholder metrics and total distributions
+
+    Raises:
+        HTTPException: 400 for unknown strategies or invalid revenue levels,
+            500 if the comparison fails
+    """
+    try:
+        capital_stack = _create_sample_capital_stack(request.project_id)
+        waterfall_structure = _create_sample_waterfall(
+            request.project_id, request.waterfall_id
+        )
+
+        comparator = StrategyComparator(waterfall_structure, capital_stack)
+        comparison = comparator.compare(
+            revenue_levels=request.revenue_levels,
+            strategies=request.release_strategies,
+            distribution_fee_rate=request.distribution_fee_rate,
+            workers=request.workers,
+        )
+
+        return StrategyComparisonResponse(
+            project_id=request.project_id,
+            release_strategies=comparison.strategies,
+            revenue_levels=comparison.revenue_levels,
+            stakeholder_ids=comparison.stakeholder_ids,
+            total_distributed=[
+                [cell.total_distributed for cell in row] for row in comparison.cells
+            ],
+            stakeholder_metrics={
+                stakeholder_id: {
+                    metric: comparison.matrix(stakeholder_id, metric)
+                    for metric in STAKEHOLDER_METRICS
+                }
+                for stakeholder_id in comparison.stakeholder_ids
+            },
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Strategy comparison failed: {str(e)}",
+        )
@@ -38,6 +38,11 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Optimizer evaluation cache (shared across requests; Redis shares it across workers)
+    EVALUATION_CACHE_SIZE: int = 4096
+    EVALUATION_CACHE_TTL_SECONDS: int = 3600
+    EVALUATION_CACHE_USE_REDIS: bool = False
+
     # CORS - stored as string, parsed in model_validator
     _BACKEND_CORS_ORIGINS: str = "http://localhost:3000"
     BACKEND_CORS_ORIGINS: List[str] = []
@@ -38,6 +38,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Database initialization skipped: {e}")
 
+    # Shared optimizer evaluation cache (Redis-backed if enabled and reachable)
+    try:
+        import app.core.path_setup  # noqa: F401
+        from engines.scenario_optimizer.evaluation_cache import configure_evaluation_cache
+        cache = configure_evaluation_cache(
+            maxsize=settings.EVALUATION_CACHE_SIZE,
+            ttl_seconds=settings.EVALUATION_CACHE_TTL_SECONDS,
+            redis_url=settings.REDIS_URL if settings.EVALUATION_CACHE_USE_REDIS else None
+        )
+        print(f"✅ Evaluation cache initialized ({cache.backend})")
+    except Exception as e:
+        print(f"⚠️ Evaluation cache initialization skipped: {e}")
+
     # TODO: Initialize Redis connection
     # TODO: Warm up policy cache (load all policies into Redis)
 
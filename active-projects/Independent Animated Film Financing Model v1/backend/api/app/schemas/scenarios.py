@@ -344,6 +344,16 @@ class OptimizeCapitalStackRequest(BaseModel):
         default=False,
         description="Use multi-start optimization for better convergence"
     )
+    use_surrogate: bool = Field(
+        default=False,
+        description="Optimize on an RBF response surface fitted to a few dozen evaluations "
+                    "(takes precedence over use_convergence)"
+    )
+    use_analytic_gradient: bool = Field(
+        default=False,
+        description="Run SLSQP on a smooth form of the score with exact gradients "
+                    "instead of finite differences (ignored with use_surrogate)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -385,6 +395,67 @@ class OptimizeCapitalStackResponse(BaseModel):
     )
 
 
+class OptimizeParetoRequest(BaseModel):
+    """Request to find the Pareto front of capital stacks."""
+    project_budget: Decimal = Field(..., gt=0, description="Total project budget")
+    template_structure: CapitalStructure = Field(
+        ...,
+        description="Template capital structure (provides starting point and instrument types)"
+    )
+    bounds: Optional[OptimizationBounds] = Field(
+        default=None,
+        description="Bounds for each financing instrument (optional)"
+    )
+    population_size: int = Field(
+        default=200,
+        ge=4,
+        le=500,
+        multiple_of=2,
+        description="Allocations evolved per generation"
+    )
+    generations: int = Field(default=60, ge=1, le=200, description="Generations to evolve")
+    seed: Optional[int] = Field(default=None, description="Random seed for reproducible fronts")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "project_budget": 30000000,
+                "template_structure": {
+                    "senior_debt": 9000000,
+                    "gap_financing": 3000000,
+                    "mezzanine_debt": 2000000,
+                    "equity": 10000000,
+                    "tax_incentives": 6000000,
+                    "presales": 0,
+                    "grants": 0
+                },
+                "population_size": 200,
+                "generations": 60
+            }
+        }
+    )
+
+
+class ParetoSolutionOutput(BaseModel):
+    """Non-dominated capital structure."""
+    scenario_name: str
+    structure: CapitalStructure
+    allocations: Dict[str, Decimal] = Field(description="Percentage allocations by instrument type")
+    objectives: Dict[str, Decimal] = Field(
+        description="equity_irr, cost_of_capital, dilution (equity % of budget) and risk (debt % of budget)"
+    )
+    overall_score: Decimal = Field(description="Weighted score with default objective weights")
+
+
+class OptimizeParetoResponse(BaseModel):
+    """Response from Pareto front optimization."""
+    solutions: List[ParetoSolutionOutput] = Field(description="Non-dominated structures, highest equity IRR first")
+    objective_names: List[str]
+    solve_time_seconds: float = Field(description="Time taken to solve")
+    generations: int = Field(description="Generations evolved")
+    num_evaluations: int = Field(description="Allocations evaluated")
+
+
 class ScenarioForTradeoff(BaseModel):
     """Scenario input for tradeoff analysis."""
     scenario_id: str
@@ -265,3 +265,82 @@ class SensitivityAnalysisResponse(BaseModel):
             }
         }
     )
+
+
+# ===== Strategy Comparison Schemas =====
+
+
+class StrategyComparisonRequest(BaseModel):
+    """Request for a release strategy × revenue level comparison."""
+    project_id: str = Field(..., description="Unique project identifier")
+    waterfall_id: str = Field(..., description="Waterfall structure ID")
+    revenue_levels: List[Decimal] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Total ultimate revenue levels to compare"
+    )
+    release_strategies: List[str] = Field(
+        default=["wide_theatrical", "platform", "streaming_first", "day_and_date"],
+        min_length=1,
+        description="Release strategies to compare"
+    )
+    distribution_fee_rate: Optional[Decimal] = Field(
+        default=None,
+        ge=0,
+        le=100,
+        description="Override the waterfall's default distribution fee %"
+    )
+    workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=16,
+        description="Worker processes (None or 1 runs in-process)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "project_id": "proj_123",
+                "waterfall_id": "waterfall_789",
+                "revenue_levels": [25000000, 50000000, 75000000, 100000000],
+                "release_strategies": ["wide_theatrical", "platform", "streaming_first", "day_and_date"],
+                "distribution_fee_rate": None,
+                "workers": None
+            }
+        }
+    )
+
+
+class StrategyComparisonResponse(BaseModel):
+    """Stakeholder metrics for every release strategy at every revenue level."""
+    project_id: str
+    release_strategies: List[str] = Field(..., description="Matrix rows")
+    revenue_levels: List[Decimal] = Field(..., description="Matrix columns")
+    stakeholder_ids: List[str]
+    total_distributed: List[List[Decimal]] = Field(
+        ...,
+        description="Paid to all waterfall payees, one row per strategy"
+    )
+    stakeholder_metrics: Dict[str, Dict[str, List[List[Optional[Decimal]]]]] = Field(
+        ...,
+        description="Stakeholder → metric → one row per strategy of one value per revenue level"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "project_id": "proj_123",
+                "release_strategies": ["wide_theatrical", "streaming_first"],
+                "revenue_levels": [50000000, 75000000],
+                "stakeholder_ids": ["equity_Equity Investors"],
+                "total_distributed": [[35000000, 52500000], [35000000, 52500000]],
+                "stakeholder_metrics": {
+                    "equity_Equity Investors": {
+                        "irr": [[0.18, 0.31], [0.22, 0.36]],
+                        "cash_on_cash": [[1.4, 2.1], [1.4, 2.1]]
+                    }
+                }
+            }
+        }
+    )
@@ -0,0 +1,74 @@
+"""
+Waterfall Engine Benchmarks
+
+Timing suite for the Engine 2 entry points (execute_over_time, stakeholder
+analysis, Monte Carlo, sensitivity analysis, revenue projection) across
+synthetic waterfalls of 5/50/500 nodes and 20/80/240 quarters, with JSON
+baselines and a regression comparison. DealGenerator builds seeded slates of
+realistic projects (capital stacks, waterfalls, deal blocks, incentive
+policies) at any scale for the slate benchmark and load tests.
+
+Usage (from backend/):
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --output current.json --compare baseline.json
+    python -m benchmarks compare baseline.json current.json --threshold 0.10
+    python -m benchmarks generate --projects 5000 --seed 7 --output slate.jsonl
+"""
+
+from .fixtures import (
+    NODE_COUNTS,
+    QUARTER_COUNTS,
+    synthetic_capital_stack,
+    synthetic_projection,
+    synthetic_waterfall,
+)
+from .generator import (
+    DealGenerator,
+    SyntheticProject,
+    write_policies,
+    write_slate,
+)
+from .suite import (
+    BenchmarkCase,
+    TARGETS,
+    build_suite,
+)
+from .runner import (
+    BenchmarkStats,
+    BenchmarkComparison,
+    time_case,
+    run_suite,
+    save_report,
+    load_report,
+    compare_reports,
+    format_comparison,
+    regressions,
+)
+
+__all__ = [
+    # Synthetic fixtures
+    "NODE_COUNTS",
+    "QUARTER_COUNTS",
+    "synthetic_capital_stack",
+    "synthetic_projection",
+    "synthetic_waterfall",
+    # Deal generator
+    "DealGenerator",
+    "SyntheticProject",
+    "write_policies",
+    "write_slate",
+    # Suite
+    "BenchmarkCase",
+    "TARGETS",
+    "build_suite",
+    # Runner and baselines
+    "BenchmarkStats",
+    "BenchmarkComparison",
+    "time_case",
+    "run_suite",
+    "save_report",
+    "load_report",
+    "compare_reports",
+    "format_comparison",
+    "regressions",
+]
@@ -0,0 +1,151 @@
+"""
+Benchmark command line.
+
+    python -m benchmarks run [--output FILE] [--filter TEXT] [--quick]
+                             [--repeat N] [--max-case-time S]
+                             [--compare BASELINE] [--threshold T]
+    python -m benchmarks compare BASELINE CURRENT [--threshold T] [--metric M]
+    python -m benchmarks generate --projects N [--seed S] [--output FILE]
+                                  [--instruments N] [--nodes N]
+                                  [--policies N --policies-dir DIR]
+
+run and compare exit with status 1 when a comparison finds a regression;
+generate writes a slate as JSON lines for load test drivers.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .runner import (
+    COMPARISON_METRICS,
+    DEFAULT_MAX_CASE_TIME,
+    DEFAULT_MIN_ROUND_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    compare_reports,
+    format_comparison,
+    load_report,
+    regressions,
+    run_suite,
+    save_report
+)
+from .generator import DealGenerator, write_policies, write_slate
+from .suite import build_suite
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Argument parser for the run, compare and generate commands"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Waterfall engine benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Time the suite and optionally save a JSON baseline")
+    run.add_argument("--output", "-o", help="Write the report to this JSON file")
+    run.add_argument("--filter", "-k", dest="name_filter", help="Only cases whose name contains this text")
+    run.add_argument("--quick", action="store_true", help="Smaller sizes and fewer Monte Carlo scenarios")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed rounds per case")
+    run.add_argument("--min-round-time", type=float, default=DEFAULT_MIN_ROUND_TIME,
+                     help="Minimum seconds per timed round")
+    run.add_argument("--max-case-time", type=float, default=DEFAULT_MAX_CASE_TIME,
+                     help="Time budget per case in seconds")
+    run.add_argument("--compare", dest="baseline", help="Compare the run against this baseline")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                     help="Relative slowdown flagged as a regression")
+    run.add_argument("--metric", choices=COMPARISON_METRICS, default="median")
+
+    compare = commands.add_parser("compare", help="Compare two saved reports")
+    compare.add_argument("baseline", help="Baseline report")
+    compare.add_argument("current", help="Current report")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="Relative slowdown flagged as a regression")
+    compare.add_argument("--metric", choices=COMPARISON_METRICS, default="median")
+
+    generate = commands.add_parser("generate", help="Write a synthetic project slate for load tests")
+    generate.add_argument("--projects", "-n", type=int, required=True, help="Projects in the slate")
+    generate.add_argument("--seed", type=int, default=0, help="Generator seed")
+    generate.add_argument("--output", "-o", default="slate.jsonl", help="JSON lines output file")
+    generate.add_argument("--instruments", type=int, help="Instruments per stack (drawn if not given)")
+    generate.add_argument("--nodes", type=int, help="Waterfall nodes per project (drawn if not given; at least the stack's recoupment tiers)")
+    generate.add_argument("--policies", type=int, default=0, help="Incentive policies for projects to claim")
+    generate.add_argument("--policies-dir", help="Write the policies here as PolicyLoader JSON files")
+
+    return parser
+
+
+def _generate(args: argparse.Namespace) -> int:
+    """Write a generated slate (and its policies)"""
+    generator = DealGenerator(seed=args.seed)
+
+    policy_ids = []
+    if args.policies:
+        policies = generator.incentive_policies(args.policies)
+        policy_ids = [policy.policy_id for policy in policies]
+        if args.policies_dir:
+            write_policies(policies, args.policies_dir)
+            print(f"Saved {len(policies)} policies to {args.policies_dir}")
+
+    count = write_slate(
+        generator.slate(
+            args.projects,
+            num_instruments=args.instruments,
+            num_nodes=args.nodes,
+            policy_ids=policy_ids
+        ),
+        args.output
+    )
+    print(f"Saved {count} projects to {args.output}")
+    return 0
+
+
+def _report_comparison(baseline, current, threshold: float, metric: str) -> int:
+    """Print a comparison; exit status 1 if anything regressed"""
+    comparisons = compare_reports(baseline, current, threshold, metric)
+    print(format_comparison(comparisons))
+    return 1 if regressions(comparisons) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark command line.
+
+    Args:
+        argv: Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit status
+    """
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "generate":
+        return _generate(args)
+    if args.command == "compare":
+        return _report_comparison(
+            load_report(args.baseline), load_report(args.current), args.threshold, args.metric
+        )
+
+    cases = build_suite(quick=args.quick, name_filter=args.name_filter)
+    if not cases:
+        print("No benchmark cases match", file=sys.stderr)
+        return 2
+
+    report = run_suite(
+        cases,
+        repeat=args.repeat,
+        min_round_time=args.min_round_time,
+        max_case_time=args.max_case_time,
+        progress=lambda stats: print(
+            f"{stats.name:<50} {stats.median * 1000:10.3f} ms  (min {stats.min * 1000:.3f}, x{stats.number})"
+        )
+    )
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"Saved {len(report['results'])} results to {args.output}")
+
+    if args.baseline:
+        return _report_comparison(load_report(args.baseline), report, args.threshold, args.metric)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
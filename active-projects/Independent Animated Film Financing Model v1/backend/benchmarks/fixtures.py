@@ -0,0 +1,189 @@
+"""
+Synthetic Benchmark Fixtures
+
+Deterministic waterfalls, capital stacks and revenue projections sized by
+node and quarter count. Every structure is built from the same templates so
+timings stay comparable between runs and machines.
+"""
+
+from decimal import Decimal
+from typing import List
+
+from engines.waterfall_executor.revenue_projector import DistributionWindow, RevenueProjection
+from engines.common.timing_kernels import get_kernel
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, MezzanineDebt, SeniorDebt
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+
+# Waterfall sizes (nodes) and projection lengths (quarters) benchmarked
+NODE_COUNTS = (5, 50, 500)
+QUARTER_COUNTS = (20, 80, 240)
+
+# Base case economics: revenue comfortably above the budget so recoupment
+# completes part-way through the projection
+PROJECT_BUDGET = Decimal("20000000")
+TOTAL_ULTIMATE_REVENUE = Decimal("60000000")
+DISTRIBUTION_FEE_RATE = Decimal("30.0")
+
+# Budget shares of the fixed-amount tiers
+SENIOR_DEBT_SHARE = Decimal("0.30")
+MEZZANINE_SHARE = Decimal("0.15")
+EQUITY_SHARE = Decimal("0.55")
+
+# Producer deferments (capped % of receipts) and talent backend (% of receipts)
+DEFERMENT_PERCENTAGE = Decimal("5")
+DEFERMENT_CAP_SHARE = Decimal("0.05")
+BACKEND_PERCENTAGE = Decimal("2")
+
+# Final net profits split
+NET_PROFITS_PERCENTAGE = Decimal("50")
+
+# (priority, payee, kind) cycled to fill the body of the waterfall; payees use
+# the names StakeholderAnalyzer maps instruments to
+NODE_TEMPLATES = (
+    (RecoupmentPriority.SENIOR_DEBT, "Senior Lender", "fixed"),
+    (RecoupmentPriority.MEZZANINE_DEBT, "Mezzanine Lender", "fixed"),
+    (RecoupmentPriority.EQUITY_RECOUPMENT, "Equity Investors", "fixed"),
+    (RecoupmentPriority.DEFERRED_PRODUCER_FEE, "Producer", "capped"),
+    (RecoupmentPriority.BACKEND_PARTICIPATION, "Talent", "percentage"),
+)
+
+# Budget share per fixed-amount payee
+FIXED_SHARES = {
+    "Senior Lender": SENIOR_DEBT_SHARE,
+    "Mezzanine Lender": MEZZANINE_SHARE,
+    "Equity Investors": EQUITY_SHARE,
+}
+
+
+def synthetic_waterfall(num_nodes: int) -> WaterfallStructure:
+    """
+    Waterfall with num_nodes tiers.
+
+    The body cycles NODE_TEMPLATES (fixed debt / equity recoupment, capped
+    deferments, backend percentages) and the last node is a net profits
+    split. Each fixed payee's budget share is divided evenly across its
+    nodes, so total recoupment is the same at every size.
+
+    The executor keys its ledger by priority and payee, so repeats of a
+    template are numbered ("Senior Lender", "Senior Lender 2", ...) to give
+    every node its own ledger.
+
+    Args:
+        num_nodes: Number of nodes (at least 2)
+
+    Returns:
+        WaterfallStructure
+
+    Raises:
+        ValueError: If num_nodes < 2
+    """
+    if num_nodes < 2:
+        raise ValueError(f"num_nodes must be at least 2, got {num_nodes}")
+
+    body = [NODE_TEMPLATES[i % len(NODE_TEMPLATES)] for i in range(num_nodes - 1)]
+    counts = {}
+    for _, payee, _ in body:
+        counts[payee] = counts.get(payee, 0) + 1
+
+    nodes = []
+    seen = {}
+    for priority, payee, kind in body:
+        seen[payee] = seen.get(payee, 0) + 1
+        name = payee if seen[payee] == 1 else f"{payee} {seen[payee]}"
+        if kind == "fixed":
+            amount = (PROJECT_BUDGET * FIXED_SHARES[payee] / counts[payee]).quantize(Decimal("0.01"))
+            nodes.append(WaterfallNode(priority=priority, payee=name, amount=amount))
+        elif kind == "capped":
+            cap = (PROJECT_BUDGET * DEFERMENT_CAP_SHARE / counts[payee]).quantize(Decimal("0.01"))
+            nodes.append(WaterfallNode(
+                priority=priority, payee=name, percentage=DEFERMENT_PERCENTAGE, capped_at=cap
+            ))
+        else:
+            nodes.append(WaterfallNode(priority=priority, payee=name, percentage=BACKEND_PERCENTAGE))
+
+    nodes.append(WaterfallNode(
+        priority=RecoupmentPriority.NET_PROFITS,
+        payee="Equity Investors",
+        percentage=NET_PROFITS_PERCENTAGE
+    ))
+
+    return WaterfallStructure(
+        waterfall_name=f"Benchmark Waterfall ({num_nodes} nodes)",
+        default_distribution_fee_rate=DISTRIBUTION_FEE_RATE,
+        nodes=nodes
+    )
+
+
+def synthetic_capital_stack() -> CapitalStack:
+    """Senior debt, mezzanine and equity matching the waterfall's fixed tiers"""
+    return CapitalStack(
+        stack_name="Benchmark Stack",
+        project_budget=PROJECT_BUDGET,
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=PROJECT_BUDGET * SENIOR_DEBT_SHARE, interest_rate=Decimal("8")),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=MezzanineDebt(amount=PROJECT_BUDGET * MEZZANINE_SHARE, interest_rate=Decimal("14")),
+                position=2
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=PROJECT_BUDGET * EQUITY_SHARE, ownership_percentage=Decimal("100")),
+                position=3
+            ),
+        ]
+    )
+
+
+def synthetic_projection(
+    num_quarters: int,
+    total_revenue: Decimal = TOTAL_ULTIMATE_REVENUE
+) -> RevenueProjection:
+    """
+    Front-loaded projection over num_quarters.
+
+    Args:
+        num_quarters: Projection length
+        total_revenue: Revenue spread across the quarters
+
+    Returns:
+        RevenueProjection whose quarters sum to exactly total_revenue
+    """
+    amounts = get_kernel("front_loaded", num_quarters).allocate(total_revenue)
+    quarterly = dict(enumerate(amounts))
+
+    cumulative = {}
+    running = Decimal("0")
+    for quarter, amount in quarterly.items():
+        running += amount
+        cumulative[quarter] = running
+
+    return RevenueProjection(
+        project_name=f"Benchmark Film ({num_quarters} quarters)",
+        projection_start_date="2025-Q1",
+        total_quarters=num_quarters,
+        quarterly_revenue=quarterly,
+        cumulative_revenue=cumulative,
+        by_window={"synthetic": total_revenue},
+        by_market={"Global": total_revenue},
+        metadata={"total_ultimate_revenue": str(total_revenue), "release_strategy": "synthetic"}
+    )
+
+
+def synthetic_windows(num_quarters: int) -> List[DistributionWindow]:
+    """
+    Release windows whose long tail ends at num_quarters.
+
+    Args:
+        num_quarters: Projection length (at least 7)
+
+    Returns:
+        Theatrical, SVOD and AVOD windows
+    """
+    return [
+        DistributionWindow("theatrical", 0, 2, Decimal("40"), "front_loaded"),
+        DistributionWindow("svod", 2, 4, Decimal("25"), "even"),
+        DistributionWindow("avod", 6, num_quarters - 6, Decimal("35"), "back_loaded"),
+    ]
@@ -0,0 +1,735 @@
+"""
+Synthetic Deal Generator
+
+Seeded generator of realistic financing structures for load and scale
+testing: capital stacks with dozens of instruments, waterfalls with hundreds
+of nodes, deal blocks, incentive policies and whole project slates.
+
+Every project draws from its own random stream (seed, project index), so
+project i is identical whether a slate has ten projects or ten thousand, and
+slates are generated lazily.
+
+Usage:
+    generator = DealGenerator(seed=7)
+    project = generator.project(0, num_instruments=40, num_nodes=400)
+    for project in generator.slate(5000):
+        ...
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from engines.waterfall_executor.revenue_projector import RevenueProjection, RevenueProjector
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.deal_block import (
+    DealBlock,
+    DealStatus,
+    create_equity_investment_template,
+    create_gap_financing_template,
+    create_presale_template,
+    create_streamer_license_template,
+)
+from models.financial_instruments import (
+    Equity,
+    FinancialInstrument,
+    GapDebt,
+    Grant,
+    MezzanineDebt,
+    PreSale,
+    SeniorDebt,
+    TaxCreditLoan,
+)
+from models.incentive_policy import (
+    CulturalTest,
+    IncentivePolicy,
+    IncentiveType,
+    MonetizationMethod,
+    QPECategory,
+    QPEDefinition,
+)
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+
+logger = logging.getLogger(__name__)
+
+# Budget range (log-uniform) and ultimate revenue as a multiple of budget
+BUDGET_RANGE = (Decimal("5000000"), Decimal("150000000"))
+REVENUE_MULTIPLE_MEDIAN = 2.0
+REVENUE_MULTIPLE_SIGMA = 0.6
+
+# Default structure sizes per project (inclusive ranges)
+INSTRUMENTS_RANGE = (3, 12)
+EXTRA_NODES_RANGE = (2, 20)
+DEALS_RANGE = (2, 8)
+
+# Instrument mix: type → relative weight
+INSTRUMENT_WEIGHTS = {
+    "equity": 0.30,
+    "senior_debt": 0.20,
+    "gap_debt": 0.10,
+    "mezzanine_debt": 0.10,
+    "tax_credit_loan": 0.10,
+    "pre_sale": 0.15,
+    "grant": 0.05,
+}
+
+# Annual interest rate ranges (%) by debt type
+INTEREST_RANGES = {
+    "senior_debt": (6.0, 10.0),
+    "gap_debt": (10.0, 15.0),
+    "mezzanine_debt": (12.0, 18.0),
+    "tax_credit_loan": (7.0, 11.0),
+}
+
+# Waterfall payee per instrument type (as StakeholderAnalyzer maps them);
+# pre-sales and grants are not recouped from the waterfall
+INSTRUMENT_PAYEES = {
+    "equity": "Equity Investors",
+    "senior_debt": "Senior Lender",
+    "gap_debt": "Gap Lender",
+    "mezzanine_debt": "Mezzanine Lender",
+    "tax_credit_loan": "Tax Credit Lender",
+}
+
+# Stack position order (debt before equity before soft money)
+POSITION_ORDER = ("senior_debt", "tax_credit_loan", "gap_debt", "mezzanine_debt", "pre_sale", "equity", "grant")
+
+# Filler tiers used to grow a waterfall to its node count: (priority, payee, kind)
+FILLER_TIERS = (
+    (RecoupmentPriority.SALES_AGENT_EXPENSES, "Sales Agent", "fixed"),
+    (RecoupmentPriority.DEFERRED_PRODUCER_FEE, "Producer", "fixed"),
+    (RecoupmentPriority.DEFERRED_TALENT, "Talent", "fixed"),
+    (RecoupmentPriority.BACKEND_PARTICIPATION, "Talent", "capped"),
+    (RecoupmentPriority.BACKEND_PARTICIPATION, "Producer", "percentage"),
+)
+
+# Filler totals, split across however many filler tiers there are: fixed
+# amounts and caps as a share of budget, percentages as % of the pool
+FILLER_FIXED_SHARE = (0.05, 0.15)
+FILLER_PERCENTAGE = (2.0, 15.0)
+
+# Net profits split between equity and producer
+NET_PROFITS_EQUITY_PERCENTAGE = Decimal("50")
+
+# Counterparties, territories and jurisdictions names are drawn from
+COUNTERPARTIES = (
+    "Northlight Capital", "Harbor Film Fund", "Silver Reel Partners", "Aurora Media Finance",
+    "Blue Lantern Pictures", "Meridian Bank", "Crescent Entertainment", "Tidewater Studios",
+    "Pinecone Animation Fund", "Summit Distribution", "Lumen Streaming", "Orbit Media",
+)
+TERRITORIES = (
+    "North America", "UK/Ireland", "France", "Germany", "Japan", "China", "Latin America",
+    "Australia/NZ", "Scandinavia", "Benelux", "Italy", "Spain", "South Korea",
+)
+JURISDICTIONS = (
+    ("UK", "United Kingdom"), ("CA", "Canada"), ("IE", "Ireland"), ("FR", "France"),
+    ("AU", "Australia"), ("NZ", "New Zealand"), ("BE", "Belgium"), ("DE", "Germany"),
+    ("US-GA", "Georgia"), ("US-NM", "New Mexico"), ("HU", "Hungary"), ("CZ", "Czech Republic"),
+)
+RELEASE_STRATEGIES = ("wide_theatrical", "platform", "streaming_first", "day_and_date")
+
+# Incentive policy rate range (%) and transfer discount range (%)
+POLICY_RATE_RANGE = (10.0, 40.0)
+TRANSFER_DISCOUNT_RANGE = (5.0, 20.0)
+
+# Money is generated in whole dollars, percentages to the basis point
+DOLLAR = Decimal("1")
+BASIS_POINT = Decimal("0.01")
+
+# Creation date stamped on generated deals (keeps output reproducible)
+GENERATED_DATE = date(2025, 1, 1)
+
+# Random stream tags: (seed, tag, ...) keys each independent stream
+DEFAULT_STREAM = 0
+PROJECT_STREAM = 1
+POLICY_STREAM = 2
+
+
+@dataclass
+class SyntheticProject:
+    """
+    One generated project.
+
+    Attributes:
+        project_id: Identifier (unique within a seed)
+        budget: Project budget
+        total_revenue: Total ultimate revenue
+        release_strategy: RevenueProjector release strategy
+        capital_stack: Generated capital stack
+        waterfall: Waterfall recouping the stack's instruments
+        deal_blocks: Deals behind the stack (plus licenses)
+        policy_ids: Incentive policies the project claims
+    """
+    project_id: str
+    budget: Decimal
+    total_revenue: Decimal
+    release_strategy: str
+    capital_stack: CapitalStack
+    waterfall: WaterfallStructure
+    deal_blocks: List[DealBlock] = field(default_factory=list)
+    policy_ids: List[str] = field(default_factory=list)
+
+    def projection(self, projector: Optional[RevenueProjector] = None) -> RevenueProjection:
+        """
+        Revenue projection for the project's total revenue and release strategy.
+
+        Args:
+            projector: Projector to use (a new one if not given)
+
+        Returns:
+            RevenueProjection
+        """
+        projector = projector or RevenueProjector()
+        return projector.project(
+            self.total_revenue,
+            release_strategy=self.release_strategy,
+            project_name=self.project_id
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict (model_dump in JSON mode)"""
+        return {
+            "project_id": self.project_id,
+            "budget": str(self.budget),
+            "total_revenue": str(self.total_revenue),
+            "release_strategy": self.release_strategy,
+            "capital_stack": self.capital_stack.model_dump(mode="json"),
+            "waterfall": self.waterfall.model_dump(mode="json"),
+            "deal_blocks": [deal.model_dump(mode="json") for deal in self.deal_blocks],
+            "policy_ids": list(self.policy_ids),
+        }
+
+
+class DealGenerator:
+    """
+    Seeded generator of capital stacks, waterfalls, deal blocks and policies.
+
+    Structures are valid model instances (they pass the same Pydantic
+    validation as hand-built fixtures) with realistic proportions: debt
+    priced by type, equity ownership summing to 100%, recoupment tiers that
+    match the stack and filler tiers (deferments, backend) up to any size.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        budget_range: Tuple[Decimal, Decimal] = BUDGET_RANGE,
+        instruments_range: Tuple[int, int] = INSTRUMENTS_RANGE,
+        extra_nodes_range: Tuple[int, int] = EXTRA_NODES_RANGE,
+        deals_range: Tuple[int, int] = DEALS_RANGE
+    ):
+        """
+        Initialize generator.
+
+        Args:
+            seed: Base seed; equal seeds generate equal structures
+            budget_range: Project budget range (log-uniform)
+            instruments_range: Instruments per capital stack (inclusive)
+            extra_nodes_range: Filler nodes beyond the recoupment tiers (inclusive)
+            deals_range: Extra license deals per project (inclusive)
+        """
+        if budget_range[0] <= 0 or budget_range[0] > budget_range[1]:
+            raise ValueError(f"Invalid budget range: {budget_range}")
+
+        self.seed = seed
+        self.budget_range = budget_range
+        self.instruments_range = instruments_range
+        self.extra_nodes_range = extra_nodes_range
+        self.deals_range = deals_range
+
+        self._instrument_types = list(INSTRUMENT_WEIGHTS)
+        weights = np.array(list(INSTRUMENT_WEIGHTS.values()))
+        self._instrument_probabilities = weights / weights.sum()
+
+    def rng(self, *stream: int) -> np.random.Generator:
+        """Independent random stream for (seed, *stream)"""
+        return np.random.default_rng([self.seed, *stream])
+
+    # === Projects ===
+
+    def project(
+        self,
+        index: int,
+        num_instruments: Optional[int] = None,
+        num_nodes: Optional[int] = None,
+        num_deals: Optional[int] = None,
+        policy_ids: Sequence[str] = ()
+    ) -> SyntheticProject:
+        """
+        Generate project number index.
+
+        Args:
+            index: Project index (selects the random stream)
+            num_instruments: Instruments in the stack (drawn if not given)
+            num_nodes: Waterfall nodes (recoupment tiers plus drawn filler if not given)
+            num_deals: Extra license deals (drawn if not given)
+            policy_ids: Policies to draw the project's claims from
+
+        Returns:
+            SyntheticProject
+        """
+        rng = self.rng(PROJECT_STREAM, index)
+        project_id = f"SYN-{self.seed}-{index:06d}"
+
+        budget = self._budget(rng)
+        multiple = rng.lognormal(np.log(REVENUE_MULTIPLE_MEDIAN), REVENUE_MULTIPLE_SIGMA)
+        total_revenue = (budget * Decimal(str(round(multiple, 4)))).quantize(DOLLAR)
+
+        if num_instruments is None:
+            num_instruments = int(rng.integers(self.instruments_range[0], self.instruments_range[1] + 1))
+        capital_stack = self.capital_stack(budget, num_instruments, rng=rng, project_id=project_id)
+
+        if num_nodes is None:
+            extra = int(rng.integers(self.extra_nodes_range[0], self.extra_nodes_range[1] + 1))
+            num_nodes = self.min_nodes(capital_stack) + extra
+        waterfall = self.waterfall(capital_stack, num_nodes, rng=rng)
+
+        if num_deals is None:
+            num_deals = int(rng.integers(self.deals_range[0], self.deals_range[1] + 1))
+        deal_blocks = self.deal_blocks(capital_stack, num_deals, rng=rng)
+
+        claimed = []
+        if policy_ids:
+            count = int(rng.integers(1, min(3, len(policy_ids)) + 1))
+            claimed = [policy_ids[i] for i in sorted(rng.choice(len(policy_ids), count, replace=False))]
+
+        return SyntheticProject(
+            project_id=project_id,
+            budget=budget,
+            total_revenue=total_revenue,
+            release_strategy=str(rng.choice(RELEASE_STRATEGIES)),
+            capital_stack=capital_stack,
+            waterfall=waterfall,
+            deal_blocks=deal_blocks,
+            policy_ids=claimed
+        )
+
+    def slate(
+        self,
+        num_projects: int,
+        start: int = 0,
+        **project_kwargs
+    ) -> Iterator[SyntheticProject]:
+        """
+        Lazily generate projects start .. start + num_projects - 1.
+
+        Args:
+            num_projects: Number of projects
+            start: First project index
+            **project_kwargs: Passed to project() (sizes, policy_ids)
+
+        Yields:
+            SyntheticProject
+        """
+        for index in range(start, start + num_projects):
+            yield self.project(index, **project_kwargs)
+
+    # === Capital stacks ===
+
+    def capital_stack(
+        self,
+        budget: Decimal,
+        num_instruments: int,
+        rng: Optional[np.random.Generator] = None,
+        project_id: str = ""
+    ) -> CapitalStack:
+        """
+        Capital stack of num_instruments instruments funding the budget exactly.
+
+        Args:
+            budget: Project budget
+            num_instruments: Instruments (at least 1; the first is always equity)
+            rng: Random stream (the generator's default stream if not given)
+            project_id: Project reference
+
+        Returns:
+            CapitalStack whose instrument amounts sum to budget
+        """
+        if num_instruments < 1:
+            raise ValueError(f"num_instruments must be at least 1, got {num_instruments}")
+        rng = rng if rng is not None else self.rng(DEFAULT_STREAM)
+
+        types = ["equity"] + list(rng.choice(
+            self._instrument_types, size=num_instruments - 1, p=self._instrument_probabilities
+        ))
+        types.sort(key=POSITION_ORDER.index)
+        amounts = self._split(budget, rng.dirichlet(np.full(num_instruments, 2.0)))
+
+        equity_total = sum(a for t, a in zip(types, amounts) if t == "equity")
+        equity_seen = Decimal("0")
+        equity_count = types.count("equity")
+
+        components = []
+        for position, (instrument_type, amount) in enumerate(zip(types, amounts), start=1):
+            if instrument_type == "equity":
+                equity_count -= 1
+                if equity_count == 0:
+                    ownership = Decimal("100") - equity_seen
+                else:
+                    ownership = (amount / equity_total * 100).quantize(Decimal("0.01"))
+                    equity_seen += ownership
+                instrument = self._equity(rng, amount, ownership)
+            else:
+                instrument = self._instrument(rng, instrument_type, amount)
+            instrument.instrument_id = f"{project_id or 'STACK'}-I{position:03d}"
+            components.append(CapitalComponent(
+                component_id=f"{project_id or 'STACK'}-C{position:03d}",
+                instrument=instrument,
+                position=position
+            ))
+
+        return CapitalStack(
+            stack_id=f"{project_id or 'STACK'}-S",
+            project_id=project_id,
+            stack_name=f"Synthetic Stack ({num_instruments} instruments)",
+            project_budget=budget,
+            components=components
+        )
+
+    def _equity(self, rng: np.random.Generator, amount: Decimal, ownership: Decimal) -> Equity:
+        """Equity tranche with a drawn premium"""
+        return Equity(
+            amount=amount,
+            ownership_percentage=ownership,
+            premium_percentage=Decimal(int(rng.integers(0, 6)) * 5),
+            provider_name=str(rng.choice(COUNTERPARTIES))
+        )
+
+    def _instrument(self, rng: np.random.Generator, instrument_type: str, amount: Decimal) -> FinancialInstrument:
+        """Non-equity instrument of the given type"""
+        provider = str(rng.choice(COUNTERPARTIES))
+        if instrument_type in INTEREST_RANGES:
+            low, high = INTEREST_RANGES[instrument_type]
+            rate = Decimal(str(round(rng.uniform(low, high), 2)))
+            term = int(rng.choice((18, 24, 36, 48)))
+            if instrument_type == "senior_debt":
+                return SeniorDebt(amount=amount, interest_rate=rate, term_months=term, provider_name=provider)
+            if instrument_type == "gap_debt":
+                return GapDebt(
+                    amount=amount, interest_rate=rate, term_months=term, provider_name=provider,
+                    gap_percentage=Decimal(int(rng.integers(10, 51)))
+                )
+            if instrument_type == "mezzanine_debt":
+                return MezzanineDebt(amount=amount, interest_rate=rate, term_months=term, provider_name=provider)
+            advance_rate = Decimal(int(rng.integers(70, 91)))
+            return TaxCreditLoan(
+                amount=amount, interest_rate=rate, term_months=term, provider_name=provider,
+                tax_credit_jurisdiction=str(rng.choice(JURISDICTIONS)[1]),
+                certified_tax_credit_amount=(amount * 100 / advance_rate).quantize(DOLLAR),
+                advance_rate=advance_rate
+            )
+        if instrument_type == "pre_sale":
+            return PreSale(
+                amount=amount, provider_name=provider,
+                territory=str(rng.choice(TERRITORIES)),
+                rights_description=str(rng.choice(("All Rights", "Theatrical Only", "SVOD"))),
+                mg_amount=amount,
+                payment_on_delivery=(amount * Decimal("0.8")).quantize(DOLLAR)
+            )
+        return Grant(
+            amount=amount, provider_name=provider,
+            jurisdiction=str(rng.choice(JURISDICTIONS)[1]),
+            grant_program_name="Synthetic Animation Fund"
+        )
+
+    # === Waterfalls ===
+
+    @classmethod
+    def min_nodes(cls, capital_stack: CapitalStack) -> int:
+        """Recoupment tiers a stack needs, plus the net profits node"""
+        return len(cls._recoupment_tiers(capital_stack)) + 1
+
+    @staticmethod
+    def _recoupment_tiers(capital_stack: CapitalStack) -> Dict[Tuple[RecoupmentPriority, str], Decimal]:
+        """
+        Amount each (priority, payee) tier recoups, in stack order.
+
+        The executor keys its ledger by priority and payee, so instruments of
+        one type recoup pari passu through a single tier.
+        """
+        tiers = {}
+        for component in capital_stack.components:
+            instrument = component.instrument
+            payee = INSTRUMENT_PAYEES.get(instrument.instrument_type.value)
+            if payee is None:
+                continue
+            if isinstance(instrument, Equity):
+                key = (RecoupmentPriority.EQUITY_RECOUPMENT, payee)
+                tiers[key] = tiers.get(key, Decimal("0")) + instrument.amount
+                if instrument.premium_percentage > 0:
+                    premium = (instrument.amount * instrument.premium_percentage / 100).quantize(DOLLAR)
+                    key = (RecoupmentPriority.EQUITY_PREMIUM, payee)
+                    tiers[key] = tiers.get(key, Decimal("0")) + premium
+            else:
+                interest = instrument.amount * instrument.interest_rate / 100 * Decimal(instrument.term_months) / 12
+                key = (instrument.recoupment_priority, payee)
+                tiers[key] = tiers.get(key, Decimal("0")) + (instrument.amount + interest).quantize(DOLLAR)
+        return tiers
+
+    def waterfall(
+        self,
+        capital_stack: CapitalStack,
+        num_nodes: int,
+        rng: Optional[np.random.Generator] = None
+    ) -> WaterfallStructure:
+        """
+        Waterfall recouping the stack, grown to num_nodes with filler tiers.
+
+        Debt recoups principal plus simple interest over its term, equity its
+        investment (then its premium), and filler tiers (sales agent
+        expenses, deferments, backend participations) fill the remaining
+        nodes. The last node splits net profits. Every node has its own
+        (priority, payee) pair, so each keeps a separate ledger.
+
+        Args:
+            capital_stack: Stack to recoup
+            num_nodes: Total nodes (at least min_nodes(capital_stack))
+            rng: Random stream (the generator's default stream if not given)
+
+        Returns:
+            WaterfallStructure with num_nodes nodes and unique node IDs
+
+        Raises:
+            ValueError: If num_nodes is below min_nodes(capital_stack)
+        """
+        required = self.min_nodes(capital_stack)
+        if num_nodes < required:
+            raise ValueError(f"num_nodes must be at least {required} for this capital stack, got {num_nodes}")
+        rng = rng if rng is not None else self.rng(DEFAULT_STREAM)
+
+        tiers = [
+            (priority, payee, {"amount": amount})
+            for (priority, payee), amount in self._recoupment_tiers(capital_stack).items()
+        ]
+        tiers.extend(self._filler_tiers(rng, num_nodes - len(tiers) - 1, capital_stack.project_budget))
+
+        # Stable sort keeps stack order within a priority
+        tiers.sort(key=lambda tier: tier[0].value)
+        tiers.append((RecoupmentPriority.NET_PROFITS, "Equity Investors", {"percentage": NET_PROFITS_EQUITY_PERCENTAGE}))
+
+        nodes = [WaterfallNode(priority=priority, payee=payee, **terms) for priority, payee, terms in tiers]
+
+        return WaterfallStructure(
+            waterfall_id=f"{capital_stack.stack_id}-WF",
+            project_id=capital_stack.project_id or "PROJECT-SYNTHETIC",
+            waterfall_name=f"Synthetic Waterfall ({num_nodes} nodes)",
+            default_distribution_fee_rate=Decimal(int(rng.integers(20, 36))),
+            nodes=nodes
+        )
+
+    @staticmethod
+    def _filler_tiers(rng: np.random.Generator, count: int, budget: Decimal) -> List[Tuple]:
+        """
+        Filler tiers sharing one drawn fixed total and one percentage total.
+
+        Payees are numbered ("Talent 1", "Talent 2", ...) so no two fillers
+        share a ledger.
+        """
+        fillers = [FILLER_TIERS[int(i)] for i in rng.integers(len(FILLER_TIERS), size=count)]
+        fixed_slots = sum(1 for _, _, kind in fillers if kind != "percentage")
+        pct_slots = sum(1 for _, _, kind in fillers if kind != "fixed")
+
+        fixed_total = float(budget) * rng.uniform(*FILLER_FIXED_SHARE)
+        pct_total = rng.uniform(*FILLER_PERCENTAGE)
+        fixed_amounts = iter(rng.dirichlet(np.ones(fixed_slots)) * fixed_total if fixed_slots else [])
+        percentages = iter(rng.dirichlet(np.ones(pct_slots)) * pct_total if pct_slots else [])
+
+        tiers = []
+        for number, (priority, payee, kind) in enumerate(fillers, start=1):
+            terms = {}
+            if kind != "percentage":
+                amount = max(DOLLAR, Decimal(round(next(fixed_amounts))))
+                terms["amount" if kind == "fixed" else "capped_at"] = amount
+            if kind != "fixed":
+                terms["percentage"] = max(BASIS_POINT, Decimal(str(round(next(percentages), 2))))
+            tiers.append((priority, f"{payee} {number}", terms))
+        return tiers
+
+    # === Deal blocks ===
+
+    def deal_blocks(
+        self,
+        capital_stack: CapitalStack,
+        num_license_deals: int = 0,
+        rng: Optional[np.random.Generator] = None
+    ) -> List[DealBlock]:
+        """
+        Deal blocks behind a stack's equity, gap and pre-sale instruments, plus
+        num_license_deals streamer license deals.
+
+        Args:
+            capital_stack: Stack the deals fund
+            num_license_deals: Extra license deals
+            rng: Random stream (the generator's default stream if not given)
+
+        Returns:
+            List of DealBlock
+        """
+        rng = rng if rng is not None else self.rng(DEFAULT_STREAM)
+        prefix = capital_stack.stack_id
+        statuses = list(DealStatus)
+
+        deals = []
+        for component in capital_stack.components:
+            instrument = component.instrument
+            deal_id = f"{prefix}-D{len(deals):03d}"
+            counterparty = instrument.provider_name or str(rng.choice(COUNTERPARTIES))
+            if isinstance(instrument, Equity):
+                deal = create_equity_investment_template(
+                    deal_id, counterparty, instrument.amount, instrument.ownership_percentage,
+                    premium_percentage=instrument.premium_percentage,
+                    has_board_seat=bool(instrument.ownership_percentage >= 25)
+                )
+            elif isinstance(instrument, GapDebt):
+                deal = create_gap_financing_template(
+                    deal_id, counterparty, instrument.amount, interest_rate=instrument.interest_rate
+                )
+            elif isinstance(instrument, PreSale):
+                deal = create_presale_template(deal_id, counterparty, instrument.amount, [instrument.territory])
+            else:
+                continue
+            deals.append(self._with_pipeline_terms(rng, deal, statuses))
+
+        budget = capital_stack.project_budget
+        for _ in range(num_license_deals):
+            territories = [str(t) for t in rng.choice(TERRITORIES, int(rng.integers(1, 4)), replace=False)]
+            amount = (budget * Decimal(str(round(rng.uniform(0.05, 0.4), 4)))).quantize(DOLLAR)
+            deal = create_streamer_license_template(
+                f"{prefix}-D{len(deals):03d}", str(rng.choice(COUNTERPARTIES)), amount, territories,
+                term_years=int(rng.integers(3, 11))
+            )
+            deals.append(self._with_pipeline_terms(rng, deal, statuses))
+
+        return deals
+
+    @staticmethod
+    def _with_pipeline_terms(rng: np.random.Generator, deal: DealBlock, statuses: List[DealStatus]) -> DealBlock:
+        """Draw the deal's status and closing probability"""
+        return deal.model_copy(update={
+            "status": statuses[int(rng.integers(len(statuses)))],
+            "probability_of_closing": Decimal(int(rng.integers(30, 101))),
+            "created_date": GENERATED_DATE,
+        })
+
+    # === Incentive policies ===
+
+    def incentive_policies(self, num_policies: int) -> List[IncentivePolicy]:
+        """
+        Incentive policies across the synthetic jurisdictions.
+
+        Args:
+            num_policies: Number of policies
+
+        Returns:
+            List of IncentivePolicy with unique policy IDs
+        """
+        rng = self.rng(POLICY_STREAM)
+        categories = list(QPECategory)
+        incentive_types = list(IncentiveType)
+
+        policies = []
+        for index in range(num_policies):
+            code, jurisdiction = JURISDICTIONS[index % len(JURISDICTIONS)]
+            incentive_type = incentive_types[int(rng.integers(len(incentive_types)))]
+            transferable = incentive_type == IncentiveType.TRANSFERABLE_TAX_CREDIT
+
+            methods = [MonetizationMethod.DIRECT_CASH, MonetizationMethod.LOAN_COLLATERAL]
+            if transferable:
+                methods = [MonetizationMethod.TRANSFER_SALE, MonetizationMethod.TAX_CREDIT_LOAN]
+            discount_low = Decimal(str(round(rng.uniform(*TRANSFER_DISCOUNT_RANGE), 1))) if transferable else None
+
+            included = sorted(
+                rng.choice(len(categories), int(rng.integers(2, len(categories) + 1)), replace=False)
+            )
+            cultural = bool(rng.random() < 0.3)
+
+            policies.append(IncentivePolicy(
+                policy_id=f"SYN-{code}-{index:04d}",
+                jurisdiction=jurisdiction,
+                program_name=f"Synthetic {jurisdiction} Production Incentive {index}",
+                headline_rate=Decimal(str(round(rng.uniform(*POLICY_RATE_RANGE), 1))),
+                incentive_type=incentive_type,
+                qpe_definition=QPEDefinition(
+                    included_categories=[categories[i] for i in included],
+                    labor_max_percent_of_spend=Decimal(int(rng.integers(40, 81))) if rng.random() < 0.3 else None,
+                ),
+                per_project_cap=Decimal(int(rng.integers(2, 31))) * Decimal("1000000") if rng.random() < 0.4 else None,
+                minimum_total_spend=Decimal(int(rng.integers(1, 11))) * Decimal("100000"),
+                cultural_test=CulturalTest(
+                    requires_cultural_test=cultural,
+                    test_name=f"{jurisdiction} Cultural Test" if cultural else None,
+                    minimum_points_required=16 if cultural else None,
+                    total_points_available=35 if cultural else None
+                ),
+                monetization_methods=methods,
+                typical_transfer_discount_low=discount_low,
+                typical_transfer_discount_high=discount_low + 5 if discount_low is not None else None,
+                timing_months_audit_to_certification=int(rng.integers(3, 13)),
+                timing_months_certification_to_cash=int(rng.integers(1, 7)),
+                is_taxable_income_federal=False,
+                last_updated="2025-10-31",
+            ))
+
+        return policies
+
+    # === Helpers ===
+
+    def _budget(self, rng: np.random.Generator) -> Decimal:
+        """Log-uniform budget rounded to $1,000"""
+        low, high = (float(bound) for bound in self.budget_range)
+        return Decimal(round(np.exp(rng.uniform(np.log(low), np.log(high))) / 1000) * 1000)
+
+    @staticmethod
+    def _split(total: Decimal, shares: np.ndarray) -> List[Decimal]:
+        """Split a total by float shares into whole dollars summing to total"""
+        amounts = [max(DOLLAR, (total * Decimal(str(float(s)))).quantize(DOLLAR)) for s in shares]
+        largest = max(range(len(amounts)), key=lambda i: amounts[i])
+        amounts[largest] += total - sum(amounts)
+        return amounts
+
+
+def write_policies(policies: Sequence[IncentivePolicy], directory: Union[str, Path]) -> List[Path]:
+    """
+    Write policies as <policy_id>.json files readable by PolicyLoader.
+
+    Args:
+        policies: Policies to write
+        directory: Target directory (created if missing)
+
+    Returns:
+        Paths written
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for policy in policies:
+        path = directory / f"{policy.policy_id}.json"
+        path.write_text(json.dumps(policy.model_dump(mode="json"), indent=2))
+        paths.append(path)
+    return paths
+
+
+def write_slate(projects: Iterable[SyntheticProject], path: Union[str, Path]) -> int:
+    """
+    Write projects as JSON lines (one project per line) for load test drivers.
+
+    Args:
+        projects: Projects to write (any iterable; consumed lazily)
+        path: Output file
+
+    Returns:
+        Number of projects written
+    """
+    count = 0
+    with Path(path).open("w") as handle:
+        for project in projects:
+            handle.write(json.dumps(project.to_dict()) + "\n")
+            count += 1
+    return count
@@ -0,0 +1,305 @@
+"""
+Benchmark Runner
+
+Times benchmark cases, writes them as JSON baselines and compares two runs.
+
+Each case is calibrated like asv / timeit: one warm-up call sizes a round to
+at least min_round_time, then `repeat` rounds are timed and reported per
+call (min, median, mean, stddev). Rounds stop early once a case has used its
+time budget, so the slowest sizes cost one or two calls rather than `repeat`.
+Comparisons use the median by default and flag cases that slowed down by
+more than the threshold.
+"""
+
+import json
+import logging
+import math
+import platform
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .suite import BenchmarkCase
+
+logger = logging.getLogger(__name__)
+
+# Baseline file format version
+BASELINE_VERSION = 1
+
+# Timed rounds per case, and the minimum duration of one round (seconds)
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_ROUND_TIME = 0.05
+
+# Time budget per case (seconds); a warm-up call longer than this is the only sample
+DEFAULT_MAX_CASE_TIME = 10.0
+
+# Relative slowdown flagged as a regression (0.10 = 10% slower)
+DEFAULT_THRESHOLD = 0.10
+
+# Statistics a comparison can use
+COMPARISON_METRICS = ("min", "median", "mean")
+
+# Comparison outcomes
+STATUS_REGRESSION = "regression"
+STATUS_IMPROVEMENT = "improvement"
+STATUS_UNCHANGED = "unchanged"
+STATUS_NEW = "new"
+STATUS_MISSING = "missing"
+
+
+@dataclass
+class BenchmarkStats:
+    """
+    Timing of one case (seconds per call).
+
+    Attributes:
+        name: Case name
+        target: Engine entry point
+        params: Size parameters
+        number: Calls per timed round
+        rounds: Timed rounds
+        min: Fastest round
+        median: Median round
+        mean: Mean round
+        stddev: Standard deviation across rounds
+    """
+    name: str
+    target: str
+    params: Dict[str, int]
+    number: int
+    rounds: int
+    min: float
+    median: float
+    mean: float
+    stddev: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dict"""
+        return asdict(self)
+
+
+@dataclass
+class BenchmarkComparison:
+    """
+    One case compared against its baseline.
+
+    Attributes:
+        name: Case name
+        status: regression, improvement, unchanged, new or missing
+        baseline: Baseline seconds per call (None for new cases)
+        current: Current seconds per call (None for missing cases)
+        ratio: current / baseline (None unless both exist)
+    """
+    name: str
+    status: str
+    baseline: Optional[float]
+    current: Optional[float]
+    ratio: Optional[float]
+
+
+def time_case(
+    case: BenchmarkCase,
+    repeat: int = DEFAULT_REPEAT,
+    min_round_time: float = DEFAULT_MIN_ROUND_TIME,
+    max_case_time: float = DEFAULT_MAX_CASE_TIME,
+    clock: Callable[[], float] = time.perf_counter
+) -> BenchmarkStats:
+    """
+    Time one case.
+
+    Args:
+        case: Case to run
+        repeat: Timed rounds
+        min_round_time: Minimum duration of a round, used to size it
+        max_case_time: Stop starting new rounds after this many seconds
+        clock: Timer (perf_counter)
+
+    Returns:
+        BenchmarkStats
+
+    Raises:
+        ValueError: If repeat < 1
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+
+    func = case.setup()
+
+    # Warm-up call (fills plan / projection caches) also sizes the rounds
+    case_start = clock()
+    func()
+    warmup = clock() - case_start
+    number = max(1, math.ceil(min_round_time / warmup)) if warmup > 0 else 1
+
+    timings = []
+    if warmup >= max_case_time:
+        timings.append(warmup)
+    while len(timings) < repeat and (not timings or clock() - case_start < max_case_time):
+        start = clock()
+        for _ in range(number):
+            func()
+        timings.append((clock() - start) / number)
+
+    return BenchmarkStats(
+        name=case.name,
+        target=case.target,
+        params=dict(case.params),
+        number=number,
+        rounds=len(timings),
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+        stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0
+    )
+
+
+def run_suite(
+    cases: List[BenchmarkCase],
+    repeat: int = DEFAULT_REPEAT,
+    min_round_time: float = DEFAULT_MIN_ROUND_TIME,
+    max_case_time: float = DEFAULT_MAX_CASE_TIME,
+    progress: Optional[Callable[[BenchmarkStats], None]] = None
+) -> Dict[str, Any]:
+    """
+    Time every case into a baseline report.
+
+    Args:
+        cases: Cases to run (from build_suite)
+        repeat: Timed rounds per case
+        min_round_time: Minimum duration of a round
+        max_case_time: Time budget per case
+        progress: Called with each case's stats as it finishes
+
+    Returns:
+        Report dict: version, created_at, machine info and results by name
+    """
+    results = {}
+    for case in cases:
+        stats = time_case(case, repeat, min_round_time, max_case_time)
+        results[case.name] = stats.to_dict()
+        logger.info(f"{case.name}: {stats.median * 1000:.3f} ms")
+        if progress is not None:
+            progress(stats)
+
+    return {
+        "version": BASELINE_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "settings": {"repeat": repeat, "min_round_time": min_round_time, "max_case_time": max_case_time},
+        "results": results,
+    }
+
+
+def save_report(report: Dict[str, Any], path: Union[str, Path]) -> None:
+    """Write a report as JSON"""
+    Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load_report(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a report written by save_report().
+
+    Raises:
+        ValueError: If the file is not a benchmark report of a known version
+    """
+    report = json.loads(Path(path).read_text())
+    if not isinstance(report, dict) or "results" not in report:
+        raise ValueError(f"{path} is not a benchmark report")
+    if report.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported benchmark report version: {report.get('version')}")
+    return report
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = "median"
+) -> List[BenchmarkComparison]:
+    """
+    Compare two reports case by case.
+
+    A case regresses when current / baseline > 1 + threshold and improves when
+    it is below 1 / (1 + threshold).
+
+    Args:
+        baseline: Baseline report
+        current: Current report
+        threshold: Relative slowdown flagged as a regression
+        metric: Statistic compared (one of COMPARISON_METRICS)
+
+    Returns:
+        Comparisons for every case in either report, baseline order first
+
+    Raises:
+        ValueError: For a negative threshold or unknown metric
+    """
+    if threshold < 0:
+        raise ValueError(f"threshold must be non-negative, got {threshold}")
+    if metric not in COMPARISON_METRICS:
+        raise ValueError(f"Unknown comparison metric: {metric}")
+
+    base_results = baseline["results"]
+    current_results = current["results"]
+
+    comparisons = []
+    for name in list(base_results) + [n for n in current_results if n not in base_results]:
+        base_value = base_results[name][metric] if name in base_results else None
+        current_value = current_results[name][metric] if name in current_results else None
+
+        if base_value is None:
+            comparisons.append(BenchmarkComparison(name, STATUS_NEW, None, current_value, None))
+            continue
+        if current_value is None:
+            comparisons.append(BenchmarkComparison(name, STATUS_MISSING, base_value, None, None))
+            continue
+
+        ratio = current_value / base_value if base_value > 0 else math.inf
+        if ratio > 1 + threshold:
+            status = STATUS_REGRESSION
+        elif ratio < 1 / (1 + threshold):
+            status = STATUS_IMPROVEMENT
+        else:
+            status = STATUS_UNCHANGED
+        comparisons.append(BenchmarkComparison(name, status, base_value, current_value, ratio))
+
+    return comparisons
+
+
+def regressions(comparisons: List[BenchmarkComparison]) -> List[BenchmarkComparison]:
+    """Comparisons flagged as regressions"""
+    return [c for c in comparisons if c.status == STATUS_REGRESSION]
+
+
+def format_comparison(comparisons: List[BenchmarkComparison]) -> str:
+    """
+    Render comparisons as a fixed-width table.
+
+    Args:
+        comparisons: Output of compare_reports()
+
+    Returns:
+        Table text with a summary line
+    """
+    width = max([len(c.name) for c in comparisons] + [len("benchmark")])
+    lines = [f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'ratio':>7}  status"]
+
+    for c in comparisons:
+        baseline = f"{c.baseline * 1000:.3f} ms" if c.baseline is not None else "-"
+        current = f"{c.current * 1000:.3f} ms" if c.current is not None else "-"
+        ratio = f"{c.ratio:.2f}x" if c.ratio is not None else "-"
+        lines.append(f"{c.name:<{width}}  {baseline:>12}  {current:>12}  {ratio:>7}  {c.status}")
+
+    counts = {}
+    for c in comparisons:
+        counts[c.status] = counts.get(c.status, 0) + 1
+    lines.append(", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+
+    return "\n".join(lines)
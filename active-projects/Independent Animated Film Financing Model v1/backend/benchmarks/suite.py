@@ -0,0 +1,218 @@
+"""
+Benchmark Suite
+
+Registry of benchmark cases: each engine entry point crossed with the
+synthetic waterfall sizes and projection lengths, plus slate execution over
+generated projects. A case's setup builds its inputs outside the timed
+region and returns the callable to time.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from engines.waterfall_executor.monte_carlo_simulator import MonteCarloSimulator, RevenueDistribution
+from engines.waterfall_executor.revenue_projector import RevenueProjector
+from engines.waterfall_executor.sensitivity_analyzer import SensitivityAnalyzer, SensitivityVariable
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+
+from .fixtures import (
+    NODE_COUNTS,
+    QUARTER_COUNTS,
+    TOTAL_ULTIMATE_REVENUE,
+    synthetic_capital_stack,
+    synthetic_projection,
+    synthetic_waterfall,
+    synthetic_windows
+)
+from .generator import DealGenerator
+
+# Engine entry points covered
+TARGETS = (
+    "execute_over_time",
+    "stakeholder_analyze",
+    "monte_carlo_simulate",
+    "sensitivity_analyze",
+    "revenue_project",
+    "slate_execute",
+)
+
+# Generated projects per slate case, and the generator seed
+SLATE_SIZES = (10, 100, 1000)
+SLATE_SEED = 2025
+
+# Monte Carlo scenarios per timed call (full / quick suite)
+MONTE_CARLO_SIMULATIONS = 200
+QUICK_MONTE_CARLO_SIMULATIONS = 50
+MONTE_CARLO_SEED = 42
+
+# Revenue variables for the sensitivity benchmark: (name, low, high) as
+# fractions of the base revenue
+SENSITIVITY_VARIABLES = (
+    ("total_revenue", Decimal("0.6"), Decimal("1.4")),
+    ("box_office_revenue", Decimal("0.5"), Decimal("1.5")),
+)
+SENSITIVITY_METRICS = ["equity_irr", "overall_recovery_rate"]
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    One benchmark.
+
+    Attributes:
+        name: Unique case name, e.g. "execute_over_time[nodes=50,quarters=80]"
+        target: Engine entry point (one of TARGETS)
+        params: Size parameters
+        setup: Builds the inputs and returns the callable to time
+    """
+    name: str
+    target: str
+    params: Dict[str, int] = field(default_factory=dict)
+    setup: Callable[[], Callable[[], Any]] = None
+
+
+def case_name(target: str, params: Dict[str, int]) -> str:
+    """Stable case name from a target and its parameters"""
+    if not params:
+        return target
+    return f"{target}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+
+
+def build_suite(
+    quick: bool = False,
+    name_filter: Optional[str] = None
+) -> List[BenchmarkCase]:
+    """
+    Build the benchmark cases.
+
+    Args:
+        quick: Only the two smaller sizes of each axis (and slate) and fewer
+            Monte Carlo scenarios (for smoke runs)
+        name_filter: Keep only cases whose name contains this substring
+
+    Returns:
+        List of BenchmarkCase in a stable order
+    """
+    node_counts = NODE_COUNTS[:2] if quick else NODE_COUNTS
+    quarter_counts = QUARTER_COUNTS[:2] if quick else QUARTER_COUNTS
+    simulations = QUICK_MONTE_CARLO_SIMULATIONS if quick else MONTE_CARLO_SIMULATIONS
+    slate_sizes = SLATE_SIZES[:2] if quick else SLATE_SIZES
+
+    factories = {
+        "execute_over_time": _execute_over_time,
+        "stakeholder_analyze": _stakeholder_analyze,
+        "monte_carlo_simulate": lambda n, q: _monte_carlo_simulate(n, q, simulations),
+        "sensitivity_analyze": _sensitivity_analyze,
+    }
+
+    cases = []
+    for target, factory in factories.items():
+        for nodes in node_counts:
+            for quarters in quarter_counts:
+                params = {"nodes": nodes, "quarters": quarters}
+                cases.append(BenchmarkCase(
+                    name=case_name(target, params),
+                    target=target,
+                    params=params,
+                    setup=_bind(factory, nodes, quarters)
+                ))
+
+    # The projector has no waterfall, so it only varies by quarters
+    for quarters in quarter_counts:
+        params = {"quarters": quarters}
+        cases.append(BenchmarkCase(
+            name=case_name("revenue_project", params),
+            target="revenue_project",
+            params=params,
+            setup=_bind(_revenue_project, quarters)
+        ))
+
+    for projects in slate_sizes:
+        params = {"projects": projects}
+        cases.append(BenchmarkCase(
+            name=case_name("slate_execute", params),
+            target="slate_execute",
+            params=params,
+            setup=_bind(_slate_execute, projects)
+        ))
+
+    if name_filter:
+        cases = [case for case in cases if name_filter in case.name]
+
+    return cases
+
+
+def _bind(factory: Callable, *args) -> Callable[[], Callable[[], Any]]:
+    """Defer a factory call until the case is run"""
+    return lambda: factory(*args)
+
+
+def _execute_over_time(nodes: int, quarters: int) -> Callable[[], Any]:
+    """Time-series execution of a fresh result each call"""
+    executor = WaterfallExecutor(synthetic_waterfall(nodes))
+    projection = synthetic_projection(quarters)
+    return lambda: executor.execute_over_time(projection)
+
+
+def _stakeholder_analyze(nodes: int, quarters: int) -> Callable[[], Any]:
+    """Stakeholder returns over a precomputed time-series result"""
+    result = WaterfallExecutor(synthetic_waterfall(nodes)).execute_over_time(synthetic_projection(quarters))
+    analyzer = StakeholderAnalyzer(synthetic_capital_stack())
+    return lambda: analyzer.analyze(result)
+
+
+def _monte_carlo_simulate(nodes: int, quarters: int, simulations: int) -> Callable[[], Any]:
+    """Seeded triangular revenue simulation"""
+    simulator = MonteCarloSimulator(
+        synthetic_waterfall(nodes), synthetic_capital_stack(), synthetic_projection(quarters)
+    )
+    distribution = RevenueDistribution(
+        variable_name="total_revenue",
+        distribution_type="triangular",
+        parameters={
+            "min": TOTAL_ULTIMATE_REVENUE * Decimal("0.25"),
+            "mode": TOTAL_ULTIMATE_REVENUE,
+            "max": TOTAL_ULTIMATE_REVENUE * Decimal("2"),
+        }
+    )
+    return lambda: simulator.simulate(
+        distribution, num_simulations=simulations, seed=MONTE_CARLO_SEED, keep_scenarios=False
+    )
+
+
+def _sensitivity_analyze(nodes: int, quarters: int) -> Callable[[], Any]:
+    """Tornado analysis over the revenue variables"""
+    analyzer = SensitivityAnalyzer(
+        synthetic_waterfall(nodes), synthetic_capital_stack(), synthetic_projection(quarters)
+    )
+    variables = [
+        SensitivityVariable(
+            variable_name=name,
+            base_value=TOTAL_ULTIMATE_REVENUE,
+            low_value=TOTAL_ULTIMATE_REVENUE * low,
+            high_value=TOTAL_ULTIMATE_REVENUE * high
+        )
+        for name, low, high in SENSITIVITY_VARIABLES
+    ]
+    return lambda: analyzer.analyze(variables, SENSITIVITY_METRICS)
+
+
+def _revenue_project(quarters: int) -> Callable[[], Any]:
+    """Projection over custom windows spanning the quarters"""
+    projector = RevenueProjector()
+    windows = synthetic_windows(quarters)
+    return lambda: projector.project(
+        TOTAL_ULTIMATE_REVENUE, custom_windows=windows, project_name="Benchmark Film"
+    )
+
+
+def _slate_execute(projects: int) -> Callable[[], Any]:
+    """Time-series execution of every project in a generated slate"""
+    projector = RevenueProjector()
+    runs = [
+        (WaterfallExecutor(project.waterfall), project.projection(projector))
+        for project in DealGenerator(seed=SLATE_SEED).slate(projects)
+    ]
+    return lambda: [executor.execute_over_time(projection) for executor, projection in runs]
@@ -0,0 +1,19 @@
+"""
+Shared Engine Utilities
+
+Building blocks used by more than one engine, kept here so the engine
+packages do not import from each other:
+- Timing kernels for spreading amounts across periods
+"""
+
+from .timing_kernels import (
+    TIMING_PROFILES,
+    TimingKernel,
+    get_kernel,
+)
+
+__all__ = [
+    "TIMING_PROFILES",
+    "TimingKernel",
+    "get_kernel",
+]
@@ -0,0 +1,108 @@
+"""
+Unit Tests for Timing Kernels
+
+Tests the memoized unit-weight tables shared by the revenue projector,
+S-curve investment drawdown and the incentive cash flow projector.
+"""
+
+import pytest
+from decimal import Decimal
+
+import numpy as np
+
+from engines.common.timing_kernels import (
+    TIMING_PROFILES,
+    get_kernel
+)
+from engines.waterfall_executor.revenue_projector import s_curve_distribution
+from engines.incentive_calculator.cash_flow_projector import CashFlowProjector
+
+
+class TestTimingKernel:
+    """Test kernel construction"""
+
+    @pytest.mark.parametrize("profile", TIMING_PROFILES)
+    @pytest.mark.parametrize("periods", [1, 2, 5, 12, 36])
+    def test_weights_sum_to_one_exactly(self, profile, periods):
+        """Test every kernel's Decimal weights sum to exactly 1"""
+        kernel = get_kernel(profile, periods)
+
+        assert sum(kernel.weights) == Decimal("1")
+        assert all(w >= 0 for w in kernel.weights)
+        assert kernel.fractions.sum() == pytest.approx(1.0)
+
+    def test_memoized(self):
+        """Test equal parameters return the same kernel object"""
+        assert get_kernel("s_curve", 12, 8.0, 0.4) is get_kernel("s_curve", 12, 8, 0.4)
+        assert get_kernel("even", 4, 3.0, 0.1) is get_kernel("even", 4)
+
+    def test_fractions_read_only(self):
+        """Test the float table can't be mutated by callers"""
+        with pytest.raises(ValueError):
+            get_kernel("front_loaded", 4).fractions[0] = 1.0
+
+    def test_profile_shapes(self):
+        """Test the window profiles keep their documented shapes"""
+        assert get_kernel("front_loaded", 4).weights == (
+            Decimal("0.60"), Decimal("0.25"), Decimal("0.10"), Decimal("0.05")
+        )
+        assert get_kernel("lump_sum", 6).periods == 1
+        back = get_kernel("back_loaded", 4).fractions
+        np.testing.assert_allclose(back, [0.1, 0.2, 0.3, 0.4])
+
+    def test_s_curve_variants(self):
+        """Test front / back variants shift the peak"""
+        front = get_kernel("s_curve_front", 10)
+        back = get_kernel("s_curve_back", 10)
+
+        assert (front.steepness, front.midpoint) == (10.0, 0.3)
+        assert front.peak_index < back.peak_index
+
+    def test_invalid_inputs(self):
+        """Test unknown profiles and bad parameters are rejected"""
+        with pytest.raises(ValueError, match="Unknown timing profile"):
+            get_kernel("sideways", 4)
+        with pytest.raises(ValueError, match="periods must be positive"):
+            get_kernel("even", 0)
+        with pytest.raises(ValueError, match="steepness must be positive"):
+            get_kernel("s_curve", 4, steepness=0)
+
+
+class TestAllocate:
+    """Test exact residual allocation"""
+
+    @pytest.mark.parametrize("total", ["1000000", "12345678.91", "0.07", "0"])
+    def test_amounts_sum_to_total(self, total):
+        """Test allocated amounts reconcile exactly"""
+        total = Decimal(total)
+        for profile in TIMING_PROFILES:
+            assert sum(get_kernel(profile, 7).allocate(total)) == total
+
+    def test_matches_s_curve_distribution(self):
+        """Test s_curve_distribution is the S-curve kernel's allocation"""
+        total = Decimal("2500000")
+
+        assert s_curve_distribution(total, 12, 8, 0.4) == get_kernel("s_curve", 12, 8, 0.4).allocate(total)
+
+
+class TestProductionPhased:
+    """Test the phased production spend kernel"""
+
+    def test_phase_shares(self):
+        """Test 15% / 60% / 25% phase split for an 18-month schedule"""
+        weights = get_kernel("production_phased", 18).weights
+
+        assert sum(weights[:3]) == pytest.approx(Decimal("0.15"), abs=Decimal("1e-20"))
+        assert sum(weights[3:12]) == pytest.approx(Decimal("0.60"), abs=Decimal("1e-20"))
+        assert sum(weights[12:]) == pytest.approx(Decimal("0.25"), abs=Decimal("1e-20"))
+
+    def test_short_schedule_even(self):
+        """Test schedules under four months spend evenly"""
+        assert len(set(get_kernel("production_phased", 3).fractions.tolist())) == 1
+
+    def test_cash_flow_projector_uses_kernel(self):
+        """Test the incentive spend curve is the phased kernel"""
+        curve = CashFlowProjector()._generate_s_curve(18)
+
+        assert curve == list(get_kernel("production_phased", 18).weights)
+        assert sum(curve) == Decimal("1")
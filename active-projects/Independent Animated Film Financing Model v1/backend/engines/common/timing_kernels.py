@@ -0,0 +1,227 @@
+"""
+Timing Kernels
+
+Precomputed unit-weight tables for spreading an amount across periods: the
+revenue window profiles (lump sum, front/back loaded, even), logistic
+S-curves and the phased production spend curve.
+
+A TimingKernel holds Decimal weights that sum to exactly 1 (the rounding
+residual sits in the largest period) plus the same weights as a read-only
+float array for vectorized callers. Kernels are built once per
+(profile, periods, steepness, midpoint) with NumPy and memoized, so
+projections only multiply a total by the stored weights. allocate() places
+the multiplication residual the same way, so the amounts always sum to the
+total exactly.
+
+Used by RevenueProjector, s_curve_distribution / InvestmentDrawdown and the
+incentive CashFlowProjector.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Profiles a kernel can be built for
+TIMING_PROFILES = ("lump_sum", "front_loaded", "even", "back_loaded", "s_curve", "production_phased")
+
+# Fixed-parameter S-curve variants: profile → (steepness, midpoint)
+S_CURVE_VARIANTS = {
+    "s_curve_front": (10.0, 0.3),
+    "s_curve_back": (10.0, 0.7),
+}
+
+# S-curve defaults (as in s_curve_distribution)
+DEFAULT_STEEPNESS = 8.0
+DEFAULT_MIDPOINT = 0.5
+
+# Front-loaded weights for the first quarters; later quarters repeat the last
+FRONT_LOADED_WEIGHTS = (Decimal("0.60"), Decimal("0.25"), Decimal("0.10"), Decimal("0.05"))
+
+# Production spend phases: pre-production gets ~1/6 of the months, principal
+# photography ~1/2 and post-production the rest, each spending its share evenly
+PRE_PRODUCTION_SHARE = Decimal("0.15")
+PRINCIPAL_SHARE = Decimal("0.60")
+POST_PRODUCTION_SHARE = Decimal("0.25")
+
+# Schedules this short spend evenly
+MIN_PHASED_MONTHS = 4
+
+# Weights are rounded to this quantum so they add without Decimal rounding
+WEIGHT_QUANTUM = Decimal("1e-24")
+
+# Memoized kernels
+KERNEL_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class TimingKernel:
+    """
+    Unit weights of a timing profile.
+
+    Attributes:
+        profile: Profile name
+        periods: Number of periods the kernel spans (1 for lump_sum)
+        steepness: S-curve steepness (None for other profiles)
+        midpoint: S-curve midpoint (None for other profiles)
+        weights: Per-period Decimal weights summing to exactly 1
+        peak_index: Period that absorbs rounding residuals
+        fractions: Weights as a read-only float array
+    """
+    profile: str
+    periods: int
+    steepness: Optional[float]
+    midpoint: Optional[float]
+    weights: Tuple[Decimal, ...]
+    peak_index: int
+    fractions: np.ndarray = field(repr=False, compare=False)
+
+    def allocate(self, total: Decimal) -> List[Decimal]:
+        """
+        Spread a total across the kernel's periods.
+
+        Args:
+            total: Amount to spread
+
+        Returns:
+            Per-period amounts summing to exactly total
+        """
+        amounts = [total * weight for weight in self.weights]
+        residual = total - sum(amounts)
+        if residual != 0:
+            amounts[self.peak_index] += residual
+        return amounts
+
+
+def get_kernel(
+    profile: str,
+    periods: int,
+    steepness: float = DEFAULT_STEEPNESS,
+    midpoint: float = DEFAULT_MIDPOINT
+) -> TimingKernel:
+    """
+    Memoized kernel for a profile.
+
+    Steepness and midpoint only apply to "s_curve"; the s_curve_front /
+    s_curve_back variants use their fixed parameters.
+
+    Args:
+        profile: One of TIMING_PROFILES or S_CURVE_VARIANTS
+        periods: Number of periods (must be positive)
+        steepness: S-curve steepness (must be positive)
+        midpoint: S-curve inflection point (0.0-1.0)
+
+    Returns:
+        TimingKernel
+
+    Raises:
+        ValueError: For an unknown profile, periods <= 0 or steepness <= 0
+    """
+    if profile in S_CURVE_VARIANTS:
+        steepness, midpoint = S_CURVE_VARIANTS[profile]
+        profile = "s_curve"
+    if profile not in TIMING_PROFILES:
+        raise ValueError(f"Unknown timing profile: {profile}")
+    if periods <= 0:
+        raise ValueError(f"periods must be positive, got {periods}")
+
+    if profile == "s_curve":
+        if steepness <= 0:
+            raise ValueError(f"steepness must be positive, got {steepness}")
+        return _build_kernel(profile, periods, float(steepness), float(midpoint))
+
+    return _build_kernel(profile, periods, None, None)
+
+
+def kernel_cache_info():
+    """functools cache statistics of the kernel table"""
+    return _build_kernel.cache_info()
+
+
+@lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def _build_kernel(
+    profile: str,
+    periods: int,
+    steepness: Optional[float],
+    midpoint: Optional[float]
+) -> TimingKernel:
+    """Build the weights for a validated profile and period count"""
+    if profile == "lump_sum":
+        weights = [Decimal("1")]
+    elif profile == "front_loaded":
+        weights = _front_loaded_weights(periods)
+    elif profile == "even":
+        weights = [Decimal("1") / Decimal(periods)] * periods
+    elif profile == "back_loaded":
+        # Linear ramp: period i gets weight i + 1
+        ramp_total = Decimal(periods * (periods + 1) // 2)
+        weights = [Decimal(i + 1) / ramp_total for i in range(periods)]
+    elif profile == "s_curve":
+        weights = _s_curve_weights(periods, steepness, midpoint)
+    else:
+        weights = _production_phased_weights(periods)
+
+    weights = [w.quantize(WEIGHT_QUANTUM) for w in weights]
+
+    # The largest weight absorbs the residual, where it distorts least
+    peak_index = max(range(len(weights)), key=lambda i: weights[i])
+    residual = Decimal("1") - sum(weights)
+    if residual != 0:
+        weights[peak_index] += residual
+
+    fractions = np.array([float(w) for w in weights])
+    fractions.setflags(write=False)
+
+    return TimingKernel(
+        profile=profile,
+        periods=len(weights),
+        steepness=steepness,
+        midpoint=midpoint,
+        weights=tuple(weights),
+        peak_index=peak_index,
+        fractions=fractions
+    )
+
+
+def _front_loaded_weights(periods: int) -> List[Decimal]:
+    """60/25/10/5 split, extended with 5% quarters and rescaled to the window"""
+    selected = list(FRONT_LOADED_WEIGHTS[:periods])
+    selected += [FRONT_LOADED_WEIGHTS[-1]] * (periods - len(selected))
+    total_weight = sum(selected)
+    return [w / total_weight for w in selected]
+
+
+def _s_curve_weights(periods: int, steepness: float, midpoint: float) -> List[Decimal]:
+    """Differences of the normalized logistic curve at period boundaries"""
+    if periods == 1:
+        return [Decimal("1")]
+
+    t = np.arange(periods + 1) / periods
+    cumulative = 1.0 / (1.0 + np.exp(-steepness * (t - midpoint)))
+    scale = cumulative[-1] - cumulative[0]
+    if scale == 0:
+        return [Decimal("1") / Decimal(periods)] * periods
+
+    normalized = (cumulative - cumulative[0]) / scale
+    return [Decimal(str(float(f))) for f in np.diff(normalized)]
+
+
+def _production_phased_weights(months: int) -> List[Decimal]:
+    """Pre-production ramp, principal photography peak, post-production tail"""
+    if months < MIN_PHASED_MONTHS:
+        return [Decimal("1.0") / Decimal(months)] * months
+
+    pre_production_months = max(1, months // 6)
+    principal_months = max(2, months // 2)
+    post_production_months = months - pre_production_months - principal_months
+
+    return (
+        [PRE_PRODUCTION_SHARE / Decimal(pre_production_months)] * pre_production_months
+        + [PRINCIPAL_SHARE / Decimal(principal_months)] * principal_months
+        + [POST_PRODUCTION_SHARE / Decimal(post_production_months)] * post_production_months
+    )
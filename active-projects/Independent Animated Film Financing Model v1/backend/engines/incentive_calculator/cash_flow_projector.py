@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from decimal import Decimal
 
+from engines.common.timing_kernels import get_kernel
+
 from .calculator import (
     JurisdictionSpend,
     IncentiveResult,
@@ -240,42 +242,9 @@ class CashFlowProjector:
         if months <= 0:
             raise ValueError("Production schedule must be at least 1 month")
 
-        # Define S-curve shape based on production phases
-        if months <= 3:
-            # Very short production - even distribution
-            return [Decimal("1.0") / Decimal(str(months))] * months
-
-        # Allocate by phase
-        pre_production_months = max(1, months // 6)  # ~15-20%
-        principal_months = max(2, months // 2)       # ~50-60%
-        post_production_months = months - pre_production_months - principal_months
-
-        curve = []
-
-        # Pre-production: 15% of budget, ramp up
-        pre_prod_total = Decimal("0.15")
-        for i in range(pre_production_months):
-            # Linear ramp
-            pct = pre_prod_total / Decimal(str(pre_production_months))
-            curve.append(pct)
-
-        # Principal photography: 60% of budget, peak spending
-        principal_total = Decimal("0.60")
-        for i in range(principal_months):
-            pct = principal_total / Decimal(str(principal_months))
-            curve.append(pct)
-
-        # Post-production: 25% of budget, tail off
-        post_prod_total = Decimal("0.25")
-        for i in range(post_production_months):
-            pct = post_prod_total / Decimal(str(post_production_months))
-            curve.append(pct)
-
-        # Normalize to ensure sum = 1.0
-        curve_sum = sum(curve)
-        curve = [c / curve_sum for c in curve]
-
-        return curve
+        # Even split for very short productions, otherwise 15% pre-production,
+        # 60% principal photography, 25% post-production
+        return list(get_kernel("production_phased", months).weights)
 
     def compare_timing_scenarios(
         self,
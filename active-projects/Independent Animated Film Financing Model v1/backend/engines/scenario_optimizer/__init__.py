@@ -26,9 +26,19 @@ from .constraint_manager import (
 from .capital_stack_optimizer import (
     OptimizationObjective,
     OptimizationResult,
+    ParetoSolution,
+    ParetoOptimizationResult,
     CapitalStackOptimizer
 )
 
+from .smooth_score import SmoothScoreModel
+
+from .evaluation_cache import (
+    EvaluationCache,
+    configure_evaluation_cache,
+    get_evaluation_cache
+)
+
 from .scenario_evaluator import (
     ScenarioEvaluation,
     ScenarioEvaluator
@@ -72,7 +82,13 @@ __all__ = [
     # Optimization
     "OptimizationObjective",
     "OptimizationResult",
+    "ParetoSolution",
+    "ParetoOptimizationResult",
     "CapitalStackOptimizer",
+    "SmoothScoreModel",
+    "EvaluationCache",
+    "configure_evaluation_cache",
+    "get_evaluation_cache",
 
     # Evaluation
     "ScenarioEvaluation",
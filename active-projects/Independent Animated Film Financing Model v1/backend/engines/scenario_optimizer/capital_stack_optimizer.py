@@ -4,27 +4,108 @@ Capital Stack Optimizer
 Uses scipy.optimize to find optimal capital stack configurations that maximize
 objective function while satisfying constraints. Integrates with Engines 1 & 2
 through ScenarioEvaluator for accurate non-linear optimization.
+
+optimize_surrogate() trades SLSQP's finite-difference probes for an RBF
+response surface fitted to a few dozen true evaluations, refined with true
+evaluations only near the surrogate optimum.
+
+optimize(analytic_gradient=True) runs SLSQP on SmoothScoreModel, a
+differentiable form of the weighted score with exact gradients, instead of
+finite-difference probes of full evaluations.
+
+optimize_pareto() runs NSGA-II over the allocation simplex and returns the
+whole non-dominated front of equity IRR, cost of capital, dilution and risk,
+evaluating each generation's population in one vectorized SmoothScoreModel
+call.
+
+Evaluations go through a shared EvaluationCache (process-wide by default),
+so repeat optimizations of the same project reuse them across optimizer
+instances and API requests.
 """
 
 import logging
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple, Callable
 from decimal import Decimal
 from enum import Enum
 
 import numpy as np
+from scipy.interpolate import RBFInterpolator
 from scipy.optimize import minimize, Bounds, LinearConstraint
+from scipy.stats import qmc
 
 from models.capital_stack import CapitalStack, CapitalComponent
 from models.financial_instruments import (
     Equity, SeniorDebt, MezzanineDebt, GapFinancing, PreSale, TaxIncentive, Debt
 )
 from .constraint_manager import ConstraintManager
-from .scenario_evaluator import ScenarioEvaluator
+from .nsga2 import (
+    polynomial_mutation,
+    project_to_budget,
+    sbx_crossover,
+    select_survivors,
+    tournament_select
+)
+from .evaluation_cache import (
+    EvaluationCache,
+    evaluation_cache_key,
+    evaluation_context_key,
+    get_evaluation_cache
+)
+from .scenario_evaluator import ScenarioEvaluation, ScenarioEvaluator
+from .smooth_score import IRR_FLOOR, SmoothScoreModel
 
 logger = logging.getLogger(__name__)
 
+# Objective value returned for allocations violating hard or structural constraints
+CONSTRAINT_PENALTY = 1_000_000.0
+
+# Multi-start: half-width of the start region around the template allocation
+# (percentage points; 100 spreads starts over the whole bounded simplex)
+START_SPREAD = 15.0
+
+# Multi-start: Sobol candidates drawn per start, screened for hard and
+# structural constraints (starts in the flat penalty region cannot move)
+START_CANDIDATES_PER_START = 8
+
+# Multi-start: a start whose SLSQP iterate comes within this distance of a
+# finished start's optimum (percentage points, every instrument) is abandoned
+BASIN_RADIUS = 1.0
+
+# Surrogate mode: initial true evaluations per (instrument count + 1)
+SURROGATE_SAMPLES_PER_INSTRUMENT = 4
+
+# Surrogate mode: default true evaluations spent on refinement near the optimum
+SURROGATE_REFINE_EVALUATIONS = 12
+
+# Surrogate mode: initial trust region half-width (percentage points)
+SURROGATE_INITIAL_RADIUS = 20.0
+
+# Surrogate mode: trust region half-width below which refinement stops
+SURROGATE_MIN_RADIUS = 0.5
+
+# Surrogate mode: candidates closer than this to an evaluated allocation are
+# not re-evaluated (percentage points, any instrument)
+SURROGATE_MIN_SPACING = 0.1
+
+# Pareto mode: objectives traded off (equity IRR is maximized, the rest
+# minimized; dilution is the equity share and risk the debt share of budget)
+PARETO_OBJECTIVES = ["equity_irr", "cost_of_capital", "dilution", "risk"]
+
+# Pareto mode: default NSGA-II population size (even) and generations
+PARETO_POPULATION_SIZE = 200
+PARETO_GENERATIONS = 60
+
+# Pareto mode: front members closer than this are reported once (percentage points)
+PARETO_DUPLICATE_RESOLUTION = 0.01
+
+# Pareto mode: constraint checks on cent-rounded amounts count a difference
+# of under half a cent as a tie
+PARETO_CENT_TOLERANCE = 0.005
+
 
 class OptimizationObjective(Enum):
     """Optimization objective."""
@@ -57,6 +138,44 @@ class OptimizationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ParetoSolution:
+    """
+    Non-dominated allocation found by optimize_pareto().
+
+    Attributes:
+        capital_stack: CapitalStack of the allocation
+        allocations: Percentage allocations by instrument type
+        objectives: Value of each Pareto objective
+        evaluation: ScenarioEvaluation carrying the metrics (for TradeOffAnalyzer)
+    """
+    capital_stack: CapitalStack
+    allocations: Dict[str, Decimal]
+    objectives: Dict[str, Decimal]
+    evaluation: ScenarioEvaluation
+
+
+@dataclass
+class ParetoOptimizationResult:
+    """
+    Result of multi-objective capital stack optimization.
+
+    Attributes:
+        solutions: Non-dominated solutions, highest equity IRR first
+        objective_names: Objectives traded off
+        solve_time_seconds: Time taken to solve
+        metadata: Additional optimization data
+    """
+    solutions: List[ParetoSolution]
+    objective_names: List[str]
+    solve_time_seconds: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def evaluations(self) -> List[ScenarioEvaluation]:
+        """Evaluations of the front, in solution order."""
+        return [solution.evaluation for solution in self.solutions]
+
+
 class CapitalStackOptimizer:
     """
     Optimize capital stack using scipy.optimize.
@@ -69,7 +188,8 @@ class CapitalStackOptimizer:
     def __init__(
         self,
         constraint_manager: Optional[ConstraintManager] = None,
-        evaluator: Optional[ScenarioEvaluator] = None
+        evaluator: Optional[ScenarioEvaluator] = None,
+        evaluation_cache: Optional[EvaluationCache] = None
     ):
         """
         Initialize optimizer.
@@ -77,10 +197,12 @@ class CapitalStackOptimizer:
         Args:
             constraint_manager: ConstraintManager (creates default if None)
             evaluator: ScenarioEvaluator for objective function (creates default if None)
+            evaluation_cache: EvaluationCache for scenario evaluations (uses the
+                process-wide cache if None)
         """
         self.constraint_manager = constraint_manager or ConstraintManager()
         self.evaluator = evaluator or ScenarioEvaluator()
-        self.evaluation_cache = {}
+        self.evaluation_cache = evaluation_cache if evaluation_cache is not None else get_evaluation_cache()
         logger.info("CapitalStackOptimizer initialized with scipy backend")
 
     def optimize(
@@ -90,11 +212,20 @@ class CapitalStackOptimizer:
         objective_weights: Optional[Dict[str, Decimal]] = None,
         bounds: Optional[Dict[str, Tuple[Decimal, Decimal]]] = None,
         scenario_name: str = "optimized_scenario",
-        waterfall_structure: Optional[Any] = None
+        waterfall_structure: Optional[Any] = None,
+        initial_percentages: Optional[np.ndarray] = None,
+        callback: Optional[Callable[[np.ndarray], None]] = None,
+        analytic_gradient: bool = False
     ) -> OptimizationResult:
         """
         Optimize capital stack starting from template.
 
+        By default SLSQP probes the full evaluation by finite differences
+        (n + 1 evaluations per gradient). With analytic_gradient it searches
+        SmoothScoreModel with exact gradients instead, following the linear
+        structural rules as constraints, and only the optimum is fully
+        evaluated for the reported objective value.
+
         Args:
             template_stack: Starting capital stack (provides structure)
             project_budget: Total project budget
@@ -102,6 +233,11 @@ class CapitalStackOptimizer:
             bounds: Optional (min%, max%) bounds per instrument type
             scenario_name: Name for resulting scenario
             waterfall_structure: WaterfallStructure for evaluation (uses default if None)
+            initial_percentages: Starting allocation (% per template component;
+                template amounts if None)
+            callback: Called with the allocation after every SLSQP iteration;
+                exceptions it raises propagate
+            analytic_gradient: Search the smooth score with exact gradients
 
         Returns:
             OptimizationResult with optimal capital stack
@@ -109,35 +245,19 @@ class CapitalStackOptimizer:
         logger.info(f"Starting scipy optimization for {scenario_name}")
         start_time = time.time()
 
-        # Clear cache for fresh optimization
-        self.evaluation_cache = {}
+        cache_stats = self.evaluation_cache.stats()
 
         # Extract instruments from template
         instruments = [c.instrument for c in template_stack.components]
-        instrument_types = [type(inst).__name__.lower().replace("debt", "_debt") for inst in instruments]
-
-        # Map instrument instances to their types
-        instrument_map = {
-            self._normalize_instrument_type(type(inst).__name__): inst
-            for inst in instruments
-        }
-
-        # Get initial amounts
-        initial_amounts = np.array([float(inst.amount) for inst in instruments])
         budget_float = float(project_budget)
 
-        # Normalize to percentages (more numerically stable)
-        initial_percentages = initial_amounts / budget_float * 100.0
+        # Get initial amounts, normalized to percentages (more numerically stable)
+        if initial_percentages is None:
+            initial_amounts = np.array([float(inst.amount) for inst in instruments])
+            initial_percentages = initial_amounts / budget_float * 100.0
 
         # Set up bounds for each instrument
-        lower_bounds = []
-        upper_bounds = []
-
-        for inst, inst_type in zip(instruments, instrument_types):
-            min_pct, max_pct = self._get_bounds(inst_type, bounds)
-            lower_bounds.append(float(min_pct))
-            upper_bounds.append(float(max_pct))
-
+        lower_bounds, upper_bounds = self._get_bound_arrays(instruments, bounds)
         bounds_obj = Bounds(lb=lower_bounds, ub=upper_bounds)
 
         # Constraint: allocations must sum to 100%
@@ -147,60 +267,35 @@ class CapitalStackOptimizer:
 
         # Define objective function
         weights = objective_weights or self._get_default_weights()
+        objective_function = self._make_objective(
+            instruments,
+            project_budget,
+            weights,
+            scenario_name,
+            waterfall_structure
+        )
 
-        def objective_function(percentages):
-            """Objective to minimize (negative score to maximize)."""
-            # Convert percentages back to amounts
-            amounts = percentages / 100.0 * budget_float
-
-            # Build capital stack
-            stack = self._build_stack_from_amounts(
-                instruments,
-                amounts,
+        constraints = [equality_constraint]
+        search_objective = objective_function
+        if analytic_gradient:
+            search_objective = self._make_smooth_objective(
+                template_stack,
                 project_budget,
-                scenario_name
+                weights,
+                scenario_name,
+                waterfall_structure
             )
-
-            # Validate hard constraints (fast)
-            validation = self.constraint_manager.validate(stack)
-            if not validation.is_valid:
-                return 1_000_000.0  # Penalty for constraint violation
-
-            # Validate structural integrity
-            if not self._validate_structure(stack):
-                return 1_000_000.0  # Penalty for structural violation
-
-            # Evaluate using ScenarioEvaluator (accurate but expensive)
-            cache_key = self._get_cache_key(amounts)
-            if cache_key in self.evaluation_cache:
-                evaluation = self.evaluation_cache[cache_key]
-            else:
-                # Use evaluator with waterfall if provided
-                if waterfall_structure:
-                    evaluation = self.evaluator.evaluate(
-                        stack,
-                        waterfall_structure,
-                        run_monte_carlo=False  # Skip Monte Carlo in optimization
-                    )
-                else:
-                    # Fallback: use simple scoring without waterfall
-                    evaluation = self._simple_evaluation(stack)
-
-                self.evaluation_cache[cache_key] = evaluation
-
-            # Calculate weighted score
-            score = self._calculate_weighted_score(evaluation, weights)
-
-            # Return negative (minimize negative = maximize positive)
-            return -float(score)
+            constraints.extend(self._structural_constraints(instruments))
 
         # Run optimization
         result = minimize(
-            objective_function,
+            search_objective,
             x0=initial_percentages,
             method='SLSQP',
+            jac=analytic_gradient,
             bounds=bounds_obj,
-            constraints=[equality_constraint],
+            constraints=constraints,
+            callback=callback,
             options={
                 'maxiter': 100,
                 'ftol': 1e-6,
@@ -208,11 +303,12 @@ class CapitalStackOptimizer:
             }
         )
 
-        solve_time = time.time() - start_time
-
         # Extract solution
         if result.success:
             optimal_percentages = result.x
+            objective_value = objective_function(optimal_percentages) if analytic_gradient else result.fun
+            solve_time = time.time() - start_time
+            end_cache_stats = self.evaluation_cache.stats()
             optimal_amounts = optimal_percentages / 100.0 * budget_float
 
             # Build optimal capital stack
@@ -229,18 +325,25 @@ class CapitalStackOptimizer:
                 for inst, pct in zip(instruments, optimal_percentages)
             }
 
+            metadata = {
+                "num_iterations": result.nit,
+                "num_evaluations": result.nfev,
+                "cache_hits": end_cache_stats["hits"] - cache_stats["hits"],
+                "cache_misses": end_cache_stats["misses"] - cache_stats["misses"],
+                "gradient": "analytic" if analytic_gradient else "finite_difference",
+                "method": "SLSQP"
+            }
+            if analytic_gradient:
+                metadata["num_gradient_evaluations"] = result.njev
+                metadata["smooth_objective_value"] = float(-result.fun)
+
             optimization_result = OptimizationResult(
-                objective_value=Decimal(str(-result.fun)),  # Negative back to positive
+                objective_value=Decimal(str(-objective_value)),  # Negative back to positive
                 capital_stack=optimal_stack,
                 solver_status="SUCCESS",
                 solve_time_seconds=solve_time,
                 allocations=allocations,
-                metadata={
-                    "num_iterations": result.nit,
-                    "num_evaluations": result.nfev,
-                    "cache_hits": len(self.evaluation_cache),
-                    "method": "SLSQP"
-                }
+                metadata=metadata
             )
 
             logger.info(f"Optimization SUCCESS in {solve_time:.2f}s ({result.nfev} evaluations)")
@@ -258,13 +361,28 @@ class CapitalStackOptimizer:
         bounds: Optional[Dict[str, Tuple[Decimal, Decimal]]] = None,
         scenario_name: str = "optimized_scenario",
         waterfall_structure: Optional[Any] = None,
-        num_starts: int = 3
+        num_starts: int = 3,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        start_spread: float = START_SPREAD,
+        basin_radius: float = BASIN_RADIUS,
+        analytic_gradient: bool = False
     ) -> OptimizationResult:
         """
-        Optimize with convergence validation from multiple random starts.
+        Optimize with convergence validation from multiple starts.
+
+        Runs optimization from the template allocation and from Sobol points
+        on the bounded allocation simplex within start_spread of it, to avoid
+        local optima and ensure robust convergence. Start points that satisfy
+        the hard and structural constraints are preferred. Each finished start
+        records its optimum as a known basin; a start whose iterate enters a
+        known basin (within basin_radius) is abandoned, since it would only
+        reproduce that optimum. Starts ending on the constraint penalty count
+        as failed.
 
-        Runs optimization from multiple initial points to avoid local optima
-        and ensure robust convergence.
+        Starts run concurrently when workers > 1. Which starts get abandoned
+        then depends on finishing order, but every basin found keeps its
+        completed start.
 
         Args:
             template_stack: Starting capital stack
@@ -273,46 +391,55 @@ class CapitalStackOptimizer:
             bounds: Optional bounds per instrument
             scenario_name: Scenario name
             waterfall_structure: WaterfallStructure for evaluation
-            num_starts: Number of random starts (default 3)
+            num_starts: Number of starts including the template (default 3)
+            seed: Sobol scrambling seed for the start points (None for random)
+            workers: Worker processes (None or 1 runs in-process)
+            start_spread: Start region half-width around the template
+                allocation (percentage points)
+            basin_radius: Known-basin distance in percentage points (0 disables
+                the early cutoff)
+            analytic_gradient: Search the smooth score with exact gradients
+                (see optimize())
 
         Returns:
-            Best OptimizationResult across all starts
-        """
-        logger.info(f"Running optimization with {num_starts} random starts for convergence")
+            Best OptimizationResult across all completed starts
 
-        results = []
+        Raises:
+            ValueError: If every start fails
+        """
+        logger.info(f"Running optimization with {num_starts} starts for convergence (workers={workers or 1})")
 
-        # First run: from template
-        try:
-            result = self.optimize(
-                template_stack,
+        # Start points: template, then Sobol points around it
+        instruments = [c.instrument for c in template_stack.components]
+        template_percentages = np.array([float(inst.amount) for inst in instruments]) / float(project_budget) * 100.0
+        starts = [template_percentages]
+        if num_starts > 1:
+            starts.extend(self._start_points(
+                instruments,
+                template_percentages,
                 project_budget,
-                objective_weights,
                 bounds,
-                f"{scenario_name}_start_0",
-                waterfall_structure
-            )
-            results.append(result)
-        except Exception as e:
-            logger.warning(f"Start 0 (template) failed: {e}")
-
-        # Additional runs: from random perturbations
-        for i in range(1, num_starts):
-            try:
-                # Create perturbed starting point
-                perturbed_stack = self._perturb_stack(template_stack, perturbation=0.15)
-
-                result = self.optimize(
-                    perturbed_stack,
-                    project_budget,
-                    objective_weights,
-                    bounds,
-                    f"{scenario_name}_start_{i}",
-                    waterfall_structure
-                )
-                results.append(result)
-            except Exception as e:
-                logger.warning(f"Start {i} failed: {e}")
+                num_starts - 1,
+                start_spread,
+                seed
+            ))
+
+        problem = {
+            "template_stack": template_stack,
+            "project_budget": project_budget,
+            "objective_weights": objective_weights,
+            "bounds": bounds,
+            "scenario_name": scenario_name,
+            "waterfall_structure": waterfall_structure,
+            "analytic_gradient": analytic_gradient,
+            "basin_radius": basin_radius,
+        }
+
+        outcomes = self._run_starts(starts, problem, workers)
+
+        results = [result for status, result in outcomes if status == "completed"]
+        abandoned = sum(1 for status, _ in outcomes if status == "abandoned")
+        failed = sum(1 for status, _ in outcomes if status == "failed")
 
         if not results:
             raise ValueError("All optimization starts failed")
@@ -324,6 +451,8 @@ class CapitalStackOptimizer:
         scores = [r.objective_value for r in results]
         best_result.metadata.update({
             "num_starts": len(results),
+            "abandoned_starts": abandoned,
+            "failed_starts": failed,
             "convergence_scores": [float(s) for s in scores],
             "convergence_std": float(np.std([float(s) for s in scores])),
             "convergence_range": float(max(scores) - min(scores))
@@ -332,10 +461,577 @@ class CapitalStackOptimizer:
         # Update scenario name
         best_result.capital_stack.stack_name = scenario_name
 
-        logger.info(f"Convergence validation: {len(results)} successful starts, best score: {best_result.objective_value:.2f}")
+        logger.info(
+            f"Convergence validation: {len(results)} completed starts ({abandoned} abandoned, "
+            f"{failed} failed), best score: {best_result.objective_value:.2f}"
+        )
 
         return best_result
 
+    def _start_points(
+        self,
+        instruments: List[Any],
+        template_percentages: np.ndarray,
+        project_budget: Decimal,
+        bounds: Optional[Dict[str, Tuple[Decimal, Decimal]]],
+        num_points: int,
+        start_spread: float,
+        seed: Optional[int]
+    ) -> List[np.ndarray]:
+        """
+        Seeded start allocations around the template.
+
+        Draws START_CANDIDATES_PER_START Sobol candidates per start within
+        start_spread of the template (and within bounds) and keeps the first
+        that pass the hard and structural constraints, topping up with
+        rejected candidates if too few pass.
+
+        Args:
+            instruments: Template instrument instances
+            template_percentages: Template allocation
+            project_budget: Total project budget
+            bounds: Optional bounds per instrument
+            num_points: Start allocations to return
+            start_spread: Start region half-width (percentage points)
+            seed: Sobol scrambling seed
+
+        Returns:
+            num_points allocations (percentages)
+        """
+        lower_list, upper_list = self._get_bound_arrays(instruments, bounds)
+        upper_bounds = np.array(upper_list)
+        region_lower = np.minimum(np.maximum(np.array(lower_list), template_percentages - start_spread), upper_bounds)
+        region_upper = np.maximum(np.minimum(upper_bounds, template_percentages + start_spread), region_lower)
+
+        candidates = self._sample_allocations(
+            num_points * START_CANDIDATES_PER_START,
+            region_lower,
+            region_upper,
+            seed
+        )
+
+        feasible, rejected = [], []
+        for candidate in candidates:
+            stack = self._build_stack_from_amounts(
+                instruments,
+                candidate / 100.0 * float(project_budget),
+                project_budget,
+                "start_candidate"
+            )
+            if self.constraint_manager.validate(stack).is_valid and self._validate_structure(stack):
+                feasible.append(candidate)
+                if len(feasible) == num_points:
+                    break
+            else:
+                rejected.append(candidate)
+
+        return (feasible + rejected)[:num_points]
+
+    def _run_starts(
+        self,
+        starts: List[np.ndarray],
+        problem: Dict[str, Any],
+        workers: Optional[int]
+    ) -> List[Tuple[str, Optional[OptimizationResult]]]:
+        """
+        Run every start, optionally in parallel.
+
+        Worker processes are forked so they inherit this optimizer as is
+        (constraint validators are often closures and cannot be pickled).
+        Without fork support the starts run in-process.
+
+        Args:
+            starts: Starting allocation per start
+            problem: Keyword arguments shared by every start (see _run_start)
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            (status, result) per start, in start order
+        """
+        if workers and workers > 1 and len(starts) > 1:
+            if "fork" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("fork")
+                with context.Manager() as manager:
+                    basins = manager.list()
+                    with ProcessPoolExecutor(
+                        max_workers=min(workers, len(starts)),
+                        mp_context=context,
+                        initializer=_init_start_worker,
+                        initargs=(self, problem, basins)
+                    ) as pool:
+                        return list(pool.map(_run_start_in_worker, range(len(starts)), starts))
+
+            logger.warning("Process fork unavailable; running optimization starts in-process")
+
+        basins: List[List[float]] = []
+        return [self._run_start(i, start, problem, basins) for i, start in enumerate(starts)]
+
+    def _run_start(
+        self,
+        index: int,
+        start: np.ndarray,
+        problem: Dict[str, Any],
+        basins: Any
+    ) -> Tuple[str, Optional[OptimizationResult]]:
+        """
+        Optimize from one start, abandoning it inside a known basin.
+
+        Args:
+            index: Start number (names the scenario)
+            start: Starting allocation (percentages)
+            problem: optimize() keyword arguments plus basin_radius
+            basins: Shared list of finished starts' optima; this start's
+                optimum is appended on completion
+
+        Returns:
+            ("completed", result), ("abandoned", None) or ("failed", None)
+        """
+        kwargs = dict(problem)
+        basin_radius = kwargs.pop("basin_radius")
+        kwargs["scenario_name"] = f"{kwargs['scenario_name']}_start_{index}"
+        last_iterate = [start]
+
+        def abandon_in_known_basin(xk: np.ndarray) -> None:
+            """SLSQP callback: stop once the iterate reaches a known optimum."""
+            last_iterate[0] = np.array(xk)
+            for optimum in list(basins):
+                if np.max(np.abs(xk - np.array(optimum))) < basin_radius:
+                    raise _StartAbandonedError()
+
+        try:
+            result = self.optimize(
+                initial_percentages=start,
+                callback=abandon_in_known_basin,
+                **kwargs
+            )
+        except _StartAbandonedError:
+            logger.info(f"Start {index} abandoned: converging to a known basin")
+            return "abandoned", None
+        except Exception as e:
+            logger.warning(f"Start {index} failed: {e}")
+            return "failed", None
+
+        if result.objective_value <= Decimal(str(-CONSTRAINT_PENALTY)):
+            logger.warning(f"Start {index} failed: stuck at an allocation violating constraints")
+            return "failed", None
+
+        basins.append([float(x) for x in last_iterate[0]])
+        return "completed", result
+
+    def optimize_surrogate(
+        self,
+        template_stack: CapitalStack,
+        project_budget: Decimal,
+        objective_weights: Optional[Dict[str, Decimal]] = None,
+        bounds: Optional[Dict[str, Tuple[Decimal, Decimal]]] = None,
+        scenario_name: str = "optimized_scenario",
+        waterfall_structure: Optional[Any] = None,
+        initial_samples: Optional[int] = None,
+        refine_evaluations: int = SURROGATE_REFINE_EVALUATIONS,
+        seed: Optional[int] = None
+    ) -> OptimizationResult:
+        """
+        Optimize on an RBF response surface fitted to a few true evaluations.
+
+        Evaluates the template allocation plus Sobol-spread allocations over
+        the bounded simplex, fits a thin-plate spline RBF surrogate of the
+        objective, then repeatedly optimizes the surrogate inside a trust
+        region around the best allocation found. Only each surrogate optimum
+        is evaluated for real; the trust region halves whenever it does not
+        improve on the best allocation.
+
+        Costs initial_samples + refine_evaluations full scenario evaluations
+        at most (40 for a 6-instrument stack with the defaults), against
+        hundreds for optimize()'s finite-difference SLSQP.
+
+        Args:
+            template_stack: Starting capital stack (provides structure)
+            project_budget: Total project budget
+            objective_weights: Weights for multi-objective optimization
+            bounds: Optional (min%, max%) bounds per instrument type
+            scenario_name: Name for resulting scenario
+            waterfall_structure: WaterfallStructure for evaluation (simple scoring if None)
+            initial_samples: True evaluations used to fit the first surrogate
+                (default SURROGATE_SAMPLES_PER_INSTRUMENT × (instruments + 1))
+            refine_evaluations: Maximum true evaluations near the optimum
+            seed: Sobol scrambling seed (None for a random design)
+
+        Returns:
+            OptimizationResult with the best truly evaluated allocation
+
+        Raises:
+            ValueError: If the stack has fewer than two instruments, too few
+                initial samples are requested, the bounds admit no allocation
+                summing to 100% or no sample satisfies the constraints
+        """
+        logger.info(f"Starting surrogate optimization for {scenario_name}")
+        start_time = time.time()
+
+        instruments = [c.instrument for c in template_stack.components]
+        num_instruments = len(instruments)
+        if num_instruments < 2:
+            raise ValueError("Surrogate optimization needs at least two instruments")
+
+        num_initial = initial_samples or SURROGATE_SAMPLES_PER_INSTRUMENT * (num_instruments + 1)
+        if num_initial < num_instruments:
+            raise ValueError(f"At least {num_instruments} initial samples are required")
+
+        lower_list, upper_list = self._get_bound_arrays(instruments, bounds)
+        lower_bounds = np.array(lower_list)
+        upper_bounds = np.array(upper_list)
+        if lower_bounds.sum() > 100.0 or upper_bounds.sum() < 100.0:
+            raise ValueError("Bounds admit no allocation summing to 100%")
+
+        weights = objective_weights or self._get_default_weights()
+        objective_function = self._make_objective(
+            instruments,
+            project_budget,
+            weights,
+            scenario_name,
+            waterfall_structure
+        )
+
+        # Initial design: template allocation plus space-filling samples
+        budget_float = float(project_budget)
+        template_percentages = self._project_to_budget(
+            np.array([float(inst.amount) for inst in instruments]) / budget_float * 100.0,
+            lower_bounds,
+            upper_bounds
+        )
+        points = [template_percentages]
+        points.extend(self._sample_allocations(num_initial - 1, lower_bounds, upper_bounds, seed))
+        values = [objective_function(p) for p in points]
+
+        if min(values) >= CONSTRAINT_PENALTY:
+            raise ValueError(f"Optimization failed: none of {num_initial} samples satisfied the constraints")
+
+        equality_constraint = LinearConstraint(np.ones((1, num_instruments)), 100.0, 100.0)
+        best = int(np.argmin(values))
+        radius = SURROGATE_INITIAL_RADIUS
+        refined = 0
+        iterations = 0
+
+        while refined < refine_evaluations and radius >= SURROGATE_MIN_RADIUS:
+            iterations += 1
+            surrogate = self._fit_surrogate(np.array(points), np.array(values))
+
+            # Optimize the surrogate inside the trust region
+            center = points[best]
+            region_lower = np.maximum(lower_bounds, center - radius)
+            region_upper = np.minimum(upper_bounds, center + radius)
+            surrogate_result = minimize(
+                lambda x: float(surrogate(x[np.newaxis, :-1] / 100.0)[0]),
+                x0=center,
+                method='SLSQP',
+                bounds=Bounds(lb=region_lower, ub=region_upper),
+                constraints=[equality_constraint],
+                options={'maxiter': 100, 'ftol': 1e-9, 'disp': False}
+            )
+            candidate = self._project_to_budget(surrogate_result.x, region_lower, region_upper)
+
+            # Surrogate points back at known allocations: zoom in
+            if np.min(np.max(np.abs(np.array(points) - candidate), axis=1)) < SURROGATE_MIN_SPACING:
+                radius /= 2.0
+                continue
+
+            value = objective_function(candidate)
+            points.append(candidate)
+            values.append(value)
+            refined += 1
+
+            if value < values[best]:
+                best = len(values) - 1
+            else:
+                radius /= 2.0
+
+        solve_time = time.time() - start_time
+
+        optimal_percentages = points[best]
+        optimal_stack = self._build_stack_from_amounts(
+            instruments,
+            optimal_percentages / 100.0 * budget_float,
+            project_budget,
+            scenario_name
+        )
+
+        allocations = {
+            self._normalize_instrument_type(type(inst).__name__): Decimal(str(pct))
+            for inst, pct in zip(instruments, optimal_percentages)
+        }
+
+        logger.info(
+            f"Surrogate optimization SUCCESS in {solve_time:.2f}s "
+            f"({len(values)} evaluations, {refined} refinements)"
+        )
+
+        return OptimizationResult(
+            objective_value=Decimal(str(-values[best])),
+            capital_stack=optimal_stack,
+            solver_status="SUCCESS",
+            solve_time_seconds=solve_time,
+            allocations=allocations,
+            metadata={
+                "num_iterations": iterations,
+                "num_evaluations": len(values),
+                "initial_samples": num_initial,
+                "refine_evaluations": refined,
+                "trust_radius": radius,
+                "method": "surrogate_rbf"
+            }
+        )
+
+    def optimize_pareto(
+        self,
+        template_stack: CapitalStack,
+        project_budget: Decimal,
+        bounds: Optional[Dict[str, Tuple[Decimal, Decimal]]] = None,
+        scenario_name: str = "pareto_scenario",
+        waterfall_structure: Optional[Any] = None,
+        population_size: int = PARETO_POPULATION_SIZE,
+        generations: int = PARETO_GENERATIONS,
+        seed: Optional[int] = None
+    ) -> ParetoOptimizationResult:
+        """
+        Find the Pareto front of equity IRR, cost of capital, dilution and risk.
+
+        Runs NSGA-II over allocations summing to 100%: binary tournament on
+        front rank and crowding distance, simulated binary crossover and
+        polynomial mutation projected back onto the bounded simplex, and
+        elitist survival of the best fronts of parents plus children.
+        Allocations violating hard or structural constraints are ranked
+        behind every feasible one.
+
+        Each generation is evaluated in one vectorized SmoothScoreModel call
+        (exact metrics, no smoothing) and its constraint violations are
+        computed from the allocation arrays, so population_size ×
+        (generations + 1) allocations cost a few hundred array operations
+        rather than as many full scenario evaluations. Capital stacks are
+        built only for the final front (and per allocation for any hard
+        constraint added beyond the constraint manager's defaults).
+
+        Args:
+            template_stack: Starting capital stack (provides structure)
+            project_budget: Total project budget
+            bounds: Optional (min%, max%) bounds per instrument type
+            scenario_name: Prefix for the front's scenario names
+            waterfall_structure: WaterfallStructure for evaluation (simple scoring if None)
+            population_size: Individuals per generation (even, at least 4)
+            generations: Generations to evolve
+            seed: Seed for the initial Sobol design and the variation operators
+
+        Returns:
+            ParetoOptimizationResult with the feasible non-dominated front
+
+        Raises:
+            ValueError: If the stack has fewer than two instruments, the
+                population size is invalid, the bounds admit no allocation
+                summing to 100% or no allocation satisfies the constraints
+        """
+        logger.info(f"Starting Pareto optimization for {scenario_name}")
+        start_time = time.time()
+
+        instruments = [c.instrument for c in template_stack.components]
+        if len(instruments) < 2:
+            raise ValueError("Pareto optimization needs at least two instruments")
+        if population_size < 4 or population_size % 2:
+            raise ValueError("population_size must be an even number of at least 4")
+
+        lower_list, upper_list = self._get_bound_arrays(instruments, bounds)
+        lower_bounds = np.array(lower_list)
+        upper_bounds = np.array(upper_list)
+        if lower_bounds.sum() > 100.0 or upper_bounds.sum() < 100.0:
+            raise ValueError("Bounds admit no allocation summing to 100%")
+
+        model = SmoothScoreModel(
+            template_stack,
+            project_budget,
+            self._get_default_weights(),
+            waterfall_structure,
+            self.evaluator.base_revenue_projection if waterfall_structure else None
+        )
+        rng = np.random.default_rng(seed)
+
+        # Initial population: template allocation plus space-filling samples
+        budget_float = float(project_budget)
+        template_percentages = self._project_to_budget(
+            np.array([float(inst.amount) for inst in instruments]) / budget_float * 100.0,
+            lower_bounds,
+            upper_bounds
+        )
+        population = np.vstack([
+            template_percentages,
+            self._sample_allocations(population_size - 1, lower_bounds, upper_bounds, seed)
+        ])
+        objectives, violations = self._pareto_objectives(population, model, instruments, project_budget)
+        order, ranks, crowding = select_survivors(objectives, violations, population_size)
+        population, objectives, violations = population[order], objectives[order], violations[order]
+
+        for _ in range(generations):
+            parents = population[tournament_select(ranks, crowding, population_size, rng)]
+            children = sbx_crossover(parents, lower_bounds, upper_bounds, rng)
+            children = polynomial_mutation(children, lower_bounds, upper_bounds, rng)
+            children = project_to_budget(children, lower_bounds, upper_bounds)
+            child_objectives, child_violations = self._pareto_objectives(
+                children, model, instruments, project_budget
+            )
+
+            merged = np.vstack([population, children])
+            merged_objectives = np.vstack([objectives, child_objectives])
+            merged_violations = np.concatenate([violations, child_violations])
+            survivors, ranks, crowding = select_survivors(merged_objectives, merged_violations, population_size)
+            population = merged[survivors]
+            objectives = merged_objectives[survivors]
+            violations = merged_violations[survivors]
+
+        front = (ranks == 0) & (violations == 0)
+        if not front.any():
+            raise ValueError(
+                f"Optimization failed: no allocation in {generations} generations satisfied the constraints"
+            )
+
+        # One solution per distinct allocation, highest equity IRR first
+        _, distinct = np.unique(
+            np.round(population[front] / PARETO_DUPLICATE_RESOLUTION), axis=0, return_index=True
+        )
+        front_indices = np.flatnonzero(front)[distinct]
+        front_indices = front_indices[np.argsort(objectives[front_indices, 0], kind="stable")]
+
+        metrics = model.metrics(population[front_indices])
+        solutions = [
+            self._pareto_solution(
+                instruments,
+                population[index],
+                {name: values[row] for name, values in metrics.items()},
+                project_budget,
+                f"{scenario_name}_{row + 1}"
+            )
+            for row, index in enumerate(front_indices)
+        ]
+
+        solve_time = time.time() - start_time
+        logger.info(
+            f"Pareto optimization SUCCESS in {solve_time:.2f}s "
+            f"({len(solutions)} non-dominated allocations)"
+        )
+
+        return ParetoOptimizationResult(
+            solutions=solutions,
+            objective_names=list(PARETO_OBJECTIVES),
+            solve_time_seconds=solve_time,
+            metadata={
+                "generations": generations,
+                "population_size": population_size,
+                "num_evaluations": population_size * (generations + 1),
+                "front_size": len(solutions),
+                "feasible_fraction": float(np.mean(violations == 0)),
+                "method": "nsga2"
+            }
+        )
+
+    def _pareto_objectives(
+        self,
+        population: np.ndarray,
+        model: SmoothScoreModel,
+        instruments: List[Any],
+        project_budget: Decimal
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Objectives to minimize and constraint violations of a population.
+
+        Args:
+            population: (m, n) percentage allocations
+            model: SmoothScoreModel of the template stack
+            instruments: Template instruments
+            project_budget: Total project budget
+
+        Returns:
+            ((m, 4) [-equity IRR, WACC, equity %, debt %], (m,) violation counts)
+        """
+        metrics = model.metrics(population)
+        # Undefined IRR (no equity, equity never recouping, or beyond the
+        # analyzer's IRR grid, where the evaluator reports none) ranks worst
+        equity_irr = np.where(np.isnan(metrics["equity_irr"]), IRR_FLOOR, metrics["equity_irr"])
+        objectives = np.column_stack([
+            -equity_irr,
+            metrics["weighted_cost_of_capital"],
+            metrics["equity_share"],
+            metrics["debt_share"]
+        ])
+
+        violations = self._constraint_violations(population, instruments, project_budget)
+
+        return objectives, violations
+
+    def _pareto_solution(
+        self,
+        instruments: List[Any],
+        percentages: np.ndarray,
+        metrics: Dict[str, float],
+        project_budget: Decimal,
+        scenario_name: str
+    ) -> ParetoSolution:
+        """
+        Build the stack, evaluation and objective values of a front member.
+
+        Args:
+            instruments: Template instruments
+            percentages: Percentage allocation
+            metrics: SmoothScoreModel metrics of the allocation
+            project_budget: Total project budget
+            scenario_name: Name for the scenario
+
+        Returns:
+            ParetoSolution
+        """
+        stack = self._build_stack_from_amounts(
+            instruments, percentages / 100.0 * float(project_budget), project_budget, scenario_name
+        )
+
+        evaluation = ScenarioEvaluation(scenario_name=scenario_name, capital_stack=stack)
+        if not np.isnan(metrics["equity_irr"]):
+            evaluation.equity_irr = Decimal(str(metrics["equity_irr"]))
+        evaluation.weighted_cost_of_capital = Decimal(str(metrics["weighted_cost_of_capital"]))
+        evaluation.tax_incentive_effective_rate = Decimal(str(metrics["tax_incentive_effective_rate"]))
+        evaluation.senior_debt_recovery_rate = Decimal(str(metrics["senior_debt_recovery_rate"]))
+        evaluation.overall_score = self._calculate_weighted_score(evaluation, self._get_default_weights())
+
+        return ParetoSolution(
+            capital_stack=stack,
+            allocations={
+                self._normalize_instrument_type(type(inst).__name__): Decimal(str(pct))
+                for inst, pct in zip(instruments, percentages)
+            },
+            objectives={
+                "equity_irr": evaluation.equity_irr if evaluation.equity_irr is not None else Decimal(str(IRR_FLOOR)),
+                "cost_of_capital": evaluation.weighted_cost_of_capital,
+                "dilution": Decimal(str(metrics["equity_share"])),
+                "risk": Decimal(str(metrics["debt_share"]))
+            },
+            evaluation=evaluation
+        )
+
+    def _fit_surrogate(self, points: np.ndarray, values: np.ndarray) -> RBFInterpolator:
+        """
+        Fit the RBF response surface of the objective.
+
+        Allocations lie on the 100% hyperplane, so the last instrument is
+        dropped to keep the linear polynomial tail well-posed. Penalized
+        allocations are clamped one objective range above the worst feasible
+        value so the surface slopes away from them without a 1,000,000 cliff.
+
+        Args:
+            points: (m, n) evaluated percentage allocations
+            values: (m,) objective values
+
+        Returns:
+            Interpolator of the objective over points[:, :-1] / 100
+        """
+        feasible = values < CONSTRAINT_PENALTY
+        worst = values[feasible].max()
+        spread = worst - values[feasible].min()
+        clamped = np.where(feasible, values, worst + max(spread, 1.0))
+        return RBFInterpolator(points[:, :-1] / 100.0, clamped, kernel="thin_plate_spline")
+
     def _validate_structure(self, stack: CapitalStack) -> bool:
         """
         Validate structural integrity of capital stack.
@@ -385,6 +1081,328 @@ class CapitalStackOptimizer:
 
         return True
 
+    def _get_bound_arrays(
+        self,
+        instruments: List[Any],
+        bounds: Optional[Dict[str, Tuple[Decimal, Decimal]]]
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Get lower and upper percentage bounds in instrument order.
+
+        Args:
+            instruments: Template instrument instances
+            bounds: Optional bounds dict
+
+        Returns:
+            (lower_bounds, upper_bounds) lists
+        """
+        instrument_types = [type(inst).__name__.lower().replace("debt", "_debt") for inst in instruments]
+
+        lower_bounds = []
+        upper_bounds = []
+        for inst_type in instrument_types:
+            min_pct, max_pct = self._get_bounds(inst_type, bounds)
+            lower_bounds.append(float(min_pct))
+            upper_bounds.append(float(max_pct))
+
+        return lower_bounds, upper_bounds
+
+    def _make_objective(
+        self,
+        instruments: List[Any],
+        project_budget: Decimal,
+        weights: Dict[str, Decimal],
+        scenario_name: str,
+        waterfall_structure: Optional[Any]
+    ) -> Callable[[np.ndarray], float]:
+        """
+        Build the objective over percentage allocations.
+
+        Args:
+            instruments: Template instrument instances
+            project_budget: Total project budget
+            weights: Objective weights
+            scenario_name: Name for evaluated stacks
+            waterfall_structure: WaterfallStructure for evaluation (simple scoring if None)
+
+        Returns:
+            Function of percentages returning the negative weighted score
+            (CONSTRAINT_PENALTY for invalid allocations)
+        """
+        budget_float = float(project_budget)
+
+        # Evaluator settings only matter to the full evaluator
+        context_key = evaluation_context_key(
+            instruments,
+            waterfall_structure,
+            self.evaluator if waterfall_structure else None
+        )
+
+        def objective_function(percentages):
+            """Objective to minimize (negative score to maximize)."""
+            # Convert percentages back to amounts
+            amounts = percentages / 100.0 * budget_float
+
+            # Build capital stack
+            stack = self._build_stack_from_amounts(
+                instruments,
+                amounts,
+                project_budget,
+                scenario_name
+            )
+
+            # Validate hard constraints (fast)
+            validation = self.constraint_manager.validate(stack)
+            if not validation.is_valid:
+                return CONSTRAINT_PENALTY
+
+            # Validate structural integrity
+            if not self._validate_structure(stack):
+                return CONSTRAINT_PENALTY
+
+            # Evaluate using ScenarioEvaluator (accurate but expensive)
+            cache_key = self._get_cache_key(amounts, context_key)
+            evaluation = self.evaluation_cache.get(cache_key)
+            if evaluation is None:
+                # Use evaluator with waterfall if provided
+                if waterfall_structure:
+                    evaluation = self.evaluator.evaluate(
+                        stack,
+                        waterfall_structure,
+                        run_monte_carlo=False  # Skip Monte Carlo in optimization
+                    )
+                else:
+                    # Fallback: use simple scoring without waterfall
+                    evaluation = self._simple_evaluation(stack)
+
+                self.evaluation_cache.put(cache_key, evaluation)
+
+            # Calculate weighted score
+            score = self._calculate_weighted_score(evaluation, weights)
+
+            # Return negative (minimize negative = maximize positive)
+            return -float(score)
+
+        return objective_function
+
+    def _make_smooth_objective(
+        self,
+        template_stack: CapitalStack,
+        project_budget: Decimal,
+        weights: Dict[str, Decimal],
+        scenario_name: str,
+        waterfall_structure: Optional[Any]
+    ) -> Callable[[np.ndarray], Tuple[float, np.ndarray]]:
+        """
+        Build the smooth objective and its gradient over percentage allocations.
+
+        Args:
+            template_stack: Template capital stack
+            project_budget: Total project budget
+            weights: Objective weights
+            scenario_name: Name for validated stacks
+            waterfall_structure: WaterfallStructure for evaluation (simple scoring if None)
+
+        Returns:
+            Function of percentages returning (negative smooth score, gradient);
+            (CONSTRAINT_PENALTY, zeros) for invalid allocations
+        """
+        instruments = [c.instrument for c in template_stack.components]
+        budget_float = float(project_budget)
+        model = SmoothScoreModel(
+            template_stack,
+            project_budget,
+            weights,
+            waterfall_structure,
+            self.evaluator.base_revenue_projection if waterfall_structure else None
+        )
+
+        def objective_function(percentages):
+            """Objective to minimize with its exact gradient."""
+            stack = self._build_stack_from_amounts(
+                instruments,
+                percentages / 100.0 * budget_float,
+                project_budget,
+                scenario_name
+            )
+            if not self.constraint_manager.validate(stack).is_valid or not self._validate_structure(stack):
+                return CONSTRAINT_PENALTY, np.zeros_like(percentages)
+
+            scores, gradients = model.evaluate(percentages)
+            return -float(scores[0]), -gradients[0]
+
+        return objective_function
+
+    def _structural_constraints(self, instruments: List[Any]) -> List[LinearConstraint]:
+        """
+        Linear forms of the structural rules in _validate_structure.
+
+        Mezzanine within senior debt and debt within 5× equity are linear in
+        the allocation, so gradient searches can follow them rather than
+        step onto the constraint penalty. Both also bind when the smaller
+        side is allocated nothing, slightly stricter than the rules. Gap
+        financing requiring senior debt is not linear and stays a penalty.
+
+        Args:
+            instruments: Template instrument instances
+
+        Returns:
+            LinearConstraints (upper bound 0) for the rules that apply
+        """
+        masks = self._instrument_masks(instruments)
+        senior, mezzanine, equity, debt = (
+            masks["senior"], masks["mezzanine"], masks["equity"], masks["debt"]
+        )
+
+        constraints = []
+        if senior.any() and mezzanine.any():
+            constraints.append(LinearConstraint(mezzanine - senior, -np.inf, 0.0))
+        if debt.any() and equity.any():
+            constraints.append(LinearConstraint(debt - 5.0 * equity, -np.inf, 0.0))
+        return constraints
+
+    def _instrument_masks(self, instruments: List[Any]) -> Dict[str, np.ndarray]:
+        """
+        Indicator vectors of the instrument groups the constraints refer to.
+
+        Args:
+            instruments: Template instrument instances
+
+        Returns:
+            Masks over instrument order: senior, mezzanine, gap, equity and
+            debt (debt-named types and gap financing, as in
+            _validate_structure), plus lender (Debt subclasses, as in the
+            default hard constraints)
+        """
+        type_names = [type(inst).__name__ for inst in instruments]
+
+        def mask(names: List[str]) -> np.ndarray:
+            return np.array([float(name in names) for name in type_names])
+
+        return {
+            "senior": mask(["SeniorDebt"]),
+            "mezzanine": mask(["MezzanineDebt"]),
+            "gap": mask(["GapFinancing"]),
+            "equity": mask(["Equity"]),
+            "debt": np.array([float("Debt" in name or name == "GapFinancing") for name in type_names]),
+            "lender": np.array([float(isinstance(inst, Debt)) for inst in instruments])
+        }
+
+    def _constraint_violations(
+        self,
+        population: np.ndarray,
+        instruments: List[Any],
+        project_budget: Decimal
+    ) -> np.ndarray:
+        """
+        Hard constraint violations plus one for a structural violation, per row.
+
+        Works on the allocation arrays: the default hard constraints and the
+        rules of _validate_structure are linear in the cent-rounded amounts
+        _build_stack_from_amounts would use. Only hard constraints added to
+        the constraint manager beyond the defaults build a stack per row.
+
+        Args:
+            population: (m, n) percentage allocations
+            instruments: Template instruments
+            project_budget: Total project budget
+
+        Returns:
+            (m,) violation counts, matching constraint_manager.validate and
+            _validate_structure on the built stacks
+        """
+        budget_float = float(project_budget)
+        amounts = np.round(population / 100.0 * budget_float, 2)
+        masks = self._instrument_masks(instruments)
+        totals = {name: amounts @ values for name, values in masks.items()}
+
+        # Default hard constraints as rows @ amounts <= limits
+        rows, limits, others = [], [], []
+        for constraint in self.constraint_manager.get_hard_constraints():
+            if constraint.constraint_id == "min_equity_15pct":
+                rows.append(-masks["equity"])
+                limits.append(-float(constraint.metadata["min_percentage"]) / 100.0 * budget_float)
+            elif constraint.constraint_id == "max_debt_ratio_75pct":
+                rows.append(masks["lender"])
+                limits.append(float(constraint.metadata["max_ratio"]) * budget_float)
+            elif constraint.constraint_id == "budget_sum_matches":
+                # Either side of the 1% tolerance
+                ones = np.ones(len(instruments))
+                rows.extend([ones, -ones])
+                limits.extend([1.01 * budget_float, -0.99 * budget_float])
+            else:
+                others.append(constraint)
+
+        violations = np.zeros(population.shape[0])
+        if rows:
+            excess = amounts @ np.array(rows).T - np.array(limits)
+            violations += (excess > PARETO_CENT_TOLERANCE).sum(axis=1)
+
+        # Zero allocations are left out of the stack, so "present" is a positive total
+        senior, mezzanine, equity, debt = (totals["senior"], totals["mezzanine"], totals["equity"], totals["debt"])
+        structural = (
+            ((totals["gap"] > 0) & (senior <= 0))
+            | ((senior > 0) & (mezzanine - senior > PARETO_CENT_TOLERANCE))
+            | ((debt > 0) & (equity > 0) & (debt - 5.0 * equity > PARETO_CENT_TOLERANCE))
+        )
+        violations += structural
+
+        if others:
+            for row, row_amounts in enumerate(amounts):
+                stack = self._build_stack_from_amounts(instruments, row_amounts, project_budget, "pareto_candidate")
+                violations[row] += sum(not constraint.validate(stack) for constraint in others)
+
+        return violations
+
+    def _sample_allocations(
+        self,
+        num_samples: int,
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray,
+        seed: Optional[int]
+    ) -> np.ndarray:
+        """
+        Spread feasible allocations over the bounded simplex.
+
+        Scrambled Sobol points fill the bounds box and are projected onto
+        the 100% budget hyperplane.
+
+        Args:
+            num_samples: Allocations to return
+            lower_bounds: Minimum percentage per instrument
+            upper_bounds: Maximum percentage per instrument
+            seed: Sobol scrambling seed
+
+        Returns:
+            (num_samples, n) array of percentages summing to 100
+        """
+        # Draw a power-of-two Sobol block (keeps its balance properties) and trim
+        sampler = qmc.Sobol(d=len(lower_bounds), scramble=True, seed=seed)
+        unit_points = sampler.random_base2(m=max(int(np.ceil(np.log2(max(num_samples, 1)))), 0))
+        points = qmc.scale(unit_points[:num_samples], lower_bounds, upper_bounds)
+        return project_to_budget(points, lower_bounds, upper_bounds)
+
+    def _project_to_budget(
+        self,
+        percentages: np.ndarray,
+        lower_bounds: np.ndarray,
+        upper_bounds: np.ndarray
+    ) -> np.ndarray:
+        """
+        Nearest allocation within bounds that sums to 100%.
+
+        Single-allocation form of nsga2.project_to_budget.
+
+        Args:
+            percentages: Allocation to project
+            lower_bounds: Minimum percentage per instrument
+            upper_bounds: Maximum percentage per instrument
+
+        Returns:
+            Projected allocation
+        """
+        return project_to_budget(percentages[np.newaxis, :], lower_bounds, upper_bounds)[0]
+
     def _get_bounds(
         self,
         instrument: str,
@@ -566,12 +1584,14 @@ class CapitalStackOptimizer:
             if amount <= 0:
                 continue  # Skip zero allocations
 
-            # Create new instrument instance with updated amount
+            # Create new instrument instance with updated amount (terms and
+            # drawdown schedule follow the template)
             inst_type = type(template_inst)
 
             if inst_type == SeniorDebt:
                 instrument = SeniorDebt(
                     amount=amount,
+                    drawdown_schedule=template_inst.drawdown_schedule,
                     interest_rate=template_inst.interest_rate,
                     term_months=template_inst.term_months,
                     origination_fee_percentage=template_inst.origination_fee_percentage
@@ -579,6 +1599,7 @@ class CapitalStackOptimizer:
             elif inst_type == MezzanineDebt:
                 instrument = MezzanineDebt(
                     amount=amount,
+                    drawdown_schedule=template_inst.drawdown_schedule,
                     interest_rate=template_inst.interest_rate,
                     term_months=template_inst.term_months,
                     equity_kicker_percentage=template_inst.equity_kicker_percentage
@@ -586,6 +1607,7 @@ class CapitalStackOptimizer:
             elif inst_type == GapFinancing:
                 instrument = GapFinancing(
                     amount=amount,
+                    drawdown_schedule=template_inst.drawdown_schedule,
                     interest_rate=template_inst.interest_rate,
                     term_months=template_inst.term_months,
                     minimum_presales_percentage=template_inst.minimum_presales_percentage
@@ -593,6 +1615,7 @@ class CapitalStackOptimizer:
             elif inst_type == PreSale:
                 instrument = PreSale(
                     amount=amount,
+                    drawdown_schedule=template_inst.drawdown_schedule,
                     territory=template_inst.territory,
                     rights_description=template_inst.rights_description,
                     mg_amount=amount,
@@ -603,6 +1626,7 @@ class CapitalStackOptimizer:
                 qualified_spend = amount / (template_inst.credit_rate / Decimal("100"))
                 instrument = TaxIncentive(
                     amount=amount,
+                    drawdown_schedule=template_inst.drawdown_schedule,
                     jurisdiction=template_inst.jurisdiction,
                     qualified_spend=qualified_spend,
                     credit_rate=template_inst.credit_rate,
@@ -611,6 +1635,7 @@ class CapitalStackOptimizer:
             elif inst_type == Equity:
                 instrument = Equity(
                     amount=amount,
+                    drawdown_schedule=template_inst.drawdown_schedule,
                     ownership_percentage=template_inst.ownership_percentage,
                     premium_percentage=template_inst.premium_percentage
                 )
@@ -626,100 +1651,6 @@ class CapitalStackOptimizer:
             components=components
         )
 
-    def _perturb_stack(self, stack: CapitalStack, perturbation: float = 0.1) -> CapitalStack:
-        """
-        Create perturbed version of capital stack for convergence testing.
-
-        Args:
-            stack: Original stack
-            perturbation: Perturbation magnitude (0.1 = 10%)
-
-        Returns:
-            Perturbed CapitalStack
-        """
-        import random
-
-        perturbed_components = []
-
-        # Get amounts and perturb them
-        amounts = [c.instrument.amount for c in stack.components]
-        total = sum(amounts)
-
-        # Add random noise (FIX: Convert float to Decimal for type compatibility)
-        perturbed_amounts = []
-        for amount in amounts:
-            pct = float(amount / total)  # Convert to float for uniform operations
-            noise = random.uniform(-perturbation, perturbation)
-            new_pct = max(0.01, pct + noise)  # Ensure positive
-            perturbed_amounts.append(new_pct)
-
-        # Renormalize to sum to 1.0
-        total_pct = sum(perturbed_amounts)
-        perturbed_amounts = [p / total_pct for p in perturbed_amounts]
-
-        # Build perturbed stack
-        for position, (component, pct) in enumerate(zip(stack.components, perturbed_amounts), start=1):
-            new_amount = Decimal(str(round(float(total) * pct, 2)))
-
-            # Create new instrument with perturbed amount
-            inst_type = type(component.instrument)
-            template_inst = component.instrument
-
-            if inst_type == SeniorDebt:
-                instrument = SeniorDebt(
-                    amount=new_amount,
-                    interest_rate=template_inst.interest_rate,
-                    term_months=template_inst.term_months,
-                    origination_fee_percentage=template_inst.origination_fee_percentage
-                )
-            elif inst_type == MezzanineDebt:
-                instrument = MezzanineDebt(
-                    amount=new_amount,
-                    interest_rate=template_inst.interest_rate,
-                    term_months=template_inst.term_months,
-                    equity_kicker_percentage=template_inst.equity_kicker_percentage
-                )
-            elif inst_type == GapFinancing:
-                instrument = GapFinancing(
-                    amount=new_amount,
-                    interest_rate=template_inst.interest_rate,
-                    term_months=template_inst.term_months,
-                    minimum_presales_percentage=template_inst.minimum_presales_percentage
-                )
-            elif inst_type == PreSale:
-                instrument = PreSale(
-                    amount=new_amount,
-                    territory=template_inst.territory,
-                    rights_description=template_inst.rights_description,
-                    mg_amount=new_amount,
-                    payment_on_delivery=template_inst.payment_on_delivery
-                )
-            elif inst_type == TaxIncentive:
-                qualified_spend = new_amount / (template_inst.credit_rate / Decimal("100"))
-                instrument = TaxIncentive(
-                    amount=new_amount,
-                    jurisdiction=template_inst.jurisdiction,
-                    qualified_spend=qualified_spend,
-                    credit_rate=template_inst.credit_rate,
-                    timing_months=template_inst.timing_months
-                )
-            elif inst_type == Equity:
-                instrument = Equity(
-                    amount=new_amount,
-                    ownership_percentage=template_inst.ownership_percentage,
-                    premium_percentage=template_inst.premium_percentage
-                )
-            else:
-                continue
-
-            perturbed_components.append(CapitalComponent(instrument=instrument, position=position))
-
-        return CapitalStack(
-            stack_name=f"{stack.stack_name}_perturbed",
-            project_budget=stack.project_budget,
-            components=perturbed_components
-        )
-
     def _normalize_instrument_type(self, type_name: str) -> str:
         """Normalize instrument type name for consistency."""
         # Convert SeniorDebt -> senior_debt, etc.
@@ -730,7 +1661,29 @@ class CapitalStackOptimizer:
             normalized += char.lower()
         return normalized
 
-    def _get_cache_key(self, amounts: np.ndarray) -> str:
-        """Create cache key from amounts (rounded for stability)."""
-        rounded = tuple(round(float(a), -3) for a in amounts)  # Round to nearest 1000
-        return str(rounded)
+    def _get_cache_key(self, amounts: np.ndarray, context_key: str) -> str:
+        """Create cache key from evaluation context and amounts (bucketed for stability)."""
+        return evaluation_cache_key(context_key, amounts)
+
+
+class _StartAbandonedError(Exception):
+    """Raised from the SLSQP callback when a start enters a known basin."""
+
+
+# Optimizer, shared problem and basin list of a multi-start worker process
+_start_worker_state: Dict[str, Any] = {}
+
+
+def _init_start_worker(optimizer: CapitalStackOptimizer, problem: Dict[str, Any], basins: Any) -> None:
+    """Process pool initializer: keep the (forked) optimizer and shared state."""
+    _start_worker_state.update(optimizer=optimizer, problem=problem, basins=basins)
+
+
+def _run_start_in_worker(index: int, start: np.ndarray) -> Tuple[str, Optional[OptimizationResult]]:
+    """Run one start in a worker process."""
+    return _start_worker_state["optimizer"]._run_start(
+        index,
+        start,
+        _start_worker_state["problem"],
+        _start_worker_state["basins"]
+    )
@@ -0,0 +1,468 @@
+"""
+Evaluation Cache
+
+Shared cache of ScenarioEvaluations for CapitalStackOptimizer.
+
+A full evaluation (revenue projection, waterfall, IRR solve) depends on the
+capital stack's instrument types and terms, the amount allocated to each,
+the waterfall structure and the evaluator's class and settings. Keys are
+SHA-256 digests of a canonical encoding of exactly those inputs, with
+amounts bucketed to AMOUNT_BUCKET, so repeat optimizations of the same
+project hit across optimizer instances and API requests while a changed
+waterfall, instrument term or evaluator setting never does. Objective
+weights are applied after evaluation and are not part of the key.
+
+Entries live in a thread-safe in-process LRU with an optional TTL. With a
+Redis client the cache also reads through to and writes to Redis (same
+TTL), so API workers share evaluations; Redis failures degrade to the
+in-process cache. Redis values are tagged JSON (encode_value /
+decode_value), never pickles, so whoever can write to Redis can at worst
+plant wrong numbers, not run code in the API process.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import fields
+from decimal import Decimal
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from models import financial_instruments
+from models.capital_stack import CapitalComponent, CapitalStack
+from .scenario_evaluator import ScenarioEvaluation
+
+logger = logging.getLogger(__name__)
+
+# Default number of evaluations kept before the least recently used is evicted
+DEFAULT_CACHE_SIZE = 4096
+
+# Default entry lifetime (seconds, None = no expiry)
+DEFAULT_TTL_SECONDS = 3600
+
+# Amounts are bucketed to the nearest multiple of this (USD)
+AMOUNT_BUCKET = 1000
+
+# Prefix of Redis keys written by the cache
+REDIS_KEY_PREFIX = "scenario_eval:"
+
+# Instrument fields left out of the stack structure: identifiers, and the
+# amount and fields the optimizer derives from it
+INSTRUMENT_KEY_EXCLUDE = {"instrument_id", "amount", "mg_amount", "qualified_spend"}
+
+# Waterfall fields that identify rather than define the structure
+WATERFALL_KEY_EXCLUDE = {"waterfall_id", "project_id", "waterfall_name"}
+
+# Instrument classes a Redis value may name (anything else is rejected)
+INSTRUMENT_TYPES = {
+    name: cls for name, cls in vars(financial_instruments).items()
+    if isinstance(cls, type) and issubclass(cls, financial_instruments.FinancialInstrument)
+}
+
+
+def _digest(payload: Any) -> str:
+    """SHA-256 hex digest of a canonical JSON encoding"""
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def evaluator_config(evaluator: Any) -> Dict[str, Any]:
+    """
+    Class and settings of an evaluator, for cache keys.
+
+    Every public attribute counts, so a setting added to ScenarioEvaluator
+    later joins the key without changes here.
+
+    Args:
+        evaluator: ScenarioEvaluator (or compatible) instance
+
+    Returns:
+        Dict of the evaluator's qualified class name and public attributes
+    """
+    return {
+        "class": f"{type(evaluator).__module__}.{type(evaluator).__qualname__}",
+        "settings": {
+            name: value for name, value in vars(evaluator).items()
+            if not name.startswith("_")
+        },
+    }
+
+
+def evaluation_context_key(
+    instruments: Sequence[Any],
+    waterfall_structure: Optional[Any] = None,
+    evaluator: Optional[Any] = None
+) -> str:
+    """
+    Canonical hash of everything an evaluation depends on except amounts.
+
+    Args:
+        instruments: Template instruments in stack order
+        waterfall_structure: WaterfallStructure (None for simple scoring)
+        evaluator: Evaluator producing the evaluations (None for simple scoring)
+
+    Returns:
+        Hex digest identifying the evaluation context
+    """
+    payload = {
+        "instruments": [
+            [type(inst).__name__, inst.model_dump(mode="json", exclude=INSTRUMENT_KEY_EXCLUDE)]
+            for inst in instruments
+        ],
+        "waterfall": (
+            None if waterfall_structure is None
+            else waterfall_structure.model_dump(mode="json", exclude=WATERFALL_KEY_EXCLUDE)
+        ),
+        "evaluator": None if evaluator is None else evaluator_config(evaluator),
+    }
+    return _digest(payload)
+
+
+def evaluation_cache_key(
+    context_key: str,
+    amounts: Sequence[float],
+    bucket: float = AMOUNT_BUCKET
+) -> str:
+    """
+    Cache key of one allocation in an evaluation context.
+
+    Args:
+        context_key: Digest from evaluation_context_key()
+        amounts: Amount per instrument (USD, stack order)
+        bucket: Amount bucket width (USD)
+
+    Returns:
+        Hex digest identifying the evaluation
+    """
+    buckets = [int(round(float(amount) / bucket)) for amount in amounts]
+    return _digest([context_key, bucket, buckets])
+
+
+def _encode(value: Any) -> Any:
+    """Tagged JSON-compatible form of a cached value"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("Only string-keyed dicts can be encoded")
+        return {"__dict__": {key: _encode(item) for key, item in value.items()}}
+    if isinstance(value, ScenarioEvaluation):
+        return {"__evaluation__": {f.name: _encode(getattr(value, f.name)) for f in fields(value)}}
+    if isinstance(value, CapitalStack):
+        stack = value.model_dump(mode="json", exclude={"components"})
+        stack["components"] = [_encode(component) for component in value.components]
+        return {"__capital_stack__": stack}
+    if isinstance(value, CapitalComponent):
+        component = value.model_dump(mode="json", exclude={"instrument"})
+        component["instrument"] = _encode(value.instrument)
+        return {"__component__": component}
+    if type(value).__name__ in INSTRUMENT_TYPES and isinstance(value, financial_instruments.FinancialInstrument):
+        return {"__instrument__": type(value).__name__, "data": value.model_dump(mode="json")}
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild a value from its tagged JSON-compatible form"""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__decimal__" in value:
+        return Decimal(value["__decimal__"])
+    if "__dict__" in value:
+        return {key: _decode(item) for key, item in value["__dict__"].items()}
+    if "__evaluation__" in value:
+        return ScenarioEvaluation(**{key: _decode(item) for key, item in value["__evaluation__"].items()})
+    if "__capital_stack__" in value:
+        stack = dict(value["__capital_stack__"])
+        stack["components"] = [_decode(component) for component in stack["components"]]
+        return CapitalStack.model_validate(stack)
+    if "__component__" in value:
+        component = dict(value["__component__"])
+        component["instrument"] = _decode(component["instrument"])
+        return CapitalComponent.model_validate(component)
+    if "__instrument__" in value:
+        instrument_type = INSTRUMENT_TYPES.get(value["__instrument__"])
+        if instrument_type is None:
+            raise ValueError(f"Unknown instrument type {value['__instrument__']!r}")
+        return instrument_type.model_validate(value["data"])
+    raise ValueError("Untagged object in cached value")
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Serialize a cached value for Redis as tagged JSON.
+
+    Handles JSON scalars, Decimals, lists, string-keyed dicts,
+    ScenarioEvaluations, CapitalStacks and financial instruments.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        UTF-8 JSON bytes
+
+    Raises:
+        TypeError: If the value holds an unsupported type
+    """
+    return json.dumps(_encode(value), separators=(",", ":")).encode("utf-8")
+
+
+def decode_value(payload: bytes) -> Any:
+    """
+    Rebuild a value serialized by encode_value().
+
+    Only the tagged types above are constructed, so a forged payload cannot
+    run code.
+
+    Args:
+        payload: UTF-8 JSON bytes
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the payload is malformed or names an unknown type
+    """
+    return _decode(json.loads(payload))
+
+
+class EvaluationCache:
+    """
+    Thread-safe LRU/TTL cache of evaluations by key, optionally backed by Redis.
+
+    A maxsize of 0 disables the in-process cache (with Redis, every lookup
+    goes to Redis).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        redis_client: Optional[Any] = None
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of evaluations kept in process
+            ttl_seconds: Entry lifetime (None for no expiry)
+            redis_client: redis.Redis-compatible client (get/set), or None
+
+        Raises:
+            ValueError: If maxsize is negative or ttl_seconds not positive
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.redis_client = redis_client
+        self.hits = 0
+        self.misses = 0
+        self.redis_hits = 0
+        self.redis_errors = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def backend(self) -> str:
+        """'redis' when backed by Redis, else 'memory'"""
+        return "memory" if self.redis_client is None else "redis"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an evaluation, marking it most recently used.
+
+        Falls back to Redis on an in-process miss and keeps what it finds.
+
+        Args:
+            key: Cache key (see evaluation_cache_key)
+
+        Returns:
+            Cached evaluation, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, evaluation = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return evaluation
+
+                del self._entries[key]
+                self.expirations += 1
+
+        evaluation = self._redis_get(key)
+
+        with self._lock:
+            if evaluation is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.redis_hits += 1
+            self._store(key, evaluation)
+            return evaluation
+
+    def put(self, key: str, evaluation: Any) -> None:
+        """
+        Store an evaluation, evicting the least recently used beyond maxsize.
+
+        Args:
+            key: Cache key
+            evaluation: Evaluation to store
+        """
+        with self._lock:
+            self._store(key, evaluation)
+        self._redis_set(key, evaluation)
+
+    def clear(self) -> None:
+        """Drop every in-process entry and reset the counters (Redis is untouched)"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.redis_hits = 0
+            self.redis_errors = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters for monitoring.
+
+        Returns:
+            Dict with backend, hits, misses, redis_hits, redis_errors,
+            evictions, expirations, size, maxsize, ttl_seconds and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend,
+                "hits": self.hits,
+                "misses": self.misses,
+                "redis_hits": self.redis_hits,
+                "redis_errors": self.redis_errors,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _store(self, key: str, evaluation: Any) -> None:
+        """Insert into the in-process LRU (caller holds the lock)"""
+        if self.maxsize == 0:
+            return
+
+        expires_at = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        self._entries[key] = (expires_at, evaluation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _redis_get(self, key: str) -> Optional[Any]:
+        """Read through to Redis (None without Redis, on a miss or an error)"""
+        if self.redis_client is None:
+            return None
+        try:
+            payload = self.redis_client.get(REDIS_KEY_PREFIX + key)
+            return None if payload is None else decode_value(payload)
+        except Exception as e:
+            self._redis_failed("read", e)
+            return None
+
+    def _redis_set(self, key: str, evaluation: Any) -> None:
+        """Write through to Redis (no-op without Redis; errors are logged)"""
+        if self.redis_client is None:
+            return
+        try:
+            ttl = None if self.ttl_seconds is None else max(int(self.ttl_seconds), 1)
+            self.redis_client.set(REDIS_KEY_PREFIX + key, encode_value(evaluation), ex=ttl)
+        except Exception as e:
+            self._redis_failed("write", e)
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        """Count and log a Redis failure"""
+        with self._lock:
+            self.redis_errors += 1
+        logger.warning(f"Evaluation cache Redis {operation} failed: {error}")
+
+
+def connect_redis(redis_url: str) -> Optional[Any]:
+    """
+    Connect to Redis if the redis package and server are available.
+
+    Args:
+        redis_url: Redis URL (e.g. settings.REDIS_URL)
+
+    Returns:
+        Connected client, or None (logged) if unavailable
+    """
+    try:
+        import redis
+    except ImportError:
+        logger.warning("redis package not installed; evaluation cache stays in process")
+        return None
+
+    try:
+        client = redis.Redis.from_url(redis_url, socket_connect_timeout=2, socket_timeout=2)
+        client.ping()
+    except Exception as e:
+        logger.warning(f"Redis unavailable at {redis_url} ({e}); evaluation cache stays in process")
+        return None
+
+    logger.info(f"Evaluation cache backed by Redis at {redis_url}")
+    return client
+
+
+# Shared by every CapitalStackOptimizer that isn't given its own cache
+_shared_cache = EvaluationCache()
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """Process-wide evaluation cache used by default"""
+    return _shared_cache
+
+
+def configure_evaluation_cache(
+    maxsize: int = DEFAULT_CACHE_SIZE,
+    ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+    redis_url: Optional[str] = None
+) -> EvaluationCache:
+    """
+    Replace the process-wide evaluation cache.
+
+    Optimizers created afterwards use the new cache.
+
+    Args:
+        maxsize: Maximum number of evaluations kept in process
+        ttl_seconds: Entry lifetime (None for no expiry)
+        redis_url: Redis URL to share evaluations through (in process only
+            if None or unreachable)
+
+    Returns:
+        The new shared cache
+    """
+    global _shared_cache
+    redis_client = connect_redis(redis_url) if redis_url else None
+    _shared_cache = EvaluationCache(maxsize=maxsize, ttl_seconds=ttl_seconds, redis_client=redis_client)
+    return _shared_cache
@@ -0,0 +1,255 @@
+"""
+NSGA-II Operators
+
+Vectorized building blocks of the NSGA-II evolutionary multi-objective
+search (Deb et al., 2002) over bounded allocations summing to 100%:
+constrained non-dominated sorting, crowding distance, binary tournament
+selection, simulated binary crossover, polynomial mutation and projection
+back onto the bounded simplex. Every operator works on a whole population
+array at once.
+
+Objectives are minimized; negate any to be maximized.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Simulated binary crossover: probability per pair and distribution index
+CROSSOVER_PROBABILITY = 0.9
+CROSSOVER_ETA = 15.0
+
+# Polynomial mutation distribution index (rate defaults to 1 / variables)
+MUTATION_ETA = 20.0
+
+# Bisection steps when projecting onto the budget hyperplane
+PROJECTION_ITERATIONS = 60
+
+
+def non_dominated_sort(objectives: np.ndarray, violations: np.ndarray) -> np.ndarray:
+    """
+    Front rank of each individual under constrained domination.
+
+    A feasible individual (violation 0) dominates any infeasible one, an
+    infeasible one dominates another with a larger violation, and feasible
+    individuals dominate by Pareto order (no worse on every objective,
+    better on one).
+
+    Args:
+        objectives: (m, k) objective values to minimize
+        violations: (m,) constraint violation (0 when feasible)
+
+    Returns:
+        (m,) ranks, 0 for the non-dominated front
+    """
+    no_worse = np.all(objectives[:, np.newaxis, :] <= objectives[np.newaxis, :, :], axis=2)
+    better = np.any(objectives[:, np.newaxis, :] < objectives[np.newaxis, :, :], axis=2)
+    feasible = violations == 0
+
+    # dominates[i, j]: individual i dominates individual j
+    dominates = np.where(
+        feasible[:, np.newaxis] & feasible[np.newaxis, :],
+        no_worse & better,
+        violations[:, np.newaxis] < violations[np.newaxis, :]
+    )
+
+    ranks = np.full(objectives.shape[0], -1)
+    remaining = np.ones(objectives.shape[0], dtype=bool)
+    rank = 0
+    while remaining.any():
+        dominated = dominates[remaining][:, remaining].any(axis=0)
+        front = np.flatnonzero(remaining)[~dominated]
+        ranks[front] = rank
+        remaining[front] = False
+        rank += 1
+
+    return ranks
+
+
+def crowding_distance(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """
+    Crowding distance of each individual within its front.
+
+    Args:
+        objectives: (m, k) objective values
+        ranks: (m,) front ranks
+
+    Returns:
+        (m,) crowding distances (inf at each front's objective extremes)
+    """
+    distance = np.zeros(objectives.shape[0])
+
+    for rank in np.unique(ranks):
+        members = np.flatnonzero(ranks == rank)
+        if members.size <= 2:
+            distance[members] = np.inf
+            continue
+
+        values = objectives[members]
+        order = np.argsort(values, axis=0, kind="stable")
+        sorted_values = np.take_along_axis(values, order, axis=0)
+        span = sorted_values[-1] - sorted_values[0]
+
+        gaps = np.zeros_like(values)
+        gaps[1:-1] = (sorted_values[2:] - sorted_values[:-2]) / np.where(span > 0, span, 1.0)
+        gaps[0] = gaps[-1] = np.inf
+
+        member_distance = np.zeros(members.size)
+        for column in range(values.shape[1]):
+            member_distance[order[:, column]] += gaps[:, column]
+        distance[members] = member_distance
+
+    return distance
+
+
+def tournament_select(
+    ranks: np.ndarray,
+    crowding: np.ndarray,
+    num_parents: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Binary tournament: lower rank wins, then larger crowding distance.
+
+    Args:
+        ranks: (m,) front ranks
+        crowding: (m,) crowding distances
+        num_parents: Parents to select
+        rng: Random generator
+
+    Returns:
+        (num_parents,) selected indices
+    """
+    first = rng.integers(0, ranks.size, num_parents)
+    second = rng.integers(0, ranks.size, num_parents)
+    first_wins = (ranks[first] < ranks[second]) | (
+        (ranks[first] == ranks[second]) & (crowding[first] >= crowding[second])
+    )
+    return np.where(first_wins, first, second)
+
+
+def sbx_crossover(
+    parents: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    rng: np.random.Generator,
+    probability: float = CROSSOVER_PROBABILITY,
+    eta: float = CROSSOVER_ETA
+) -> np.ndarray:
+    """
+    Simulated binary crossover of consecutive parent pairs.
+
+    Args:
+        parents: (m, n) parents, m even
+        lower_bounds: Minimum per variable
+        upper_bounds: Maximum per variable
+        rng: Random generator
+        probability: Probability each pair is crossed
+        eta: Distribution index (larger keeps children nearer parents)
+
+    Returns:
+        (m, n) children within bounds
+    """
+    first, second = parents[0::2], parents[1::2]
+
+    u = rng.random(first.shape)
+    beta = np.where(
+        u <= 0.5,
+        (2.0 * u) ** (1.0 / (eta + 1.0)),
+        (1.0 / (2.0 * (1.0 - u))) ** (1.0 / (eta + 1.0))
+    )
+    crossed = rng.random(first.shape[0]) < probability
+    beta = np.where(crossed[:, np.newaxis], beta, 1.0)
+
+    child_1 = 0.5 * ((1.0 + beta) * first + (1.0 - beta) * second)
+    child_2 = 0.5 * ((1.0 - beta) * first + (1.0 + beta) * second)
+
+    children = np.empty_like(parents)
+    children[0::2] = child_1
+    children[1::2] = child_2
+    return np.clip(children, lower_bounds, upper_bounds)
+
+
+def polynomial_mutation(
+    population: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    rng: np.random.Generator,
+    rate: Optional[float] = None,
+    eta: float = MUTATION_ETA
+) -> np.ndarray:
+    """
+    Polynomial mutation of each variable with probability rate.
+
+    Args:
+        population: (m, n) individuals
+        lower_bounds: Minimum per variable
+        upper_bounds: Maximum per variable
+        rng: Random generator
+        rate: Mutation probability per variable (1 / n if None)
+        eta: Distribution index
+
+    Returns:
+        (m, n) mutated individuals within bounds
+    """
+    rate = 1.0 / population.shape[1] if rate is None else rate
+    span = upper_bounds - lower_bounds
+
+    u = rng.random(population.shape)
+    delta = np.where(
+        u < 0.5,
+        (2.0 * u) ** (1.0 / (eta + 1.0)) - 1.0,
+        1.0 - (2.0 * (1.0 - u)) ** (1.0 / (eta + 1.0))
+    )
+    mutated = rng.random(population.shape) < rate
+
+    return np.clip(population + np.where(mutated, delta * span, 0.0), lower_bounds, upper_bounds)
+
+
+def project_to_budget(
+    population: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray
+) -> np.ndarray:
+    """
+    Nearest allocation within bounds summing to 100%, for every row.
+
+    Bisects each row's shift t so that clip(row - t, lower, upper) sums to
+    100 (Euclidean projection onto the bounded simplex).
+
+    Args:
+        population: (m, n) allocations (percentages)
+        lower_bounds: Minimum percentage per instrument
+        upper_bounds: Maximum percentage per instrument
+
+    Returns:
+        (m, n) projected allocations
+    """
+    low = np.min(population - upper_bounds, axis=1)
+    high = np.max(population - lower_bounds, axis=1)
+    for _ in range(PROJECTION_ITERATIONS):
+        shift = (low + high) / 2.0
+        over = np.clip(population - shift[:, np.newaxis], lower_bounds, upper_bounds).sum(axis=1) > 100.0
+        low = np.where(over, shift, low)
+        high = np.where(over, high, shift)
+
+    shift = (low + high) / 2.0
+    return np.clip(population - shift[:, np.newaxis], lower_bounds, upper_bounds)
+
+
+def select_survivors(objectives: np.ndarray, violations: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    NSGA-II environmental selection: best fronts, then least crowded.
+
+    Args:
+        objectives: (m, k) objective values to minimize
+        violations: (m,) constraint violations
+        size: Survivors to keep
+
+    Returns:
+        (survivor indices, their ranks, their crowding distances)
+    """
+    ranks = non_dominated_sort(objectives, violations)
+    crowding = crowding_distance(objectives, ranks)
+    order = np.lexsort((-crowding, ranks))[:size]
+    return order, ranks[order], crowding[order]
@@ -198,7 +198,7 @@ class ScenarioEvaluator:
 
         # 3. Execute waterfall (Engine 2)
         executor = WaterfallExecutor(waterfall_structure)
-        waterfall_result = executor.execute_over_time(rev_projection)
+        waterfall_result = executor.execute_summary(rev_projection)
 
         # 4. Analyze stakeholders (Engine 2)
         analyzer = StakeholderAnalyzer(capital_stack, discount_rate=self.discount_rate)
@@ -313,7 +313,10 @@ class ScenarioEvaluator:
                 base_projection
             )
 
-            mc_result = simulator.simulate(revenue_dist, num_simulations=num_simulations, seed=42)
+            # Latin Hypercube reaches i.i.d. precision with far fewer runs
+            mc_result = simulator.simulate(
+                revenue_dist, num_simulations=num_simulations, seed=42, sampling="lhs"
+            )
 
             # Extract equity metrics
             equity_stakeholder_ids = [
@@ -0,0 +1,358 @@
+"""
+Smooth Score Model
+
+Differentiable stand-in for CapitalStackOptimizer's weighted score.
+
+Over the optimizer's search space only the instrument amounts change, and
+every metric the weighted score reads is a closed-form function of them:
+
+- Tax incentive rate and cost of capital are linear in the allocation.
+- The waterfall structure and revenue projection are fixed, so each
+  stakeholder's receipts are too. Senior debt recovery is receipts over
+  principal, and equity IRR is the root of PV(receipts, r) =
+  PV(investment, r), with the investment drawn on the instrument's
+  drawdown schedule (all in quarter 0 without one). Its derivative follows
+  from the implicit function theorem.
+- Recoupment probability comes from Monte Carlo, which the optimizer skips,
+  so it contributes nothing.
+
+The receipts are taken once from the template stack's stakeholder
+analysis. Two things differ from a plain smooth function of the allocation:
+
+- The score's min(x / target, 1) caps are replaced by a softplus smooth
+  minimum (at most ln 2 / SMOOTH_MIN_SHARPNESS below the cap, i.e. 0.7% of
+  a component).
+- Equity IRR is only defined between IRR_FLOOR and IRR_CEILING, the ends
+  of StakeholderAnalyzer's IRR bracket grid. Beyond them the analyzer
+  reports no IRR and the evaluator scores the component 0, so the model
+  does too. The score is discontinuous there (small equity tranches
+  against large fixed receipts), and gradients only describe it locally.
+
+Scores and exact gradients are computed for whole batches of allocations
+in vectorized NumPy.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from scipy.special import expit
+
+from models.capital_stack import CapitalStack
+from models.financial_instruments import Debt, Equity, PreSale, TaxIncentive
+from engines.waterfall_executor import RevenueProjector, StakeholderAnalyzer, WaterfallExecutor
+from engines.waterfall_executor.stakeholder_analyzer import IRR_BRACKET_GRID
+
+logger = logging.getLogger(__name__)
+
+# Sharpness of the smooth min(x, 1) replacing the score caps
+SMOOTH_MIN_SHARPNESS = 100.0
+
+# Equity IRR: Newton iterations and convergence tolerance (log-rate units)
+IRR_MAX_ITERATIONS = 200
+IRR_TOLERANCE = 1e-10
+
+# Equity IRR outside these is treated as undefined (the ends of the
+# evaluator's IRR bracket grid)
+IRR_FLOOR = float(IRR_BRACKET_GRID[0])
+IRR_CEILING = float(IRR_BRACKET_GRID[-1])
+
+
+def smooth_min_one(values: np.ndarray, sharpness: float = SMOOTH_MIN_SHARPNESS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Smooth min(values, 1) and its derivative.
+
+    Args:
+        values: Input array
+        sharpness: Higher is closer to the hard minimum
+
+    Returns:
+        (smooth minimum, derivative) arrays
+    """
+    z = sharpness * (1.0 - values)
+    return 1.0 - np.logaddexp(0.0, z) / sharpness, expit(z)
+
+
+class SmoothScoreModel:
+    """
+    Weighted score of allocations with analytic gradients.
+
+    Mirrors CapitalStackOptimizer._calculate_weighted_score applied to
+    ScenarioEvaluator.evaluate (waterfall given, Monte Carlo off) or to the
+    optimizer's simple evaluation (no waterfall).
+    """
+
+    def __init__(
+        self,
+        template_stack: CapitalStack,
+        project_budget: Decimal,
+        weights: Dict[str, Decimal],
+        waterfall_structure: Optional[Any] = None,
+        revenue_projection: Optional[Decimal] = None,
+        sharpness: float = SMOOTH_MIN_SHARPNESS
+    ):
+        """
+        Initialize model, running the template's waterfall once if given.
+
+        Args:
+            template_stack: Stack whose instruments are allocated (stack order)
+            project_budget: Total project budget
+            weights: Objective weights
+            waterfall_structure: WaterfallStructure (simple scoring if None)
+            revenue_projection: Total ultimate revenue (required with a waterfall)
+            sharpness: Smooth minimum sharpness
+
+        Raises:
+            ValueError: If a waterfall is given without a revenue projection
+        """
+        instruments = [c.instrument for c in template_stack.components]
+        self.budget = float(project_budget)
+        self.weights = {name: float(weight) for name, weight in weights.items()}
+        self.sharpness = sharpness
+        self.with_waterfall = waterfall_structure is not None
+
+        self.tax_mask = np.array([float(isinstance(inst, TaxIncentive)) for inst in instruments])
+        self.debt_mask = np.array([float(isinstance(inst, Debt)) for inst in instruments])
+        self.cost_rates = np.array([self._cost_rate(inst) for inst in instruments])
+
+        if not self.with_waterfall:
+            self.equity_mask = np.array([float(isinstance(inst, Equity)) for inst in instruments])
+            return
+
+        if revenue_projection is None:
+            raise ValueError("revenue_projection is required with a waterfall structure")
+
+        self.equity_mask = np.array(
+            [float("equity" in inst.instrument_type.value) for inst in instruments]
+        )
+        self.senior_mask = np.array(
+            [float("senior" in inst.instrument_type.value) for inst in instruments]
+        )
+
+        # Receipts do not depend on amounts: take them from the template
+        projection = RevenueProjector().project(
+            total_ultimate_revenue=revenue_projection,
+            release_strategy="wide_theatrical",
+            project_name=template_stack.stack_name
+        )
+        summary = WaterfallExecutor(waterfall_structure).execute_summary(projection)
+        analysis = StakeholderAnalyzer(template_stack).analyze(summary)
+
+        # Receipt and drawdown quarters share one time grid
+        drawdowns = [inst.drawdown_schedule or {0: Decimal("100")} for inst in instruments]
+        quarters = sorted(
+            {q for s in analysis.stakeholders for q in s.quarterly_receipts}.union(*drawdowns)
+        )
+        self.years = np.array(quarters, dtype=float) / 4.0
+        self.receipts = np.array([
+            [float(s.quarterly_receipts.get(q, Decimal("0"))) for q in quarters]
+            for s in analysis.stakeholders
+        ]).reshape(len(instruments), len(quarters))
+        self.drawdown_shares = np.array([
+            [float(schedule.get(q, Decimal("0"))) / 100.0 for q in quarters]
+            for schedule in drawdowns
+        ]).reshape(len(instruments), len(quarters))
+        self.senior_receipts = float(self.receipts.sum(axis=1) @ self.senior_mask)
+
+    def evaluate(self, percentages: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score allocations.
+
+        Args:
+            percentages: (n,) or (m, n) percentage allocations in stack order
+
+        Returns:
+            (scores (m,), gradients (m, n)) with respect to the percentages
+        """
+        pct = np.atleast_2d(np.asarray(percentages, dtype=float))
+        scores = np.zeros(pct.shape[0])
+        gradients = np.zeros_like(pct)
+
+        def add(name: str, value: np.ndarray, slope: np.ndarray, target: float, active: np.ndarray) -> None:
+            """Add weight × 100 × smooth_min(value / target, 1) where active."""
+            if name not in self.weights:
+                return
+            capped, dcapped = smooth_min_one(value / target, self.sharpness)
+            scale = self.weights[name] * 100.0 * active
+            scores[:] += scale * capped
+            gradients[:] += (scale * dcapped / target)[:, np.newaxis] * slope
+
+        # Equity IRR (the evaluator skips None and exactly zero)
+        irr, dirr = self._equity_irr(pct)
+        has_irr = ~np.isnan(irr) & (irr != 0.0)
+        add("equity_irr", np.where(has_irr, irr, 0.0), np.where(has_irr[:, np.newaxis], dirr, 0.0), 20.0, has_irr)
+
+        # Tax incentive effective rate (% of budget)
+        tax_rate = pct @ self.tax_mask
+        add("tax_incentives", tax_rate, np.broadcast_to(self.tax_mask, pct.shape), 20.0, np.ones_like(tax_rate))
+
+        # Cost of capital: 12% / WACC when WACC is positive
+        wacc = pct @ self.cost_rates / 100.0
+        positive = wacc > 0
+        safe_wacc = np.where(positive, wacc, 1.0)
+        add(
+            "cost_of_capital",
+            np.where(positive, 12.0 / safe_wacc, 0.0),
+            -(12.0 / safe_wacc ** 2)[:, np.newaxis] * self.cost_rates[np.newaxis, :] / 100.0,
+            1.0,
+            positive.astype(float)
+        )
+
+        # Senior debt recovery (% of principal)
+        if self.with_waterfall:
+            principal = pct @ self.senior_mask * self.budget / 100.0
+            funded = principal > 0
+            safe_principal = np.where(funded, principal, 1.0)
+            add(
+                "debt_recovery",
+                np.where(funded, self.senior_receipts / safe_principal * 100.0, 0.0),
+                -(self.senior_receipts * self.budget / safe_principal ** 2)[:, np.newaxis] * self.senior_mask,
+                100.0,
+                funded.astype(float)
+            )
+
+        return scores, gradients
+
+    def metrics(self, percentages: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Evaluation metrics of allocations (exact, no smoothing).
+
+        Args:
+            percentages: (n,) or (m, n) percentage allocations in stack order
+
+        Returns:
+            Dict of (m,) arrays: equity_irr (NaN where undefined),
+            tax_incentive_effective_rate, weighted_cost_of_capital,
+            senior_debt_recovery_rate, and equity_share and debt_share
+            (% of budget)
+        """
+        pct = np.atleast_2d(np.asarray(percentages, dtype=float))
+        irr, _ = self._equity_irr(pct)
+
+        recovery = np.zeros(pct.shape[0])
+        if self.with_waterfall:
+            principal = pct @ self.senior_mask * self.budget / 100.0
+            funded = principal > 0
+            recovery = np.where(funded, self.senior_receipts / np.where(funded, principal, 1.0) * 100.0, 0.0)
+
+        return {
+            "equity_irr": irr,
+            "tax_incentive_effective_rate": pct @ self.tax_mask,
+            "weighted_cost_of_capital": pct @ self.cost_rates / 100.0,
+            "senior_debt_recovery_rate": recovery,
+            "equity_share": pct @ self.equity_mask,
+            "debt_share": pct @ self.debt_mask,
+        }
+
+    def _equity_irr(self, pct: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Equity IRR and its gradient.
+
+        Returns:
+            (irr (m,), d irr / d percentage (m, n)); NaN IRR where undefined
+        """
+        if not self.with_waterfall:
+            # Simple evaluation: 15 + (50 - equity %) / 5 when equity is held
+            equity_pct = pct @ self.equity_mask
+            held = equity_pct > 0
+            irr = np.where(held, 15.0 + (50.0 - equity_pct) / 5.0, np.nan)
+            dirr = np.where(held[:, np.newaxis], -self.equity_mask / 5.0, 0.0)
+            return irr, dirr
+
+        # Average over funded equity stakeholders with a defined IRR
+        total = np.zeros(pct.shape[0])
+        dtotal = np.zeros_like(pct)
+        counted = np.zeros(pct.shape[0])
+        for index in np.flatnonzero(self.equity_mask):
+            amounts = pct[:, index] * self.budget / 100.0
+            irr, dirr_damount = self._solve_irr(amounts, self.receipts[index], self.drawdown_shares[index])
+            defined = ~np.isnan(irr) & (amounts > 0)
+            total += np.where(defined, irr, 0.0)
+            dtotal[:, index] += np.where(defined, dirr_damount * self.budget / 100.0, 0.0)
+            counted += defined
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            irr = np.where(counted > 0, total / counted, np.nan)
+            dirr = np.where((counted > 0)[:, np.newaxis], dtotal / counted[:, np.newaxis], 0.0)
+        return irr, dirr
+
+    def _solve_irr(
+        self,
+        amounts: np.ndarray,
+        receipts: np.ndarray,
+        drawdown_shares: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        IRR of investments drawn on a fixed schedule against fixed receipts.
+
+        With s = ln(1 + r), the NPV f(s) = PV(receipts, s) - amount × PV(shares, s)
+        changes sign once between the IRR bounds for a defined IRR. Newton's
+        method is kept inside that bracket, bisecting whenever a step would
+        leave it.
+
+        Args:
+            amounts: (m,) investments
+            receipts: Receipts per period (self.years)
+            drawdown_shares: Share of the investment drawn per period
+                (None draws it all in quarter 0)
+
+        Returns:
+            (irr (m,), d irr / d amount (m,)); NaN where no IRR in
+            [IRR_FLOOR, IRR_CEILING]
+        """
+        if drawdown_shares is None:
+            drawdown_shares = (self.years == 0).astype(float)
+
+        def present_values(s: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            """NPV, its derivative in s, and the present value of the drawdown shares."""
+            discount = np.exp(-s[:, np.newaxis] * self.years[np.newaxis, :])
+            timed = discount * self.years[np.newaxis, :]
+            drawn = discount @ drawdown_shares
+            npv = discount @ receipts - amounts * drawn
+            dnpv = -(timed @ receipts) + amounts * (timed @ drawdown_shares)
+            return npv, dnpv, drawn
+
+        floor = np.full(amounts.shape, np.log1p(IRR_FLOOR))
+        ceiling = np.full(amounts.shape, np.log1p(IRR_CEILING))
+        # Like the analyzer: some period must be a net outflow, another a net inflow
+        net = receipts[np.newaxis, :] - amounts[:, np.newaxis] * drawdown_shares[np.newaxis, :]
+        defined = (
+            (net < 0).any(axis=1)
+            & (net > 0).any(axis=1)
+            & (present_values(floor)[0] > 0)
+            & (present_values(ceiling)[0] <= 0)
+        )
+
+        low, high = floor, ceiling
+        s = np.clip(np.zeros(amounts.shape), low, high)
+        with np.errstate(all="ignore"):
+            for _ in range(IRR_MAX_ITERATIONS):
+                npv, dnpv, _ = present_values(s)
+                low = np.where(npv > 0, s, low)
+                high = np.where(npv > 0, high, s)
+                newton = s - npv / dnpv
+                inside = np.isfinite(newton) & (newton > low) & (newton < high)
+                updated = np.where(defined, np.where(inside, newton, (low + high) / 2.0), s)
+                converged = np.all(np.abs(updated - s) < IRR_TOLERANCE)
+                s = updated
+                if converged:
+                    break
+
+            _, dnpv, drawn = present_values(s)
+            growth = np.exp(s)
+            irr = np.where(defined, growth - 1.0, np.nan)
+            dirr = np.where(defined, growth * drawn / dnpv, 0.0)
+        return irr, dirr
+
+    def _cost_rate(self, instrument: Any) -> float:
+        """Cost of capital rate (%) the evaluation assigns to an instrument."""
+        if isinstance(instrument, Debt):
+            return float(instrument.interest_rate)
+        if isinstance(instrument, Equity):
+            return 20.0
+        if isinstance(instrument, TaxIncentive):
+            return -5.0
+        if isinstance(instrument, PreSale) and self.with_waterfall:
+            return float(instrument.sales_agent_commission)
+        return 0.0
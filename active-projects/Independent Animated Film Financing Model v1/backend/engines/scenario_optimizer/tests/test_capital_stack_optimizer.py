@@ -10,15 +10,24 @@ import numpy as np
 
 from engines.scenario_optimizer import (
     CapitalStackOptimizer,
+    ConstraintCategory,
     ConstraintManager,
+    ConstraintType,
+    EvaluationCache,
+    HardConstraint,
     ScenarioEvaluator,
     ScenarioGenerator,
     OptimizationObjective,
-    OptimizationResult
+    OptimizationResult,
+    ParetoOptimizationResult,
+    TradeOffAnalyzer
 )
+from engines.scenario_optimizer.smooth_score import IRR_FLOOR
+from engines.waterfall_executor import RevenueProjector, StakeholderAnalyzer, WaterfallExecutor
+from engines.waterfall_executor.stakeholder_analyzer import IRR_BRACKET_GRID
 from models.capital_stack import CapitalStack, CapitalComponent
 from models.financial_instruments import (
-    Equity, SeniorDebt, MezzanineDebt, GapFinancing, TaxIncentive
+    Equity, SeniorDebt, MezzanineDebt, GapFinancing, TaxIncentive, PreSale
 )
 from models.waterfall import (
     WaterfallStructure, WaterfallNode, RecoupmentPriority, PayeeType, RecoupmentBasis
@@ -32,13 +41,43 @@ def create_minimal_capital_stack(name: str = "test", budget: Decimal = Decimal("
     return CapitalStack(stack_name=name, project_budget=budget, components=[component])
 
 
+def create_sample_waterfall() -> WaterfallStructure:
+    """Create a senior debt and equity waterfall for evaluation."""
+    return WaterfallStructure(
+        waterfall_id="test_waterfall",
+        project_id="test_project",
+        waterfall_name="Test Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                node_id="node_1",
+                priority=RecoupmentPriority.SENIOR_DEBT_PRINCIPAL,
+                description="Senior Debt",
+                payee_type=PayeeType.LENDER,
+                payee_name="Senior Lender",
+                recoupment_basis=RecoupmentBasis.GROSS_RECEIPTS,
+                fixed_amount=Decimal("10000000")
+            ),
+            WaterfallNode(
+                node_id="node_2",
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                description="Equity",
+                payee_type=PayeeType.INVESTOR,
+                payee_name="Equity Investors",
+                recoupment_basis=RecoupmentBasis.REMAINING_POOL,
+                fixed_amount=Decimal("10000000")
+            )
+        ]
+    )
+
+
 class TestCapitalStackOptimizer:
     """Test CapitalStackOptimizer class."""
 
     @pytest.fixture
     def optimizer(self):
-        """Create optimizer instance."""
-        return CapitalStackOptimizer()
+        """Create optimizer instance with its own evaluation cache."""
+        return CapitalStackOptimizer(evaluation_cache=EvaluationCache())
 
     @pytest.fixture
     def constraint_manager(self):
@@ -90,32 +129,7 @@ class TestCapitalStackOptimizer:
     @pytest.fixture
     def sample_waterfall(self):
         """Create sample waterfall for evaluation."""
-        return WaterfallStructure(
-            waterfall_id="test_waterfall",
-            project_id="test_project",
-            waterfall_name="Test Waterfall",
-            default_distribution_fee_rate=Decimal("30.0"),
-            nodes=[
-                WaterfallNode(
-                    node_id="node_1",
-                    priority=RecoupmentPriority.SENIOR_DEBT_PRINCIPAL,
-                    description="Senior Debt",
-                    payee_type=PayeeType.LENDER,
-                    payee_name="Senior Lender",
-                    recoupment_basis=RecoupmentBasis.GROSS_RECEIPTS,
-                    fixed_amount=Decimal("10000000")
-                ),
-                WaterfallNode(
-                    node_id="node_2",
-                    priority=RecoupmentPriority.EQUITY_RECOUPMENT,
-                    description="Equity",
-                    payee_type=PayeeType.INVESTOR,
-                    payee_name="Equity Investors",
-                    recoupment_basis=RecoupmentBasis.REMAINING_POOL,
-                    fixed_amount=Decimal("10000000")
-                )
-            ]
-        )
+        return create_sample_waterfall()
 
     # Initialization Tests
 
@@ -123,7 +137,7 @@ class TestCapitalStackOptimizer:
         """Test optimizer initialization."""
         assert optimizer.constraint_manager is not None
         assert optimizer.evaluator is not None
-        assert isinstance(optimizer.evaluation_cache, dict)
+        assert isinstance(optimizer.evaluation_cache, EvaluationCache)
 
     def test_initialization_with_custom_managers(self, constraint_manager, evaluator):
         """Test initialization with custom managers."""
@@ -287,6 +301,57 @@ class TestCapitalStackOptimizer:
         assert "convergence_range" in result.metadata
         assert result.metadata["num_starts"] >= 1
 
+    def test_convergence_seed_reproducible(self, optimizer, template_stack):
+        """Test seeded starts give identical runs."""
+        project_budget = Decimal("30000000")
+
+        first = optimizer.optimize_with_convergence(template_stack, project_budget, num_starts=4, seed=11)
+        second = optimizer.optimize_with_convergence(template_stack, project_budget, num_starts=4, seed=11)
+
+        assert first.metadata["convergence_scores"] == second.metadata["convergence_scores"]
+        assert first.allocations == second.allocations
+
+    def test_start_points_around_template(self, optimizer, template_stack):
+        """Test start points sum to 100% within the spread and pass constraints."""
+        project_budget = Decimal("30000000")
+        instruments = [c.instrument for c in template_stack.components]
+        template = np.array([float(inst.amount) for inst in instruments]) / float(project_budget) * 100.0
+
+        starts = optimizer._start_points(instruments, template, project_budget, None, 5, 15.0, seed=2)
+
+        assert len(starts) == 5
+        for start in starts:
+            assert start.sum() == pytest.approx(100.0)
+            assert np.all(np.abs(start - template) <= 15.0 + 1e-9)
+            stack = optimizer._build_stack_from_amounts(instruments, start / 100.0 * 30000000.0, project_budget, "s")
+            assert optimizer.constraint_manager.validate(stack).is_valid
+
+    def test_known_basin_abandons_starts(self, optimizer, template_stack):
+        """Test starts entering a finished start's basin are abandoned."""
+        project_budget = Decimal("30000000")
+
+        result = optimizer.optimize_with_convergence(
+            template_stack, project_budget, num_starts=4, seed=5, basin_radius=100.0
+        )
+
+        assert result.metadata["num_starts"] == 1
+        assert result.metadata["abandoned_starts"] == 3
+
+    def test_parallel_starts_match_in_process(self, optimizer, template_stack):
+        """Test the process pool completes the same starts without the cutoff."""
+        project_budget = Decimal("30000000")
+
+        in_process = optimizer.optimize_with_convergence(
+            template_stack, project_budget, num_starts=4, seed=5, basin_radius=0.0
+        )
+        parallel = optimizer.optimize_with_convergence(
+            template_stack, project_budget, num_starts=4, seed=5, basin_radius=0.0, workers=2
+        )
+
+        assert in_process.metadata["abandoned_starts"] == 0
+        assert parallel.metadata["convergence_scores"] == in_process.metadata["convergence_scores"]
+        assert parallel.allocations == in_process.allocations
+
     # Structural Validation Tests
 
     def test_structural_validation_gap_requires_senior(self, optimizer):
@@ -469,15 +534,213 @@ class TestCapitalStackOptimizer:
         assert result.solve_time_seconds > 0
         assert result.solve_time_seconds < 60  # Should be reasonably fast
 
+    # Analytic Gradient Tests
+
+    def test_analytic_gradient_mode(self, optimizer, template_stack):
+        """Test the analytic gradient search reports the true score at its optimum."""
+        project_budget = Decimal("30000000")
+
+        result = optimizer.optimize(template_stack, project_budget, analytic_gradient=True)
+
+        assert result.metadata["gradient"] == "analytic"
+        assert result.metadata["cache_misses"] <= 1
+        assert result.metadata["smooth_objective_value"] == pytest.approx(float(result.objective_value), abs=1.0)
+        assert sum(result.allocations.values()) == pytest.approx(Decimal("100"), abs=Decimal("0.01"))
+        assert optimizer._validate_structure(result.capital_stack)
+
+    def test_analytic_gradient_with_waterfall(self, optimizer, template_stack, sample_waterfall):
+        """Test the analytic gradient search fully evaluates only the optimum."""
+        project_budget = Decimal("30000000")
+        calls = []
+        evaluate = optimizer.evaluator.evaluate
+        optimizer.evaluator.evaluate = lambda *args, **kwargs: calls.append(1) or evaluate(*args, **kwargs)
+
+        result = optimizer.optimize(
+            template_stack,
+            project_budget,
+            waterfall_structure=sample_waterfall,
+            analytic_gradient=True
+        )
+
+        assert len(calls) == 1
+        assert result.solver_status == "SUCCESS"
+        assert result.metadata["num_gradient_evaluations"] > 0
+
+    def test_structural_constraints_linear(self, optimizer):
+        """Test the linear structural rules for a stack with mezzanine debt."""
+        instruments = [
+            Equity(amount=Decimal("1000000"), ownership_percentage=Decimal("50.0")),
+            SeniorDebt(amount=Decimal("1000000"), interest_rate=Decimal("8.0"), term_months=24),
+            MezzanineDebt(amount=Decimal("1000000"), interest_rate=Decimal("12.0"), term_months=36)
+        ]
+
+        constraints = optimizer._structural_constraints(instruments)
+
+        assert len(constraints) == 2
+        assert np.allclose(constraints[0].A, [[0.0, -1.0, 1.0]])
+        assert np.allclose(constraints[1].A, [[-5.0, 1.0, 1.0]])
+
+    # Pareto Tests
+
+    def test_pareto_front_non_dominated(self, optimizer, template_stack):
+        """Test NSGA-II returns several feasible, mutually non-dominated allocations."""
+        result = optimizer.optimize_pareto(
+            template_stack=template_stack,
+            project_budget=Decimal("30000000"),
+            population_size=40,
+            generations=10,
+            seed=7
+        )
+
+        assert isinstance(result, ParetoOptimizationResult)
+        assert result.metadata["method"] == "nsga2"
+        assert result.metadata["num_evaluations"] == 40 * 11
+        assert len(result.solutions) > 1
+
+        # Minimization form of each solution's objectives
+        points = np.array([
+            [-float(s.objectives["equity_irr"]), float(s.objectives["cost_of_capital"]),
+             float(s.objectives["dilution"]), float(s.objectives["risk"])]
+            for s in result.solutions
+        ])
+        for i, point in enumerate(points):
+            dominated = np.all(points <= point, axis=1) & np.any(points < point, axis=1)
+            assert not dominated.any(), f"solution {i} is dominated"
+
+        for solution in result.solutions:
+            assert sum(solution.allocations.values()) == pytest.approx(Decimal("100"), abs=Decimal("0.01"))
+            assert optimizer.constraint_manager.validate(solution.capital_stack).is_valid
+
+        irrs = [s.objectives["equity_irr"] for s in result.solutions]
+        assert irrs == sorted(irrs, reverse=True)
+
+    def test_pareto_reproducible_with_seed(self, optimizer, template_stack):
+        """Test a seeded run returns the same front."""
+        runs = [
+            optimizer.optimize_pareto(
+                template_stack=template_stack,
+                project_budget=Decimal("30000000"),
+                population_size=20,
+                generations=5,
+                seed=11
+            )
+            for _ in range(2)
+        ]
+
+        assert [s.allocations for s in runs[0].solutions] == [s.allocations for s in runs[1].solutions]
+
+    def test_pareto_evaluations_feed_tradeoff_analyzer(self, optimizer, template_stack):
+        """Test the front's evaluations can be analyzed by TradeOffAnalyzer."""
+        result = optimizer.optimize_pareto(
+            template_stack=template_stack,
+            project_budget=Decimal("30000000"),
+            population_size=20,
+            generations=5,
+            seed=3
+        )
+        evaluations = result.evaluations()
+
+        analysis = TradeOffAnalyzer().analyze(
+            evaluations,
+            objective_pairs=[("equity_irr", "weighted_cost_of_capital")]
+        )
+
+        assert len({e.scenario_name for e in evaluations}) == len(evaluations)
+        frontier = analysis.pareto_frontiers[0]
+        assert len(frontier.frontier_points) + len(frontier.dominated_points) == len(evaluations)
+
+    def test_pareto_with_waterfall(self, optimizer, template_stack):
+        """Test waterfall-mode front IRRs match StakeholderAnalyzer (and stay on its IRR grid)."""
+        waterfall = create_sample_waterfall()
+        result = optimizer.optimize_pareto(
+            template_stack=template_stack,
+            project_budget=Decimal("30000000"),
+            waterfall_structure=waterfall,
+            population_size=40,
+            generations=15,
+            seed=5
+        )
+
+        assert len(result.solutions) > 1
+        projection = RevenueProjector().project(
+            total_ultimate_revenue=optimizer.evaluator.base_revenue_projection,
+            release_strategy="wide_theatrical"
+        )
+        waterfall_result = WaterfallExecutor(waterfall).execute_summary(projection)
+        for solution in result.solutions:
+            analysis = StakeholderAnalyzer(solution.capital_stack).analyze(waterfall_result)
+            equity_irrs = [
+                s.irr for s in analysis.stakeholders
+                if "equity" in s.stakeholder_type.lower() and s.irr is not None
+            ]
+
+            if equity_irrs:
+                assert solution.evaluation.equity_irr == pytest.approx(
+                    sum(equity_irrs) / len(equity_irrs), abs=Decimal("1e-6")
+                )
+                assert solution.objectives["equity_irr"] <= IRR_BRACKET_GRID[-1]
+            else:
+                # Undefined for the analyzer (e.g. above 1000%): undefined here, ranked worst
+                assert solution.evaluation.equity_irr is None
+                assert solution.objectives["equity_irr"] == Decimal(str(IRR_FLOOR))
+
+    @pytest.mark.parametrize("custom_constraint", [False, True])
+    def test_pareto_violations_match_stack_validation(self, optimizer, custom_constraint):
+        """Test array-based violation counts match validating the built stacks."""
+        instruments = [
+            Equity(amount=Decimal("6000000"), ownership_percentage=Decimal("30.0")),
+            SeniorDebt(amount=Decimal("6000000"), interest_rate=Decimal("8.0"), term_months=24),
+            MezzanineDebt(amount=Decimal("6000000"), interest_rate=Decimal("12.0"), term_months=36),
+            GapFinancing(amount=Decimal("6000000"), interest_rate=Decimal("10.0"), term_months=24),
+            TaxIncentive(
+                amount=Decimal("6000000"),
+                jurisdiction="Canada",
+                qualified_spend=Decimal("30000000"),
+                credit_rate=Decimal("33.3")
+            )
+        ]
+        if custom_constraint:
+            optimizer.constraint_manager.add_constraint(HardConstraint(
+                constraint_id="max_tax_incentive_20pct",
+                constraint_type=ConstraintType.HARD,
+                category=ConstraintCategory.FINANCIAL,
+                description="Maximum 20% tax incentive",
+                validator=lambda stack: all(
+                    c.instrument.amount <= Decimal("6000000")
+                    for c in stack.components if isinstance(c.instrument, TaxIncentive)
+                )
+            ))
+        budget = Decimal("30000000")
+        rng = np.random.default_rng(0)
+        population = rng.dirichlet(np.ones(len(instruments)) * 0.7, size=200) * 100.0
+        # Ties: exactly 15% equity, mezzanine equal to senior, senior allocated nothing
+        population[:3] = [[15.0, 25.0, 25.0, 15.0, 20.0], [20.0, 20.0, 20.0, 20.0, 20.0], [30.0, 0.0, 30.0, 20.0, 20.0]]
+
+        violations = optimizer._constraint_violations(population, instruments, budget)
+
+        expected = []
+        for percentages in population:
+            stack = optimizer._build_stack_from_amounts(instruments, percentages / 100.0 * 30000000.0, budget, "check")
+            validation = optimizer.constraint_manager.validate(stack)
+            expected.append(len(validation.hard_violations) + (0 if optimizer._validate_structure(stack) else 1))
+        assert violations.tolist() == expected
+        assert 0 < np.count_nonzero(violations) < len(population)
+
+    def test_pareto_rejects_odd_population(self, optimizer, template_stack):
+        """Test population sizes must be even."""
+        with pytest.raises(ValueError):
+            optimizer.optimize_pareto(
+                template_stack=template_stack,
+                project_budget=Decimal("30000000"),
+                population_size=21
+            )
+
     # Cache Tests
 
     def test_evaluation_cache_used(self, optimizer, template_stack):
         """Test that evaluation cache is used to avoid redundant evaluations."""
         project_budget = Decimal("30000000")
 
-        # Clear cache
-        optimizer.evaluation_cache = {}
-
         result = optimizer.optimize(
             template_stack=template_stack,
             project_budget=project_budget
@@ -485,20 +748,43 @@ class TestCapitalStackOptimizer:
 
         # Cache should have entries
         assert len(optimizer.evaluation_cache) > 0
+        assert result.metadata["cache_misses"] == len(optimizer.evaluation_cache)
+
+    def test_cache_shared_across_optimizers(self, template_stack):
+        """Test a repeat optimization on a new optimizer hits the shared cache."""
+        project_budget = Decimal("30000000")
+        cache = EvaluationCache()
+
+        first = CapitalStackOptimizer(evaluation_cache=cache).optimize(template_stack, project_budget)
+        second = CapitalStackOptimizer(evaluation_cache=cache).optimize(template_stack, project_budget)
+
+        assert second.metadata["cache_misses"] == 0
+        assert second.metadata["cache_hits"] > 0
+        assert second.allocations == first.allocations
+
+    def test_injected_empty_cache_kept(self):
+        """Test an injected (empty, hence falsy) cache is not replaced by the shared one."""
+        cache = EvaluationCache()
+
+        assert CapitalStackOptimizer(evaluation_cache=cache).evaluation_cache is cache
 
     def test_cache_key_generation(self, optimizer):
         """Test cache key generation."""
         amounts = np.array([10000000.0, 15000000.0, 5000000.0])
 
-        key = optimizer._get_cache_key(amounts)
+        key = optimizer._get_cache_key(amounts, "context")
 
         assert isinstance(key, str)
         assert len(key) > 0
 
         # Same amounts should produce same key
-        key2 = optimizer._get_cache_key(amounts)
+        key2 = optimizer._get_cache_key(amounts, "context")
         assert key == key2
 
+        # Amounts within one bucket share a key; other contexts do not
+        assert optimizer._get_cache_key(amounts + 200.0, "context") == key
+        assert optimizer._get_cache_key(amounts, "other") != key
+
     # Instrument Type Normalization Tests
 
     def test_normalize_instrument_type(self, optimizer):
@@ -543,32 +829,6 @@ class TestCapitalStackOptimizer:
         # Should only have 2 components (zero excluded)
         assert len(stack.components) == 2
 
-    # Perturbation Tests
-
-    def test_perturb_stack(self, optimizer, template_stack):
-        """Test stack perturbation for convergence testing."""
-        perturbed = optimizer._perturb_stack(template_stack, perturbation=0.1)
-
-        assert perturbed.project_budget == template_stack.project_budget
-        assert len(perturbed.components) == len(template_stack.components)
-
-        # Components should be different but close
-        original_amounts = [c.instrument.amount for c in template_stack.components]
-        perturbed_amounts = [c.instrument.amount for c in perturbed.components]
-
-        for orig, pert in zip(original_amounts, perturbed_amounts):
-            # Should be within 20% (10% perturbation + renormalization)
-            assert abs(pert - orig) / orig < Decimal("0.25")
-
-    def test_perturbed_stack_sums_to_budget(self, optimizer, template_stack):
-        """Test that perturbed stack still sums to budget."""
-        perturbed = optimizer._perturb_stack(template_stack, perturbation=0.15)
-
-        component_sum = sum(c.instrument.amount for c in perturbed.components)
-        tolerance = template_stack.project_budget * Decimal("0.01")
-
-        assert abs(component_sum - template_stack.project_budget) <= tolerance
-
     # Simple Evaluation Tests
 
     def test_simple_evaluation_fallback(self, optimizer, template_stack):
@@ -588,6 +848,153 @@ class TestCapitalStackOptimizer:
         assert evaluation.tax_incentive_effective_rate > Decimal("0")
 
 
+class TestSurrogateOptimization:
+    """Test CapitalStackOptimizer.optimize_surrogate()."""
+
+    @pytest.fixture
+    def optimizer(self):
+        """Create optimizer instance with its own evaluation cache."""
+        return CapitalStackOptimizer(evaluation_cache=EvaluationCache())
+
+    @pytest.fixture
+    def six_instrument_stack(self):
+        """Create a template stack using all six instrument types."""
+        instruments = [
+            Equity(
+                amount=Decimal("9000000"),
+                ownership_percentage=Decimal("40.0"),
+                premium_percentage=Decimal("20.0")
+            ),
+            SeniorDebt(
+                amount=Decimal("7500000"),
+                interest_rate=Decimal("8.0"),
+                term_months=24,
+                origination_fee_percentage=Decimal("2.0")
+            ),
+            MezzanineDebt(
+                amount=Decimal("3000000"),
+                interest_rate=Decimal("12.0"),
+                term_months=36,
+                equity_kicker_percentage=Decimal("5.0")
+            ),
+            GapFinancing(
+                amount=Decimal("3000000"),
+                interest_rate=Decimal("10.0"),
+                term_months=24,
+                minimum_presales_percentage=Decimal("0")
+            ),
+            PreSale(
+                amount=Decimal("3000000"),
+                territory="Japan",
+                rights_description="All rights",
+                mg_amount=Decimal("3000000"),
+                payment_on_delivery=Decimal("100")
+            ),
+            TaxIncentive(
+                amount=Decimal("4500000"),
+                jurisdiction="Canada",
+                qualified_spend=Decimal("13500000"),
+                credit_rate=Decimal("33.3"),
+                timing_months=18
+            ),
+        ]
+        return CapitalStack(
+            stack_name="six_instruments",
+            project_budget=Decimal("30000000"),
+            components=[
+                CapitalComponent(instrument=inst, position=i)
+                for i, inst in enumerate(instruments, start=1)
+            ]
+        )
+
+    def test_evaluation_budget(self, optimizer, six_instrument_stack):
+        """Test a 6-instrument optimization stays within a few dozen evaluations."""
+        result = optimizer.optimize_surrogate(
+            six_instrument_stack, Decimal("30000000"), seed=7
+        )
+
+        assert result.metadata["method"] == "surrogate_rbf"
+        assert result.metadata["initial_samples"] == 28
+        assert result.metadata["num_evaluations"] <= 28 + 12
+        assert result.metadata["num_evaluations"] == 28 + result.metadata["refine_evaluations"]
+
+    def test_improves_on_template(self, optimizer, six_instrument_stack):
+        """Test the result scores at least as well as the template and SLSQP."""
+        budget = Decimal("30000000")
+        weights = optimizer._get_default_weights()
+        template_score = optimizer._calculate_weighted_score(
+            optimizer._simple_evaluation(six_instrument_stack), weights
+        )
+
+        slsqp = optimizer.optimize(six_instrument_stack, budget)
+        surrogate = optimizer.optimize_surrogate(six_instrument_stack, budget, seed=7)
+
+        assert surrogate.objective_value >= template_score
+        assert surrogate.objective_value >= slsqp.objective_value
+
+    def test_result_is_feasible(self, optimizer, six_instrument_stack):
+        """Test the optimum sums to budget and satisfies all constraints."""
+        budget = Decimal("30000000")
+        bounds = {"equity": (Decimal("25.0"), Decimal("50.0"))}
+
+        result = optimizer.optimize_surrogate(six_instrument_stack, budget, bounds=bounds, seed=7)
+
+        total = sum(c.instrument.amount for c in result.capital_stack.components)
+        assert abs(total - budget) < Decimal("100")
+        assert Decimal("24.99") <= result.allocations["equity"] <= Decimal("50.01")
+        assert optimizer.constraint_manager.validate(result.capital_stack).is_valid
+        assert optimizer._validate_structure(result.capital_stack)
+
+    def test_with_waterfall(self, optimizer, six_instrument_stack):
+        """Test the full evaluator is called at most once per true evaluation."""
+        waterfall = create_sample_waterfall()
+        calls = []
+        evaluate = optimizer.evaluator.evaluate
+        optimizer.evaluator.evaluate = lambda *args, **kwargs: calls.append(1) or evaluate(*args, **kwargs)
+
+        result = optimizer.optimize_surrogate(
+            six_instrument_stack,
+            Decimal("30000000"),
+            waterfall_structure=waterfall,
+            seed=7
+        )
+
+        assert 0 < len(calls) <= result.metadata["num_evaluations"] <= 40
+
+    def test_seed_reproducible(self, optimizer, six_instrument_stack):
+        """Test the same seed gives the same allocation."""
+        budget = Decimal("30000000")
+
+        first = optimizer.optimize_surrogate(six_instrument_stack, budget, seed=3)
+        second = optimizer.optimize_surrogate(six_instrument_stack, budget, seed=3)
+
+        assert first.allocations == second.allocations
+        assert first.objective_value == second.objective_value
+
+    def test_single_instrument_rejected(self, optimizer):
+        """Test a one-instrument stack is rejected."""
+        with pytest.raises(ValueError, match="at least two instruments"):
+            optimizer.optimize_surrogate(create_minimal_capital_stack(), Decimal("30000000"))
+
+    def test_infeasible_bounds_rejected(self, optimizer, six_instrument_stack):
+        """Test bounds that cannot sum to 100% are rejected."""
+        bounds = {"equity": (Decimal("90.0"), Decimal("95.0")), "senior_debt": (Decimal("20.0"), Decimal("30.0"))}
+
+        with pytest.raises(ValueError, match="Bounds admit no allocation"):
+            optimizer.optimize_surrogate(six_instrument_stack, Decimal("30000000"), bounds=bounds)
+
+    def test_project_to_budget(self, optimizer):
+        """Test projection lands on the bounded 100% hyperplane."""
+        lower = np.array([15.0, 0.0, 0.0])
+        upper = np.array([80.0, 60.0, 35.0])
+
+        projected = optimizer._project_to_budget(np.array([90.0, 50.0, 40.0]), lower, upper)
+
+        assert projected.sum() == pytest.approx(100.0)
+        assert np.all(projected >= lower - 1e-9)
+        assert np.all(projected <= upper + 1e-9)
+
+
 class TestOptimizationResult:
     """Test OptimizationResult dataclass."""
 
@@ -0,0 +1,242 @@
+"""
+Unit Tests for EvaluationCache
+
+Tests content-hash keys, LRU/TTL eviction, Redis read/write-through and hit-rate metrics.
+"""
+
+import json
+import time
+import pytest
+from decimal import Decimal
+
+from engines.scenario_optimizer import EvaluationCache, ScenarioEvaluation, ScenarioEvaluator
+from engines.scenario_optimizer.evaluation_cache import (
+    REDIS_KEY_PREFIX,
+    decode_value,
+    encode_value,
+    evaluation_cache_key,
+    evaluation_context_key
+)
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+from models.waterfall import (
+    WaterfallStructure, WaterfallNode, RecoupmentPriority, PayeeType, RecoupmentBasis
+)
+
+
+def create_waterfall(equity_amount: Decimal = Decimal("10000000"), waterfall_id: str = "wf") -> WaterfallStructure:
+    """Create a single-tier equity waterfall."""
+    return WaterfallStructure(
+        waterfall_id=waterfall_id,
+        project_id="test_project",
+        waterfall_name="Test Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                node_id="node_1",
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                description="Equity",
+                payee_type=PayeeType.INVESTOR,
+                payee_name="Equity Investors",
+                recoupment_basis=RecoupmentBasis.REMAINING_POOL,
+                fixed_amount=equity_amount
+            )
+        ]
+    )
+
+
+def create_instruments(interest_rate: Decimal = Decimal("8.0")):
+    """Create equity and senior debt template instruments."""
+    return [
+        Equity(amount=Decimal("10000000"), ownership_percentage=Decimal("40.0")),
+        SeniorDebt(amount=Decimal("10000000"), interest_rate=interest_rate, term_months=24)
+    ]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.Redis get/set interface."""
+
+    def __init__(self, fail: bool = False):
+        self.store = {}
+        self.expiries = {}
+        self.fail = fail
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.store[key] = value
+        self.expiries[key] = ex
+
+
+class TestEvaluationKeys:
+    """Test evaluation cache keys."""
+
+    def test_context_key_stable(self):
+        """Test identical inputs hash identically (instrument IDs are ignored)."""
+        waterfall = create_waterfall()
+
+        key1 = evaluation_context_key(create_instruments(), waterfall, ScenarioEvaluator())
+        key2 = evaluation_context_key(create_instruments(), waterfall, ScenarioEvaluator())
+
+        assert key1 == key2
+
+    def test_context_key_ignores_waterfall_identity(self):
+        """Test renaming a waterfall keeps the key."""
+        key1 = evaluation_context_key(create_instruments(), create_waterfall(waterfall_id="a"))
+        key2 = evaluation_context_key(create_instruments(), create_waterfall(waterfall_id="b"))
+
+        assert key1 == key2
+
+    def test_context_key_changes_with_inputs(self):
+        """Test instrument terms, waterfall and evaluator settings all change the key."""
+        evaluator = ScenarioEvaluator()
+        base = evaluation_context_key(create_instruments(), create_waterfall(), evaluator)
+
+        assert evaluation_context_key(create_instruments(Decimal("9.0")), create_waterfall(), evaluator) != base
+        assert evaluation_context_key(create_instruments(), create_waterfall(Decimal("12000000")), evaluator) != base
+        assert evaluation_context_key(
+            create_instruments(), create_waterfall(), ScenarioEvaluator(base_revenue_projection=Decimal("80000000"))
+        ) != base
+        assert evaluation_context_key(
+            create_instruments(), create_waterfall(), ScenarioEvaluator(discount_rate=Decimal("0.10"))
+        ) != base
+        assert evaluation_context_key(create_instruments(), None, evaluator) != base
+
+    def test_context_key_covers_every_evaluator_setting(self):
+        """Test settings beyond revenue and discount rate, and evaluator subclasses, change the key."""
+        class ConservativeEvaluator(ScenarioEvaluator):
+            pass
+
+        evaluator = ScenarioEvaluator()
+        base = evaluation_context_key(create_instruments(), create_waterfall(), evaluator)
+
+        evaluator.release_strategy = "streaming_first"
+        assert evaluation_context_key(create_instruments(), create_waterfall(), evaluator) != base
+        assert evaluation_context_key(create_instruments(), create_waterfall(), ConservativeEvaluator()) != base
+
+    def test_amounts_bucketed(self):
+        """Test amounts in one bucket share a key."""
+        key = evaluation_cache_key("ctx", [10000000.0, 20000000.0])
+
+        assert evaluation_cache_key("ctx", [10000400.0, 19999600.0]) == key
+        assert evaluation_cache_key("ctx", [10001000.0, 19999000.0]) != key
+        assert evaluation_cache_key("other", [10000000.0, 20000000.0]) != key
+
+
+class TestEvaluationCache:
+    """Test EvaluationCache class."""
+
+    def test_hit_and_miss_counts(self):
+        """Test lookups are counted and the hit rate reported."""
+        cache = EvaluationCache()
+
+        assert cache.get("a") is None
+        cache.put("a", "evaluation")
+        assert cache.get("a") == "evaluation"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["backend"] == "memory"
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted beyond maxsize."""
+        cache = EvaluationCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        cache = EvaluationCache(ttl_seconds=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalid_configuration(self):
+        """Test negative sizes and non-positive TTLs are rejected."""
+        with pytest.raises(ValueError):
+            EvaluationCache(maxsize=-1)
+        with pytest.raises(ValueError):
+            EvaluationCache(ttl_seconds=0)
+
+    def test_redis_write_and_read_through(self):
+        """Test evaluations are shared through Redis between caches."""
+        redis_client = FakeRedis()
+        writer = EvaluationCache(redis_client=redis_client, ttl_seconds=60)
+        reader = EvaluationCache(redis_client=redis_client)
+
+        writer.put("a", {"score": 1})
+
+        assert json.loads(redis_client.store[REDIS_KEY_PREFIX + "a"]) == {"__dict__": {"score": 1}}
+        assert redis_client.expiries[REDIS_KEY_PREFIX + "a"] == 60
+        assert reader.get("a") == {"score": 1}
+        assert reader.stats()["redis_hits"] == 1
+        assert len(reader) == 1
+
+    def test_redis_failure_degrades_to_memory(self):
+        """Test Redis errors are counted and the in-process cache still works."""
+        cache = EvaluationCache(redis_client=FakeRedis(fail=True))
+
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["redis_errors"] == 2
+
+    def test_redis_rejects_forged_payload(self):
+        """Test a Redis value naming an unknown type is a counted miss, not an object."""
+        redis_client = FakeRedis()
+        redis_client.store[REDIS_KEY_PREFIX + "a"] = b'{"__instrument__": "os.system", "data": {}}'
+        cache = EvaluationCache(redis_client=redis_client)
+
+        assert cache.get("a") is None
+        assert cache.stats()["redis_errors"] == 1
+
+
+class TestValueEncoding:
+    """Test the JSON encoding of Redis values."""
+
+    def test_evaluation_round_trip(self):
+        """Test an evaluation with its capital stack survives encoding."""
+        stack = CapitalStack(
+            stack_name="encoded",
+            project_budget=Decimal("20000000"),
+            components=[
+                CapitalComponent(instrument=instrument, position=position)
+                for position, instrument in enumerate(create_instruments(), start=1)
+            ]
+        )
+        evaluation = ScenarioEvaluation(
+            scenario_name="encoded",
+            capital_stack=stack,
+            equity_irr=Decimal("0.1834"),
+            stakeholder_irrs={"Equity Investors": Decimal("0.1834")},
+            strengths=["Strong returns"],
+            metadata={"num_periods": 12, "notes": None}
+        )
+
+        decoded = decode_value(encode_value(evaluation))
+
+        assert decoded == evaluation
+        assert isinstance(decoded.capital_stack.components[1].instrument, SeniorDebt)
+        assert decoded.capital_stack.components[1].instrument.interest_rate == Decimal("8.0")
+
+    def test_unsupported_types_rejected(self):
+        """Test values that cannot be encoded raise rather than pickle."""
+        with pytest.raises(TypeError):
+            encode_value({"callback": print})
@@ -431,7 +431,8 @@ class TestCapitalStackOptimizer:
             project_budget=Decimal("30000000"),
             waterfall_structure=sample_waterfall,
             scenario_name="convergence_tested",
-            num_starts=3
+            num_starts=3,
+            seed=1
         )
 
         assert result is not None
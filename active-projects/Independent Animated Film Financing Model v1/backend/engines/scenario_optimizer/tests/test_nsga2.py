@@ -0,0 +1,168 @@
+"""
+Unit Tests for NSGA-II Operators
+
+Tests constrained non-dominated sorting, crowding distance, variation operators and budget projection.
+"""
+
+import pytest
+import numpy as np
+
+from engines.scenario_optimizer.nsga2 import (
+    crowding_distance,
+    non_dominated_sort,
+    polynomial_mutation,
+    project_to_budget,
+    sbx_crossover,
+    select_survivors,
+    tournament_select
+)
+
+
+LOWER = np.array([15.0, 0.0, 0.0, 0.0])
+UPPER = np.array([80.0, 60.0, 30.0, 35.0])
+
+
+def random_allocations(num: int, seed: int = 0) -> np.ndarray:
+    """Random allocations within bounds summing to 100%."""
+    rng = np.random.default_rng(seed)
+    return project_to_budget(rng.uniform(LOWER, UPPER, (num, LOWER.size)), LOWER, UPPER)
+
+
+class TestNonDominatedSort:
+    """Test non_dominated_sort function."""
+
+    def test_fronts(self):
+        """Test ranks follow Pareto dominance."""
+        objectives = np.array([
+            [1.0, 4.0],
+            [2.0, 2.0],
+            [4.0, 1.0],
+            [3.0, 3.0],
+            [5.0, 5.0]
+        ])
+
+        ranks = non_dominated_sort(objectives, np.zeros(5))
+
+        assert ranks.tolist() == [0, 0, 0, 1, 2]
+
+    def test_feasible_dominates_infeasible(self):
+        """Test any feasible individual ranks ahead of infeasible ones."""
+        objectives = np.array([
+            [5.0, 5.0],
+            [0.0, 0.0],
+            [1.0, 1.0]
+        ])
+        violations = np.array([0.0, 2.0, 1.0])
+
+        ranks = non_dominated_sort(objectives, violations)
+
+        assert ranks.tolist() == [0, 2, 1]
+
+    def test_duplicates_share_front(self):
+        """Test identical individuals do not dominate each other."""
+        ranks = non_dominated_sort(np.ones((3, 2)), np.zeros(3))
+
+        assert ranks.tolist() == [0, 0, 0]
+
+
+class TestCrowdingDistance:
+    """Test crowding_distance function."""
+
+    def test_extremes_infinite(self):
+        """Test front extremes are kept and interior points measured."""
+        objectives = np.array([
+            [0.0, 4.0],
+            [1.0, 3.0],
+            [3.0, 1.0],
+            [4.0, 0.0]
+        ])
+
+        distance = crowding_distance(objectives, np.zeros(4, dtype=int))
+
+        assert np.isinf(distance[[0, 3]]).all()
+        assert distance[1] == pytest.approx(3.0 / 4.0 * 2.0)
+        assert distance[2] == pytest.approx(3.0 / 4.0 * 2.0)
+
+    def test_small_fronts_infinite(self):
+        """Test fronts of one or two individuals are maximally spread."""
+        distance = crowding_distance(np.array([[0.0, 1.0], [1.0, 0.0], [2.0, 2.0]]), np.array([0, 0, 1]))
+
+        assert np.isinf(distance).all()
+
+
+class TestSelection:
+    """Test tournament and survivor selection."""
+
+    def test_tournament_prefers_lower_rank(self):
+        """Test every tournament between ranks 0 and 1 picks rank 0."""
+        ranks = np.array([0, 1])
+        crowding = np.array([0.0, np.inf])
+
+        selected = tournament_select(ranks, crowding, 200, np.random.default_rng(0))
+
+        # A tournament of index 1 against itself is the only way to pick it
+        assert np.mean(selected == 0) > 0.6
+
+    def test_survivors_best_fronts_first(self):
+        """Test survivors fill from the best fronts, then the least crowded."""
+        objectives = np.array([
+            [0.0, 4.0],
+            [1.0, 3.0],
+            [2.0, 2.0],
+            [4.0, 0.0],
+            [5.0, 5.0]
+        ])
+
+        order, ranks, _ = select_survivors(objectives, np.zeros(5), 3)
+
+        assert set(order.tolist()) <= {0, 1, 2, 3}
+        assert {0, 3} <= set(order.tolist())
+        assert (ranks == 0).all()
+
+
+class TestVariation:
+    """Test crossover, mutation and projection."""
+
+    def test_crossover_within_bounds(self):
+        """Test children stay inside the bounds box."""
+        parents = random_allocations(20)
+
+        children = sbx_crossover(parents, LOWER, UPPER, np.random.default_rng(1))
+
+        assert children.shape == parents.shape
+        assert (children >= LOWER - 1e-12).all() and (children <= UPPER + 1e-12).all()
+
+    def test_crossover_preserves_pair_means(self):
+        """Test SBX children are symmetric about their parents' mean."""
+        parents = random_allocations(10, seed=2)
+        lower = np.full(4, -1e9)
+        upper = np.full(4, 1e9)
+
+        children = sbx_crossover(parents, lower, upper, np.random.default_rng(3))
+
+        assert children[0::2] + children[1::2] == pytest.approx(parents[0::2] + parents[1::2])
+
+    def test_mutation_within_bounds(self):
+        """Test mutation stays inside the bounds box."""
+        population = random_allocations(50, seed=4)
+
+        mutated = polynomial_mutation(population, LOWER, UPPER, np.random.default_rng(5), rate=1.0)
+
+        assert not np.allclose(mutated, population)
+        assert (mutated >= LOWER).all() and (mutated <= UPPER).all()
+
+    def test_projection_onto_bounded_simplex(self):
+        """Test projected rows sum to 100 within bounds."""
+        rng = np.random.default_rng(6)
+        population = rng.uniform(-50.0, 150.0, (30, 4))
+
+        projected = project_to_budget(population, LOWER, UPPER)
+
+        assert projected.sum(axis=1) == pytest.approx(np.full(30, 100.0), abs=1e-8)
+        assert (projected >= LOWER).all() and (projected <= UPPER).all()
+
+    def test_projection_keeps_feasible_rows(self):
+        """Test allocations already on the simplex are unchanged."""
+        population = random_allocations(10, seed=7)
+
+        assert project_to_budget(population, LOWER, UPPER) == pytest.approx(population, abs=1e-8)
@@ -0,0 +1,267 @@
+"""
+Unit Tests for SmoothScoreModel
+
+Tests agreement with the full weighted score, exact gradients and batch evaluation.
+"""
+
+import pytest
+from decimal import Decimal
+import numpy as np
+
+from engines.scenario_optimizer import (
+    CapitalStackOptimizer,
+    EvaluationCache,
+    SmoothScoreModel
+)
+from engines.scenario_optimizer.smooth_score import IRR_CEILING, smooth_min_one
+from engines.waterfall_executor import StakeholderAnalyzer
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt, TaxIncentive
+from models.waterfall import (
+    WaterfallStructure, WaterfallNode, RecoupmentPriority, PayeeType, RecoupmentBasis
+)
+
+
+BUDGET = Decimal("30000000")
+REVENUE = Decimal("75000000")
+
+
+def create_template_stack() -> CapitalStack:
+    """Create an equity, senior debt and tax incentive template."""
+    return CapitalStack(
+        stack_name="template",
+        project_budget=BUDGET,
+        components=[
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("10000000"), ownership_percentage=Decimal("40.0")),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=SeniorDebt(
+                    amount=Decimal("10000000"),
+                    interest_rate=Decimal("8.0"),
+                    term_months=24,
+                    origination_fee_percentage=Decimal("2.0")
+                ),
+                position=2
+            ),
+            CapitalComponent(
+                instrument=TaxIncentive(
+                    amount=Decimal("10000000"),
+                    jurisdiction="Canada",
+                    qualified_spend=Decimal("30000000"),
+                    credit_rate=Decimal("33.3"),
+                    timing_months=18
+                ),
+                position=3
+            )
+        ]
+    )
+
+
+def create_sample_waterfall() -> WaterfallStructure:
+    """Create a senior debt and equity waterfall."""
+    return WaterfallStructure(
+        waterfall_id="test_waterfall",
+        project_id="test_project",
+        waterfall_name="Test Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                node_id="node_1",
+                priority=RecoupmentPriority.SENIOR_DEBT_PRINCIPAL,
+                description="Senior Debt",
+                payee_type=PayeeType.LENDER,
+                payee_name="Senior Lender",
+                recoupment_basis=RecoupmentBasis.GROSS_RECEIPTS,
+                fixed_amount=Decimal("10000000")
+            ),
+            WaterfallNode(
+                node_id="node_2",
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                description="Equity",
+                payee_type=PayeeType.INVESTOR,
+                payee_name="Equity Investors",
+                recoupment_basis=RecoupmentBasis.REMAINING_POOL,
+                fixed_amount=Decimal("10000000")
+            )
+        ]
+    )
+
+
+def finite_difference_gradient(model: SmoothScoreModel, percentages: np.ndarray, step: float = 1e-4) -> np.ndarray:
+    """Central-difference gradient of the model score."""
+    gradient = np.zeros_like(percentages)
+    for i in range(len(percentages)):
+        shift = np.zeros_like(percentages)
+        shift[i] = step
+        up = model.evaluate(percentages + shift)[0][0]
+        down = model.evaluate(percentages - shift)[0][0]
+        gradient[i] = (up - down) / (2.0 * step)
+    return gradient
+
+
+ALLOCATIONS = [
+    np.array([100.0, 100.0, 100.0]) / 3.0,
+    np.array([40.0, 35.0, 25.0]),
+    np.array([25.0, 50.0, 25.0]),
+]
+
+
+class TestSmoothMin:
+    """Test the smooth score caps."""
+
+    def test_matches_hard_minimum_away_from_cap(self):
+        """Test values well below or above 1 pass through or cap."""
+        values, slopes = smooth_min_one(np.array([0.2, 3.0]))
+
+        assert values == pytest.approx([0.2, 1.0], abs=1e-6)
+        assert slopes == pytest.approx([1.0, 0.0], abs=1e-6)
+
+    def test_error_at_cap_bounded(self):
+        """Test the smoothing costs at most ln 2 / sharpness."""
+        values, _ = smooth_min_one(np.array([1.0]), sharpness=100.0)
+
+        assert 1.0 - values[0] == pytest.approx(np.log(2.0) / 100.0)
+
+
+class TestSmoothScoreModel:
+    """Test SmoothScoreModel class."""
+
+    @pytest.fixture
+    def optimizer(self):
+        """Create optimizer for reference evaluations."""
+        return CapitalStackOptimizer(evaluation_cache=EvaluationCache())
+
+    @pytest.fixture
+    def weights(self, optimizer):
+        """Default objective weights."""
+        return optimizer._get_default_weights()
+
+    def reference_score(self, optimizer, weights, percentages, waterfall=None) -> float:
+        """Full weighted score of an allocation."""
+        instruments = [c.instrument for c in create_template_stack().components]
+        stack = optimizer._build_stack_from_amounts(
+            instruments, percentages / 100.0 * float(BUDGET), BUDGET, "reference"
+        )
+        if waterfall is None:
+            evaluation = optimizer._simple_evaluation(stack)
+        else:
+            evaluation = optimizer.evaluator.evaluate(stack, waterfall, revenue_projection=REVENUE, run_monte_carlo=False)
+        return float(optimizer._calculate_weighted_score(evaluation, weights))
+
+    @pytest.mark.parametrize("percentages", ALLOCATIONS)
+    def test_simple_score_matches_evaluation(self, optimizer, weights, percentages):
+        """Test the simple-path score matches the full weighted score."""
+        model = SmoothScoreModel(create_template_stack(), BUDGET, weights)
+
+        scores, _ = model.evaluate(percentages)
+
+        assert scores[0] == pytest.approx(self.reference_score(optimizer, weights, percentages), abs=0.5)
+
+    @pytest.mark.parametrize("percentages", ALLOCATIONS)
+    def test_waterfall_score_matches_evaluation(self, optimizer, weights, percentages):
+        """Test the waterfall-path score matches the full evaluator."""
+        waterfall = create_sample_waterfall()
+        model = SmoothScoreModel(create_template_stack(), BUDGET, weights, waterfall, REVENUE)
+
+        scores, _ = model.evaluate(percentages)
+
+        assert scores[0] == pytest.approx(
+            self.reference_score(optimizer, weights, percentages, waterfall), abs=0.5
+        )
+
+    @pytest.mark.parametrize("with_waterfall", [False, True])
+    def test_gradient_matches_finite_differences(self, weights, with_waterfall):
+        """Test analytic gradients against central differences."""
+        waterfall = create_sample_waterfall() if with_waterfall else None
+        model = SmoothScoreModel(create_template_stack(), BUDGET, weights, waterfall, REVENUE)
+
+        for percentages in ALLOCATIONS:
+            _, gradients = model.evaluate(percentages)
+            assert gradients[0] == pytest.approx(
+                finite_difference_gradient(model, percentages), rel=1e-4, abs=1e-6
+            )
+
+    def test_batch_matches_rows(self, weights):
+        """Test a batch scores each row as a single evaluation would."""
+        model = SmoothScoreModel(create_template_stack(), BUDGET, weights, create_sample_waterfall(), REVENUE)
+        batch = np.array(ALLOCATIONS)
+
+        scores, gradients = model.evaluate(batch)
+
+        for row, percentages in enumerate(ALLOCATIONS):
+            single_scores, single_gradients = model.evaluate(percentages)
+            assert scores[row] == pytest.approx(single_scores[0])
+            assert gradients[row] == pytest.approx(single_gradients[0])
+
+    def test_equity_irr_matches_analyzer(self, weights):
+        """Test the equity IRR solve against StakeholderAnalyzer, including where it is undefined."""
+        model = SmoothScoreModel(create_template_stack(), BUDGET, weights, create_sample_waterfall(), REVENUE)
+        # 1M and 6M return over 1000% (above the analyzer's grid), 40M never recoups
+        amounts = np.array([1000000.0, 6000000.0, 9000000.0, 12000000.0, 20000000.0, 40000000.0])
+        receipts = model.receipts[0]
+
+        irr, _ = model._solve_irr(amounts, receipts)
+
+        analyzer = StakeholderAnalyzer(create_template_stack())
+        quarters = (model.years * 4.0).round().astype(int)
+        for amount, solved in zip(amounts, irr):
+            cash_flows = [(0, Decimal(str(-amount)))] + [
+                (int(q), Decimal(str(r))) for q, r in zip(quarters, receipts) if r > 0
+            ]
+            expected = analyzer.calculate_irr(cash_flows)
+            if expected is None:
+                assert np.isnan(solved), f"IRR {solved} defined at {amount} where the analyzer has none"
+            else:
+                assert solved == pytest.approx(float(expected), abs=1e-4)
+        assert np.isnan(irr[[0, 1, 5]]).all()
+        assert not np.isnan(irr[[2, 3, 4]]).any()
+
+    def test_equity_irr_bounded(self, weights):
+        """Test no allocation gets an IRR above the analyzer's bracket grid."""
+        model = SmoothScoreModel(create_template_stack(), BUDGET, weights, create_sample_waterfall(), REVENUE)
+        equity = np.linspace(1.0, 60.0, 60)
+        allocations = np.column_stack([equity, (100.0 - equity) / 2.0, (100.0 - equity) / 2.0])
+
+        irr, _ = model._equity_irr(allocations)
+
+        assert np.nanmax(irr) <= IRR_CEILING
+        assert np.isnan(irr[:5]).all()
+
+    def test_phased_drawdown_matches_evaluation(self, optimizer, weights):
+        """Test an equity drawdown schedule is carried into the rebuilt stack and the IRR."""
+        template = create_template_stack()
+        equity = template.components[0].instrument
+        equity.drawdown_schedule = {0: Decimal("80"), 1: Decimal("20")}
+        instruments = [c.instrument for c in template.components]
+        waterfall = create_sample_waterfall()
+        model = SmoothScoreModel(template, BUDGET, weights, waterfall, REVENUE)
+        percentages = np.array([30.0, 35.0, 35.0])
+
+        scores, _ = model.evaluate(percentages)
+        stack = optimizer._build_stack_from_amounts(
+            instruments, percentages / 100.0 * float(BUDGET), BUDGET, "phased"
+        )
+        evaluation = optimizer.evaluator.evaluate(stack, waterfall, revenue_projection=REVENUE, run_monte_carlo=False)
+
+        assert stack.components[0].instrument.drawdown_schedule == equity.drawdown_schedule
+        assert scores[0] == pytest.approx(float(optimizer._calculate_weighted_score(evaluation, weights)), abs=0.5)
+
+        # Drawing 20% a quarter late raises the IRR over an upfront investment
+        irr, _ = model._equity_irr(percentages[np.newaxis, :])
+        upfront = SmoothScoreModel(create_template_stack(), BUDGET, weights, waterfall, REVENUE)
+        upfront_irr, _ = upfront._equity_irr(percentages[np.newaxis, :])
+        amount = Decimal("9000000")
+        quarters = (model.years * 4.0).round().astype(int)
+        cash_flows = [(q, -amount * share / Decimal("100")) for q, share in equity.drawdown_schedule.items()] + [
+            (int(q), Decimal(str(r))) for q, r in zip(quarters, model.receipts[0]) if r > 0
+        ]
+        expected = StakeholderAnalyzer(template).calculate_irr(cash_flows)
+        assert irr[0] == pytest.approx(float(expected), abs=1e-4)
+        assert irr[0] > upfront_irr[0]
+
+    def test_waterfall_requires_revenue(self, weights):
+        """Test a waterfall without revenue is rejected."""
+        with pytest.raises(ValueError):
+            SmoothScoreModel(create_template_stack(), BUDGET, weights, create_sample_waterfall())
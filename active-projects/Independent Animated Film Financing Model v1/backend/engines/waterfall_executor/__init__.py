@@ -4,36 +4,95 @@ Engine 2: Waterfall Execution Engine with IRR/NPV
 This module provides comprehensive investor analytics capabilities:
 - Multi-year revenue projection with 2025-accurate distribution windows
 - Time-series waterfall execution tracking cumulative recoupment
+- Event-driven execution on arbitrary dates with daily interest accrual
 - Stakeholder return calculations (IRR, NPV, cash-on-cash, payback)
-- Monte Carlo simulation of revenue uncertainty
+- Monte Carlo simulation of revenue uncertainty (single or correlated variables)
 - Sensitivity analysis to identify key drivers
+- Release strategy × revenue level comparison
+- Opt-in execution tracing (OTLP spans, Prometheus metrics)
 """
 
+from .instrumentation import (
+    Tracer,
+    Span,
+    SpanStats,
+    tracing,
+    current_tracer,
+)
 from .revenue_projector import (
     RevenueProjector,
     DistributionWindow,
     MarketRevenue,
     RevenueProjection,
+    RevenueComponent,
     # S-curve investment modeling
     s_curve,
     s_curve_distribution,
     InvestmentDrawdown,
 )
+from engines.common.timing_kernels import (
+    TimingKernel,
+    get_kernel,
+)
+from .projection_cache import (
+    ProjectionCache,
+    ProjectionShape,
+    get_projection_cache,
+)
+from .waterfall_plan import (
+    CompiledWaterfallPlan,
+    compile_waterfall,
+)
 from .waterfall_executor import (
     WaterfallExecutor,
     QuarterlyWaterfallExecution,
+    CompactQuarterlyExecution,
     TimeSeriesWaterfallResult,
+    WaterfallSummary,
+    WaterfallCheckpoints,
+    WaterfallDiff,
+)
+from .event_engine import (
+    EventWaterfallEngine,
+    EventWaterfallResult,
+    EventExecution,
+    ScheduledEvent,
+    InterestTerms,
+    revenue_events,
+    drawdown_events,
+)
+from .batch_waterfall import (
+    BatchWaterfallExecutor,
+    BatchWaterfallResult,
+)
+from .revenue_scale_curve import (
+    RevenueScaleCurve,
+    build_revenue_scale_curve,
 )
 from .stakeholder_analyzer import (
     StakeholderAnalyzer,
     StakeholderCashFlows,
+    CompactStakeholderCashFlows,
     StakeholderAnalysisResult,
 )
+from .correlated_revenue import (
+    CorrelatedRevenueModel,
+    RevenueVariable,
+    TimingVariable,
+)
+from .quantile_sketch import (
+    QuantileSketch,
+)
 from .monte_carlo_simulator import (
     MonteCarloSimulator,
     RevenueDistribution,
     MonteCarloScenario,
+    CompactMonteCarloScenario,
     MonteCarloResult,
+    MonteCarloAggregator,
+    ReplicateStatistics,
+    PrecisionTarget,
+    ConvergenceDiagnostics,
 )
 from .sensitivity_analyzer import (
     SensitivityAnalyzer,
@@ -41,6 +100,19 @@ from .sensitivity_analyzer import (
     SensitivityResult,
     TornadoChartData,
 )
+from .sensitivity_engine import (
+    SensitivityEngine,
+    SweepResult,
+    SpiderChartData,
+    GridResult,
+    SobolIndex,
+    MorrisEffect,
+)
+from .strategy_comparison import (
+    StrategyComparator,
+    StrategyComparisonCell,
+    StrategyComparisonResult,
+)
 
 __all__ = [
     # Revenue projection
@@ -48,28 +120,86 @@ __all__ = [
     "DistributionWindow",
     "MarketRevenue",
     "RevenueProjection",
+    "RevenueComponent",
     # S-curve investment modeling
     "s_curve",
     "s_curve_distribution",
     "InvestmentDrawdown",
+    # Timing kernels
+    "TimingKernel",
+    "get_kernel",
+    # Projection shape cache
+    "ProjectionCache",
+    "ProjectionShape",
+    "get_projection_cache",
+    # Compiled waterfall plan
+    "CompiledWaterfallPlan",
+    "compile_waterfall",
     # Waterfall execution
     "WaterfallExecutor",
     "QuarterlyWaterfallExecution",
+    "CompactQuarterlyExecution",
     "TimeSeriesWaterfallResult",
+    "WaterfallSummary",
+    "WaterfallCheckpoints",
+    "WaterfallDiff",
+    # Event-driven (dated) waterfall execution
+    "EventWaterfallEngine",
+    "EventWaterfallResult",
+    "EventExecution",
+    "ScheduledEvent",
+    "InterestTerms",
+    "revenue_events",
+    "drawdown_events",
+    # Batch (vectorized) waterfall execution
+    "BatchWaterfallExecutor",
+    "BatchWaterfallResult",
+    # Revenue-scale response curve
+    "RevenueScaleCurve",
+    "build_revenue_scale_curve",
     # Stakeholder analysis
     "StakeholderAnalyzer",
     "StakeholderCashFlows",
+    "CompactStakeholderCashFlows",
     "StakeholderAnalysisResult",
     # Monte Carlo simulation
     "MonteCarloSimulator",
     "RevenueDistribution",
     "MonteCarloScenario",
+    "CompactMonteCarloScenario",
     "MonteCarloResult",
+    "MonteCarloAggregator",
+    "ReplicateStatistics",
+    "PrecisionTarget",
+    "ConvergenceDiagnostics",
+    # Correlated multi-variable revenue
+    "CorrelatedRevenueModel",
+    "RevenueVariable",
+    "TimingVariable",
+    # Streaming percentile estimation
+    "QuantileSketch",
     # Sensitivity analysis
     "SensitivityAnalyzer",
     "SensitivityVariable",
     "SensitivityResult",
     "TornadoChartData",
+    # Multi-variable sensitivity engine
+    "SensitivityEngine",
+    "SweepResult",
+    "SpiderChartData",
+    "GridResult",
+    "SobolIndex",
+    "MorrisEffect",
+    # Release strategy comparison
+    "StrategyComparator",
+    "StrategyComparisonCell",
+    "StrategyComparisonResult",
+    # Execution tracing
+    "Tracer",
+    "Span",
+    "SpanStats",
+    "tracing",
+    "current_tracer",
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,213 @@
+"""
+Batch Waterfall Executor
+
+Executes a waterfall structure for many revenue scenarios at once using NumPy
+arrays shaped (scenarios × quarters × nodes). This is the vectorized
+counterpart of WaterfallExecutor used by Monte Carlo and other batch callers.
+
+Numerical tolerance:
+    The batch path runs the same CompiledWaterfallPlan on an int64 cent
+    ledger, with the same half-even rounding as WaterfallExecutor. Given the
+    same revenue (to the cent), payouts are identical to the Decimal path.
+    Revenue supplied as float64 dollars is rounded to cents on entry, so it
+    can differ from a Decimal input by one cent on a rounding boundary.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+from decimal import Decimal
+
+import numpy as np
+
+from models.waterfall import WaterfallStructure
+from .waterfall_plan import CompiledWaterfallPlan, compile_waterfall
+from .instrumentation import traced
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchWaterfallResult:
+    """
+    Waterfall execution for a batch of revenue scenarios.
+
+    Attributes:
+        quarters: Quarter number for each column of the quarter axis
+        node_ids: Node ID for each slot of the node axis
+        payee_names: Payee name for each slot of the payee axis
+        gross_receipts: (scenarios × quarters) gross revenue
+        distribution_fees: (scenarios × quarters) distribution fees deducted
+        node_payouts: (scenarios × quarters × nodes) payout per node
+        payee_payouts: (scenarios × quarters × payees) payout per payee
+        cumulative_recouped: (scenarios × nodes) final cumulative recouped per node
+        metadata: Execution notes
+    """
+    quarters: np.ndarray
+    node_ids: List[str]
+    payee_names: List[str]
+
+    gross_receipts: np.ndarray
+    distribution_fees: np.ndarray
+
+    node_payouts: np.ndarray
+    payee_payouts: np.ndarray
+    cumulative_recouped: np.ndarray
+
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def num_scenarios(self) -> int:
+        """Number of scenarios in the batch"""
+        return self.gross_receipts.shape[0]
+
+    def payee_index(self, payee_name: str) -> Optional[int]:
+        """Index of payee on the payee axis, or None if not in the waterfall"""
+        try:
+            return self.payee_names.index(payee_name)
+        except ValueError:
+            return None
+
+    def total_paid_by_payee(self) -> np.ndarray:
+        """(scenarios × payees) total paid over all quarters"""
+        return self.payee_payouts.sum(axis=1)
+
+
+class BatchWaterfallExecutor:
+    """
+    Execute a waterfall structure over a batch of revenue scenarios.
+
+    Applies the same node rules as WaterfallExecutor.process_quarter (fixed
+    amounts recoup up to their target, percentage nodes take a share of the
+    remaining pool subject to caps) but evaluates every scenario in a single
+    array operation per node and quarter.
+    """
+
+    def __init__(
+        self,
+        waterfall_structure: WaterfallStructure,
+        plan: Optional[CompiledWaterfallPlan] = None
+    ):
+        """
+        Initialize with waterfall structure.
+
+        Args:
+            waterfall_structure: WaterfallStructure from backend/models/waterfall.py
+            plan: Precompiled plan for this structure (compiled if not given)
+        """
+        self.waterfall = waterfall_structure
+        self.plan = plan or compile_waterfall(waterfall_structure)
+
+        self.node_ids: List[str] = list(self.plan.slot_ids)
+        self.payee_names: List[str] = list(self.plan.payee_names)
+
+        self._node_slots = np.array(self.plan.node_slots, dtype=np.int64)
+        self._node_payees = np.array(self.plan.node_payees, dtype=np.int64)
+        self._fixed_cents = np.array(self.plan.fixed_cents, dtype=np.int64)
+        self._pct_numerators = np.array(self.plan.pct_numerators, dtype=np.int64)
+        self._pct_denominators = np.array(self.plan.pct_denominators, dtype=np.int64)
+        self._cap_cents = np.array(self.plan.cap_cents, dtype=np.int64)
+
+        # Slot → payee mapping for aggregating node payouts to payees
+        slot_payees = np.zeros(self.plan.num_slots, dtype=np.int64)
+        slot_payees[self._node_slots] = self._node_payees
+        self._slot_to_payee = np.zeros((self.plan.num_slots, len(self.payee_names)), dtype=np.int64)
+        self._slot_to_payee[np.arange(self.plan.num_slots), slot_payees] = 1
+
+        logger.info(
+            f"BatchWaterfallExecutor initialized with waterfall: {waterfall_structure.waterfall_name} "
+            f"({self.plan.num_nodes} nodes)"
+        )
+
+    @traced("batch_waterfall.execute", "execution")
+    def execute(
+        self,
+        quarterly_revenue: np.ndarray,
+        quarters: Optional[np.ndarray] = None,
+        distribution_fee_rate: Optional[Decimal] = None,
+        pa_expenses: Optional[np.ndarray] = None
+    ) -> BatchWaterfallResult:
+        """
+        Execute the waterfall for every scenario in the batch.
+
+        Args:
+            quarterly_revenue: (scenarios × quarters) gross receipts
+            quarters: Quarter number for each column (defaults to 0..Q-1)
+            distribution_fee_rate: Override default distribution fee (%)
+            pa_expenses: Optional P&A expenses per quarter, shape (quarters,)
+
+        Returns:
+            BatchWaterfallResult with (scenarios × quarters × nodes) payouts
+        """
+        gross = np.atleast_2d(np.asarray(quarterly_revenue, dtype=float))
+        num_scenarios, num_quarters = gross.shape
+        num_slots = self.plan.num_slots
+
+        if quarters is None:
+            quarters = np.arange(num_quarters)
+
+        gross_cents = np.rint(gross * 100.0).astype(np.int64)
+        fee_cents = _apply_ratio(gross_cents, *self.plan.resolve_fee_ratio(distribution_fee_rate))
+        pools = gross_cents - fee_cents
+        if pa_expenses is not None:
+            pa_cents = np.rint(np.asarray(pa_expenses, dtype=float) * 100.0).astype(np.int64)
+            pools = pools - pa_cents[np.newaxis, :]
+
+        node_payouts = np.zeros((num_scenarios, num_quarters, num_slots), dtype=np.int64)
+        cumulative = np.zeros((num_scenarios, num_slots), dtype=np.int64)
+
+        fixed_cents = self._fixed_cents
+        pct_numerators = self._pct_numerators
+        pct_denominators = self._pct_denominators
+        cap_cents = self._cap_cents
+
+        for q in range(num_quarters):
+            pool = pools[:, q].copy()
+            # WaterfallExecutor skips quarters with zero gross receipts entirely
+            live = gross[:, q] != 0
+
+            for i, slot in enumerate(self._node_slots):
+                # WaterfallExecutor stops processing once the pool is exhausted
+                paying = live & (pool > 0)
+
+                if fixed_cents[i]:
+                    remaining = fixed_cents[i] - cumulative[:, slot]
+                    payment = np.where(paying & (remaining > 0), np.minimum(pool, remaining), 0)
+                elif pct_numerators[i]:
+                    share = _apply_ratio(pool, pct_numerators[i], pct_denominators[i])
+                    payment = np.where(paying, share, 0)
+                    if cap_cents[i]:
+                        remaining_cap = cap_cents[i] - cumulative[:, slot]
+                        payment = np.where(remaining_cap > 0, np.minimum(payment, remaining_cap), 0)
+                else:
+                    continue
+
+                node_payouts[:, q, slot] += payment
+                cumulative[:, slot] += payment
+                pool -= payment
+
+        payee_payouts = node_payouts @ self._slot_to_payee
+
+        return BatchWaterfallResult(
+            quarters=np.asarray(quarters),
+            node_ids=list(self.node_ids),
+            payee_names=list(self.payee_names),
+            gross_receipts=gross,
+            distribution_fees=fee_cents / 100.0,
+            node_payouts=node_payouts / 100.0,
+            payee_payouts=payee_payouts / 100.0,
+            cumulative_recouped=cumulative / 100.0,
+            metadata={
+                "num_scenarios": num_scenarios,
+                "num_quarters": num_quarters,
+                "distribution_fee_rate": str(distribution_fee_rate) if distribution_fee_rate else "default"
+            }
+        )
+
+
+def _apply_ratio(cents: np.ndarray, numerator: int, denominator: int) -> np.ndarray:
+    """Vectorized waterfall_plan.apply_ratio (half-even rounding)"""
+    quotient, remainder = np.divmod(cents * numerator, denominator)
+    twice = 2 * remainder
+    round_up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + round_up
@@ -0,0 +1,650 @@
+"""
+Event-Driven Waterfall Engine
+
+Executes a waterfall on dated events instead of integer quarters: revenue
+receipts, investment / debt drawdowns, off-the-top fees and interest accrual
+checkpoints can fall on any calendar date. Events sit in a priority queue and
+are processed date by date; dates without events are never visited, so
+memory and run time scale with the number of events, not the calendar
+length (a 20-year monthly schedule is 240 dates; a daily one with sparse
+receipts costs no more).
+
+Interest:
+    InterestTerms attach simple interest to a fixed-amount (debt) node.
+    Interest accrues daily on the outstanding drawn principal between event
+    dates (ACT/365 by default) and is kept as an exact fraction, so the
+    result does not depend on how finely events split the timeline; whole
+    cents are credited to the node's recoupment target (or to a separate
+    interest node) at each event date. Payments to a node that carries its
+    own interest settle interest before principal.
+
+Fees:
+    Fee events are expenses paid off the top of later receipts (after the
+    distribution fee, before the waterfall nodes). Fees larger than a date's
+    receipts carry forward to the next receipts.
+
+Receipts on the same date are pooled and paid through the compiled plan's
+integer-cent ledger (see waterfall_plan.py), exactly as one quarter is in
+WaterfallExecutor.
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Any
+
+from models.waterfall import WaterfallStructure
+from engines.common.timing_kernels import get_kernel
+from .revenue_projector import RevenueProjection, InvestmentDrawdown
+from .waterfall_plan import (
+    CompiledWaterfallPlan,
+    compile_waterfall,
+    to_cents,
+    from_cents,
+    apply_ratio,
+    rate_ratio,
+    UNPAID
+)
+
+logger = logging.getLogger(__name__)
+
+# Event types, in the order they're applied within one date
+EVENT_TYPES = ("drawdown", "interest_accrual", "fee", "revenue_receipt")
+_EVENT_ORDER = {event_type: order for order, event_type in enumerate(EVENT_TYPES)}
+
+# Reporting granularities for EventWaterfallResult.summarize_by_period()
+GRANULARITIES = ("daily", "monthly", "quarterly")
+
+# Months per projection quarter when splitting quarterly revenue
+MONTHS_PER_QUARTER = 3
+
+# Day-count bases accepted for interest accrual
+DAY_COUNT_BASES = (360, 365)
+
+
+@dataclass
+class ScheduledEvent:
+    """
+    Single dated waterfall event.
+
+    Attributes:
+        event_date: Calendar date of the event
+        event_type: revenue_receipt, drawdown, fee or interest_accrual
+        amount: Event amount (ignored for interest_accrual)
+        node_id: Debt node a drawdown funds (None = investment tracking only)
+        description: Human-readable label
+    """
+    event_date: date
+    event_type: str
+    amount: Decimal = Decimal("0")
+    node_id: Optional[str] = None
+    description: str = ""
+
+    def __post_init__(self):
+        """Validate and convert types"""
+        if self.event_type not in _EVENT_ORDER:
+            raise ValueError(f"Unsupported event type: {self.event_type}")
+        if not isinstance(self.amount, Decimal):
+            self.amount = Decimal(str(self.amount))
+        if self.amount < 0:
+            raise ValueError("Event amount must be non-negative")
+
+
+@dataclass
+class InterestTerms:
+    """
+    Simple interest on a debt node.
+
+    Attributes:
+        node_id: Fixed-amount node holding the principal (e.g. "6_Senior Lender")
+        annual_rate: Annual interest rate %
+        start_date: Accrual start (None = start of the schedule)
+        interest_node_id: Node that collects the interest (None = the principal node)
+        day_count: Day-count basis (365 or 360)
+    """
+    node_id: str
+    annual_rate: Decimal
+    start_date: Optional[date] = None
+    interest_node_id: Optional[str] = None
+    day_count: int = 365
+
+    def __post_init__(self):
+        """Validate and convert types"""
+        if not isinstance(self.annual_rate, Decimal):
+            self.annual_rate = Decimal(str(self.annual_rate))
+        if self.annual_rate < 0:
+            raise ValueError("annual_rate must be non-negative")
+        if self.day_count not in DAY_COUNT_BASES:
+            raise ValueError(f"day_count must be one of {DAY_COUNT_BASES}")
+
+
+@dataclass
+class EventExecution:
+    """
+    Waterfall activity on one event date.
+
+    Attributes:
+        event_date: Date processed
+        event_types: Event types that occurred on this date
+        gross_receipts: Revenue received
+        distribution_fees: Distribution fees deducted
+        expenses: Fee-event expenses paid from this date's receipts
+        remaining_pool: Left after all nodes
+        interest_accrued: Node ID → interest credited since the previous date
+        node_payouts: Node ID → payout
+        payee_payouts: Payee → total payout
+        investment_drawn: Investment drawn on this date
+    """
+    event_date: date
+    event_types: List[str]
+    gross_receipts: Decimal
+    distribution_fees: Decimal
+    expenses: Decimal
+    remaining_pool: Decimal
+
+    interest_accrued: Dict[str, Decimal] = field(default_factory=dict)
+    node_payouts: Dict[str, Decimal] = field(default_factory=dict)
+    payee_payouts: Dict[str, Decimal] = field(default_factory=dict)
+
+    investment_drawn: Decimal = Decimal("0")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "event_date": self.event_date.isoformat(),
+            "event_types": self.event_types,
+            "gross_receipts": str(self.gross_receipts),
+            "distribution_fees": str(self.distribution_fees),
+            "expenses": str(self.expenses),
+            "remaining_pool": str(self.remaining_pool),
+            "interest_accrued": {k: str(v) for k, v in self.interest_accrued.items()},
+            "node_payouts": {k: str(v) for k, v in self.node_payouts.items()},
+            "payee_payouts": {k: str(v) for k, v in self.payee_payouts.items()},
+            "investment_drawn": str(self.investment_drawn)
+        }
+
+
+@dataclass
+class EventWaterfallResult:
+    """
+    Waterfall execution over an event schedule.
+
+    Attributes:
+        project_name: Project identifier
+        start_date: Schedule start (interest accrues from here by default)
+        end_date: Last event date
+        executions: One entry per event date, in date order
+        total_receipts: Total gross receipts
+        total_fees: Distribution fees plus expenses paid
+        unpaid_expenses: Fee-event expenses never covered by receipts
+        total_interest: Node ID → interest credited
+        total_recouped_by_node: Node ID → total recouped
+        total_paid_by_payee: Payee → total paid
+        final_unrecouped: Fixed-amount node ID → remaining (principal plus interest)
+        total_investment_drawn: Sum of drawdown events
+        metadata: Execution notes
+    """
+    project_name: str
+    start_date: date
+    end_date: date
+
+    executions: List[EventExecution]
+
+    total_receipts: Decimal
+    total_fees: Decimal
+    unpaid_expenses: Decimal
+    total_interest: Dict[str, Decimal]
+    total_recouped_by_node: Dict[str, Decimal]
+    total_paid_by_payee: Dict[str, Decimal]
+
+    final_unrecouped: Dict[str, Decimal]
+
+    total_investment_drawn: Decimal = Decimal("0")
+
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def summarize_by_period(self, granularity: str = "monthly") -> List[Dict[str, Any]]:
+        """
+        Roll executions up to reporting periods.
+
+        Only periods with events appear.
+
+        Args:
+            granularity: daily, monthly or quarterly
+
+        Returns:
+            List of period dicts (period label, receipts, fees, expenses,
+            interest and payee payouts), in date order
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+
+        periods: Dict[str, Dict[str, Any]] = {}
+        for execution in self.executions:
+            label = period_label(execution.event_date, granularity)
+            period = periods.get(label)
+            if period is None:
+                period = periods[label] = {
+                    "period": label,
+                    "gross_receipts": Decimal("0"),
+                    "distribution_fees": Decimal("0"),
+                    "expenses": Decimal("0"),
+                    "interest_accrued": Decimal("0"),
+                    "investment_drawn": Decimal("0"),
+                    "payee_payouts": {},
+                }
+
+            period["gross_receipts"] += execution.gross_receipts
+            period["distribution_fees"] += execution.distribution_fees
+            period["expenses"] += execution.expenses
+            period["interest_accrued"] += sum(execution.interest_accrued.values(), Decimal("0"))
+            period["investment_drawn"] += execution.investment_drawn
+            payee_payouts = period["payee_payouts"]
+            for payee, amount in execution.payee_payouts.items():
+                payee_payouts[payee] = payee_payouts.get(payee, Decimal("0")) + amount
+
+        return list(periods.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "project_name": self.project_name,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "executions": [e.to_dict() for e in self.executions],
+            "total_receipts": str(self.total_receipts),
+            "total_fees": str(self.total_fees),
+            "unpaid_expenses": str(self.unpaid_expenses),
+            "total_interest": {k: str(v) for k, v in self.total_interest.items()},
+            "total_recouped_by_node": {k: str(v) for k, v in self.total_recouped_by_node.items()},
+            "total_paid_by_payee": {k: str(v) for k, v in self.total_paid_by_payee.items()},
+            "final_unrecouped": {k: str(v) for k, v in self.final_unrecouped.items()},
+            "total_investment_drawn": str(self.total_investment_drawn),
+            "metadata": self.metadata
+        }
+
+
+@dataclass
+class _Accrual:
+    """Running interest state for one InterestTerms"""
+    terms: InterestTerms
+    rate: Fraction
+    node_index: int
+    slot: int
+    interest_index: int
+    principal: int
+    drawn: Optional[int]
+    since: date
+    accrued: Fraction = Fraction(0)
+    credited: int = 0
+
+    def outstanding(self, ledger: List[int]) -> int:
+        """Drawn principal not yet repaid (interest is repaid first)"""
+        drawn = self.principal if self.drawn is None else min(self.drawn, self.principal)
+        repaid = ledger[self.slot]
+        if self.interest_index == self.node_index:
+            repaid -= self.credited
+        return max(0, drawn - max(0, repaid))
+
+
+class EventWaterfallEngine:
+    """
+    Execute a waterfall over dated events.
+
+    The structure is compiled once; execute() can run any number of
+    schedules against it.
+    """
+
+    def __init__(
+        self,
+        waterfall_structure: WaterfallStructure,
+        interest_terms: Optional[List[InterestTerms]] = None,
+        plan: Optional[CompiledWaterfallPlan] = None
+    ):
+        """
+        Initialize with a waterfall structure.
+
+        Args:
+            waterfall_structure: WaterfallStructure from backend/models/waterfall.py
+            interest_terms: Interest accrual on debt nodes
+            plan: Precompiled plan for this structure (compiled if not given)
+
+        Raises:
+            ValueError: If interest terms name an unknown or unsuitable node
+        """
+        self.waterfall = waterfall_structure
+        self.plan = plan or compile_waterfall(waterfall_structure)
+        self.interest_terms = list(interest_terms or [])
+
+        for terms in self.interest_terms:
+            index = self._node_index(terms.node_id)
+            if not self.plan.fixed_cents[index]:
+                raise ValueError(f"Interest node {terms.node_id} must have a fixed amount")
+            if terms.interest_node_id is not None:
+                interest_index = self._node_index(terms.interest_node_id)
+                if self.plan.pct_numerators[interest_index]:
+                    raise ValueError(
+                        f"Interest node {terms.interest_node_id} can't be a percentage node"
+                    )
+
+        logger.info(f"EventWaterfallEngine initialized with waterfall: {waterfall_structure.waterfall_name}")
+
+    def execute(
+        self,
+        events: Iterable[ScheduledEvent],
+        start_date: Optional[date] = None,
+        distribution_fee_rate: Optional[Decimal] = None,
+        project_name: str = "Untitled Project"
+    ) -> EventWaterfallResult:
+        """
+        Process an event schedule date by date.
+
+        Args:
+            events: Dated events in any order
+            start_date: Schedule start (defaults to the first event date)
+            distribution_fee_rate: Override default distribution fee (%)
+            project_name: Project identifier
+
+        Returns:
+            EventWaterfallResult with one execution per event date
+
+        Raises:
+            ValueError: If an event precedes start_date or names an unknown node
+        """
+        plan = self.plan
+        fee_ratio = plan.resolve_fee_ratio(distribution_fee_rate)
+
+        queue = [
+            (event.event_date, _EVENT_ORDER[event.event_type], sequence, event)
+            for sequence, event in enumerate(events)
+        ]
+        heapq.heapify(queue)
+
+        if start_date is None:
+            start_date = queue[0][0] if queue else date.today()
+        if queue and queue[0][0] < start_date:
+            raise ValueError(f"Event on {queue[0][0]} precedes start_date {start_date}")
+
+        funded_nodes = {event.node_id for _, _, _, event in queue if event.node_id is not None}
+        for node_id in funded_nodes:
+            self._node_index(node_id)
+        accruals = self._start_accruals(start_date, funded_nodes)
+
+        targets = list(plan.fixed_cents)
+        ledger = plan.new_ledger()
+        payouts = plan.new_payouts()
+
+        executions: List[EventExecution] = []
+        total_receipts = Decimal("0")
+        total_fee_cents = 0
+        unpaid_expense_cents = 0
+        interest_cents: Dict[str, int] = {}
+        investment_cents = 0
+
+        while queue:
+            event_date = queue[0][0]
+            batch: List[ScheduledEvent] = []
+            while queue and queue[0][0] == event_date:
+                batch.append(heapq.heappop(queue)[3])
+
+            # Interest for the interval up to today, on yesterday's balances
+            accrued = self._accrue(accruals, event_date, ledger, targets)
+            for node_id, cents in accrued.items():
+                interest_cents[node_id] = interest_cents.get(node_id, 0) + cents
+
+            gross_receipts = Decimal("0")
+            drawn_cents = 0
+            for event in batch:
+                if event.event_type == "revenue_receipt":
+                    gross_receipts += event.amount
+                elif event.event_type == "fee":
+                    unpaid_expense_cents += to_cents(event.amount)
+                elif event.event_type == "drawdown":
+                    cents = to_cents(event.amount)
+                    drawn_cents += cents
+                    for accrual in accruals:
+                        if accrual.drawn is not None and accrual.terms.node_id == event.node_id:
+                            accrual.drawn += cents
+
+            gross_cents = to_cents(gross_receipts)
+            fee_cents = apply_ratio(gross_cents, *fee_ratio)
+            net_cents = gross_cents - fee_cents
+            expense_cents = min(unpaid_expense_cents, max(net_cents, 0))
+            unpaid_expense_cents -= expense_cents
+
+            node_payouts: Dict[str, Decimal] = {}
+            payee_payouts: Dict[str, Decimal] = {}
+            remaining_pool = net_cents - expense_cents
+            if gross_cents:
+                remaining_pool = plan.run_quarter(remaining_pool, ledger, payouts, targets)
+                for i, payment in enumerate(payouts):
+                    if payment == UNPAID:
+                        continue
+                    amount = from_cents(payment)
+                    node_payouts[plan.node_ids[i]] = amount
+                    payee = plan.payee_names[plan.node_payees[i]]
+                    payee_payouts[payee] = payee_payouts.get(payee, Decimal("0")) + amount
+
+            executions.append(EventExecution(
+                event_date=event_date,
+                event_types=sorted({e.event_type for e in batch}, key=_EVENT_ORDER.get),
+                gross_receipts=gross_receipts,
+                distribution_fees=from_cents(fee_cents),
+                expenses=from_cents(expense_cents),
+                remaining_pool=from_cents(remaining_pool),
+                interest_accrued={node_id: from_cents(c) for node_id, c in accrued.items()},
+                node_payouts=node_payouts,
+                payee_payouts=payee_payouts,
+                investment_drawn=from_cents(drawn_cents)
+            ))
+
+            total_receipts += gross_receipts
+            total_fee_cents += fee_cents + expense_cents
+            investment_cents += drawn_cents
+
+        paid_cents: Dict[str, int] = {}
+        for i, slot in enumerate(plan.node_slots):
+            payee = plan.payee_names[plan.node_payees[i]]
+            paid_cents[payee] = paid_cents.get(payee, 0) + ledger[slot]
+
+        result = EventWaterfallResult(
+            project_name=project_name,
+            start_date=start_date,
+            end_date=executions[-1].event_date if executions else start_date,
+            executions=executions,
+            total_receipts=total_receipts,
+            total_fees=from_cents(total_fee_cents),
+            unpaid_expenses=from_cents(unpaid_expense_cents),
+            total_interest={node_id: from_cents(c) for node_id, c in interest_cents.items()},
+            total_recouped_by_node={
+                slot_id: from_cents(ledger[slot]) for slot, slot_id in enumerate(plan.slot_ids)
+            },
+            total_paid_by_payee={payee: from_cents(cents) for payee, cents in paid_cents.items()},
+            final_unrecouped={
+                node_id: from_cents(remaining)
+                for node_id, remaining in plan.unrecouped_cents(ledger, targets).items()
+            },
+            total_investment_drawn=from_cents(investment_cents),
+            metadata={
+                "num_event_dates": len(executions),
+                "distribution_fee_rate": str(distribution_fee_rate) if distribution_fee_rate else "default",
+                "interest_nodes": [terms.node_id for terms in self.interest_terms],
+                "mode": "event"
+            }
+        )
+
+        logger.info(
+            f"Executed waterfall over {len(executions)} event dates: "
+            f"${total_receipts:,.0f} total receipts"
+        )
+
+        return result
+
+    def _node_index(self, node_id: str) -> int:
+        """First plan node with a node ID"""
+        try:
+            return self.plan.node_ids.index(node_id)
+        except ValueError:
+            raise ValueError(f"Unknown waterfall node: {node_id}")
+
+    def _start_accruals(self, start_date: date, funded_nodes: set) -> List[_Accrual]:
+        """Fresh accrual state for each InterestTerms"""
+        plan = self.plan
+        accruals = []
+        for terms in self.interest_terms:
+            index = self._node_index(terms.node_id)
+            numerator, denominator = rate_ratio(terms.annual_rate)
+            accruals.append(_Accrual(
+                terms=terms,
+                rate=Fraction(numerator, denominator * terms.day_count),
+                node_index=index,
+                slot=plan.node_slots[index],
+                interest_index=(
+                    index if terms.interest_node_id is None else self._node_index(terms.interest_node_id)
+                ),
+                principal=plan.fixed_cents[index],
+                # Without drawdown events the whole principal is out from the start
+                drawn=0 if terms.node_id in funded_nodes else None,
+                since=max(start_date, terms.start_date or start_date)
+            ))
+        return accruals
+
+    def _accrue(
+        self,
+        accruals: List[_Accrual],
+        event_date: date,
+        ledger: List[int],
+        targets: List[int]
+    ) -> Dict[str, int]:
+        """
+        Accrue interest up to a date and credit whole cents to the targets.
+
+        Args:
+            accruals: Running accrual state, updated in place
+            event_date: Date to accrue to
+            ledger: Cumulative cents recouped per slot
+            targets: Per-node fixed targets, updated in place
+
+        Returns:
+            Node ID → cents credited
+        """
+        credited: Dict[str, int] = {}
+        for accrual in accruals:
+            days = (event_date - accrual.since).days
+            if days <= 0:
+                continue
+
+            outstanding = accrual.outstanding(ledger)
+            if outstanding:
+                accrual.accrued += outstanding * days * accrual.rate
+            accrual.since = event_date
+
+            cents = apply_ratio(accrual.accrued.numerator, 1, accrual.accrued.denominator) - accrual.credited
+            if cents:
+                targets[accrual.interest_index] += cents
+                accrual.credited += cents
+                node_id = self.plan.node_ids[accrual.interest_index]
+                credited[node_id] = credited.get(node_id, 0) + cents
+
+        return credited
+
+
+def period_label(event_date: date, granularity: str) -> str:
+    """Reporting period label: 2025-03-14, 2025-03 or 2025-Q1"""
+    if granularity == "daily":
+        return event_date.isoformat()
+    if granularity == "monthly":
+        return f"{event_date.year:04d}-{event_date.month:02d}"
+    return f"{event_date.year:04d}-Q{(event_date.month - 1) // MONTHS_PER_QUARTER + 1}"
+
+
+def add_months(start: date, months: int) -> date:
+    """First day of the month a number of months after start's month"""
+    month_index = start.year * 12 + start.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def projection_start_date(revenue_projection: RevenueProjection) -> date:
+    """First day of a projection's start quarter (e.g. "2025-Q1" → 2025-01-01)"""
+    year, quarter = revenue_projection.projection_start_date.split("-Q")
+    return date(int(year), (int(quarter) - 1) * MONTHS_PER_QUARTER + 1, 1)
+
+
+def revenue_events(
+    revenue_projection: RevenueProjection,
+    start_date: Optional[date] = None,
+    granularity: str = "monthly"
+) -> List[ScheduledEvent]:
+    """
+    Turn a quarterly projection into dated revenue receipts.
+
+    Quarterly granularity books each quarter on its first day; monthly splits
+    it evenly across its three months (to the cent, residual in the first
+    month). Quarters without revenue produce no events.
+
+    Args:
+        revenue_projection: Revenue projection from RevenueProjector
+        start_date: Date of quarter 0 (defaults to the projection's start)
+        granularity: monthly or quarterly
+
+    Returns:
+        revenue_receipt events
+    """
+    if granularity not in ("monthly", "quarterly"):
+        raise ValueError(f"Revenue events can be monthly or quarterly, not {granularity}")
+    start_date = start_date or projection_start_date(revenue_projection)
+
+    months = MONTHS_PER_QUARTER if granularity == "monthly" else 1
+    kernel = get_kernel("even", months)
+
+    events: List[ScheduledEvent] = []
+    for quarter in sorted(revenue_projection.quarterly_revenue):
+        amount = revenue_projection.quarterly_revenue[quarter]
+        if amount == 0:
+            continue
+
+        cents = [to_cents(a) for a in kernel.allocate(amount)]
+        cents[0] += to_cents(amount) - sum(cents)
+        for month, month_cents in enumerate(cents):
+            events.append(ScheduledEvent(
+                event_date=add_months(start_date, quarter * MONTHS_PER_QUARTER + month),
+                event_type="revenue_receipt",
+                amount=from_cents(month_cents),
+                description=f"Q{quarter} revenue"
+            ))
+
+    return events
+
+
+def drawdown_events(
+    drawdown: InvestmentDrawdown,
+    start_date: date,
+    months_per_period: int = 1,
+    node_id: Optional[str] = None
+) -> List[ScheduledEvent]:
+    """
+    Turn an InvestmentDrawdown schedule into dated drawdown events.
+
+    Args:
+        drawdown: S-curve drawdown schedule
+        start_date: Date of the first draw period
+        months_per_period: Months per draw period (1 monthly, 3 quarterly)
+        node_id: Debt node the draws fund (None = investment tracking only)
+
+    Returns:
+        drawdown events (zero draws are skipped)
+    """
+    return [
+        ScheduledEvent(
+            event_date=add_months(start_date, period * months_per_period),
+            event_type="drawdown",
+            amount=amount,
+            node_id=node_id,
+            description=f"Draw period {period + 1}"
+        )
+        for period, amount in enumerate(drawdown.quarterly_draws)
+        if amount > 0
+    ]
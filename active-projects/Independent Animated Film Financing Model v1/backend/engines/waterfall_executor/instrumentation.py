@@ -0,0 +1,425 @@
+"""
+Execution Instrumentation
+
+Opt-in tracing of waterfall runs. Inside a tracing() block the engines
+record timed spans and counters on a Tracer:
+
+Spans (phase in brackets):
+- revenue.project [projection]: RevenueProjector.project()
+- waterfall.execute [execution]: WaterfallExecutor.execute_over_time(),
+  execute_summary() and reexecute()
+- batch_waterfall.execute [execution]: BatchWaterfallExecutor.execute()
+- stakeholder.analyze: StakeholderAnalyzer.analyze()
+- stakeholder.irr [irr]: StakeholderAnalyzer.calculate_irr_batch()
+- monte_carlo.simulate / monte_carlo.simulate_batch: whole simulations
+- monte_carlo.project [projection]: scenario revenue sampling and scaling
+- monte_carlo.aggregate [aggregation]: percentiles and recoupment rates
+
+Counters:
+- waterfall.quarters: quarters executed
+- waterfall.nodes_evaluated / waterfall.nodes_skipped: node visits that
+  paid / did not pay (recouped, capped or empty pool)
+- irr.rows: cash flow rows solved
+- irr.newton_iterations: Newton-Raphson row iterations
+- irr.bracketed_rows / irr.bracketed_iterations: rows re-solved by the
+  bracketed fallback and its row iterations
+- irr.failures: rows left without an IRR despite an outflow and an inflow
+- monte_carlo.scenarios: scenarios simulated
+
+A Tracer exports its spans as an OTLP/JSON trace request (to_otlp()) and
+its span timings and counters in the Prometheus text format
+(to_prometheus()). Neither needs a telemetry library.
+
+With no active tracer every hook is a context variable lookup returning a
+shared no-op, so instrumented code runs at full speed when disabled. Spans
+started in worker processes (simulate_batch(workers=...),
+SensitivityEngine, StrategyComparator) are not recorded.
+"""
+
+import functools
+import logging
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Individual spans kept per tracer (timings of later spans are still aggregated)
+DEFAULT_MAX_SPANS = 10000
+
+# OTLP service.name resource attribute
+DEFAULT_SERVICE_NAME = "film-financing-engine"
+
+# Prometheus metric name prefix
+DEFAULT_NAMESPACE = "waterfall"
+
+# Help text of the counters the engines record
+COUNTER_HELP = {
+    "waterfall.quarters": "Quarters executed",
+    "waterfall.nodes_evaluated": "Waterfall node visits that paid",
+    "waterfall.nodes_skipped": "Waterfall node visits skipped (recouped, capped or empty pool)",
+    "irr.rows": "Cash flow rows passed to the IRR solver",
+    "irr.newton_iterations": "Newton-Raphson IRR row iterations",
+    "irr.bracketed_rows": "IRR rows re-solved by the bracketed fallback",
+    "irr.bracketed_iterations": "Bracketed IRR row iterations",
+    "irr.failures": "IRR rows without a solution",
+    "monte_carlo.scenarios": "Monte Carlo scenarios simulated",
+}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """
+    One timed operation.
+
+    Attributes:
+        name: Operation name (e.g. "waterfall.execute")
+        span_id: 16 hex digit span ID
+        parent_id: Enclosing span's ID (None for a root span)
+        start_ns: Start time (Unix epoch nanoseconds)
+        end_ns: End time (Unix epoch nanoseconds, None while open)
+        attributes: Span attributes (phase, sizes, modes)
+    """
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Elapsed seconds (0 while open)"""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set one attribute"""
+        self.attributes[key] = value
+
+
+@dataclass
+class SpanStats:
+    """
+    Aggregated timings of every span with one name.
+
+    Attributes:
+        phase: Phase attribute of the spans (None if unset)
+        count: Spans finished
+        total_seconds: Summed duration
+        max_seconds: Longest duration
+    """
+    phase: Optional[str] = None
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class Tracer:
+    """
+    Collects spans and counters for one traced run.
+
+    Spans nest in the order they are opened, so a tracer should be used from
+    one thread (or asyncio task) at a time.
+    """
+
+    def __init__(
+        self,
+        service_name: str = DEFAULT_SERVICE_NAME,
+        max_spans: int = DEFAULT_MAX_SPANS
+    ):
+        """
+        Initialize an empty tracer.
+
+        Args:
+            service_name: OTLP service.name resource attribute
+            max_spans: Individual spans kept; later spans only update
+                span_stats and dropped_spans
+        """
+        self.service_name = service_name
+        self.max_spans = max_spans
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.span_stats: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, float] = {}
+        self._stack: List[Span] = []
+
+        # Anchor the monotonic clock to wall time once
+        self._epoch_ns = time.time_ns() - time.perf_counter_ns()
+
+    @contextmanager
+    def span(self, name: str, phase: Optional[str] = None, **attributes: Any) -> Iterator[Span]:
+        """
+        Time the enclosed block as a span.
+
+        Args:
+            name: Operation name
+            phase: Phase label (projection, execution, irr, aggregation)
+            **attributes: Span attributes
+
+        Yields:
+            The open Span (attributes may be added inside the block)
+        """
+        if phase is not None:
+            attributes["phase"] = phase
+        parent = self._stack[-1] if self._stack else None
+        span = Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=self._epoch_ns + time.perf_counter_ns(),
+            attributes=attributes
+        )
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            span.end_ns = self._epoch_ns + time.perf_counter_ns()
+            self._stack.pop()
+            self._finish(span, phase)
+
+    def count(self, name: str, value: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name (e.g. "irr.failures")
+            value: Amount to add
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def phase_seconds(self) -> Dict[str, float]:
+        """Total seconds per phase (spans without a phase are excluded)"""
+        totals: Dict[str, float] = {}
+        for stats in self.span_stats.values():
+            if stats.phase is not None:
+                totals[stats.phase] = totals.get(stats.phase, 0.0) + stats.total_seconds
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert span statistics and counters to a dictionary"""
+        return {
+            "trace_id": self.trace_id,
+            "phase_seconds": self.phase_seconds(),
+            "spans": {
+                name: {
+                    "phase": stats.phase,
+                    "count": stats.count,
+                    "total_seconds": stats.total_seconds,
+                    "max_seconds": stats.max_seconds,
+                }
+                for name, stats in self.span_stats.items()
+            },
+            "counters": dict(self.counters),
+            "dropped_spans": self.dropped_spans,
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """
+        Export recorded spans as an OTLP/JSON ExportTraceServiceRequest.
+
+        Returns:
+            Dict ready to json.dumps() and POST to a collector's /v1/traces
+        """
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [
+                        {
+                            "traceId": self.trace_id,
+                            "spanId": span.span_id,
+                            "parentSpanId": span.parent_id or "",
+                            "name": span.name,
+                            "kind": 1,
+                            "startTimeUnixNano": str(span.start_ns),
+                            "endTimeUnixNano": str(span.end_ns),
+                            "attributes": [
+                                _otlp_attribute(key, value) for key, value in span.attributes.items()
+                            ],
+                        }
+                        for span in self.spans
+                    ],
+                }],
+            }]
+        }
+
+    def to_prometheus(self, namespace: str = DEFAULT_NAMESPACE) -> str:
+        """
+        Export span timings and counters in the Prometheus text format.
+
+        Span timings are a summary (_sum / _count per span and phase) plus a
+        _max gauge; every counter becomes <namespace>_<name>_total.
+
+        Args:
+            namespace: Metric name prefix
+
+        Returns:
+            Exposition text (newline terminated)
+        """
+        lines = []
+        if self.span_stats:
+            metric = f"{namespace}_span_duration_seconds"
+            lines.append(f"# HELP {metric} Time spent in traced spans")
+            lines.append(f"# TYPE {metric} summary")
+            for name, stats in sorted(self.span_stats.items()):
+                labels = _prometheus_labels(name, stats.phase)
+                lines.append(f"{metric}_sum{labels} {stats.total_seconds!r}")
+                lines.append(f"{metric}_count{labels} {stats.count}")
+
+            gauge = f"{namespace}_span_duration_max_seconds"
+            lines.append(f"# HELP {gauge} Longest traced span")
+            lines.append(f"# TYPE {gauge} gauge")
+            for name, stats in sorted(self.span_stats.items()):
+                lines.append(f"{gauge}{_prometheus_labels(name, stats.phase)} {stats.max_seconds!r}")
+
+        for name, value in sorted(self.counters.items()):
+            metric = f"{namespace}_{_prometheus_name(name)}_total"
+            lines.append(f"# HELP {metric} {COUNTER_HELP.get(name, name)}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value!r}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _finish(self, span: Span, phase: Optional[str]) -> None:
+        """Fold a closed span into the statistics and keep it if there is room"""
+        stats = self.span_stats.get(span.name)
+        if stats is None:
+            stats = self.span_stats[span.name] = SpanStats(phase=phase)
+        duration = span.duration_seconds
+        stats.count += 1
+        stats.total_seconds += duration
+        if duration > stats.max_seconds:
+            stats.max_seconds = duration
+
+        if len(self.spans) < self.max_spans:
+            self.spans.append(span)
+        else:
+            self.dropped_spans += 1
+
+
+class _NullSpan:
+    """Shared no-op span context used when tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+_current_tracer: ContextVar[Optional[Tracer]] = ContextVar("waterfall_tracer", default=None)
+
+
+def current_tracer() -> Optional[Tracer]:
+    """Active tracer, or None when tracing is disabled"""
+    return _current_tracer.get()
+
+
+@contextmanager
+def tracing(tracer: Optional[Tracer] = None) -> Iterator[Tracer]:
+    """
+    Enable tracing for the enclosed block.
+
+    Example:
+        >>> with tracing() as tracer:
+        ...     executor.execute_over_time(projection)
+        >>> tracer.phase_seconds()["execution"]
+
+    Args:
+        tracer: Tracer to record into (a new one if not given)
+
+    Yields:
+        The active Tracer
+    """
+    tracer = tracer if tracer is not None else Tracer()
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def span(name: str, phase: Optional[str] = None, **attributes: Any):
+    """
+    Span context on the active tracer (a shared no-op when disabled).
+
+    Args:
+        name: Operation name
+        phase: Phase label
+        **attributes: Span attributes
+
+    Returns:
+        Context manager yielding the Span, or None when disabled
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, phase, **attributes)
+
+
+def count(name: str, value: float = 1) -> None:
+    """Add to a counter on the active tracer (no-op when disabled)"""
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        tracer.count(name, value)
+
+
+def traced(name: str, phase: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator recording every call as a span on the active tracer.
+
+    Args:
+        name: Operation name
+        phase: Phase label
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _current_tracer.get()
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, phase):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """OTLP/JSON KeyValue for a Python value"""
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _prometheus_name(name: str) -> str:
+    """Metric-safe form of a dotted name"""
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+def _prometheus_labels(name: str, phase: Optional[str]) -> str:
+    """Label set for a span's series"""
+    if phase is None:
+        return f'{{span="{name}"}}'
+    return f'{{span="{name}",phase="{phase}"}}'
@@ -3,22 +3,283 @@ Monte Carlo Simulator
 
 Runs Monte Carlo simulations of revenue uncertainty to quantify risk and
 generate confidence intervals for investor returns.
+
+Two execution paths are available:
+- simulate(): scenario-by-scenario Decimal path (reference implementation)
+- simulate_batch(): vectorized NumPy path for large runs, optionally split
+  across a process pool
+
+Neither path touches the global random state: simulate() uses a private
+random.Random, and simulate_batch() gives every shard its own
+numpy.random.SeedSequence child stream, so a given seed produces
+bit-identical results for any worker count.
+
+Batch tolerance against the Decimal path (for identical revenue draws):
+- total_receipts / cash_on_cash: relative 1e-9 (both paths run the same
+  compiled plan on a cent ledger; float64 revenue scaling can move a
+  quarter's gross by one cent on a rounding boundary)
+- irr: absolute 1e-6 (both paths use StakeholderAnalyzer.calculate_irr_batch)
+- fully_recouped: receipts within 1e-9 (relative) of the investment count as
+  recouped, absorbing float64 error when converting cents back to dollars
+
+Revenue input:
+Both paths accept a RevenueDistribution (one total-revenue variable scaling
+the base projection) or a CorrelatedRevenueModel (per-window / per-territory
+revenue and timing variables under a Gaussian copula; draws come from a
+numpy Generator seeded with the same seed in both paths).
+
+Sampling:
+sampling="random" draws i.i.d. values (the default, unchanged streams).
+"antithetic" pairs every uniform u with 1 - u, "lhs" uses a Latin Hypercube
+and "sobol" a scrambled Sobol sequence (scipy.stats.qmc); all three push the
+uniforms through the distribution's inverse CDF (or the copula of a
+CorrelatedRevenueModel).
+
+Standard errors:
+Scenarios are split into replicate blocks, each an independently randomized
+design (randomized QMC for Sobol). The spread of a statistic across blocks
+gives its standard error under the chosen sampling method, so variance
+reduction shows up as smaller errors: result.standard_errors holds errors for
+every reported percentile and recoupment probability.
+
+Adaptive stopping:
+With precision_targets, simulate() treats num_simulations as a budget and
+runs in replicate batches of batch_size until the Student-t confidence
+interval of every target (e.g. equity irr_p50, senior debt probability of
+recoupment) is within its tolerance. result.convergence reports the
+diagnostics.
+
+Aggregation:
+By default percentiles are exact (nearest rank over every scenario). With
+streaming=True, both paths fold scenarios into a MonteCarloAggregator of
+mergeable t-digest sketches and running recoupment counters, so memory stays
+constant in the number of simulations; pass keep_scenarios=False as well to
+skip retaining per-scenario results. keep_scenarios with compact_scenarios=True
+retains CompactMonteCarloScenario rows (float64 metrics on a shared
+stakeholder index) instead of nested dicts.
 """
 
 import logging
 import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any, Sequence, Tuple, Union
 from decimal import Decimal
 
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc, t as student_t
+
 from models.waterfall import WaterfallStructure
 from models.capital_stack import CapitalStack
 from .revenue_projector import RevenueProjector, RevenueProjection
 from .waterfall_executor import WaterfallExecutor
 from .stakeholder_analyzer import StakeholderAnalyzer
+from .batch_waterfall import BatchWaterfallExecutor
+from .waterfall_plan import compile_waterfall
+from .revenue_scale_curve import build_revenue_scale_curve
+from .quantile_sketch import QuantileSketch, DEFAULT_COMPRESSION
+from .correlated_revenue import CorrelatedRevenueModel
+from .instrumentation import traced, span, count
 
 logger = logging.getLogger(__name__)
 
+# Relative tolerance used by the batch path when testing full recoupment
+RECOUPMENT_TOLERANCE = 1e-9
+
+# Scenarios per independently seeded shard in the batch path
+DEFAULT_SHARD_SIZE = 10000
+
+# Percentiles reported when none are requested
+DEFAULT_PERCENTILES = (10, 50, 90)
+
+# Per-stakeholder metrics summarised by percentile, with their key prefixes
+PERCENTILE_METRICS = {"irr": "irr", "cash_on_cash": "coc"}
+
+# Columns of a CompactMonteCarloScenario's metrics table
+SCENARIO_METRICS = ("irr", "cash_on_cash", "total_receipts", "fully_recouped")
+
+# Supported sampling strategies
+SAMPLING_METHODS = ("random", "antithetic", "lhs", "sobol")
+
+# Independent replicate blocks used for standard errors
+DEFAULT_REPLICATES = 10
+
+# Scenarios per batch (replicate block) in adaptive mode
+DEFAULT_BATCH_SIZE = 100
+
+# Batches run before precision targets may stop a simulation
+MIN_CONVERGENCE_BATCHES = 4
+
+
+def percentile_key(percentile: float) -> str:
+    """Result key for a percentile (10 → "p10", 97.5 → "p97.5")"""
+    return f"p{percentile:g}"
+
+
+def _nearest_rank(values: np.ndarray, percentile: float) -> float:
+    """Nearest-rank percentile of a float array (same indexing as _calculate_percentile)"""
+    index = min(int(values.size * percentile / 100), values.size - 1)
+    return float(np.partition(values, index)[index])
+
+
+def _uniform_design(sampling: str, size: int, dimensions: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw a (size × dimensions) design of uniforms for one replicate block.
+
+    Args:
+        sampling: Sampling strategy (see SAMPLING_METHODS)
+        size: Number of points
+        dimensions: Number of random inputs per point
+        rng: NumPy random generator (seeds LHS / Sobol scrambling)
+
+    Returns:
+        Uniform design in [0, 1)
+    """
+    if size == 0:
+        return np.empty((0, dimensions))
+
+    if sampling == "lhs":
+        return qmc.LatinHypercube(d=dimensions, seed=rng).random(size)
+
+    if sampling == "sobol":
+        sampler = qmc.Sobol(d=dimensions, scramble=True, seed=rng)
+        with warnings.catch_warnings():
+            # Sizes that aren't powers of two lose some balance, not validity
+            warnings.simplefilter("ignore", UserWarning)
+            return sampler.random(size)
+
+    if sampling == "antithetic":
+        half = rng.random((-(-size // 2), dimensions))
+        return np.stack([half, 1.0 - half], axis=1).reshape(-1, dimensions)[:size]
+
+    return rng.random((size, dimensions))
+
+
+def _block_bounds(offset: int, size: int, block_size: int) -> List[Tuple[int, int]]:
+    """
+    Cut a run of scenarios at replicate block boundaries.
+
+    Args:
+        offset: Index of the first scenario in the whole simulation
+        size: Number of scenarios in the run
+        block_size: Scenarios per replicate block
+
+    Returns:
+        (start, stop) pairs relative to the run
+    """
+    cuts = [0]
+    boundary = (offset // block_size + 1) * block_size
+    while boundary < offset + size:
+        cuts.append(boundary - offset)
+        boundary += block_size
+    cuts.append(size)
+    return [(start, stop) for start, stop in zip(cuts, cuts[1:]) if stop > start]
+
+
+def _validate_sampling(sampling: str, replicates: int) -> None:
+    """Check the sampling strategy and replicate count"""
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Unsupported sampling method: {sampling}")
+    if replicates < 1:
+        raise ValueError("replicates must be at least 1")
+
+
+def _validate_precision_targets(targets: Sequence["PrecisionTarget"], percentiles: Sequence[float]) -> None:
+    """Check every precision target names a reported statistic"""
+    supported = {"probability_of_recoupment"}
+    supported.update(f"revenue_{percentile_key(p)}" for p in percentiles)
+    supported.update(
+        f"{prefix}_{percentile_key(p)}" for prefix in PERCENTILE_METRICS.values() for p in percentiles
+    )
+    for target in targets:
+        if target.metric not in supported:
+            raise ValueError(
+                f"Unsupported precision target metric: {target.metric} "
+                f"(percentile targets must use a requested percentile)"
+            )
+
+
+def _evaluate_precision_targets(
+    targets: Sequence["PrecisionTarget"],
+    replicate_stats: "ReplicateStatistics"
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Confidence intervals of every precision target from replicate blocks.
+
+    The half-width is the Student-t quantile (batches - 1 degrees of freedom)
+    times the between-batch standard error.
+
+    Args:
+        targets: Precision targets
+        replicate_stats: Statistics of the batches run so far
+
+    Returns:
+        Target label ("revenue_p50", "<stakeholder_id>.irr_p50") → estimate,
+        half_width (None before two batches), tolerance and met flag
+    """
+    estimates = replicate_stats.estimates()
+    errors = replicate_stats.standard_errors()
+    num_batches = replicate_stats.num_replicates
+
+    def stakeholder_statistic(values: Dict[str, Any], sid: str, metric: str) -> Optional[Decimal]:
+        if metric == "probability_of_recoupment":
+            return values["probability_of_recoupment"][sid]
+        return values["stakeholder_percentiles"][sid][metric]
+
+    report = {}
+    for target in targets:
+        if target.metric.startswith("revenue_"):
+            key = target.metric[len("revenue_"):]
+            entries = [(target.metric, estimates["revenue_percentiles"][key], errors["revenue_percentiles"][key])]
+        else:
+            stakeholder_ids = [sid for sid in estimates["probability_of_recoupment"] if target.matches(sid)]
+            if not stakeholder_ids:
+                raise ValueError(
+                    f"Precision target {target.metric} matches no stakeholder: {target.stakeholder}"
+                )
+            entries = [
+                (
+                    f"{sid}.{target.metric}",
+                    stakeholder_statistic(estimates, sid, target.metric),
+                    stakeholder_statistic(errors, sid, target.metric)
+                )
+                for sid in stakeholder_ids
+            ]
+
+        for label, estimate, error in entries:
+            tolerance = target.tolerance
+            if target.relative and estimate != 0:
+                tolerance *= abs(float(estimate))
+            half_width = None
+            if error is not None:
+                quantile = student_t.ppf((1.0 + target.confidence) / 2.0, num_batches - 1)
+                half_width = Decimal(str(float(quantile) * float(error)))
+            report[label] = {
+                "estimate": estimate,
+                "half_width": half_width,
+                "tolerance": Decimal(str(tolerance)),
+                "met": (
+                    num_batches >= MIN_CONVERGENCE_BATCHES
+                    and half_width is not None
+                    and half_width <= Decimal(str(tolerance))
+                )
+            }
+
+    return report
+
+
+def _validate_percentiles(percentiles: Sequence[float]) -> List[float]:
+    """Check requested percentiles are within 0-100"""
+    percentiles = list(percentiles)
+    if not percentiles:
+        raise ValueError("At least one percentile is required")
+    for percentile in percentiles:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100: {percentile}")
+    return percentiles
+
 
 @dataclass
 class RevenueDistribution:
@@ -42,6 +303,102 @@ class RevenueDistribution:
                 if param not in self.parameters:
                     raise ValueError(f"Triangular distribution requires {param}")
 
+    def inverse_cdf(self, u: np.ndarray) -> np.ndarray:
+        """
+        Map uniforms in [0, 1] to draws (vectorized inverse CDF).
+
+        Normal draws are clamped at zero, as in the samplers.
+
+        Args:
+            u: Uniform values
+
+        Returns:
+            Draws as float array
+        """
+        u = np.asarray(u, dtype=float)
+
+        if self.distribution_type == "triangular":
+            low = float(self.parameters["min"])
+            mode = float(self.parameters["mode"])
+            high = float(self.parameters["max"])
+            width = high - low
+            if width <= 0:
+                return np.full(u.shape, low)
+            split = (mode - low) / width
+            return np.where(
+                u < split,
+                low + np.sqrt(u * width * (mode - low)),
+                high - np.sqrt((1.0 - u) * width * (high - mode))
+            )
+
+        elif self.distribution_type == "uniform":
+            low = float(self.parameters["min"])
+            high = float(self.parameters["max"])
+            return low + u * (high - low)
+
+        elif self.distribution_type == "normal":
+            mean = float(self.parameters["mean"])
+            std = float(self.parameters["std"])
+            return np.maximum(mean + std * ndtri(u), 0.0)
+
+        else:
+            raise ValueError(f"Unsupported distribution type: {self.distribution_type}")
+
+
+@dataclass
+class PrecisionTarget:
+    """
+    Confidence-interval precision required of one simulated statistic.
+
+    Attributes:
+        metric: "revenue_p50"-style revenue percentile, stakeholder percentile
+            ("irr_p50", "coc_p90") or "probability_of_recoupment"
+        tolerance: Maximum confidence-interval half-width
+        stakeholder: Stakeholder ID or ID prefix (e.g. "equity", "senior_debt");
+            None applies a stakeholder metric to every stakeholder
+        confidence: Confidence level of the interval
+        relative: Tolerance is a fraction of the estimate's magnitude; while
+            the estimate is exactly zero it applies as an absolute half-width,
+            since no interval could meet a zero tolerance. Statistics that
+            hover near zero (low IRR percentiles) are better given absolute
+            tolerances.
+    """
+    metric: str
+    tolerance: float
+    stakeholder: Optional[str] = None
+    confidence: float = 0.95
+    relative: bool = False
+
+    def __post_init__(self):
+        """Validate tolerance and confidence"""
+        if self.tolerance <= 0:
+            raise ValueError("Precision target tolerance must be positive")
+        if not 0.0 < self.confidence < 1.0:
+            raise ValueError("Precision target confidence must be between 0 and 1")
+
+    def matches(self, stakeholder_id: str) -> bool:
+        """Whether a stakeholder falls under this target"""
+        return self.stakeholder is None or stakeholder_id.startswith(self.stakeholder)
+
+
+@dataclass
+class ConvergenceDiagnostics:
+    """
+    Convergence report of an adaptive Monte Carlo run.
+
+    Attributes:
+        converged: Every precision target was met before the budget ran out
+        num_simulations: Scenarios run
+        num_batches: Batches (replicate blocks) run
+        targets: Target label → estimate, half_width, tolerance and met flag
+        history: Scenarios run and target half-widths after each batch
+    """
+    converged: bool
+    num_simulations: int
+    num_batches: int
+    targets: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    history: List[Dict[str, Any]] = field(default_factory=list)
+
 
 @dataclass
 class MonteCarloScenario:
@@ -57,6 +414,102 @@ class MonteCarloScenario:
     total_revenue: Decimal
     stakeholder_results: Dict[str, Dict[str, Decimal]] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "scenario_id": self.scenario_id,
+            "total_revenue": str(self.total_revenue),
+            "stakeholder_results": {
+                sid: {
+                    name: value if isinstance(value, bool) else str(value)
+                    for name, value in metrics.items()
+                }
+                for sid, metrics in self.stakeholder_results.items()
+            }
+        }
+
+
+class CompactMonteCarloScenario:
+    """
+    Array-backed simulation scenario.
+
+    Same attributes and to_dict() as MonteCarloScenario, but the metrics are
+    one float64 row per stakeholder (columns SCENARIO_METRICS) on a
+    stakeholder index shared by every scenario of the run, and
+    stakeholder_results is built on access. In the batch path the rows are
+    views of one (scenarios × stakeholders × metrics) table. Metrics are
+    float64, as simulate_batch() computes them; use expand() for a
+    MonteCarloScenario.
+
+    Attributes:
+        scenario_id: Scenario number
+        total_revenue: Sampled total revenue
+        stakeholder_ids: Shared stakeholder index (row order of metrics)
+        metrics: (stakeholders × SCENARIO_METRICS) float64 table
+    """
+
+    __slots__ = ("scenario_id", "total_revenue", "stakeholder_ids", "metrics")
+
+    def __init__(
+        self,
+        scenario_id: int,
+        total_revenue: Decimal,
+        stakeholder_ids: Tuple[str, ...],
+        metrics: np.ndarray
+    ):
+        """Initialize with metrics on the shared stakeholder index (arguments as the attributes)"""
+        self.scenario_id = scenario_id
+        self.total_revenue = total_revenue
+        self.stakeholder_ids = stakeholder_ids
+        self.metrics = metrics
+
+    @classmethod
+    def from_results(
+        cls,
+        scenario_id: int,
+        total_revenue: Decimal,
+        stakeholder_ids: Tuple[str, ...],
+        stakeholder_results: Dict[str, Dict[str, Any]]
+    ) -> "CompactMonteCarloScenario":
+        """Pack a stakeholder → metrics dict (as in MonteCarloScenario)"""
+        metrics = np.array(
+            [[float(stakeholder_results[sid][name]) for name in SCENARIO_METRICS] for sid in stakeholder_ids],
+            dtype=float
+        ).reshape(len(stakeholder_ids), len(SCENARIO_METRICS))
+        return cls(scenario_id, total_revenue, stakeholder_ids, metrics)
+
+    @property
+    def stakeholder_results(self) -> Dict[str, Dict[str, Any]]:
+        """Stakeholder → metrics dict"""
+        return {
+            sid: {
+                "irr": Decimal(str(irr)),
+                "cash_on_cash": Decimal(str(cash_on_cash)),
+                "total_receipts": Decimal(str(total_receipts)),
+                "fully_recouped": bool(fully_recouped)
+            }
+            for sid, (irr, cash_on_cash, total_receipts, fully_recouped)
+            in zip(self.stakeholder_ids, self.metrics.tolist())
+        }
+
+    def expand(self) -> MonteCarloScenario:
+        """Equivalent dict-based MonteCarloScenario"""
+        return MonteCarloScenario(
+            scenario_id=self.scenario_id,
+            total_revenue=self.total_revenue,
+            stakeholder_results=self.stakeholder_results
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (same shape as MonteCarloScenario)"""
+        return self.expand().to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactMonteCarloScenario(scenario_id={self.scenario_id}, "
+            f"total_revenue={self.total_revenue}, stakeholders={len(self.stakeholder_ids)})"
+        )
+
 
 @dataclass
 class MonteCarloResult:
@@ -65,22 +518,378 @@ class MonteCarloResult:
 
     Attributes:
         num_simulations: Number of scenarios run
-        scenarios: List of scenarios
-        revenue_percentiles: P10, P50, P90 for revenue
+        scenarios: List of scenarios (empty when keep_scenarios=False;
+            compact with compact_scenarios=True)
+        revenue_percentiles: Requested percentiles of revenue (P10, P50, P90 by default)
         stakeholder_percentiles: Stakeholder → metric percentiles
         probability_of_recoupment: Stakeholder → probability
+        standard_errors: Standard error of each percentile and recoupment
+            probability, keyed like the fields above
+        convergence: Diagnostics of an adaptive run (None otherwise)
         metadata: Simulation parameters
     """
     num_simulations: int
-    scenarios: List[MonteCarloScenario]
+    scenarios: List[Union[MonteCarloScenario, CompactMonteCarloScenario]]
 
     revenue_percentiles: Dict[str, Decimal]
     stakeholder_percentiles: Dict[str, Dict[str, Decimal]]
     probability_of_recoupment: Dict[str, Decimal]
 
+    standard_errors: Dict[str, Any] = field(default_factory=dict)
+    convergence: Optional[ConvergenceDiagnostics] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class MonteCarloAggregator:
+    """
+    Constant-memory running aggregation of Monte Carlo scenarios.
+
+    Keeps a QuantileSketch for revenue and for each stakeholder's IRR and
+    cash-on-cash, plus running recoupment counters. Aggregators built on
+    separate shards merge into one, so the batch path can aggregate inside
+    worker processes.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        """
+        Initialize an empty aggregator.
+
+        Args:
+            compression: t-digest compression for every sketch
+        """
+        self.compression = compression
+        self.num_scenarios = 0
+        self.revenue = QuantileSketch(compression)
+        self.metrics: Dict[str, Dict[str, QuantileSketch]] = {}
+        self.recouped_counts: Dict[str, int] = {}
+
+    def add_scenario(
+        self,
+        total_revenue: Decimal,
+        stakeholder_results: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Fold one scenario into the aggregate.
+
+        Args:
+            total_revenue: Sampled total revenue
+            stakeholder_results: Stakeholder → metrics dict (as in MonteCarloScenario)
+        """
+        self.num_scenarios += 1
+        self.revenue.update(total_revenue)
+
+        for sid, result in stakeholder_results.items():
+            sketches = self._stakeholder_sketches(sid)
+            for name in PERCENTILE_METRICS:
+                sketches[name].update(result[name])
+            if result["fully_recouped"]:
+                self.recouped_counts[sid] += 1
+
+    def add_batch(
+        self,
+        revenues: np.ndarray,
+        metrics: Dict[str, Dict[str, np.ndarray]]
+    ) -> None:
+        """
+        Fold an array batch of scenarios into the aggregate.
+
+        Args:
+            revenues: Sampled total revenue per scenario
+            metrics: Stakeholder → metric name → array (as produced by the batch path)
+        """
+        self.num_scenarios += len(revenues)
+        self.revenue.update(revenues)
+
+        for sid, values in metrics.items():
+            sketches = self._stakeholder_sketches(sid)
+            for name in PERCENTILE_METRICS:
+                sketches[name].update(values[name])
+            self.recouped_counts[sid] += int(np.count_nonzero(values["fully_recouped"]))
+
+    def merge(self, other: "MonteCarloAggregator") -> "MonteCarloAggregator":
+        """
+        Fold another aggregator into this one.
+
+        Args:
+            other: Aggregator to merge
+
+        Returns:
+            This aggregator
+        """
+        self.num_scenarios += other.num_scenarios
+        self.revenue.merge(other.revenue)
+
+        for sid, sketches in other.metrics.items():
+            own = self._stakeholder_sketches(sid)
+            for name, sketch in sketches.items():
+                own[name].merge(sketch)
+            self.recouped_counts[sid] += other.recouped_counts[sid]
+
+        return self
+
+    def revenue_percentiles(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Decimal]:
+        """Estimated revenue percentiles keyed "p10", "p50", ..."""
+        return {
+            percentile_key(p): self._estimate(self.revenue, p) for p in percentiles
+        }
+
+    def stakeholder_percentiles(
+        self,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Dict[str, Decimal]]:
+        """Estimated stakeholder percentiles keyed "irr_p10", "coc_p50", ..."""
+        return {
+            sid: {
+                f"{prefix}_{percentile_key(p)}": self._estimate(sketches[name], p)
+                for name, prefix in PERCENTILE_METRICS.items()
+                for p in percentiles
+            }
+            for sid, sketches in self.metrics.items()
+        }
+
+    def probability_of_recoupment(self) -> Dict[str, Decimal]:
+        """Share of scenarios in which each stakeholder fully recouped"""
+        if self.num_scenarios == 0:
+            return {sid: Decimal("0") for sid in self.recouped_counts}
+        return {
+            sid: Decimal(str(count)) / Decimal(str(self.num_scenarios))
+            for sid, count in self.recouped_counts.items()
+        }
+
+    def _stakeholder_sketches(self, stakeholder_id: str) -> Dict[str, QuantileSketch]:
+        """Sketches for a stakeholder, created on first use"""
+        sketches = self.metrics.get(stakeholder_id)
+        if sketches is None:
+            sketches = {name: QuantileSketch(self.compression) for name in PERCENTILE_METRICS}
+            self.metrics[stakeholder_id] = sketches
+            self.recouped_counts[stakeholder_id] = 0
+        return sketches
+
+    @staticmethod
+    def _estimate(sketch: QuantileSketch, percentile: float) -> Decimal:
+        """Sketch quantile as Decimal (0 when empty, like _calculate_percentile)"""
+        if sketch.count == 0:
+            return Decimal("0")
+        return Decimal(str(sketch.quantile(percentile / 100)))
+
+
+class ReplicateStatistics:
+    """
+    Per-replicate statistics for standard errors.
+
+    Each block is an independently randomized sample, so the spread of a
+    statistic across blocks estimates its standard error under the sampling
+    method used, including any variance reduction. Only running sums of the
+    block-level statistics are kept, so memory does not grow with the
+    number of blocks, and instances merge across shards.
+    """
+
+    def __init__(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES):
+        """
+        Initialize with no blocks.
+
+        Args:
+            percentiles: Percentiles tracked per block
+        """
+        self.percentiles = list(percentiles)
+        self.num_replicates = 0
+        # Section → key path → (shift, [Σs, Σs², Σs·y, Σs²·y, Σs²·y²]) with
+        # y = block statistic - shift and s = block size
+        self.sums: Dict[str, Dict[Tuple[str, ...], Tuple[float, np.ndarray]]] = {
+            "revenue_percentiles": {},
+            "stakeholder_percentiles": {},
+            "probability_of_recoupment": {}
+        }
+
+    def add_block(
+        self,
+        revenues: np.ndarray,
+        metrics: Dict[str, Dict[str, np.ndarray]]
+    ) -> None:
+        """
+        Record the statistics of one replicate block.
+
+        Args:
+            revenues: Sampled total revenue per scenario in the block
+            metrics: Stakeholder → metric name → array for the block
+        """
+        revenues = np.asarray(revenues, dtype=float)
+        if revenues.size == 0:
+            return
+
+        self._record(
+            revenues.size,
+            {percentile_key(p): _nearest_rank(revenues, p) for p in self.percentiles},
+            {
+                sid: {
+                    f"{prefix}_{percentile_key(p)}": _nearest_rank(np.asarray(values[name], dtype=float), p)
+                    for name, prefix in PERCENTILE_METRICS.items()
+                    for p in self.percentiles
+                }
+                for sid, values in metrics.items()
+            },
+            {
+                sid: float(np.mean(np.asarray(values["fully_recouped"], dtype=float)))
+                for sid, values in metrics.items()
+            }
+        )
+
+    def add_aggregate(self, aggregator: MonteCarloAggregator) -> None:
+        """
+        Record one replicate block summarized by a MonteCarloAggregator.
+
+        Used by the streaming path, which never holds a block's scenarios;
+        block percentiles are the aggregator's sketch estimates.
+
+        Args:
+            aggregator: Aggregator fed with exactly the block's scenarios
+        """
+        if aggregator.num_scenarios == 0:
+            return
+
+        self._record(
+            aggregator.num_scenarios,
+            {key: float(value) for key, value in aggregator.revenue_percentiles(self.percentiles).items()},
+            {
+                sid: {key: float(value) for key, value in values.items()}
+                for sid, values in aggregator.stakeholder_percentiles(self.percentiles).items()
+            },
+            {sid: float(value) for sid, value in aggregator.probability_of_recoupment().items()}
+        )
+
+    def merge(self, other: "ReplicateStatistics") -> "ReplicateStatistics":
+        """
+        Fold another instance's blocks into this one.
+
+        Args:
+            other: Statistics to merge
+
+        Returns:
+            This instance
+        """
+        self.num_replicates += other.num_replicates
+        for section, entries in other.sums.items():
+            for path, (shift, sums) in entries.items():
+                self._accumulate(section, path, shift, sums)
+        return self
+
+    def standard_errors(self) -> Dict[str, Any]:
+        """
+        Standard errors of the size-weighted mean of block statistics.
+
+        Returns:
+            Dict with "revenue_percentiles", "stakeholder_percentiles" and
+            "probability_of_recoupment", keyed like MonteCarloResult (values
+            are None with fewer than two blocks)
+        """
+        def standard_error(shift: float, sums: np.ndarray) -> Optional[Decimal]:
+            if self.num_replicates < 2:
+                return None
+            size, size_squared, weighted, squared_weighted, squared_weighted_squares = sums
+            # Σw²(y - m)² with w = s/Σs, expanded over the running sums
+            mean = weighted / size
+            spread = squared_weighted_squares - 2 * mean * squared_weighted + mean ** 2 * size_squared
+            variance = self.num_replicates / (self.num_replicates - 1) * max(spread, 0.0) / size ** 2
+            return Decimal(str(float(np.sqrt(variance))))
+
+        return self._summarize(standard_error)
+
+    def estimates(self) -> Dict[str, Any]:
+        """
+        Size-weighted means of block statistics.
+
+        Returns:
+            Dict keyed like standard_errors()
+        """
+        return self._summarize(lambda shift, sums: Decimal(str(float(shift + sums[2] / sums[0]))))
+
+    def _record(
+        self,
+        size: int,
+        revenue_percentiles: Dict[str, float],
+        stakeholder_percentiles: Dict[str, Dict[str, float]],
+        probability_of_recoupment: Dict[str, float]
+    ) -> None:
+        """Fold one block's statistics into the running sums"""
+        self.num_replicates += 1
+        block = {
+            "revenue_percentiles": {(key,): value for key, value in revenue_percentiles.items()},
+            "stakeholder_percentiles": {
+                (sid, key): value
+                for sid, values in stakeholder_percentiles.items()
+                for key, value in values.items()
+            },
+            "probability_of_recoupment": {(sid,): value for sid, value in probability_of_recoupment.items()}
+        }
+        for section, values in block.items():
+            for path, value in values.items():
+                entry = self.sums[section].get(path)
+                # The first block's value is the shift, keeping the squared sums well conditioned
+                shift = value if entry is None else entry[0]
+                y = value - shift
+                self._accumulate(
+                    section, path, shift,
+                    np.array([size, size ** 2, size * y, size ** 2 * y, size ** 2 * y ** 2], dtype=float)
+                )
+
+    def _accumulate(
+        self,
+        section: str,
+        path: Tuple[str, ...],
+        shift: float,
+        sums: np.ndarray
+    ) -> None:
+        """Add running sums taken about `shift` to a quantity's entry"""
+        entry = self.sums[section].get(path)
+        if entry is None:
+            self.sums[section][path] = (shift, sums.copy())
+            return
+
+        own_shift, own = entry
+        # Re-express the incoming sums about this entry's shift
+        delta = shift - own_shift
+        size, size_squared, weighted, squared_weighted, squared_weighted_squares = sums
+        own += [
+            size,
+            size_squared,
+            weighted + delta * size,
+            squared_weighted + delta * size_squared,
+            squared_weighted_squares + 2 * delta * squared_weighted + delta ** 2 * size_squared
+        ]
+
+    def _summarize(
+        self,
+        statistic: Callable[[float, np.ndarray], Optional[Decimal]]
+    ) -> Dict[str, Any]:
+        """
+        Apply a statistic to every tracked quantity's running sums.
+
+        Args:
+            statistic: Function of (shift, running sums)
+
+        Returns:
+            Dict keyed like standard_errors() (empty with no blocks)
+        """
+        if not self.num_replicates:
+            return {}
+
+        stakeholder_percentiles: Dict[str, Dict[str, Optional[Decimal]]] = {}
+        for (sid, key), (shift, sums) in self.sums["stakeholder_percentiles"].items():
+            stakeholder_percentiles.setdefault(sid, {})[key] = statistic(shift, sums)
+
+        return {
+            "revenue_percentiles": {
+                key: statistic(shift, sums)
+                for (key,), (shift, sums) in self.sums["revenue_percentiles"].items()
+            },
+            "stakeholder_percentiles": stakeholder_percentiles,
+            "probability_of_recoupment": {
+                sid: statistic(shift, sums)
+                for (sid,), (shift, sums) in self.sums["probability_of_recoupment"].items()
+            }
+        }
+
+
 class MonteCarloSimulator:
     """
     Run Monte Carlo simulations of revenue uncertainty.
@@ -107,110 +916,435 @@ class MonteCarloSimulator:
         self.capital_stack = capital_stack
         self.base_projection = base_revenue_projection
 
+        # Compiled once and shared by every scenario (and shipped to workers)
+        self.plan = compile_waterfall(waterfall_structure)
+
         logger.info("MonteCarloSimulator initialized")
 
+    @traced("monte_carlo.simulate")
     def simulate(
         self,
-        revenue_distribution: RevenueDistribution,
+        revenue_distribution: Union[RevenueDistribution, CorrelatedRevenueModel],
         num_simulations: int = 1000,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        keep_scenarios: bool = True,
+        streaming: bool = False,
+        sampling: str = "random",
+        replicates: int = DEFAULT_REPLICATES,
+        precision_targets: Optional[Sequence[PrecisionTarget]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compact_scenarios: bool = False
     ) -> MonteCarloResult:
         """
         Run Monte Carlo simulation.
 
         Args:
-            revenue_distribution: Distribution for total revenue
-            num_simulations: Number of scenarios to run
+            revenue_distribution: Distribution for total revenue, or a
+                CorrelatedRevenueModel
+            num_simulations: Number of scenarios to run (the maximum budget
+                when precision_targets are given)
             seed: Random seed for reproducibility
+            percentiles: Percentiles to report (0-100)
+            keep_scenarios: Retain every MonteCarloScenario on the result
+            streaming: Estimate percentiles with a MonteCarloAggregator
+                (constant memory) instead of exact sorting
+            sampling: "random", "antithetic", "lhs" or "sobol"
+            replicates: Independent replicate blocks used for standard errors
+                (ignored in adaptive mode, where every batch is a block)
+            precision_targets: Stop once every target's confidence interval
+                is within tolerance
+            batch_size: Scenarios per batch in adaptive mode
+            compact_scenarios: Retain scenarios as CompactMonteCarloScenario
 
         Returns:
             MonteCarloResult with percentile analysis
         """
-        if seed is not None:
-            random.seed(seed)
+        percentiles = _validate_percentiles(percentiles)
+        _validate_sampling(sampling, replicates)
+
+        targets = list(precision_targets or [])
+        if targets:
+            if batch_size < 1:
+                raise ValueError("batch_size must be at least 1")
+            _validate_precision_targets(targets, percentiles)
+            block_size = batch_size
+        else:
+            block_size = max(1, -(-num_simulations // replicates))
+
+        # Private generators so concurrent runs don't share the global stream
+        rng = random.Random(seed)
+        np_rng = np.random.default_rng(seed)
+
+        correlated = isinstance(revenue_distribution, CorrelatedRevenueModel)
+        dimensions = revenue_distribution.dimensions if correlated else 1
+
+        total_revenue = self.base_projection.metadata["total_ultimate_revenue"]
+        if isinstance(total_revenue, str):
+            total_revenue = Decimal(total_revenue)
 
         scenarios = []
-        all_revenues = []
+        stakeholder_ids: Tuple[str, ...] = ()
+        aggregator = MonteCarloAggregator() if streaming else None
+        replicate_stats = ReplicateStatistics(percentiles)
+        convergence = None
+        history: List[Dict[str, Any]] = []
 
-        # Collect all stakeholder IDs
-        stakeholder_ids = set()
+        # Exact-mode accumulators (stakeholder → metric values)
+        all_revenues = []
+        metric_values: Dict[str, Dict[str, List[Decimal]]] = {}
+        recouped_counts: Dict[str, int] = {}
 
         logger.info(f"Running {num_simulations} Monte Carlo simulations...")
 
-        for i in range(num_simulations):
-            # Sample revenue
-            sampled_revenue = self._sample_from_distribution(revenue_distribution)
-            all_revenues.append(sampled_revenue)
-
-            # Generate revenue projection (scaled from base)
-            # Convert metadata value to Decimal if it's a string
-            total_revenue = self.base_projection.metadata["total_ultimate_revenue"]
-            if isinstance(total_revenue, str):
-                total_revenue = Decimal(total_revenue)
-            scale_factor = sampled_revenue / total_revenue
-            scaled_projection = self._scale_projection(self.base_projection, scale_factor)
-
-            # Execute waterfall
-            executor = WaterfallExecutor(self.waterfall)
-            waterfall_result = executor.execute_over_time(scaled_projection)
-
-            # Analyze stakeholders
-            analyzer = StakeholderAnalyzer(self.capital_stack)
-            stakeholder_analysis = analyzer.analyze(waterfall_result)
-
-            # Extract results
-            stakeholder_results = {}
-            for stakeholder in stakeholder_analysis.stakeholders:
-                stakeholder_ids.add(stakeholder.stakeholder_id)
-                stakeholder_results[stakeholder.stakeholder_id] = {
-                    "irr": stakeholder.irr if stakeholder.irr else Decimal("0"),
-                    "cash_on_cash": stakeholder.cash_on_cash,
-                    "total_receipts": stakeholder.total_receipts,
-                    "fully_recouped": stakeholder.total_receipts >= stakeholder.initial_investment
+        simulations_run = 0
+        for block_start, block_stop in _block_bounds(0, num_simulations, block_size):
+            block_length = block_stop - block_start
+
+            # Each block is an independently randomized design
+            design = None
+            if sampling != "random":
+                design = _uniform_design(sampling, block_length, dimensions, np_rng)
+
+            correlated_revenue = None
+            sampled_values = None
+            if correlated:
+                # Correlated draws are vectorized per block, one revenue row per scenario
+                correlated_revenue = revenue_distribution.sample(block_length, np_rng, uniforms=design)
+            elif design is not None:
+                sampled_values = revenue_distribution.inverse_cdf(design[:, 0]).tolist()
+
+            # Streaming summarizes each block in a sketch rather than per-scenario lists
+            block_aggregator = MonteCarloAggregator() if streaming else None
+            block_revenues: List[float] = []
+            block_metrics: Dict[str, Dict[str, List[float]]] = {}
+
+            for j in range(block_length):
+                with span("monte_carlo.project", "projection"):
+                    if correlated_revenue is not None:
+                        scaled_projection = self._projection_from_quarters(
+                            revenue_distribution.quarters, correlated_revenue[j]
+                        )
+                        sampled_revenue = sum(scaled_projection.quarterly_revenue.values(), Decimal("0"))
+                    else:
+                        # Sample revenue
+                        if sampled_values is not None:
+                            sampled_revenue = Decimal(str(sampled_values[j]))
+                        else:
+                            sampled_revenue = self._sample_from_distribution(revenue_distribution, rng)
+
+                        # Generate revenue projection (scaled from base)
+                        scale_factor = sampled_revenue / total_revenue
+                        scaled_projection = self._scale_projection(self.base_projection, scale_factor)
+
+                # Execute waterfall
+                executor = WaterfallExecutor(self.waterfall, self.plan)
+                waterfall_result = executor.execute_summary(scaled_projection)
+
+                # Analyze stakeholders
+                analyzer = StakeholderAnalyzer(self.capital_stack)
+                stakeholder_analysis = analyzer.analyze(waterfall_result)
+
+                # Extract results
+                stakeholder_results = {}
+                for stakeholder in stakeholder_analysis.stakeholders:
+                    stakeholder_results[stakeholder.stakeholder_id] = {
+                        "irr": stakeholder.irr if stakeholder.irr else Decimal("0"),
+                        "cash_on_cash": stakeholder.cash_on_cash,
+                        "total_receipts": stakeholder.total_receipts,
+                        "fully_recouped": stakeholder.total_receipts >= stakeholder.initial_investment
+                    }
+
+                if block_aggregator is not None:
+                    block_aggregator.add_scenario(sampled_revenue, stakeholder_results)
+                else:
+                    all_revenues.append(sampled_revenue)
+                    for stakeholder_id, result in stakeholder_results.items():
+                        values = metric_values.setdefault(
+                            stakeholder_id, {name: [] for name in PERCENTILE_METRICS}
+                        )
+                        for name in PERCENTILE_METRICS:
+                            values[name].append(result[name])
+                        recouped_counts[stakeholder_id] = (
+                            recouped_counts.get(stakeholder_id, 0) + bool(result["fully_recouped"])
+                        )
+
+                    block_revenues.append(float(sampled_revenue))
+                    for stakeholder_id, result in stakeholder_results.items():
+                        values = block_metrics.setdefault(
+                            stakeholder_id, {name: [] for name in list(PERCENTILE_METRICS) + ["fully_recouped"]}
+                        )
+                        for name in values:
+                            values[name].append(float(result[name]))
+
+                if keep_scenarios and compact_scenarios:
+                    # Scenarios share one stakeholder index tuple
+                    if tuple(stakeholder_results) != stakeholder_ids:
+                        stakeholder_ids = tuple(stakeholder_results)
+                    scenarios.append(CompactMonteCarloScenario.from_results(
+                        block_start + j, sampled_revenue, stakeholder_ids, stakeholder_results
+                    ))
+                elif keep_scenarios:
+                    scenarios.append(MonteCarloScenario(
+                        scenario_id=block_start + j,
+                        total_revenue=sampled_revenue,
+                        stakeholder_results=stakeholder_results
+                    ))
+
+            if block_aggregator is not None:
+                replicate_stats.add_aggregate(block_aggregator)
+                aggregator.merge(block_aggregator)
+            else:
+                replicate_stats.add_block(np.array(block_revenues), block_metrics)
+            simulations_run = block_stop
+
+            if targets:
+                report = _evaluate_precision_targets(targets, replicate_stats)
+                history.append({
+                    "num_simulations": simulations_run,
+                    "half_widths": {label: entry["half_width"] for label, entry in report.items()}
+                })
+                convergence = ConvergenceDiagnostics(
+                    converged=all(entry["met"] for entry in report.values()),
+                    num_simulations=simulations_run,
+                    num_batches=replicate_stats.num_replicates,
+                    targets=report,
+                    history=history
+                )
+                if convergence.converged:
+                    logger.info(f"Precision targets met after {simulations_run} simulations")
+                    break
+
+        count("monte_carlo.scenarios", simulations_run)
+        with span("monte_carlo.aggregate", "aggregation"):
+            if aggregator is not None:
+                revenue_percentiles = aggregator.revenue_percentiles(percentiles)
+                stakeholder_percentiles = aggregator.stakeholder_percentiles(percentiles)
+                probability_of_recoupment = aggregator.probability_of_recoupment()
+            else:
+                # Calculate percentiles
+                revenue_percentiles = {
+                    percentile_key(p): self._calculate_percentile(all_revenues, p) for p in percentiles
                 }
 
-            scenario = MonteCarloScenario(
-                scenario_id=i,
-                total_revenue=sampled_revenue,
-                stakeholder_results=stakeholder_results
+                # Calculate stakeholder percentiles
+                stakeholder_percentiles = {
+                    stakeholder_id: {
+                        f"{prefix}_{percentile_key(p)}": self._calculate_percentile(values[name], p)
+                        for name, prefix in PERCENTILE_METRICS.items()
+                        for p in percentiles
+                    }
+                    for stakeholder_id, values in metric_values.items()
+                }
+
+                probability_of_recoupment = {
+                    stakeholder_id: Decimal(str(recouped)) / Decimal(str(simulations_run))
+                    for stakeholder_id, recouped in recouped_counts.items()
+                }
+
+        result = MonteCarloResult(
+            num_simulations=simulations_run,
+            scenarios=scenarios,
+            revenue_percentiles=revenue_percentiles,
+            stakeholder_percentiles=stakeholder_percentiles,
+            probability_of_recoupment=probability_of_recoupment,
+            standard_errors=replicate_stats.standard_errors(),
+            convergence=convergence,
+            metadata={
+                "distribution": revenue_distribution.distribution_type,
+                "seed": seed,
+                "percentiles": percentiles,
+                "streaming": streaming,
+                "sampling": sampling,
+                "replicates": replicate_stats.num_replicates,
+                "max_simulations": num_simulations
+            }
+        )
+
+        logger.info(f"Completed {simulations_run} simulations")
+
+        return result
+
+    @traced("monte_carlo.simulate_batch")
+    def simulate_batch(
+        self,
+        revenue_distribution: Union[RevenueDistribution, CorrelatedRevenueModel],
+        num_simulations: int = 1000,
+        seed: Optional[int] = None,
+        chunk_size: int = 10000,
+        workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        response_curve: bool = False,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        keep_scenarios: bool = True,
+        streaming: bool = False,
+        sampling: str = "random",
+        replicates: int = DEFAULT_REPLICATES,
+        compact_scenarios: bool = False
+    ) -> MonteCarloResult:
+        """
+        Run Monte Carlo simulation as vectorized NumPy batches.
+
+        Scenarios are split into fixed-size shards. Each shard draws from its
+        own numpy.random.SeedSequence child stream, executes the quarterly
+        waterfall with BatchWaterfallExecutor and solves all stakeholder IRRs
+        in one pass. Shards run in a ProcessPoolExecutor when workers > 1 and
+        are merged in shard order, so results for a given seed are
+        bit-identical whatever the worker count. Results match simulate()
+        within the tolerances in the module docstring.
+
+        With streaming=True each shard folds its chunks into a
+        MonteCarloAggregator and only the aggregators are merged; combined
+        with keep_scenarios=False no per-scenario arrays outlive their shard.
+
+        Args:
+            revenue_distribution: Distribution for total revenue, or a
+                CorrelatedRevenueModel
+            num_simulations: Number of scenarios to run
+            seed: Random seed for reproducibility (root of the SeedSequence)
+            chunk_size: Scenarios per array batch within a shard (bounds peak memory)
+            workers: Worker processes (None or 1 runs in-process)
+            shard_size: Scenarios per independently seeded shard
+            response_curve: Read payee receipts off a RevenueScaleCurve instead
+                of running the quarterly waterfall (agrees to within a few cents;
+                single-variable distributions only). Shards whose curve would
+                need more segments than they have scenarios run directly.
+            percentiles: Percentiles to report (0-100)
+            keep_scenarios: Retain every MonteCarloScenario on the result
+            streaming: Estimate percentiles with mergeable sketches instead of
+                exact partitioning
+            sampling: "random", "antithetic", "lhs" or "sobol"; replicate
+                blocks are split at shard boundaries so each piece is its own
+                design
+            replicates: Independent replicate blocks used for standard errors
+            compact_scenarios: Retain scenarios as CompactMonteCarloScenario
+                rows of one shared metrics table
+
+        Returns:
+            MonteCarloResult with percentile analysis
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        if response_curve and isinstance(revenue_distribution, CorrelatedRevenueModel):
+            raise ValueError("response_curve requires a single revenue scale variable")
+        percentiles = _validate_percentiles(percentiles)
+        _validate_sampling(sampling, replicates)
+        block_size = max(1, -(-num_simulations // replicates))
+
+        num_shards = max(1, -(-num_simulations // shard_size))
+        shard_sizes = [
+            min(shard_size, num_simulations - i * shard_size) for i in range(num_shards)
+        ]
+        shard_seeds = np.random.SeedSequence(seed).spawn(num_shards)
+
+        # Per-scenario arrays are only needed for exact percentiles or raw scenarios
+        retain_arrays = keep_scenarios or not streaming
+
+        logger.info(
+            f"Running {num_simulations} Monte Carlo simulations (batch mode, "
+            f"{num_shards} shards, workers={workers or 1})..."
+        )
+
+        shard_args = (
+            [revenue_distribution] * num_shards,
+            shard_seeds,
+            shard_sizes,
+            [chunk_size] * num_shards,
+            [response_curve] * num_shards,
+            [streaming] * num_shards,
+            [retain_arrays] * num_shards,
+            [sampling] * num_shards,
+            [i * shard_size for i in range(num_shards)],
+            [block_size] * num_shards,
+            [percentiles] * num_shards
+        )
+        aggregator = MonteCarloAggregator() if streaming else None
+        replicate_stats = ReplicateStatistics(percentiles)
+        if workers and workers > 1 and num_shards > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, num_shards)) as pool:
+                shard_results = self._collect_shards(
+                    pool.map(self._simulate_shard, *shard_args), aggregator, replicate_stats, retain_arrays
+                )
+        else:
+            shard_results = self._collect_shards(
+                map(self._simulate_shard, *shard_args), aggregator, replicate_stats, retain_arrays
             )
 
-            scenarios.append(scenario)
+        count("monte_carlo.scenarios", num_simulations)
+        with span("monte_carlo.aggregate", "aggregation"):
+            scenarios = []
+            if retain_arrays:
+                # Merge partial results in shard order
+                sampled_revenues = np.concatenate([shard["revenues"] for shard in shard_results])
+                metrics = {
+                    sid: {
+                        name: np.concatenate([shard["metrics"][sid][name] for shard in shard_results])
+                        for name in values
+                    }
+                    for sid, values in shard_results[0]["metrics"].items()
+                }
+                recouped_counts = {
+                    sid: sum(shard["recouped_counts"][sid] for shard in shard_results)
+                    for sid in metrics
+                }
 
-        # Calculate percentiles
-        revenue_percentiles = {
-            "p10": self._calculate_percentile(all_revenues, 10),
-            "p50": self._calculate_percentile(all_revenues, 50),
-            "p90": self._calculate_percentile(all_revenues, 90)
-        }
+            if keep_scenarios and compact_scenarios:
+                # One (scenarios × stakeholders × metrics) table; scenarios hold row views
+                stakeholder_ids = tuple(metrics)
+                table = np.zeros((num_simulations, len(stakeholder_ids), len(SCENARIO_METRICS)))
+                for column, sid in enumerate(stakeholder_ids):
+                    for m, name in enumerate(SCENARIO_METRICS):
+                        table[:, column, m] = metrics[sid][name]
+                scenarios = [
+                    CompactMonteCarloScenario(i, Decimal(str(revenue)), stakeholder_ids, table[i])
+                    for i, revenue in enumerate(sampled_revenues.tolist())
+                ]
+            elif keep_scenarios:
+                # Build scenarios in the same shape as simulate()
+                revenues_list = sampled_revenues.tolist()
+                metric_lists = {
+                    sid: {name: values.tolist() for name, values in stakeholder_metrics.items()}
+                    for sid, stakeholder_metrics in metrics.items()
+                }
+                for i in range(num_simulations):
+                    stakeholder_results = {
+                        sid: {
+                            "irr": Decimal(str(values["irr"][i])),
+                            "cash_on_cash": Decimal(str(values["cash_on_cash"][i])),
+                            "total_receipts": Decimal(str(values["total_receipts"][i])),
+                            "fully_recouped": values["fully_recouped"][i]
+                        }
+                        for sid, values in metric_lists.items()
+                    }
+                    scenarios.append(MonteCarloScenario(
+                        scenario_id=i,
+                        total_revenue=Decimal(str(revenues_list[i])),
+                        stakeholder_results=stakeholder_results
+                    ))
+
+            if aggregator is not None:
+                revenue_percentiles = aggregator.revenue_percentiles(percentiles)
+                stakeholder_percentiles = aggregator.stakeholder_percentiles(percentiles)
+                probability_of_recoupment = aggregator.probability_of_recoupment()
+            else:
+                revenue_percentiles = {
+                    percentile_key(p): self._calculate_percentile_array(sampled_revenues, p)
+                    for p in percentiles
+                }
 
-        # Calculate stakeholder percentiles
-        stakeholder_percentiles = {}
-        probability_of_recoupment = {}
-
-        for stakeholder_id in stakeholder_ids:
-            irrs = []
-            cocs = []
-            recouped_count = 0
-
-            for scenario in scenarios:
-                if stakeholder_id in scenario.stakeholder_results:
-                    result = scenario.stakeholder_results[stakeholder_id]
-                    irrs.append(result["irr"])
-                    cocs.append(result["cash_on_cash"])
-                    if result["fully_recouped"]:
-                        recouped_count += 1
-
-            stakeholder_percentiles[stakeholder_id] = {
-                "irr_p10": self._calculate_percentile(irrs, 10),
-                "irr_p50": self._calculate_percentile(irrs, 50),
-                "irr_p90": self._calculate_percentile(irrs, 90),
-                "coc_p10": self._calculate_percentile(cocs, 10),
-                "coc_p50": self._calculate_percentile(cocs, 50),
-                "coc_p90": self._calculate_percentile(cocs, 90),
-            }
+                stakeholder_percentiles = {
+                    sid: {
+                        f"{prefix}_{percentile_key(p)}": self._calculate_percentile_array(values[name], p)
+                        for name, prefix in PERCENTILE_METRICS.items()
+                        for p in percentiles
+                    }
+                    for sid, values in metrics.items()
+                }
 
-            probability_of_recoupment[stakeholder_id] = Decimal(str(recouped_count)) / Decimal(str(num_simulations))
+                probability_of_recoupment = {
+                    sid: Decimal(str(recouped_counts[sid])) / Decimal(str(num_simulations))
+                    for sid in metrics
+                }
 
         result = MonteCarloResult(
             num_simulations=num_simulations,
@@ -218,36 +1352,329 @@ class MonteCarloSimulator:
             revenue_percentiles=revenue_percentiles,
             stakeholder_percentiles=stakeholder_percentiles,
             probability_of_recoupment=probability_of_recoupment,
+            standard_errors=replicate_stats.standard_errors(),
             metadata={
                 "distribution": revenue_distribution.distribution_type,
-                "seed": seed
+                "seed": seed,
+                "method": "batch",
+                "workers": workers or 1,
+                "shard_size": shard_size,
+                "num_shards": num_shards,
+                "response_curve": response_curve,
+                "percentiles": percentiles,
+                "streaming": streaming,
+                "sampling": sampling,
+                "replicates": replicate_stats.num_replicates
             }
         )
 
-        logger.info(f"Completed {num_simulations} simulations")
+        logger.info(f"Completed {num_simulations} simulations (batch mode)")
 
         return result
 
+    @staticmethod
+    def _collect_shards(
+        shard_results: Iterable[Dict[str, Any]],
+        aggregator: Optional[MonteCarloAggregator],
+        replicate_stats: ReplicateStatistics,
+        retain_arrays: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Consume shard results in order, merging aggregators as they arrive.
+
+        Args:
+            shard_results: Shard results in shard order
+            aggregator: Aggregator to merge shard aggregators into (streaming only)
+            replicate_stats: Replicate statistics to merge shard blocks into
+            retain_arrays: Keep shard results for array merging
+
+        Returns:
+            Retained shard results (empty when arrays are not retained)
+        """
+        retained = []
+        for shard in shard_results:
+            if aggregator is not None:
+                aggregator.merge(shard["aggregator"])
+            replicate_stats.merge(shard["replicates"])
+            if retain_arrays:
+                retained.append(shard)
+        return retained
+
+    def _simulate_shard(
+        self,
+        revenue_distribution: Union[RevenueDistribution, CorrelatedRevenueModel],
+        seed_sequence: np.random.SeedSequence,
+        size: int,
+        chunk_size: int,
+        response_curve: bool = False,
+        streaming: bool = False,
+        retain_arrays: bool = True,
+        sampling: str = "random",
+        offset: int = 0,
+        block_size: Optional[int] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Any]:
+        """
+        Simulate one independently seeded shard of scenarios.
+
+        Runs in a worker process when simulate_batch() is parallel, so it only
+        depends on the simulator's own (picklable) state.
+
+        Args:
+            revenue_distribution: Distribution for total revenue, or a
+                CorrelatedRevenueModel
+            seed_sequence: Child SeedSequence for this shard
+            size: Number of scenarios in the shard
+            chunk_size: Scenarios per array batch
+            response_curve: Evaluate receipts from a RevenueScaleCurve, unless
+                it needs more segments than the shard has scenarios
+            streaming: Fold each chunk into a MonteCarloAggregator
+            retain_arrays: Return per-scenario revenue and metric arrays
+            sampling: Sampling strategy (see SAMPLING_METHODS)
+            offset: Index of the shard's first scenario in the whole run
+            block_size: Scenarios per replicate block (None = one block)
+            percentiles: Percentiles tracked per replicate block
+
+        Returns:
+            Dict with sampled revenues, per-stakeholder metric arrays and
+            recoupment counts (None unless retain_arrays), the shard's
+            aggregator (None unless streaming) and its ReplicateStatistics
+        """
+        rng = np.random.default_rng(seed_sequence)
+
+        correlated = isinstance(revenue_distribution, CorrelatedRevenueModel)
+        blocks = _block_bounds(offset, size, block_size or max(size, 1))
+
+        design = None
+        if sampling != "random":
+            dimensions = revenue_distribution.dimensions if correlated else 1
+            design = np.vstack([np.empty((0, dimensions))] + [
+                _uniform_design(sampling, stop - start, dimensions, rng) for start, stop in blocks
+            ])
+
+        with span("monte_carlo.project", "projection"):
+            if correlated:
+                # Totals are filled in chunk by chunk as revenue matrices are drawn
+                sampled_revenues = np.zeros(size)
+                revenue_quarters = revenue_distribution.quarters.tolist()
+            else:
+                if design is None:
+                    sampled_revenues = self._sample_batch(revenue_distribution, size, rng)
+                else:
+                    sampled_revenues = revenue_distribution.inverse_cdf(design[:, 0])
+
+                total_revenue = self.base_projection.metadata["total_ultimate_revenue"]
+                if isinstance(total_revenue, str):
+                    total_revenue = Decimal(total_revenue)
+
+                revenue_quarters = sorted(self.base_projection.quarterly_revenue.keys())
+                base_revenue = np.array(
+                    [float(self.base_projection.quarterly_revenue[q]) for q in revenue_quarters]
+                )
+                scale_factors = sampled_revenues / float(total_revenue)
+
+        stakeholders = self._build_stakeholder_specs()
+
+        # Common time grid covering revenue quarters and investment quarters
+        grid_quarters = sorted(
+            set(revenue_quarters).union(*(s["investment"].keys() for s in stakeholders.values()))
+        )
+        grid_index = {q: i for i, q in enumerate(grid_quarters)}
+        revenue_columns = np.array([grid_index[q] for q in revenue_quarters], dtype=np.int64)
+        grid_array = np.array(grid_quarters, dtype=float)
+        analyzer = StakeholderAnalyzer(self.capital_stack)
+
+        # Shard-sized arrays feed the replicate blocks; returned only if retained
+        metrics = {
+            sid: {
+                "irr": np.zeros(size),
+                "cash_on_cash": np.zeros(size),
+                "total_receipts": np.zeros(size),
+                "fully_recouped": np.zeros(size, dtype=bool)
+            }
+            for sid in stakeholders
+        }
+        aggregator = MonteCarloAggregator() if streaming else None
+
+        executor = BatchWaterfallExecutor(self.waterfall, self.plan)
+        payee_lookup = {name: i for i, name in enumerate(self.plan.payee_names)}
+
+        revenue_curve = None
+        if response_curve and size:
+            # Each segment costs about one scenario, so small shards run directly
+            revenue_curve = build_revenue_scale_curve(
+                self.waterfall,
+                self.base_projection,
+                max_scale=max(float(scale_factors.max()), 1e-9),
+                plan=self.plan,
+                max_segments=size
+            )
+        if revenue_curve is not None:
+            curve_quarters = set(revenue_curve.quarters)
+            curve_columns = [i for i, q in enumerate(revenue_quarters) if q in curve_quarters]
+
+        for start in range(0, size, chunk_size):
+            stop = min(start + chunk_size, size)
+            if correlated:
+                revenue = revenue_distribution.sample(
+                    stop - start, rng, uniforms=None if design is None else design[start:stop]
+                )
+                sampled_revenues[start:stop] = revenue.sum(axis=1)
+            else:
+                revenue = scale_factors[start:stop, np.newaxis] * base_revenue[np.newaxis, :]
+
+            if revenue_curve is not None:
+                payee_payouts = np.zeros((stop - start, len(revenue_quarters), len(payee_lookup)))
+                payee_payouts[:, curve_columns, :] = revenue_curve.payee_receipts(scale_factors[start:stop])
+            else:
+                batch_result = executor.execute(revenue, quarters=np.array(revenue_quarters))
+                payee_payouts = batch_result.payee_payouts
+
+            chunk_metrics = {}
+            for sid, spec in stakeholders.items():
+                payee_idx = payee_lookup.get(spec["payee_name"])
+                if payee_idx is None:
+                    receipts = np.zeros_like(revenue)
+                else:
+                    receipts = payee_payouts[:, :, payee_idx]
+
+                total_receipts = receipts.sum(axis=1)
+                amount = spec["amount"]
+
+                cash_flows = np.zeros((stop - start, len(grid_quarters)))
+                cash_flows[:, revenue_columns] += receipts
+                for quarter, outflow in spec["investment"].items():
+                    cash_flows[:, grid_index[quarter]] -= outflow
+
+                irr = analyzer.calculate_irr_batch(cash_flows, grid_array)
+
+                chunk_metrics[sid] = {
+                    "irr": np.nan_to_num(irr, nan=0.0),
+                    "total_receipts": total_receipts,
+                    "cash_on_cash": total_receipts / amount if amount > 0 else np.zeros(stop - start),
+                    "fully_recouped": total_receipts >= amount * (1.0 - RECOUPMENT_TOLERANCE)
+                }
+
+            if aggregator is not None:
+                aggregator.add_batch(sampled_revenues[start:stop], chunk_metrics)
+            for sid, values in chunk_metrics.items():
+                for name, array in values.items():
+                    metrics[sid][name][start:stop] = array
+
+        replicate_stats = ReplicateStatistics(percentiles)
+        for start, stop in blocks:
+            replicate_stats.add_block(
+                sampled_revenues[start:stop],
+                {
+                    sid: {name: array[start:stop] for name, array in values.items()}
+                    for sid, values in metrics.items()
+                }
+            )
+
+        return {
+            "revenues": sampled_revenues if retain_arrays else None,
+            "metrics": metrics if retain_arrays else None,
+            "recouped_counts": {
+                sid: int(values["fully_recouped"].sum()) for sid, values in metrics.items()
+            } if retain_arrays else None,
+            "aggregator": aggregator,
+            "replicates": replicate_stats
+        }
+
+    def _build_stakeholder_specs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Describe each capital stack instrument for batch analysis.
+
+        Mirrors StakeholderAnalyzer.analyze(): stakeholder IDs, payee mapping
+        and investment outflows (S-curve drawdown or lump sum at quarter 0).
+
+        Returns:
+            Dict mapping stakeholder_id → {payee_name, amount, investment}
+        """
+        analyzer = StakeholderAnalyzer(self.capital_stack)
+        specs: Dict[str, Dict[str, Any]] = {}
+
+        for component in self.capital_stack.components:
+            instrument = component.instrument
+            payee_name = analyzer.map_instrument_to_payee(instrument)
+
+            investment: Dict[int, float] = {}
+            if instrument.drawdown_schedule:
+                for quarter, percentage in instrument.drawdown_schedule.items():
+                    drawdown = float(instrument.amount * (percentage / Decimal("100")))
+                    investment[quarter] = investment.get(quarter, 0.0) + drawdown
+            else:
+                investment[0] = float(instrument.amount)
+
+            specs[f"{instrument.instrument_type.value}_{payee_name}"] = {
+                "payee_name": payee_name,
+                "amount": float(instrument.amount),
+                "investment": investment
+            }
+
+        return specs
+
+    def _sample_batch(
+        self,
+        distribution: RevenueDistribution,
+        size: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        Sample an array of values from the specified distribution.
+
+        Args:
+            distribution: RevenueDistribution specification
+            size: Number of samples
+            rng: NumPy random generator
+
+        Returns:
+            Sampled values as float array
+        """
+        if distribution.distribution_type == "triangular":
+            min_val = float(distribution.parameters["min"])
+            mode_val = float(distribution.parameters["mode"])
+            max_val = float(distribution.parameters["max"])
+            return rng.triangular(min_val, mode_val, max_val, size)
+
+        elif distribution.distribution_type == "uniform":
+            min_val = float(distribution.parameters["min"])
+            max_val = float(distribution.parameters["max"])
+            return rng.uniform(min_val, max_val, size)
+
+        elif distribution.distribution_type == "normal":
+            mean = float(distribution.parameters["mean"])
+            std = float(distribution.parameters["std"])
+            # Ensure non-negative
+            return np.maximum(rng.normal(mean, std, size), 0.0)
+
+        else:
+            raise ValueError(f"Unsupported distribution type: {distribution.distribution_type}")
+
     def _sample_from_distribution(
         self,
-        distribution: RevenueDistribution
+        distribution: RevenueDistribution,
+        rng: Optional[random.Random] = None
     ) -> Decimal:
         """
         Sample a value from the specified distribution.
 
         Args:
             distribution: RevenueDistribution specification
+            rng: Random generator (defaults to the global random module)
 
         Returns:
             Sampled value as Decimal
         """
+        rng = rng or random
+
         if distribution.distribution_type == "triangular":
             # Triangular distribution
             min_val = float(distribution.parameters["min"])
             mode_val = float(distribution.parameters["mode"])
             max_val = float(distribution.parameters["max"])
 
-            sampled = random.triangular(min_val, max_val, mode_val)
+            sampled = rng.triangular(min_val, max_val, mode_val)
             return Decimal(str(sampled))
 
         elif distribution.distribution_type == "uniform":
@@ -255,7 +1682,7 @@ class MonteCarloSimulator:
             min_val = float(distribution.parameters["min"])
             max_val = float(distribution.parameters["max"])
 
-            sampled = random.uniform(min_val, max_val)
+            sampled = rng.uniform(min_val, max_val)
             return Decimal(str(sampled))
 
         elif distribution.distribution_type == "normal":
@@ -263,7 +1690,7 @@ class MonteCarloSimulator:
             mean = float(distribution.parameters["mean"])
             std = float(distribution.parameters["std"])
 
-            sampled = random.gauss(mean, std)
+            sampled = rng.gauss(mean, std)
             # Ensure non-negative
             sampled = max(0, sampled)
             return Decimal(str(sampled))
@@ -313,10 +1740,46 @@ class MonteCarloSimulator:
             metadata=base_projection.metadata
         )
 
+    def _projection_from_quarters(
+        self,
+        quarters: np.ndarray,
+        revenue: np.ndarray
+    ) -> RevenueProjection:
+        """
+        Build a projection from one row of a sampled revenue matrix.
+
+        Args:
+            quarters: Quarter of each column
+            revenue: Revenue per quarter
+
+        Returns:
+            RevenueProjection (windows and markets are not broken down)
+        """
+        quarterly_revenue = {
+            int(q): Decimal(str(amount)) for q, amount in zip(quarters.tolist(), revenue.tolist())
+        }
+
+        cumulative_revenue = {}
+        cumulative = Decimal("0")
+        for q in sorted(quarterly_revenue):
+            cumulative += quarterly_revenue[q]
+            cumulative_revenue[q] = cumulative
+
+        return RevenueProjection(
+            project_name=self.base_projection.project_name,
+            projection_start_date=self.base_projection.projection_start_date,
+            total_quarters=len(quarterly_revenue),
+            quarterly_revenue=quarterly_revenue,
+            cumulative_revenue=cumulative_revenue,
+            by_window={},
+            by_market={},
+            metadata=self.base_projection.metadata
+        )
+
     def _calculate_percentile(
         self,
         values: List[Decimal],
-        percentile: int
+        percentile: float
     ) -> Decimal:
         """
         Calculate percentile of values.
@@ -336,3 +1799,26 @@ class MonteCarloSimulator:
         index = min(index, len(sorted_values) - 1)
 
         return sorted_values[index]
+
+    def _calculate_percentile_array(
+        self,
+        values: np.ndarray,
+        percentile: float
+    ) -> Decimal:
+        """
+        Calculate percentile of a float array (same indexing as _calculate_percentile).
+
+        Args:
+            values: Array of values
+            percentile: Percentile (0-100)
+
+        Returns:
+            Percentile value as Decimal
+        """
+        if values.size == 0:
+            return Decimal("0")
+
+        index = int(values.size * percentile / 100)
+        index = min(index, values.size - 1)
+
+        return Decimal(str(float(np.partition(values, index)[index])))
@@ -0,0 +1,183 @@
+"""
+Projection Cache
+
+Bounded LRU cache of unit-revenue projection shapes for RevenueProjector.
+
+Resolving windows (template copy, normalization, box office / SVOD
+adjustments) and spreading each window across quarters only depends on the
+window definitions and the adjustment ratios, not on the total revenue. A
+ProjectionShape stores the result for a total of 1, so projecting any total
+with the same windows is one scalar multiply per quarter.
+
+Keys are SHA-256 digests of a canonical encoding of the windows and the
+adjustment ratios, so equal inputs hit regardless of object identity.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default number of shapes kept before the least recently used is evicted
+DEFAULT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ProjectionShape:
+    """
+    Projection of one unit of total revenue.
+
+    Attributes:
+        quarterly: (quarter, share of total revenue) in quarter order
+        by_window: (window type, share of total revenue) in window order
+        windows_active: (quarter, active window types) in quarter order
+        num_windows: Number of resolved windows
+    """
+    quarterly: Tuple[Tuple[int, Decimal], ...]
+    by_window: Tuple[Tuple[str, Decimal], ...]
+    windows_active: Tuple[Tuple[int, Tuple[str, ...]], ...]
+    num_windows: int
+
+
+def projection_cache_key(
+    windows: Sequence[Any],
+    theatrical_ratio: Optional[Decimal],
+    svod_ratio: Optional[Decimal]
+) -> str:
+    """
+    Canonical hash of projection inputs.
+
+    Args:
+        windows: Distribution windows before normalization
+        theatrical_ratio: Theatrical box office / total revenue (None = not adjusted)
+        svod_ratio: SVOD license fee / total revenue (None = not adjusted)
+
+    Returns:
+        Hex digest identifying the projection shape
+    """
+    payload = {
+        "windows": [
+            [
+                w.window_type,
+                w.start_quarter,
+                w.duration_quarters,
+                str(w.revenue_percentage),
+                w.timing_profile,
+                w.metadata,
+            ]
+            for w in windows
+        ],
+        "theatrical": None if theatrical_ratio is None else str(theatrical_ratio),
+        "svod": None if svod_ratio is None else str(svod_ratio),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ProjectionCache:
+    """
+    Thread-safe LRU cache of ProjectionShape by key.
+
+    A maxsize of 0 disables caching (every lookup is a miss and nothing is
+    stored).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of shapes kept
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: "OrderedDict[str, ProjectionShape]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[ProjectionShape]:
+        """
+        Look up a shape, marking it most recently used.
+
+        Args:
+            key: Cache key (see projection_cache_key)
+
+        Returns:
+            Cached shape, or None on a miss
+        """
+        with self._lock:
+            shape = self._entries.get(key)
+            if shape is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return shape
+
+    def put(self, key: str, shape: ProjectionShape) -> None:
+        """
+        Store a shape, evicting the least recently used beyond maxsize.
+
+        Args:
+            key: Cache key
+            shape: Shape to store
+        """
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = shape
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters for monitoring.
+
+        Returns:
+            Dict with hits, misses, evictions, size, maxsize and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Shared by every RevenueProjector that isn't given its own cache
+_shared_cache = ProjectionCache()
+
+
+def get_projection_cache() -> ProjectionCache:
+    """Process-wide projection cache used by default"""
+    return _shared_cache
@@ -0,0 +1,199 @@
+"""
+Quantile Sketch
+
+Mergeable t-digest for streaming percentile estimation. Memory is bounded by
+the compression parameter rather than by the number of values seen, and two
+sketches built on separate chunks (or in separate worker processes) merge into
+one that summarises the union, so Monte Carlo runs can aggregate percentiles
+without keeping every scenario.
+
+Accuracy:
+    Centroid sizes follow the k1 scale function, so clusters are smallest in
+    the tails. With the default compression of 200 the rank error of P10/P50/
+    P90 is typically well under 0.5%, and the minimum and maximum are exact.
+    Merging sketches in a fixed order is deterministic.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default compression (δ); roughly δ/2 centroids are kept after compression
+DEFAULT_COMPRESSION = 200
+
+# Buffered values per centroid before the buffer is folded into the digest
+BUFFER_FACTOR = 10
+
+
+class QuantileSketch:
+    """
+    Mergeable t-digest over float values.
+
+    Values are buffered and periodically merged into weighted centroids in
+    one vectorized pass, so update() is cheap for both single values and
+    whole arrays.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            compression: Compression δ (higher = more centroids, more accurate)
+        """
+        if compression < 10:
+            raise ValueError("compression must be at least 10")
+
+        self.compression = compression
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer: List[np.ndarray] = []
+        self._scalars: List[float] = []
+        self._buffered = 0
+
+    def update(self, values: Union[float, Decimal, Iterable[float], np.ndarray]) -> None:
+        """
+        Add one value or an array of values.
+
+        Args:
+            values: Value(s) to add (NaN values are ignored)
+        """
+        if np.isscalar(values) or isinstance(values, Decimal):
+            self._update_scalar(float(values))
+            return
+
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        self.count += values.size
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        self._buffer.append(values)
+        self._buffered += values.size
+        if self._buffered >= BUFFER_FACTOR * self.compression:
+            self._compress()
+
+    def _update_scalar(self, value: float) -> None:
+        """Add a single value without array overhead"""
+        if value != value:  # NaN
+            return
+
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        self._scalars.append(value)
+        self._buffered += 1
+        if self._buffered >= BUFFER_FACTOR * self.compression:
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Fold another sketch into this one.
+
+        Args:
+            other: Sketch to merge (left unchanged)
+
+        Returns:
+            This sketch
+        """
+        if other.count == 0:
+            return self
+
+        # Other's centroids and buffered values, copied so other keeps its state
+        buffered = other._buffer + [np.array(other._scalars)]
+        means = np.concatenate([other._means] + buffered)
+        weights = np.concatenate([other._weights] + [np.ones(chunk.size) for chunk in buffered])
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        self._compress(means, weights)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value (NaN if the sketch is empty)
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            return float("nan")
+
+        self._compress()
+
+        # Each centroid sits at the middle of the rank range it covers
+        centers = np.cumsum(self._weights) - self._weights / 2.0
+        positions = np.concatenate(([0.0], centers, [float(self.count)]))
+        values = np.concatenate(([self.min], self._means, [self.max]))
+
+        return float(np.interp(q * self.count, positions, values))
+
+    @property
+    def num_centroids(self) -> int:
+        """Number of centroids after compression"""
+        self._compress()
+        return self._means.size
+
+    def _compress(self, means: Optional[np.ndarray] = None, weights: Optional[np.ndarray] = None) -> None:
+        """
+        Merge buffered values (and optional extra centroids) into the digest.
+
+        Sorted centroids are grouped by the integer part of the k1 scale
+        function at the centre of their rank range, then each group collapses
+        to its weighted mean.
+
+        Args:
+            means: Extra centroid means to merge
+            weights: Extra centroid weights
+        """
+        if self._scalars:
+            self._buffer.append(np.array(self._scalars))
+            self._scalars = []
+        if not self._buffer and means is None:
+            return
+
+        all_means = [self._means] + self._buffer
+        all_weights = [self._weights] + [np.ones(chunk.size) for chunk in self._buffer]
+        if means is not None:
+            all_means.append(means)
+            all_weights.append(weights)
+
+        self._buffer = []
+        self._buffered = 0
+
+        merged_means = np.concatenate(all_means)
+        merged_weights = np.concatenate(all_weights)
+
+        order = np.argsort(merged_means, kind="stable")
+        merged_means = merged_means[order]
+        merged_weights = merged_weights[order]
+
+        total = merged_weights.sum()
+        q = (np.cumsum(merged_weights) - merged_weights / 2.0) / total
+        k = self.compression / (2.0 * np.pi) * np.arcsin(2.0 * q - 1.0)
+        groups = np.floor(k).astype(np.int64)
+
+        starts = np.flatnonzero(np.diff(groups, prepend=groups[0] - 1))
+        self._weights = np.add.reduceat(merged_weights, starts)
+        self._means = np.add.reduceat(merged_means * merged_weights, starts) / self._weights
@@ -12,6 +12,21 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal
 
+from engines.common.timing_kernels import (
+    DEFAULT_MIDPOINT,
+    DEFAULT_STEEPNESS,
+    S_CURVE_VARIANTS,
+    TIMING_PROFILES,
+    get_kernel,
+)
+from .instrumentation import traced
+from .projection_cache import (
+    ProjectionCache,
+    ProjectionShape,
+    get_projection_cache,
+    projection_cache_key,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,44 +92,7 @@ def s_curve_distribution(
     if periods <= 0:
         return []
 
-    if periods == 1:
-        return [total]
-
-    # Calculate cumulative S-curve values at each period boundary
-    cumulative_values = []
-    for i in range(periods + 1):
-        t = i / periods
-        cumulative_values.append(s_curve(t, k=steepness, midpoint=midpoint))
-
-    # Normalize so that final cumulative = 1.0
-    min_val = cumulative_values[0]
-    max_val = cumulative_values[-1]
-    scale = max_val - min_val
-
-    if scale == 0:
-        # Fallback to even distribution
-        per_period = total / Decimal(str(periods))
-        return [per_period] * periods
-
-    normalized = [(v - min_val) / scale for v in cumulative_values]
-
-    # Calculate per-period amounts as differences in cumulative values
-    period_amounts: List[Decimal] = []
-    for i in range(periods):
-        fraction = Decimal(str(normalized[i + 1] - normalized[i]))
-        amount = total * fraction
-        period_amounts.append(amount)
-
-    # Ensure exact total (handle rounding)
-    distributed = sum(period_amounts)
-    remainder = total - distributed
-    if remainder != 0 and period_amounts:
-        # Add remainder to the peak period (around midpoint)
-        peak_idx = int(midpoint * periods)
-        peak_idx = max(0, min(peak_idx, len(period_amounts) - 1))
-        period_amounts[peak_idx] += remainder
-
-    return period_amounts
+    return get_kernel("s_curve", periods, steepness, midpoint).allocate(total)
 
 
 @dataclass
@@ -259,6 +237,29 @@ class MarketRevenue:
             self.total_revenue = Decimal(str(self.total_revenue))
 
 
+@dataclass
+class RevenueComponent:
+    """
+    One distribution window's revenue in one market.
+
+    The unit stochastic revenue models perturb: amount and start quarter can
+    be drawn per window and territory, while the profile keeps the window's
+    timing shape.
+
+    Attributes:
+        window_type: Type of window (theatrical, svod, avod, ...)
+        market_name: Market identifier (None for a single worldwide market)
+        start_quarter: Global quarter the window starts
+        amount: Window revenue
+        profile: Share of amount in each quarter from start_quarter (sums to 1)
+    """
+    window_type: str
+    market_name: Optional[str]
+    start_quarter: int
+    amount: Decimal
+    profile: Tuple[float, ...]
+
+
 @dataclass
 class RevenueProjection:
     """
@@ -311,11 +312,22 @@ class RevenueProjector:
     theatrical, streaming, and TV releases.
     """
 
-    def __init__(self):
-        """Initialize with default window templates"""
+    def __init__(self, cache: Optional[ProjectionCache] = None):
+        """
+        Initialize with default window templates.
+
+        Args:
+            cache: Projection shape cache (None = the shared process-wide cache)
+        """
         self.window_templates = self._load_default_templates()
+        self.cache = cache if cache is not None else get_projection_cache()
         logger.info("RevenueProjector initialized with 2025 window templates")
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the projection shape cache"""
+        return self.cache.stats()
+
+    @traced("revenue.project", "projection")
     def project(
         self,
         total_ultimate_revenue: Decimal,
@@ -344,34 +356,21 @@ class RevenueProjector:
         if not isinstance(total_ultimate_revenue, Decimal):
             total_ultimate_revenue = Decimal(str(total_ultimate_revenue))
 
-        # Use custom windows or template
-        if custom_windows:
-            windows = deepcopy(custom_windows)
-        else:
-            windows = deepcopy(self.window_templates.get(release_strategy, self.window_templates["wide_theatrical"]))
-
-        windows = self._normalize_window_percentages(windows)
-
-        # Adjust windows based on known values
-        if theatrical_box_office:
-            windows = self._adjust_for_theatrical(windows, theatrical_box_office, total_ultimate_revenue)
-
-        if svod_license_fee:
-            windows = self._adjust_for_svod(windows, svod_license_fee, total_ultimate_revenue)
-
-        # Project quarter-by-quarter
-        quarterly_revenue: Dict[int, Decimal] = {}
-        by_window: Dict[str, Decimal] = {}
-
-        for window in windows:
-            window_total = total_ultimate_revenue * (window.revenue_percentage / Decimal("100"))
-            by_window[window.window_type] = by_window.get(window.window_type, Decimal("0")) + window_total
-
-            # Distribute across quarters
-            quarterly_distribution = self._apply_timing_profile(window, window_total)
+        shape = self._projection_shape(
+            total_ultimate_revenue,
+            theatrical_box_office,
+            svod_license_fee,
+            release_strategy,
+            custom_windows
+        )
 
-            for quarter, amount in quarterly_distribution.items():
-                quarterly_revenue[quarter] = quarterly_revenue.get(quarter, Decimal("0")) + amount
+        # Project quarter-by-quarter: every quarter is a fixed share of the total
+        quarterly_revenue: Dict[int, Decimal] = {
+            quarter: total_ultimate_revenue * share for quarter, share in shape.quarterly
+        }
+        by_window: Dict[str, Decimal] = {
+            window_type: total_ultimate_revenue * share for window_type, share in shape.by_window
+        }
 
         # Ensure totals reconcile exactly to the requested ultimate revenue
         total_reconciled = sum(quarterly_revenue.values())
@@ -391,15 +390,12 @@ class RevenueProjector:
 
         # Generate detailed breakdown
         quarterly_detail = []
-        for q in sorted(quarterly_revenue.keys()):
+        for q, windows_active in shape.windows_active:
             detail = {
                 "quarter": q,
                 "revenue": str(quarterly_revenue[q]),
                 "cumulative": str(cumulative_revenue[q]),
-                "windows_active": [
-                    w.window_type for w in windows
-                    if w.start_quarter <= q < w.start_quarter + w.duration_quarters
-                ]
+                "windows_active": list(windows_active)
             }
             quarterly_detail.append(detail)
 
@@ -427,12 +423,198 @@ class RevenueProjector:
         )
 
         logger.info(
-            f"Projected revenue for '{project_name}': {len(windows)} windows, "
+            f"Projected revenue for '{project_name}': {shape.num_windows} windows, "
             f"{projection.total_quarters} quarters, ${total_ultimate_revenue:,.0f} total"
         )
 
         return projection
 
+    def project_components(
+        self,
+        total_ultimate_revenue: Decimal,
+        theatrical_box_office: Optional[Decimal] = None,
+        svod_license_fee: Optional[Decimal] = None,
+        markets: Optional[List[MarketRevenue]] = None,
+        release_strategy: str = "wide_theatrical",
+        custom_windows: Optional[List[DistributionWindow]] = None
+    ) -> List[RevenueComponent]:
+        """
+        Break a projection into per-window, per-market revenue components.
+
+        Without markets, the windows are those project() would use and the
+        components sum to the same quarterly revenue. With markets, each
+        market's own windows (or the release strategy template if it has
+        none) split its total revenue, offset by its release quarter.
+
+        Args:
+            total_ultimate_revenue: Total lifetime revenue estimate (ignored when markets are given)
+            theatrical_box_office: Theatrical box office (if known)
+            svod_license_fee: SVOD license fee (if known)
+            markets: Territory-by-territory breakdown (if available)
+            release_strategy: Release pattern (wide_theatrical, platform, streaming_first, day_and_date)
+            custom_windows: Override default windows
+
+        Returns:
+            List of RevenueComponent
+        """
+        if not isinstance(total_ultimate_revenue, Decimal):
+            total_ultimate_revenue = Decimal(str(total_ultimate_revenue))
+
+        if markets:
+            market_windows = [
+                (
+                    market.market_name,
+                    market.release_quarter,
+                    market.total_revenue,
+                    self._resolve_windows(
+                        market.total_revenue, None, None, release_strategy,
+                        market.distribution_windows or custom_windows
+                    )
+                )
+                for market in markets
+            ]
+        else:
+            market_windows = [(
+                None,
+                0,
+                total_ultimate_revenue,
+                self._resolve_windows(
+                    total_ultimate_revenue, theatrical_box_office, svod_license_fee,
+                    release_strategy, custom_windows
+                )
+            )]
+
+        components: List[RevenueComponent] = []
+        for market_name, release_quarter, market_total, windows in market_windows:
+            for window in windows:
+                shares = self._apply_timing_profile(window, Decimal("1"))
+                length = max(shares) - window.start_quarter + 1 if shares else 0
+                profile = [0.0] * length
+                for quarter, share in shares.items():
+                    profile[quarter - window.start_quarter] = float(share)
+
+                components.append(RevenueComponent(
+                    window_type=window.window_type,
+                    market_name=market_name,
+                    start_quarter=release_quarter + window.start_quarter,
+                    amount=market_total * (window.revenue_percentage / Decimal("100")),
+                    profile=tuple(profile)
+                ))
+
+        return components
+
+    def _projection_shape(
+        self,
+        total_ultimate_revenue: Decimal,
+        theatrical_box_office: Optional[Decimal],
+        svod_license_fee: Optional[Decimal],
+        release_strategy: str,
+        custom_windows: Optional[List[DistributionWindow]]
+    ) -> ProjectionShape:
+        """
+        Unit-revenue projection shape, from the cache when possible.
+
+        Box office and SVOD adjustments only depend on their ratio to the
+        total, so the shape for one total serves every total with the same
+        windows and ratios.
+
+        Args:
+            total_ultimate_revenue: Total lifetime revenue estimate
+            theatrical_box_office: Theatrical box office (if known)
+            svod_license_fee: SVOD license fee (if known)
+            release_strategy: Release pattern
+            custom_windows: Override default windows
+
+        Returns:
+            ProjectionShape for a total of 1
+        """
+        source = custom_windows or self.window_templates.get(
+            release_strategy, self.window_templates["wide_theatrical"]
+        )
+        theatrical_ratio = (
+            Decimal(str(theatrical_box_office)) / total_ultimate_revenue if theatrical_box_office else None
+        )
+        svod_ratio = Decimal(str(svod_license_fee)) / total_ultimate_revenue if svod_license_fee else None
+
+        key = projection_cache_key(source, theatrical_ratio, svod_ratio)
+        shape = self.cache.get(key)
+        if shape is not None:
+            return shape
+
+        windows = self._resolve_windows(
+            total_ultimate_revenue,
+            theatrical_box_office,
+            svod_license_fee,
+            release_strategy,
+            custom_windows
+        )
+
+        quarterly: Dict[int, Decimal] = {}
+        by_window: Dict[str, Decimal] = {}
+        for window in windows:
+            share = window.revenue_percentage / Decimal("100")
+            by_window[window.window_type] = by_window.get(window.window_type, Decimal("0")) + share
+
+            for quarter, amount in self._apply_timing_profile(window, share).items():
+                quarterly[quarter] = quarterly.get(quarter, Decimal("0")) + amount
+
+        quarters = sorted(quarterly)
+        shape = ProjectionShape(
+            quarterly=tuple((q, quarterly[q]) for q in quarters),
+            by_window=tuple(by_window.items()),
+            windows_active=tuple(
+                (
+                    q,
+                    tuple(
+                        w.window_type for w in windows
+                        if w.start_quarter <= q < w.start_quarter + w.duration_quarters
+                    )
+                )
+                for q in quarters
+            ),
+            num_windows=len(windows)
+        )
+        self.cache.put(key, shape)
+        return shape
+
+    def _resolve_windows(
+        self,
+        total_ultimate_revenue: Decimal,
+        theatrical_box_office: Optional[Decimal],
+        svod_license_fee: Optional[Decimal],
+        release_strategy: str,
+        custom_windows: Optional[List[DistributionWindow]]
+    ) -> List[DistributionWindow]:
+        """
+        Select, normalize and adjust the windows for a projection.
+
+        Args:
+            total_ultimate_revenue: Total lifetime revenue estimate
+            theatrical_box_office: Theatrical box office (if known)
+            svod_license_fee: SVOD license fee (if known)
+            release_strategy: Release pattern
+            custom_windows: Override default windows
+
+        Returns:
+            Windows with percentages summing to 100%
+        """
+        # Use custom windows or template
+        if custom_windows:
+            windows = deepcopy(custom_windows)
+        else:
+            windows = deepcopy(self.window_templates.get(release_strategy, self.window_templates["wide_theatrical"]))
+
+        windows = self._normalize_window_percentages(windows)
+
+        # Adjust windows based on known values
+        if theatrical_box_office:
+            windows = self._adjust_for_theatrical(windows, theatrical_box_office, total_ultimate_revenue)
+
+        if svod_license_fee:
+            windows = self._adjust_for_svod(windows, svod_license_fee, total_ultimate_revenue)
+
+        return windows
+
     def _load_default_templates(self) -> Dict[str, List[DistributionWindow]]:
         """
         Load default 2025 distribution window templates.
@@ -539,88 +721,25 @@ class RevenueProjector:
         Returns:
             Dict mapping quarter → revenue
         """
-        quarterly_distribution: Dict[int, Decimal] = {}
-
-        if window.timing_profile == "lump_sum":
-            # 100% in first quarter
-            quarterly_distribution[window.start_quarter] = total_revenue
-
-        elif window.timing_profile == "front_loaded":
-            # Theatrical and PVOD: heavy first quarters
-            # 60% Q1, 25% Q2, 10% Q3, 5% Q4
-            base_weights = [Decimal("0.60"), Decimal("0.25"), Decimal("0.10"), Decimal("0.05")]
-
-            if window.duration_quarters > len(base_weights):
-                base_weights = base_weights + [base_weights[-1]] * (window.duration_quarters - len(base_weights))
-
-            selected_weights = base_weights[: window.duration_quarters]
-            total_weight = sum(selected_weights)
-            scaled_weights = [w / total_weight for w in selected_weights]
-
-            for i, weight in enumerate(scaled_weights):
-                quarter = window.start_quarter + i
-                quarterly_distribution[quarter] = total_revenue * weight
-
-        elif window.timing_profile == "even":
-            # Equal distribution across quarters
-            per_quarter = total_revenue / Decimal(str(window.duration_quarters))
-            for i in range(window.duration_quarters):
-                quarter = window.start_quarter + i
-                quarterly_distribution[quarter] = per_quarter
-
-        elif window.timing_profile == "back_loaded":
-            # EST: grows over time
-            # Linear ramp: Q1 gets 1x, Q2 gets 2x, Q3 gets 3x, etc.
-            total_weight = sum(i + 1 for i in range(window.duration_quarters))
-            for i in range(window.duration_quarters):
-                weight = Decimal(str(i + 1)) / Decimal(str(total_weight))
-                quarter = window.start_quarter + i
-                quarterly_distribution[quarter] = total_revenue * weight
-
-        elif window.timing_profile == "s_curve":
-            # S-curve: slow start, rapid growth, gradual tapering
-            # Ideal for modeling realistic revenue accumulation patterns
-            steepness = window.metadata.get("s_curve_steepness", 8.0)
-            midpoint = window.metadata.get("s_curve_midpoint", 0.5)
-
-            amounts = s_curve_distribution(
-                total_revenue,
-                window.duration_quarters,
-                steepness=steepness,
-                midpoint=midpoint
-            )
+        profile = window.timing_profile
 
-            for i, amount in enumerate(amounts):
-                quarter = window.start_quarter + i
-                quarterly_distribution[quarter] = amount
-
-        elif window.timing_profile == "s_curve_front":
-            # S-curve front-loaded: early peak, good for theatrical with strong opening
-            amounts = s_curve_distribution(
-                total_revenue,
-                window.duration_quarters,
-                steepness=10.0,
-                midpoint=0.3  # Peak earlier
-            )
-
-            for i, amount in enumerate(amounts):
-                quarter = window.start_quarter + i
-                quarterly_distribution[quarter] = amount
-
-        elif window.timing_profile == "s_curve_back":
-            # S-curve back-loaded: late peak, good for word-of-mouth driven releases
-            amounts = s_curve_distribution(
-                total_revenue,
+        if profile == "s_curve":
+            # S-curve: slow start, rapid growth, gradual tapering
+            kernel = get_kernel(
+                profile,
                 window.duration_quarters,
-                steepness=10.0,
-                midpoint=0.7  # Peak later
+                steepness=window.metadata.get("s_curve_steepness", DEFAULT_STEEPNESS),
+                midpoint=window.metadata.get("s_curve_midpoint", DEFAULT_MIDPOINT)
             )
+        elif profile in TIMING_PROFILES or profile in S_CURVE_VARIANTS:
+            # lump_sum: 100% in first quarter; front_loaded: 60/25/10/5;
+            # back_loaded: linear ramp; s_curve_front / s_curve_back: early / late peak
+            kernel = get_kernel(profile, window.duration_quarters)
+        else:
+            return {}
 
-            for i, amount in enumerate(amounts):
-                quarter = window.start_quarter + i
-                quarterly_distribution[quarter] = amount
-
-        return quarterly_distribution
+        amounts = kernel.allocate(total_revenue)
+        return {window.start_quarter + i: amount for i, amount in enumerate(amounts)}
 
     def _adjust_for_theatrical(
         self,
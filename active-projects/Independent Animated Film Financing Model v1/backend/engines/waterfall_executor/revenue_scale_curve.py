@@ -0,0 +1,375 @@
+"""
+Revenue-Scale Response Curve
+
+When every quarter of a base projection is scaled by the same factor s (as
+Monte Carlo revenue draws and revenue tornado sweeps do), each waterfall
+payment is a piecewise-linear function of s. Breakpoints fall where a fixed
+node fully recoups, a cap is hit or the pool runs out in some quarter.
+
+build_revenue_scale_curve() traces the compiled plan once over a scale range
+and records, for every linear segment, intercept and slope of each payee's
+quarterly receipts. Any scale factor in range is then evaluated without
+re-running the quarterly loop.
+
+Numerical tolerance:
+    The curve is traced in float64 dollars and receipts are rounded to the
+    cent on evaluation. WaterfallExecutor rounds every fee and payment to the
+    cent as it goes, so quarterly receipts agree to within a few cents (one
+    cent per payment, plus rounding carried through the cumulative ledger).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from models.waterfall import WaterfallStructure
+from .revenue_projector import RevenueProjection
+from .waterfall_executor import WaterfallSummary
+from .waterfall_plan import CompiledWaterfallPlan, compile_waterfall, apply_ratio, from_cents, to_cents
+
+logger = logging.getLogger(__name__)
+
+# Roots closer than this (relative) to a segment start don't open a new segment
+BREAKPOINT_TOLERANCE = 1e-12
+
+
+@dataclass
+class RevenueScaleCurve:
+    """
+    Piecewise-linear waterfall response to a revenue scale factor.
+
+    Attributes:
+        project_name: Project identifier
+        quarters: Quarters with non-zero base revenue
+        payee_names: Payee for each column of the payee axis
+        node_ids: Ledger slot node IDs (plan.slot_ids)
+        breakpoints: Scale factor where each segment starts (ascending)
+        max_scale: Largest scale factor covered
+        receipt_intercepts: (segments × quarters × payees) receipt intercepts
+        receipt_slopes: (segments × quarters × payees) receipt slopes
+        recouped_intercepts: (segments × nodes) final recouped intercepts
+        recouped_slopes: (segments × nodes) final recouped slopes
+        plan: Compiled plan the curve was traced from
+        base_quarterly_revenue: Base gross revenue per quarter
+        fee_ratio: Distribution fee as (numerator, denominator)
+        pa_expenses: P&A expenses per quarter
+        metadata: Build notes
+    """
+    project_name: str
+    quarters: List[int]
+    payee_names: List[str]
+    node_ids: List[str]
+
+    breakpoints: np.ndarray
+    max_scale: float
+
+    receipt_intercepts: np.ndarray
+    receipt_slopes: np.ndarray
+    recouped_intercepts: np.ndarray
+    recouped_slopes: np.ndarray
+
+    plan: CompiledWaterfallPlan
+    base_quarterly_revenue: List[Decimal]
+    fee_ratio: Tuple[int, int]
+    pa_expenses: List[Decimal]
+
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def num_segments(self) -> int:
+        """Number of linear segments"""
+        return len(self.breakpoints)
+
+    def payee_index(self, payee_name: str) -> Optional[int]:
+        """Index of payee on the payee axis, or None if not in the waterfall"""
+        try:
+            return self.payee_names.index(payee_name)
+        except ValueError:
+            return None
+
+    def payee_receipts(self, scales: np.ndarray) -> np.ndarray:
+        """
+        Per-payee quarterly receipts for each scale factor.
+
+        Args:
+            scales: Scale factors, shape (scenarios,)
+
+        Returns:
+            (scenarios × quarters × payees) receipts, rounded to the cent
+        """
+        scales = self._check_range(scales)
+        segments = self._segments(scales)
+        receipts = (
+            self.receipt_intercepts[segments]
+            + self.receipt_slopes[segments] * scales[:, np.newaxis, np.newaxis]
+        )
+        return np.round(receipts, 2)
+
+    def total_paid_by_payee(self, scales: np.ndarray) -> np.ndarray:
+        """(scenarios × payees) total receipts for each scale factor"""
+        return self.payee_receipts(scales).sum(axis=1)
+
+    def recouped_by_node(self, scales: np.ndarray) -> np.ndarray:
+        """(scenarios × nodes) final cumulative recouped for each scale factor"""
+        scales = self._check_range(scales)
+        segments = self._segments(scales)
+        recouped = self.recouped_intercepts[segments] + self.recouped_slopes[segments] * scales[:, np.newaxis]
+        return np.round(recouped, 2)
+
+    def summary(self, scale: Decimal) -> WaterfallSummary:
+        """
+        WaterfallSummary at one scale factor, for StakeholderAnalyzer.
+
+        Args:
+            scale: Revenue scale factor (1.0 = base projection)
+
+        Returns:
+            WaterfallSummary equivalent to WaterfallExecutor.execute_summary()
+            on the scaled projection (within the module tolerance)
+        """
+        plan = self.plan
+        scale = Decimal(str(scale))
+        receipts = np.rint(self.payee_receipts(np.array([float(scale)]))[0] * 100.0).astype(np.int64)
+        recouped = np.rint(self.recouped_by_node(np.array([float(scale)]))[0] * 100.0).astype(np.int64)
+
+        gross = [amount * scale for amount in self.base_quarterly_revenue]
+        live = [i for i, amount in enumerate(gross) if amount != 0]
+        quarters = [self.quarters[i] for i in live]
+
+        total_fee_cents = sum(
+            apply_ratio(to_cents(gross[i]), *self.fee_ratio) + to_cents(self.pa_expenses[i])
+            for i in live
+        )
+
+        total_recouped_by_node: Dict[str, Decimal] = {}
+        total_paid_by_payee: Dict[str, Decimal] = {}
+        ledger = recouped.tolist() if live else plan.new_ledger()
+        if live:
+            total_recouped_by_node = {
+                slot_id: from_cents(ledger[slot]) for slot, slot_id in enumerate(plan.slot_ids)
+            }
+            # Same aggregation as WaterfallExecutor.execute_summary()
+            paid_cents: Dict[str, int] = {}
+            for i, slot in enumerate(plan.node_slots):
+                payee = plan.payee_names[plan.node_payees[i]]
+                paid_cents[payee] = paid_cents.get(payee, 0) + ledger[slot]
+            total_paid_by_payee = {payee: from_cents(cents) for payee, cents in paid_cents.items()}
+
+        return WaterfallSummary(
+            project_name=self.project_name,
+            quarters=quarters,
+            payee_receipts={
+                payee: [from_cents(int(receipts[i, p])) for i in live]
+                for p, payee in enumerate(self.payee_names)
+            },
+            total_receipts=sum((gross[i] for i in live), Decimal("0")),
+            total_fees=from_cents(total_fee_cents),
+            total_recouped_by_node=total_recouped_by_node,
+            total_paid_by_payee=total_paid_by_payee,
+            final_unrecouped={
+                node_id: from_cents(remaining)
+                for node_id, remaining in plan.unrecouped_cents(ledger).items()
+            },
+            metadata={
+                "num_quarters": len(quarters),
+                "mode": "revenue_scale_curve",
+                "scale": str(scale)
+            }
+        )
+
+    def _check_range(self, scales: np.ndarray) -> np.ndarray:
+        """Validate scale factors are within the traced range"""
+        scales = np.atleast_1d(np.asarray(scales, dtype=float))
+        if scales.size and (scales.min() < 0 or scales.max() > self.max_scale * (1 + BREAKPOINT_TOLERANCE)):
+            raise ValueError(
+                f"Scale factors must be within [0, {self.max_scale}] for this response curve"
+            )
+        return scales
+
+    def _segments(self, scales: np.ndarray) -> np.ndarray:
+        """Segment index for each scale factor"""
+        return np.clip(np.searchsorted(self.breakpoints, scales, side="right") - 1, 0, self.num_segments - 1)
+
+
+class _SegmentTracer:
+    """
+    Run the compiled plan with every amount as a linear function a + b·s.
+
+    Each comparison in run_quarter() is a sign test on a linear function. A
+    trace starts on [start, end); whenever a tested function changes sign
+    inside the current interval, the interval is cut at the root, so every
+    branch taken holds for the whole (shrunken) segment.
+    """
+
+    def __init__(self, plan: CompiledWaterfallPlan, pools: List[Tuple[float, float]]):
+        self.plan = plan
+        self.pools = pools
+        self.fixed = [cents / 100.0 for cents in plan.fixed_cents]
+        self.caps = [cents / 100.0 for cents in plan.cap_cents]
+        self.pcts = [
+            numerator / denominator
+            for numerator, denominator in zip(plan.pct_numerators, plan.pct_denominators)
+        ]
+
+    def trace(self, start: float, end: float):
+        """
+        Trace one segment beginning at start.
+
+        Returns:
+            (segment end, receipts (quarters × payees × 2), recouped (nodes × 2))
+        """
+        self.start = start
+        self.end = end
+
+        plan = self.plan
+        num_payees = len(plan.payee_names)
+        receipts = np.zeros((len(self.pools), num_payees, 2))
+        ledger = [(0.0, 0.0)] * plan.num_slots
+
+        for q, (pool_a, pool_b) in enumerate(self.pools):
+            for i in range(plan.num_nodes):
+                if not self._positive(pool_a, pool_b):
+                    break
+
+                slot = plan.node_slots[i]
+                cum_a, cum_b = ledger[slot]
+
+                if self.fixed[i]:
+                    rem_a, rem_b = self.fixed[i] - cum_a, -cum_b
+                    if not self._positive(rem_a, rem_b):
+                        continue
+                    if self._positive(rem_a - pool_a, rem_b - pool_b):
+                        pay_a, pay_b = pool_a, pool_b
+                    else:
+                        pay_a, pay_b = rem_a, rem_b
+                elif self.pcts[i]:
+                    pay_a, pay_b = pool_a * self.pcts[i], pool_b * self.pcts[i]
+                    if self.caps[i]:
+                        rem_a, rem_b = self.caps[i] - cum_a, -cum_b
+                        if not self._positive(rem_a, rem_b):
+                            continue
+                        if self._positive(pay_a - rem_a, pay_b - rem_b):
+                            pay_a, pay_b = rem_a, rem_b
+                else:
+                    continue
+
+                ledger[slot] = (cum_a + pay_a, cum_b + pay_b)
+                receipts[q, plan.node_payees[i]] += (pay_a, pay_b)
+                pool_a, pool_b = pool_a - pay_a, pool_b - pay_b
+
+        return self.end, receipts, np.array(ledger)
+
+    def _positive(self, a: float, b: float) -> bool:
+        """Sign test on a + b·s, cutting the segment at any interior root"""
+        if b != 0.0:
+            root = -a / b
+            if self.start + BREAKPOINT_TOLERANCE * max(1.0, abs(self.start)) < root < self.end:
+                self.end = root
+        midpoint = (self.start + self.end) / 2.0
+        return a + b * midpoint > 0.0
+
+
+def build_revenue_scale_curve(
+    waterfall_structure: WaterfallStructure,
+    base_projection: RevenueProjection,
+    max_scale: float,
+    distribution_fee_rate: Optional[Decimal] = None,
+    pa_expenses_per_quarter: Optional[Dict[int, Decimal]] = None,
+    plan: Optional[CompiledWaterfallPlan] = None,
+    max_segments: Optional[int] = None
+) -> Optional[RevenueScaleCurve]:
+    """
+    Trace the waterfall's response to scaling the base projection.
+
+    Each segment costs about one quarterly run of the plan, so callers that
+    only evaluate a handful of scale factors can bound the work with
+    max_segments and run those scenarios directly instead.
+
+    Args:
+        waterfall_structure: WaterfallStructure from backend/models/waterfall.py
+        base_projection: Projection that scale factor 1.0 refers to
+        max_scale: Largest scale factor the curve must cover
+        distribution_fee_rate: Override default distribution fee (%)
+        pa_expenses_per_quarter: Optional P&A expenses by quarter (not scaled)
+        plan: Precompiled plan for this structure (compiled if not given)
+        max_segments: Give up once tracing needs more segments than this
+
+    Returns:
+        RevenueScaleCurve covering scale factors in [0, max_scale], or None
+        if max_segments was exceeded
+    """
+    if max_scale <= 0:
+        raise ValueError("max_scale must be positive")
+
+    plan = plan or compile_waterfall(waterfall_structure)
+    numerator, denominator = plan.resolve_fee_ratio(distribution_fee_rate)
+    fee_fraction = numerator / denominator
+
+    quarters = [
+        q for q in sorted(base_projection.quarterly_revenue.keys())
+        if base_projection.quarterly_revenue[q] != 0
+    ]
+    base_revenue = np.array([float(base_projection.quarterly_revenue[q]) for q in quarters])
+    pa_expenses = np.array([
+        float(pa_expenses_per_quarter.get(q, 0)) if pa_expenses_per_quarter else 0.0
+        for q in quarters
+    ])
+
+    # Pool after fees and P&A as a linear function of the scale factor
+    pools = [(-pa, gross * (1.0 - fee_fraction)) for gross, pa in zip(base_revenue, pa_expenses)]
+    tracer = _SegmentTracer(plan, pools)
+
+    breakpoints: List[float] = []
+    receipt_segments = []
+    recouped_segments = []
+
+    start = 0.0
+    while start < max_scale:
+        if max_segments is not None and len(breakpoints) >= max_segments:
+            logger.debug(
+                f"Revenue scale curve for '{base_projection.project_name}' needs more than "
+                f"{max_segments} segments; not built"
+            )
+            return None
+        end, receipts, recouped = tracer.trace(start, max_scale)
+        breakpoints.append(start)
+        receipt_segments.append(receipts)
+        recouped_segments.append(recouped)
+        start = end
+
+    receipt_coefficients = np.array(receipt_segments)
+    recouped_coefficients = np.array(recouped_segments)
+
+    curve = RevenueScaleCurve(
+        project_name=base_projection.project_name,
+        quarters=quarters,
+        payee_names=list(plan.payee_names),
+        node_ids=list(plan.slot_ids),
+        breakpoints=np.array(breakpoints),
+        max_scale=float(max_scale),
+        receipt_intercepts=receipt_coefficients[..., 0],
+        receipt_slopes=receipt_coefficients[..., 1],
+        recouped_intercepts=recouped_coefficients[..., 0],
+        recouped_slopes=recouped_coefficients[..., 1],
+        plan=plan,
+        base_quarterly_revenue=[base_projection.quarterly_revenue[q] for q in quarters],
+        fee_ratio=(numerator, denominator),
+        pa_expenses=[
+            pa_expenses_per_quarter.get(q, Decimal("0")) if pa_expenses_per_quarter else Decimal("0")
+            for q in quarters
+        ],
+        metadata={
+            "num_segments": len(breakpoints),
+            "distribution_fee_rate": str(distribution_fee_rate) if distribution_fee_rate else "default"
+        }
+    )
+
+    logger.debug(
+        f"Built revenue scale curve for '{base_projection.project_name}': "
+        f"{len(breakpoints)} segments over [0, {max_scale}]"
+    )
+
+    return curve
@@ -7,13 +7,15 @@ impact on investor returns (tornado charts).
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from decimal import Decimal
 
 from models.waterfall import WaterfallStructure
 from models.capital_stack import CapitalStack
 from .revenue_projector import RevenueProjector, RevenueProjection
-from .waterfall_executor import WaterfallExecutor
+from .waterfall_executor import WaterfallExecutor, TimeSeriesWaterfallResult, WaterfallSummary
+from .waterfall_plan import compile_waterfall
+from .revenue_scale_curve import RevenueScaleCurve, build_revenue_scale_curve
 from .stakeholder_analyzer import StakeholderAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -29,13 +31,17 @@ class SensitivityVariable:
         base_value: Base case value
         low_value: Pessimistic value
         high_value: Optimistic value
-        variable_type: Type (revenue, cost, rate)
+        variable_type: Type (revenue, cost, rate); SensitivityEngine uses it
+            to pick the parameter handler
+        target: What the handler adjusts (window type, node_id or debt
+            instrument type; SensitivityEngine only)
     """
     variable_name: str
     base_value: Decimal
     low_value: Decimal
     high_value: Decimal
     variable_type: str = "revenue"
+    target: Optional[str] = None
 
 
 @dataclass
@@ -109,6 +115,9 @@ class SensitivityAnalyzer:
         self.capital_stack = capital_stack
         self.base_projection = base_revenue_projection
 
+        # Compiled once and reused by every scenario
+        self.plan = compile_waterfall(waterfall_structure)
+
         logger.info("SensitivityAnalyzer initialized")
 
     def analyze(
@@ -133,23 +142,17 @@ class SensitivityAnalyzer:
         # Run base case
         base_metrics = self._run_scenario(self.base_projection)
 
+        # Revenue variables only rescale the base projection, so one response
+        # curve covers every revenue case
+        revenue_curve = self._build_revenue_curve(variables)
+
         # Analyze each variable
         for variable in variables:
             # Run low case
-            low_projection = self._adjust_projection(
-                self.base_projection,
-                variable.variable_name,
-                variable.low_value
-            )
-            low_metrics = self._run_scenario(low_projection)
+            low_metrics = self._run_variable_case(variable, variable.low_value, revenue_curve)
 
             # Run high case
-            high_projection = self._adjust_projection(
-                self.base_projection,
-                variable.variable_name,
-                variable.high_value
-            )
-            high_metrics = self._run_scenario(high_projection)
+            high_metrics = self._run_variable_case(variable, variable.high_value, revenue_curve)
 
             # Calculate deltas for each target metric
             for metric in target_metrics:
@@ -223,9 +226,85 @@ class SensitivityAnalyzer:
             Dict of metrics
         """
         # Execute waterfall
-        executor = WaterfallExecutor(self.waterfall)
-        waterfall_result = executor.execute_over_time(projection)
+        executor = WaterfallExecutor(self.waterfall, self.plan)
+        waterfall_result = executor.execute_summary(projection)
+
+        return self._metrics_from_waterfall(waterfall_result)
+
+    def _run_variable_case(
+        self,
+        variable: SensitivityVariable,
+        value: Decimal,
+        revenue_curve: Optional[RevenueScaleCurve]
+    ) -> Dict[str, Decimal]:
+        """
+        Run one variable value, reading revenue variables off the response curve.
+
+        Args:
+            variable: Variable being analyzed
+            value: Value to test
+            revenue_curve: Response curve for revenue variables (if built)
+
+        Returns:
+            Dict of metrics
+        """
+        scale_factor = self._revenue_scale_factor(self.base_projection, variable.variable_name, value)
+        if (
+            scale_factor is not None
+            and revenue_curve is not None
+            and 0 <= scale_factor <= Decimal(str(revenue_curve.max_scale))
+        ):
+            return self._metrics_from_waterfall(revenue_curve.summary(scale_factor))
+
+        projection = self._adjust_projection(self.base_projection, variable.variable_name, value)
+        return self._run_scenario(projection)
+
+    def _build_revenue_curve(self, variables: List[SensitivityVariable]) -> Optional[RevenueScaleCurve]:
+        """
+        Build a response curve covering every revenue variable's values.
+
+        Tracing a segment costs about as much as running one scenario, so the
+        curve is abandoned once it needs more segments than there are revenue
+        cases to evaluate.
+
+        Args:
+            variables: Variables to analyze
 
+        Returns:
+            RevenueScaleCurve, or None if no variable scales revenue or the
+            curve would cost more than running the cases directly
+        """
+        scale_factors = []
+        for variable in variables:
+            for value in (variable.low_value, variable.high_value):
+                scale_factor = self._revenue_scale_factor(self.base_projection, variable.variable_name, value)
+                if scale_factor is not None:
+                    scale_factors.append(scale_factor)
+
+        if not scale_factors or max(scale_factors) <= 0:
+            return None
+
+        return build_revenue_scale_curve(
+            self.waterfall,
+            self.base_projection,
+            max_scale=float(max(scale_factors)),
+            plan=self.plan,
+            max_segments=len(scale_factors)
+        )
+
+    def _metrics_from_waterfall(
+        self,
+        waterfall_result: Union[TimeSeriesWaterfallResult, WaterfallSummary]
+    ) -> Dict[str, Decimal]:
+        """
+        Analyze stakeholders and extract key metrics.
+
+        Args:
+            waterfall_result: Waterfall execution result
+
+        Returns:
+            Dict of metrics
+        """
         # Analyze stakeholders
         analyzer = StakeholderAnalyzer(self.capital_stack)
         stakeholder_analysis = analyzer.analyze(waterfall_result)
@@ -269,13 +348,8 @@ class SensitivityAnalyzer:
             Adjusted RevenueProjection
         """
         # For revenue variables, scale the projection
-        if "revenue" in variable_name.lower() or "box_office" in variable_name.lower():
-            base_value = Decimal(base_projection.metadata.get("total_ultimate_revenue", "1"))
-            if base_value > 0:
-                scale_factor = value / base_value
-            else:
-                scale_factor = Decimal("1")
-
+        scale_factor = self._revenue_scale_factor(base_projection, variable_name, value)
+        if scale_factor is not None:
             # Scale all revenue
             scaled_quarterly = {
                 q: amt * scale_factor
@@ -306,3 +380,28 @@ class SensitivityAnalyzer:
 
         # For other variables, return base (would need more sophisticated handling)
         return base_projection
+
+    def _revenue_scale_factor(
+        self,
+        base_projection: RevenueProjection,
+        variable_name: str,
+        value: Decimal
+    ) -> Optional[Decimal]:
+        """
+        Scale factor a revenue variable applies to the base projection.
+
+        Args:
+            base_projection: Base projection
+            variable_name: Variable to adjust
+            value: New value
+
+        Returns:
+            Scale factor, or None if the variable doesn't scale revenue
+        """
+        if "revenue" not in variable_name.lower() and "box_office" not in variable_name.lower():
+            return None
+
+        base_value = Decimal(base_projection.metadata.get("total_ultimate_revenue", "1"))
+        if base_value > 0:
+            return value / base_value
+        return Decimal("1")
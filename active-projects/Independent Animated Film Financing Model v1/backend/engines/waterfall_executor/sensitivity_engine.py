@@ -0,0 +1,937 @@
+"""
+Sensitivity Engine
+
+Multi-variable sensitivity analysis with explicit parameter handlers:
+tornado cases, N-point sweeps (spider charts), two-way grids and
+variance-based global indices (Sobol first / total order, Morris screening).
+
+Every analysis turns into a list of parameter-value rows that are evaluated
+independently, in chunks, optionally across a process pool; results come
+back in row order, so they don't depend on the worker count.
+
+Parameter handlers (SensitivityVariable.variable_type):
+- revenue: total revenue in dollars (target = window type to set only that
+  window's total)
+- distribution_fee_rate: distribution fee % overriding the waterfall default
+- pa_expenses: total P&A in dollars, deducted in proportion to the base P&A
+  schedule or, without one, to theatrical revenue
+- window_timing: quarter shift of a window's start (target = window type,
+  None = every window)
+- node_amount: fixed amount of one waterfall node (target = node_id)
+- interest_rate: annual % for debt instruments (target = instrument type,
+  None = all debt); each debt payee's fixed waterfall amounts scale with
+  principal plus simple interest over the loan term
+"""
+
+import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.stats import qmc
+
+from models.waterfall import WaterfallStructure
+from models.capital_stack import CapitalStack
+from models.financial_instruments import Debt
+from .revenue_projector import RevenueProjector, RevenueProjection, RevenueComponent
+from .waterfall_executor import WaterfallExecutor
+from .waterfall_plan import compile_waterfall
+from .stakeholder_analyzer import StakeholderAnalyzer
+from .sensitivity_analyzer import (
+    SensitivityAnalyzer,
+    SensitivityVariable,
+    SensitivityResult
+)
+
+logger = logging.getLogger(__name__)
+
+# Supported SensitivityVariable.variable_type handlers
+PARAMETER_KINDS = (
+    "revenue",
+    "distribution_fee_rate",
+    "pa_expenses",
+    "window_timing",
+    "node_amount",
+    "interest_rate",
+)
+
+# Points per variable in a sweep or grid axis
+DEFAULT_SWEEP_POINTS = 9
+
+# Base samples for Sobol indices (total evaluations = N × (variables + 2))
+DEFAULT_SOBOL_SAMPLES = 256
+
+# Morris screening defaults
+DEFAULT_MORRIS_TRAJECTORIES = 10
+DEFAULT_MORRIS_LEVELS = 4
+
+# Evaluation chunks handed to each worker process
+CHUNKS_PER_WORKER = 4
+
+# Largest per-quarter difference for derived components to count as matching
+COMPONENT_TOLERANCE = Decimal("1")
+
+
+@dataclass
+class SweepResult:
+    """
+    N-point sweep of one variable (others at base).
+
+    Attributes:
+        variable: Variable swept
+        values: Input values, low to high
+        metrics: Metric → value at each input
+    """
+    variable: SensitivityVariable
+    values: List[Decimal]
+    metrics: Dict[str, List[Decimal]]
+
+
+@dataclass
+class SpiderChartData:
+    """
+    Data for spider chart visualization.
+
+    Attributes:
+        target_metric: Metric being analyzed
+        base_value: Metric at the base case
+        variables: Variable names
+        input_changes: Variable → input change from base at each point
+            (relative, or absolute when the base value is zero)
+        metric_values: Variable → metric value at each point
+    """
+    target_metric: str
+    base_value: Decimal
+    variables: List[str]
+    input_changes: Dict[str, List[Decimal]]
+    metric_values: Dict[str, List[Decimal]]
+
+
+@dataclass
+class GridResult:
+    """
+    Two-way grid over a pair of variables (others at base).
+
+    Attributes:
+        x_variable: First variable
+        y_variable: Second variable
+        x_values: First variable's values
+        y_values: Second variable's values
+        metrics: Metric → rows (one per x value) of values (one per y value)
+    """
+    x_variable: SensitivityVariable
+    y_variable: SensitivityVariable
+    x_values: List[Decimal]
+    y_values: List[Decimal]
+    metrics: Dict[str, List[List[Decimal]]]
+
+
+@dataclass
+class SobolIndex:
+    """
+    Variance-based sensitivity of one variable.
+
+    Attributes:
+        variable_name: Variable identifier
+        first_order: Share of output variance explained by the variable alone
+        total_order: Share including all its interactions
+    """
+    variable_name: str
+    first_order: Decimal
+    total_order: Decimal
+
+
+@dataclass
+class MorrisEffect:
+    """
+    Morris elementary-effect statistics of one variable.
+
+    Effects are per full low-to-high range of the variable.
+
+    Attributes:
+        variable_name: Variable identifier
+        mu: Mean elementary effect (signed)
+        mu_star: Mean absolute elementary effect (overall importance)
+        sigma: Standard deviation of effects (non-linearity / interactions)
+    """
+    variable_name: str
+    mu: Decimal
+    mu_star: Decimal
+    sigma: Decimal
+
+
+@dataclass
+class _ScenarioInputs:
+    """Mutable inputs assembled by the parameter handlers for one evaluation"""
+    amounts: np.ndarray
+    starts: np.ndarray
+    distribution_fee_rate: Optional[Decimal] = None
+    pa_total: Optional[Decimal] = None
+    node_amounts: Dict[str, Decimal] = field(default_factory=dict)
+
+
+class SensitivityEngine(SensitivityAnalyzer):
+    """
+    Parallel multi-variable sensitivity analysis.
+
+    Drop-in replacement for SensitivityAnalyzer.analyze() (same results
+    shape) that understands every parameter handler, plus sweeps, grids and
+    global indices. Revenue is modeled as RevenueComponents so windows can be
+    rescaled or shifted independently.
+    """
+
+    def __init__(
+        self,
+        waterfall_structure: WaterfallStructure,
+        capital_stack: CapitalStack,
+        base_revenue_projection: RevenueProjection,
+        components: Optional[List[RevenueComponent]] = None,
+        pa_expenses_per_quarter: Optional[Dict[int, Decimal]] = None,
+        distribution_fee_rate: Optional[Decimal] = None
+    ):
+        """
+        Initialize with base case structures.
+
+        Args:
+            waterfall_structure: Waterfall structure
+            capital_stack: Capital stack
+            base_revenue_projection: Base revenue projection
+            components: Revenue components behind the projection (derived from
+                its metadata when possible, otherwise one "total" component)
+            pa_expenses_per_quarter: Base P&A schedule
+            distribution_fee_rate: Base distribution fee % (None = waterfall default)
+        """
+        super().__init__(waterfall_structure, capital_stack, base_revenue_projection)
+
+        self.components = components or self._default_components()
+        self.base_pa_expenses = dict(pa_expenses_per_quarter or {})
+        self.distribution_fee_rate = distribution_fee_rate
+
+        self._base_amounts = np.array([float(c.amount) for c in self.components])
+        self._base_starts = np.array([c.start_quarter for c in self.components], dtype=np.int64)
+        self._profiles = [np.array(c.profile) for c in self.components]
+        self._theatrical = np.array([c.window_type == "theatrical" for c in self.components])
+
+        # Debt instruments with the waterfall payee each one maps to
+        payee_lookup = StakeholderAnalyzer(capital_stack)
+        self._debt_payees = [
+            (
+                component.instrument.instrument_type.value,
+                payee_lookup.map_instrument_to_payee(component.instrument),
+                component.instrument
+            )
+            for component in capital_stack.components
+            if isinstance(component.instrument, Debt)
+        ]
+
+        # Plans compiled for node-amount overrides (cheap, cached per process)
+        self._plans = {(): self.plan}
+
+        logger.info(f"SensitivityEngine initialized with {len(self.components)} revenue components")
+
+    def analyze(
+        self,
+        variables: List[SensitivityVariable],
+        target_metrics: List[str],
+        workers: Optional[int] = None
+    ) -> Dict[str, List[SensitivityResult]]:
+        """
+        Perform one-at-a-time (tornado) sensitivity analysis.
+
+        Args:
+            variables: Variables to analyze
+            target_metrics: Metrics to track (e.g., ["equity_irr"])
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            Dict mapping target_metric → list of SensitivityResult sorted by impact
+        """
+        self._validate_variables(variables)
+        base = [v.base_value for v in variables]
+
+        rows = [base]
+        for i, variable in enumerate(variables):
+            for value in (variable.low_value, variable.high_value):
+                row = list(base)
+                row[i] = value
+                rows.append(row)
+
+        outcomes = self._evaluate_rows(variables, rows, workers)
+        base_metrics = outcomes[0]
+
+        results_by_metric: Dict[str, List[SensitivityResult]] = {metric: [] for metric in target_metrics}
+        for i, variable in enumerate(variables):
+            low_metrics = outcomes[1 + 2 * i]
+            high_metrics = outcomes[2 + 2 * i]
+
+            for metric in target_metrics:
+                base_val = base_metrics.get(metric, Decimal("0"))
+                low_val = low_metrics.get(metric, Decimal("0"))
+                high_val = high_metrics.get(metric, Decimal("0"))
+
+                delta_low = base_val - low_val
+                delta_high = high_val - base_val
+
+                results_by_metric[metric].append(SensitivityResult(
+                    variable=variable,
+                    base_case={metric: base_val},
+                    low_case={metric: low_val},
+                    high_case={metric: high_val},
+                    delta_low={metric: delta_low},
+                    delta_high={metric: delta_high},
+                    impact_score=max(abs(delta_low), abs(delta_high))
+                ))
+
+        for metric in target_metrics:
+            results_by_metric[metric].sort(key=lambda r: r.impact_score, reverse=True)
+
+        logger.info(f"Tornado analysis complete for {len(variables)} variables ({len(rows)} scenarios)")
+
+        return results_by_metric
+
+    def sweep(
+        self,
+        variables: List[SensitivityVariable],
+        target_metrics: List[str],
+        num_points: int = DEFAULT_SWEEP_POINTS,
+        workers: Optional[int] = None
+    ) -> Dict[str, SweepResult]:
+        """
+        Sweep each variable over N evenly spaced points from low to high.
+
+        Args:
+            variables: Variables to sweep (others held at base)
+            target_metrics: Metrics to track
+            num_points: Points per variable
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            Dict mapping variable name → SweepResult
+        """
+        if num_points < 2:
+            raise ValueError("num_points must be at least 2")
+        self._validate_variables(variables)
+        base = [v.base_value for v in variables]
+
+        points = {v.variable_name: self._linspace(v, num_points) for v in variables}
+        rows = []
+        for i, variable in enumerate(variables):
+            for value in points[variable.variable_name]:
+                row = list(base)
+                row[i] = value
+                rows.append(row)
+
+        outcomes = self._evaluate_rows(variables, rows, workers)
+
+        sweeps = {}
+        for i, variable in enumerate(variables):
+            block = outcomes[i * num_points:(i + 1) * num_points]
+            sweeps[variable.variable_name] = SweepResult(
+                variable=variable,
+                values=points[variable.variable_name],
+                metrics={
+                    metric: [outcome.get(metric, Decimal("0")) for outcome in block]
+                    for metric in target_metrics
+                }
+            )
+
+        logger.info(f"Sweep complete for {len(variables)} variables ({len(rows)} scenarios)")
+
+        return sweeps
+
+    def generate_spider_chart_data(
+        self,
+        sweeps: Dict[str, SweepResult],
+        target_metric: str,
+        base_value: Optional[Decimal] = None
+    ) -> SpiderChartData:
+        """
+        Generate data for spider chart visualization.
+
+        Args:
+            sweeps: Results from sweep()
+            target_metric: Which metric to visualize
+            base_value: Metric at the base case (evaluated if omitted)
+
+        Returns:
+            SpiderChartData ready for plotting
+        """
+        if base_value is None:
+            variables = [s.variable for s in sweeps.values()]
+            base_value = self._evaluate_rows(
+                variables, [[v.base_value for v in variables]], None
+            )[0].get(target_metric, Decimal("0"))
+
+        input_changes = {}
+        for name, sweep in sweeps.items():
+            base_input = sweep.variable.base_value
+            input_changes[name] = [
+                (value - base_input) / abs(base_input) if base_input != 0 else value - base_input
+                for value in sweep.values
+            ]
+
+        return SpiderChartData(
+            target_metric=target_metric,
+            base_value=base_value,
+            variables=list(sweeps),
+            input_changes=input_changes,
+            metric_values={name: sweep.metrics[target_metric] for name, sweep in sweeps.items()}
+        )
+
+    def grid(
+        self,
+        x_variable: SensitivityVariable,
+        y_variable: SensitivityVariable,
+        target_metrics: List[str],
+        num_points: int = DEFAULT_SWEEP_POINTS,
+        workers: Optional[int] = None,
+        base_variables: Optional[List[SensitivityVariable]] = None
+    ) -> GridResult:
+        """
+        Evaluate a two-way grid over a pair of variables.
+
+        Args:
+            x_variable: First variable
+            y_variable: Second variable
+            target_metrics: Metrics to track
+            num_points: Points per axis
+            workers: Worker processes (None or 1 runs in-process)
+            base_variables: Other variables held at their base values
+
+        Returns:
+            GridResult with one metric row per x value
+        """
+        if num_points < 2:
+            raise ValueError("num_points must be at least 2")
+        variables = [x_variable, y_variable] + list(base_variables or [])
+        self._validate_variables(variables)
+        rest = [v.base_value for v in variables[2:]]
+
+        x_values = self._linspace(x_variable, num_points)
+        y_values = self._linspace(y_variable, num_points)
+        rows = [[x, y] + rest for x in x_values for y in y_values]
+
+        outcomes = self._evaluate_rows(variables, rows, workers)
+
+        metrics = {
+            metric: [
+                [outcomes[i * num_points + j].get(metric, Decimal("0")) for j in range(num_points)]
+                for i in range(num_points)
+            ]
+            for metric in target_metrics
+        }
+
+        logger.info(f"Grid complete: {x_variable.variable_name} × {y_variable.variable_name} ({len(rows)} scenarios)")
+
+        return GridResult(
+            x_variable=x_variable,
+            y_variable=y_variable,
+            x_values=x_values,
+            y_values=y_values,
+            metrics=metrics
+        )
+
+    def sobol_indices(
+        self,
+        variables: List[SensitivityVariable],
+        target_metrics: List[str],
+        num_samples: int = DEFAULT_SOBOL_SAMPLES,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> Dict[str, List[SobolIndex]]:
+        """
+        Estimate Sobol first- and total-order indices.
+
+        Variables are uniform over [low, high]. Uses the Saltelli (2010)
+        first-order and Jansen total-order estimators on a scrambled Sobol
+        design: num_samples × (variables + 2) evaluations.
+
+        Args:
+            variables: Variables to analyze
+            target_metrics: Metrics to track
+            num_samples: Base samples (a power of two keeps the design balanced)
+            seed: Random seed for the design
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            Dict mapping target_metric → SobolIndex list sorted by total order
+        """
+        if num_samples < 2:
+            raise ValueError("num_samples must be at least 2")
+        self._validate_variables(variables)
+        dimensions = len(variables)
+
+        design = qmc.Sobol(d=2 * dimensions, scramble=True, seed=np.random.default_rng(seed))
+        with warnings.catch_warnings():
+            # Sizes that aren't powers of two lose some balance, not validity
+            warnings.simplefilter("ignore", UserWarning)
+            samples = design.random(num_samples)
+        a, b = samples[:, :dimensions], samples[:, dimensions:]
+
+        blocks = [a, b]
+        for i in range(dimensions):
+            mixed = a.copy()
+            mixed[:, i] = b[:, i]
+            blocks.append(mixed)
+
+        outcomes = self._evaluate_rows(variables, self._scale_unit_rows(variables, np.vstack(blocks)), workers)
+
+        indices = {}
+        for metric in target_metrics:
+            values = self._metric_array(outcomes, metric).reshape(dimensions + 2, num_samples)
+            f_a, f_b = values[0], values[1]
+            variance = np.var(np.concatenate([f_a, f_b]))
+
+            metric_indices = []
+            for i, variable in enumerate(variables):
+                f_ab = values[2 + i]
+                if variance > 0:
+                    first = float(np.mean(f_b * (f_ab - f_a)) / variance)
+                    total = float(0.5 * np.mean((f_a - f_ab) ** 2) / variance)
+                else:
+                    first = total = 0.0
+                metric_indices.append(SobolIndex(
+                    variable_name=variable.variable_name,
+                    first_order=Decimal(str(first)),
+                    total_order=Decimal(str(total))
+                ))
+            metric_indices.sort(key=lambda index: index.total_order, reverse=True)
+            indices[metric] = metric_indices
+
+        logger.info(f"Sobol indices complete for {dimensions} variables ({len(outcomes)} scenarios)")
+
+        return indices
+
+    def morris_screening(
+        self,
+        variables: List[SensitivityVariable],
+        target_metrics: List[str],
+        num_trajectories: int = DEFAULT_MORRIS_TRAJECTORIES,
+        num_levels: int = DEFAULT_MORRIS_LEVELS,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> Dict[str, List[MorrisEffect]]:
+        """
+        Screen variables with Morris elementary effects.
+
+        Each trajectory starts at a random point of a num_levels grid over
+        [low, high] and moves one variable at a time by Δ = levels / (2 ×
+        (levels - 1)): num_trajectories × (variables + 1) evaluations.
+
+        Args:
+            variables: Variables to screen
+            target_metrics: Metrics to track
+            num_trajectories: Number of trajectories
+            num_levels: Grid levels per variable (even)
+            seed: Random seed for the trajectories
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            Dict mapping target_metric → MorrisEffect list sorted by mu_star
+        """
+        if num_trajectories < 2:
+            raise ValueError("num_trajectories must be at least 2")
+        if num_levels < 2 or num_levels % 2:
+            raise ValueError("num_levels must be an even number of at least 2")
+        self._validate_variables(variables)
+        dimensions = len(variables)
+
+        rng = np.random.default_rng(seed)
+        delta = num_levels / (2.0 * (num_levels - 1))
+        start_levels = np.arange(num_levels // 2) / (num_levels - 1)
+
+        points = []
+        orders = []
+        for _ in range(num_trajectories):
+            point = rng.choice(start_levels, size=dimensions)
+            # Half the trajectories start high and step down
+            point = np.where(rng.random(dimensions) < 0.5, point, point + delta)
+            order = rng.permutation(dimensions)
+            trajectory = [point.copy()]
+            for i in order:
+                point = point.copy()
+                point[i] = point[i] + delta if point[i] + delta <= 1.0 + 1e-12 else point[i] - delta
+                trajectory.append(point)
+            points.extend(trajectory)
+            orders.append(order)
+
+        unit_points = np.array(points)
+        outcomes = self._evaluate_rows(variables, self._scale_unit_rows(variables, unit_points), workers)
+
+        effects = {}
+        for metric in target_metrics:
+            values = self._metric_array(outcomes, metric).reshape(num_trajectories, dimensions + 1)
+            unit = unit_points.reshape(num_trajectories, dimensions + 1, dimensions)
+
+            elementary = np.zeros((num_trajectories, dimensions))
+            for t, order in enumerate(orders):
+                for step, i in enumerate(order):
+                    change = unit[t, step + 1, i] - unit[t, step, i]
+                    elementary[t, i] = (values[t, step + 1] - values[t, step]) / change
+
+            metric_effects = [
+                MorrisEffect(
+                    variable_name=variable.variable_name,
+                    mu=Decimal(str(float(elementary[:, i].mean()))),
+                    mu_star=Decimal(str(float(np.abs(elementary[:, i]).mean()))),
+                    sigma=Decimal(str(float(elementary[:, i].std(ddof=1))))
+                )
+                for i, variable in enumerate(variables)
+            ]
+            metric_effects.sort(key=lambda effect: effect.mu_star, reverse=True)
+            effects[metric] = metric_effects
+
+        logger.info(f"Morris screening complete for {dimensions} variables ({len(outcomes)} scenarios)")
+
+        return effects
+
+    def evaluate(
+        self,
+        variables: List[SensitivityVariable],
+        values: Sequence[Decimal]
+    ) -> Dict[str, Decimal]:
+        """
+        Evaluate one scenario with the given variable values.
+
+        Args:
+            variables: Variables to set
+            values: Value of each variable
+
+        Returns:
+            Dict of metrics
+        """
+        self._validate_variables(variables)
+        return self._evaluate_rows(variables, [list(values)], None)[0]
+
+    def _evaluate_rows(
+        self,
+        variables: List[SensitivityVariable],
+        rows: List[List[Decimal]],
+        workers: Optional[int]
+    ) -> List[Dict[str, Decimal]]:
+        """
+        Evaluate rows of variable values, in chunks, optionally in parallel.
+
+        Args:
+            variables: Variables the row columns belong to
+            rows: Variable values per scenario
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            Metrics for each row, in row order
+        """
+        if not workers or workers <= 1 or len(rows) < 2:
+            return self._evaluate_chunk(variables, rows)
+
+        num_chunks = min(len(rows), workers * CHUNKS_PER_WORKER)
+        bounds = np.linspace(0, len(rows), num_chunks + 1).astype(int)
+        chunks = [rows[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        outcomes: List[Dict[str, Decimal]] = []
+        with ProcessPoolExecutor(max_workers=min(workers, num_chunks)) as pool:
+            for chunk_outcomes in pool.map(self._evaluate_chunk, [variables] * num_chunks, chunks):
+                outcomes.extend(chunk_outcomes)
+        return outcomes
+
+    def _evaluate_chunk(
+        self,
+        variables: List[SensitivityVariable],
+        rows: List[List[Decimal]]
+    ) -> List[Dict[str, Decimal]]:
+        """
+        Evaluate rows in this process.
+
+        Args:
+            variables: Variables the row columns belong to
+            rows: Variable values per scenario
+
+        Returns:
+            Metrics for each row
+        """
+        outcomes = []
+        for row in rows:
+            inputs = _ScenarioInputs(
+                amounts=self._base_amounts.copy(),
+                starts=self._base_starts.copy(),
+                distribution_fee_rate=self.distribution_fee_rate
+            )
+            for variable, value in zip(variables, row):
+                handler = getattr(self, f"_apply_{variable.variable_type}")
+                handler(inputs, variable, value if isinstance(value, Decimal) else Decimal(str(value)))
+
+            projection, pa_expenses = self._build_revenue(inputs)
+
+            executor = WaterfallExecutor(self.waterfall, self._plan_for(inputs.node_amounts))
+            waterfall_result = executor.execute_summary(
+                projection,
+                distribution_fee_rate=inputs.distribution_fee_rate,
+                pa_expenses_per_quarter=pa_expenses
+            )
+            outcomes.append(self._metrics_from_waterfall(waterfall_result))
+        return outcomes
+
+    def _apply_revenue(self, inputs: _ScenarioInputs, variable: SensitivityVariable, value: Decimal) -> None:
+        """Set total revenue, or one window's total when targeted"""
+        group = self._window_mask(variable.target)
+        base_total = self._base_amounts[group].sum()
+        inputs.amounts[group] = self._base_amounts[group] * (float(value) / base_total)
+
+    def _apply_distribution_fee_rate(self, inputs: _ScenarioInputs, variable: SensitivityVariable, value: Decimal) -> None:
+        """Override the distribution fee %"""
+        inputs.distribution_fee_rate = min(max(value, Decimal("0")), Decimal("100"))
+
+    def _apply_pa_expenses(self, inputs: _ScenarioInputs, variable: SensitivityVariable, value: Decimal) -> None:
+        """Set total P&A expenses"""
+        inputs.pa_total = max(value, Decimal("0"))
+
+    def _apply_window_timing(self, inputs: _ScenarioInputs, variable: SensitivityVariable, value: Decimal) -> None:
+        """Shift window start quarters (windows can't start before quarter 0)"""
+        group = self._window_mask(variable.target)
+        shift = int(value.to_integral_value())
+        inputs.starts[group] = np.maximum(self._base_starts[group] + shift, 0)
+
+    def _apply_node_amount(self, inputs: _ScenarioInputs, variable: SensitivityVariable, value: Decimal) -> None:
+        """Set a waterfall node's fixed amount"""
+        inputs.node_amounts[variable.target] = max(value, Decimal("0"))
+
+    def _apply_interest_rate(self, inputs: _ScenarioInputs, variable: SensitivityVariable, value: Decimal) -> None:
+        """
+        Rescale debt payees' fixed amounts to principal plus simple interest at the new rate.
+
+        Instruments of one type share a payee, so each payee's nodes scale
+        once by the principal-weighted ratio of its instruments' repayments
+        at the new and base rates. The ratio applies on top of any node_amount
+        override in the same scenario.
+        """
+        base_repayment: Dict[str, Decimal] = {}
+        new_repayment: Dict[str, Decimal] = {}
+        targeted_payees = set()
+        for instrument_type, payee_name, instrument in self._debt_payees:
+            targeted = variable.target is None or instrument_type == variable.target
+            if targeted:
+                targeted_payees.add(payee_name)
+            years = Decimal(instrument.term_months) / Decimal("12")
+            rate = value if targeted else instrument.interest_rate
+            base_repayment[payee_name] = base_repayment.get(payee_name, Decimal("0")) + instrument.amount * (
+                Decimal("1") + instrument.interest_rate / Decimal("100") * years
+            )
+            new_repayment[payee_name] = new_repayment.get(payee_name, Decimal("0")) + instrument.amount * (
+                Decimal("1") + rate / Decimal("100") * years
+            )
+
+        for node in self.waterfall.nodes:
+            # Payees with no targeted instrument keep their amounts
+            if node.payee_name not in targeted_payees or node.fixed_amount is None:
+                continue
+            if base_repayment[node.payee_name] > 0:
+                factor = new_repayment[node.payee_name] / base_repayment[node.payee_name]
+                amount = inputs.node_amounts.get(node.node_id, node.fixed_amount)
+                inputs.node_amounts[node.node_id] = amount * factor
+
+    def _build_revenue(
+        self,
+        inputs: _ScenarioInputs
+    ) -> Tuple[RevenueProjection, Optional[Dict[int, Decimal]]]:
+        """
+        Assemble the scenario's quarterly revenue and P&A schedule.
+
+        Args:
+            inputs: Handler-adjusted scenario inputs
+
+        Returns:
+            (RevenueProjection, P&A expenses by quarter or None)
+        """
+        num_quarters = max(
+            (int(start) + profile.size for start, profile in zip(inputs.starts, self._profiles)),
+            default=0
+        )
+        revenue = np.zeros(num_quarters)
+        theatrical = np.zeros(num_quarters)
+        for i, profile in enumerate(self._profiles):
+            start = int(inputs.starts[i])
+            contribution = inputs.amounts[i] * profile
+            revenue[start:start + profile.size] += contribution
+            if self._theatrical[i]:
+                theatrical[start:start + profile.size] += contribution
+
+        quarterly_revenue = {
+            q: Decimal(str(float(amount))) for q, amount in enumerate(revenue) if amount != 0
+        }
+        projection = RevenueProjection(
+            project_name=self.base_projection.project_name,
+            projection_start_date=self.base_projection.projection_start_date,
+            total_quarters=num_quarters,
+            quarterly_revenue=quarterly_revenue,
+            cumulative_revenue={},
+            by_window={},
+            by_market={},
+            metadata=self.base_projection.metadata
+        )
+
+        return projection, self._pa_schedule(inputs.pa_total, theatrical, revenue)
+
+    def _pa_schedule(
+        self,
+        pa_total: Optional[Decimal],
+        theatrical: np.ndarray,
+        revenue: np.ndarray
+    ) -> Optional[Dict[int, Decimal]]:
+        """
+        Spread total P&A over quarters.
+
+        Args:
+            pa_total: Total P&A (None keeps the base schedule)
+            theatrical: Theatrical revenue by quarter
+            revenue: Total revenue by quarter
+
+        Returns:
+            P&A expenses by quarter (None if there are none)
+        """
+        if pa_total is None:
+            return self.base_pa_expenses or None
+        if pa_total == 0:
+            return None
+
+        base_total = sum(self.base_pa_expenses.values(), Decimal("0"))
+        if base_total > 0:
+            return {q: amount * pa_total / base_total for q, amount in self.base_pa_expenses.items()}
+
+        weights = theatrical if theatrical.sum() > 0 else revenue
+        if weights.sum() <= 0:
+            return None
+        shares = weights / weights.sum()
+        return {
+            q: pa_total * Decimal(str(float(share))) for q, share in enumerate(shares) if share > 0
+        }
+
+    def _plan_for(self, node_amounts: Dict[str, Decimal]):
+        """Compiled plan with node fixed amounts overridden (cached)"""
+        key = tuple(sorted((node_id, str(amount)) for node_id, amount in node_amounts.items()))
+        plan = self._plans.get(key)
+        if plan is None:
+            nodes = [
+                node.model_copy(update={"fixed_amount": node_amounts[node.node_id]})
+                if node.node_id in node_amounts else node
+                for node in self.waterfall.nodes
+            ]
+            plan = compile_waterfall(self.waterfall.model_copy(update={"nodes": nodes}))
+            self._plans[key] = plan
+        return plan
+
+    def _window_mask(self, window_type: Optional[str]) -> np.ndarray:
+        """Components of a window type (None = all)"""
+        if window_type is None:
+            return np.ones(len(self.components), dtype=bool)
+        return np.array([c.window_type == window_type for c in self.components])
+
+    def _validate_variables(self, variables: List[SensitivityVariable]) -> None:
+        """
+        Check every variable has a handler and a valid target.
+
+        Args:
+            variables: Variables to check
+        """
+        names = [v.variable_name for v in variables]
+        if len(set(names)) != len(names):
+            raise ValueError("Variable names must be unique")
+
+        node_ids = {node.node_id: node for node in self.waterfall.nodes}
+        for variable in variables:
+            kind = variable.variable_type
+            if kind not in PARAMETER_KINDS:
+                raise ValueError(
+                    f"Unsupported sensitivity variable type: {kind} "
+                    f"(expected one of {', '.join(PARAMETER_KINDS)})"
+                )
+
+            if kind in ("revenue", "window_timing") and variable.target is not None:
+                group = self._window_mask(variable.target)
+                if not group.any():
+                    raise ValueError(f"Variable {variable.variable_name}: no revenue window {variable.target}")
+            if kind == "revenue" and self._base_amounts[self._window_mask(variable.target)].sum() <= 0:
+                raise ValueError(f"Variable {variable.variable_name} covers no base revenue")
+            if kind == "node_amount":
+                node = node_ids.get(variable.target)
+                if node is None:
+                    raise ValueError(f"Variable {variable.variable_name}: no waterfall node {variable.target}")
+                if node.fixed_amount is None:
+                    raise ValueError(f"Variable {variable.variable_name}: node {variable.target} has no fixed amount")
+            if kind == "interest_rate" and not any(
+                variable.target is None or instrument_type == variable.target
+                for instrument_type, _, _ in self._debt_payees
+            ):
+                raise ValueError(f"Variable {variable.variable_name}: no matching debt instrument")
+
+    def _default_components(self) -> List[RevenueComponent]:
+        """
+        Revenue components reproducing the base projection.
+
+        Uses RevenueProjector.project_components() with the projection's own
+        assumptions when they reproduce it (to the dollar), otherwise a single
+        "total" component with the projection's quarterly shape.
+
+        Returns:
+            List of RevenueComponent
+        """
+        projection = self.base_projection
+        metadata = projection.metadata or {}
+
+        if metadata.get("release_strategy") and metadata.get("total_ultimate_revenue"):
+            def optional(key: str) -> Optional[Decimal]:
+                return Decimal(metadata[key]) if metadata.get(key) else None
+
+            try:
+                components = RevenueProjector().project_components(
+                    Decimal(metadata["total_ultimate_revenue"]),
+                    theatrical_box_office=optional("theatrical_box_office"),
+                    svod_license_fee=optional("svod_license_fee"),
+                    release_strategy=metadata["release_strategy"]
+                )
+            except ValueError:
+                components = []
+
+            rebuilt: Dict[int, Decimal] = {}
+            for component in components:
+                for offset, share in enumerate(component.profile):
+                    quarter = component.start_quarter + offset
+                    rebuilt[quarter] = rebuilt.get(quarter, Decimal("0")) + component.amount * Decimal(str(share))
+            quarters = set(rebuilt) | set(projection.quarterly_revenue)
+            if components and all(
+                abs(rebuilt.get(q, Decimal("0")) - projection.quarterly_revenue.get(q, Decimal("0")))
+                <= COMPONENT_TOLERANCE
+                for q in quarters
+            ):
+                return components
+
+        quarters = sorted(q for q, amount in projection.quarterly_revenue.items() if amount != 0)
+        if not quarters:
+            return []
+        total = sum((projection.quarterly_revenue[q] for q in quarters), Decimal("0"))
+        first = quarters[0]
+        profile = tuple(
+            float(projection.quarterly_revenue.get(q, Decimal("0")) / total)
+            for q in range(first, quarters[-1] + 1)
+        )
+        return [RevenueComponent("total", None, first, total, profile)]
+
+    @staticmethod
+    def _linspace(variable: SensitivityVariable, num_points: int) -> List[Decimal]:
+        """Evenly spaced values from low to high"""
+        step = (variable.high_value - variable.low_value) / Decimal(num_points - 1)
+        return [variable.low_value + step * i for i in range(num_points)]
+
+    @staticmethod
+    def _scale_unit_rows(variables: List[SensitivityVariable], unit: np.ndarray) -> List[List[Decimal]]:
+        """Map unit-cube points to [low, high] per variable"""
+        low = np.array([float(v.low_value) for v in variables])
+        high = np.array([float(v.high_value) for v in variables])
+        values = low + unit * (high - low)
+        return [[Decimal(str(x)) for x in row] for row in values.tolist()]
+
+    @staticmethod
+    def _metric_array(outcomes: List[Dict[str, Decimal]], metric: str) -> np.ndarray:
+        """Metric values as floats (missing metrics count as zero, as in analyze())"""
+        return np.array([float(outcome.get(metric, Decimal("0"))) for outcome in outcomes])
@@ -3,19 +3,41 @@ Stakeholder Analyzer
 
 Calculates investor returns (IRR, NPV, cash-on-cash, payback period) from
 waterfall execution results.
+
+IRR and NPV are solved for whole cash flow matrices at once
+(calculate_irr_batch / calculate_npv_batch): rows are stakeholders or
+scenarios, columns are quarters. Rows where Newton-Raphson fails fall back
+to bisection on a bracketed sign change of NPV.
+
+analyze(compact=True) returns CompactStakeholderCashFlows, whose receipts
+are cent arrays on one quarter index shared by all stakeholders.
 """
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from decimal import Decimal
 import math
 
+import numpy as np
+
 from models.capital_stack import CapitalStack
-from .waterfall_executor import TimeSeriesWaterfallResult
+from .waterfall_executor import TimeSeriesWaterfallResult, WaterfallSummary
+from .waterfall_plan import to_cents, from_cents
+from .instrumentation import traced, count, current_tracer
 
 logger = logging.getLogger(__name__)
 
+# Newton-Raphson settings (10% initial guess, annual rates)
+IRR_INITIAL_GUESS = 0.10
+IRR_PRECISION = 0.00001
+IRR_MAX_ITERATIONS = 100
+IRR_DIVERGENCE_LIMIT = 10.0  # IRR > 1000% or < -1000%
+
+# Rates scanned for a sign change of NPV when Newton-Raphson fails
+IRR_BRACKET_GRID = np.array([-0.99, -0.9, -0.75, -0.5, -0.25, 0.0, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0])
+IRR_BISECTION_TOLERANCE = 1e-12
+
 
 @dataclass
 class StakeholderCashFlows:
@@ -77,6 +99,114 @@ class StakeholderCashFlows:
         }
 
 
+class CompactStakeholderCashFlows:
+    """
+    Array-backed cash flows for a single stakeholder.
+
+    Same attributes and to_dict() as StakeholderCashFlows, but receipts are
+    an int64 cent array on a quarter index shared by every stakeholder of
+    the analysis, and quarterly_receipts is built on access. Produced by
+    StakeholderAnalyzer.analyze(compact=True); use expand() for a
+    StakeholderCashFlows.
+
+    Attributes:
+        quarters: Shared quarter index (executed quarters of the waterfall run)
+        receipt_cents: Cents received in each quarter of the index
+        (other attributes as StakeholderCashFlows)
+    """
+
+    __slots__ = (
+        "stakeholder_id",
+        "stakeholder_name",
+        "stakeholder_type",
+        "initial_investment",
+        "investment_quarter",
+        "quarters",
+        "receipt_cents",
+        "total_receipts",
+        "irr",
+        "npv",
+        "cash_on_cash",
+        "payback_quarter",
+        "payback_years",
+        "roi_percentage",
+        "metadata",
+    )
+
+    def __init__(
+        self,
+        stakeholder_id: str,
+        stakeholder_name: str,
+        stakeholder_type: str,
+        initial_investment: Decimal,
+        investment_quarter: int,
+        quarters: np.ndarray,
+        receipt_cents: np.ndarray,
+        total_receipts: Decimal,
+        irr: Optional[Decimal],
+        npv: Optional[Decimal],
+        cash_on_cash: Decimal,
+        payback_quarter: Optional[int],
+        payback_years: Optional[Decimal],
+        roi_percentage: Decimal,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize with receipts on the shared quarter index (arguments as the attributes)"""
+        self.stakeholder_id = stakeholder_id
+        self.stakeholder_name = stakeholder_name
+        self.stakeholder_type = stakeholder_type
+        self.initial_investment = initial_investment
+        self.investment_quarter = investment_quarter
+        self.quarters = quarters
+        self.receipt_cents = receipt_cents
+        self.total_receipts = total_receipts
+        self.irr = irr
+        self.npv = npv
+        self.cash_on_cash = cash_on_cash
+        self.payback_quarter = payback_quarter
+        self.payback_years = payback_years
+        self.roi_percentage = roi_percentage
+        self.metadata = metadata if metadata is not None else {}
+
+    @property
+    def quarterly_receipts(self) -> Dict[int, Decimal]:
+        """Quarter → amount received (quarters with positive receipts only)"""
+        return {
+            quarter: from_cents(cents)
+            for quarter, cents in zip(self.quarters.tolist(), self.receipt_cents.tolist())
+            if cents > 0
+        }
+
+    def expand(self) -> StakeholderCashFlows:
+        """Equivalent dict-based StakeholderCashFlows"""
+        return StakeholderCashFlows(
+            stakeholder_id=self.stakeholder_id,
+            stakeholder_name=self.stakeholder_name,
+            stakeholder_type=self.stakeholder_type,
+            initial_investment=self.initial_investment,
+            investment_quarter=self.investment_quarter,
+            quarterly_receipts=self.quarterly_receipts,
+            total_receipts=self.total_receipts,
+            irr=self.irr,
+            npv=self.npv,
+            cash_on_cash=self.cash_on_cash,
+            payback_quarter=self.payback_quarter,
+            payback_years=self.payback_years,
+            roi_percentage=self.roi_percentage,
+            metadata=self.metadata
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (same shape as StakeholderCashFlows)"""
+        return self.expand().to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactStakeholderCashFlows(stakeholder_id={self.stakeholder_id!r}, "
+            f"total_receipts={self.total_receipts}, irr={self.irr})"
+        )
+
+
 @dataclass
 class StakeholderAnalysisResult:
     """
@@ -84,17 +214,17 @@ class StakeholderAnalysisResult:
 
     Attributes:
         project_name: Project identifier
-        waterfall_result: Waterfall execution result
+        waterfall_result: Waterfall execution result (full or summary)
         capital_stack: Capital stack used
-        stakeholders: List of stakeholder cash flows
+        stakeholders: List of stakeholder cash flows (compact when analyzed with compact=True)
         discount_rate: Discount rate used for NPV
         summary_statistics: Aggregate stats
     """
     project_name: str
-    waterfall_result: TimeSeriesWaterfallResult
+    waterfall_result: Union[TimeSeriesWaterfallResult, WaterfallSummary]
     capital_stack: Optional[CapitalStack]
 
-    stakeholders: List[StakeholderCashFlows]
+    stakeholders: List[Union[StakeholderCashFlows, CompactStakeholderCashFlows]]
 
     discount_rate: Decimal
 
@@ -135,17 +265,22 @@ class StakeholderAnalyzer:
         self.discount_rate = discount_rate
         logger.info(f"StakeholderAnalyzer initialized with {discount_rate * 100}% discount rate")
 
+    @traced("stakeholder.analyze")
     def analyze(
         self,
-        waterfall_result: TimeSeriesWaterfallResult,
-        investment_timing: Optional[Dict[str, int]] = None
+        waterfall_result: Union[TimeSeriesWaterfallResult, WaterfallSummary],
+        investment_timing: Optional[Dict[str, int]] = None,
+        compact: bool = False
     ) -> StakeholderAnalysisResult:
         """
         Analyze returns for all stakeholders.
 
         Args:
             waterfall_result: Result from WaterfallExecutor.execute_over_time()
+                or WaterfallExecutor.execute_summary()
             investment_timing: Optional dict mapping stakeholder → investment quarter
+            compact: Return CompactStakeholderCashFlows (receipts as cent
+                arrays on a shared quarter index)
 
         Returns:
             StakeholderAnalysisResult with detailed returns
@@ -154,13 +289,18 @@ class StakeholderAnalyzer:
             investment_timing = {}
 
         stakeholders = []
+        stakeholder_cash_flows: List[List[Tuple[int, Decimal]]] = []
+
+        quarter_index = None
+        if compact:
+            quarter_index = np.array(self._executed_quarters(waterfall_result), dtype=np.int64)
 
         # Analyze each financial instrument in capital stack
         for component in self.capital_stack.components:
             instrument = component.instrument
 
             # Map instrument to waterfall payee
-            payee_name = self._map_instrument_to_payee(instrument)
+            payee_name = self.map_instrument_to_payee(instrument)
 
             # Extract quarterly receipts for this payee
             quarterly_receipts = self._extract_quarterly_receipts(
@@ -188,11 +328,13 @@ class StakeholderAnalyzer:
             for quarter, receipt in quarterly_receipts.items():
                 cash_flows.append((quarter, receipt))
 
-            # Calculate metrics
+            stakeholder_cash_flows.append(cash_flows)
+
+            # Calculate metrics (IRR/NPV filled in below for all stakeholders at once)
             total_receipts = sum(quarterly_receipts.values())
 
-            irr = self.calculate_irr(cash_flows)
-            npv = self.calculate_npv(cash_flows, self.discount_rate)
+            irr = None
+            npv = None
             cash_on_cash = total_receipts / instrument.amount if instrument.amount > 0 else Decimal("0")
 
             payback_quarter, payback_years = self.calculate_payback_period(
@@ -203,13 +345,12 @@ class StakeholderAnalyzer:
             roi_percentage = ((total_receipts - instrument.amount) / instrument.amount * Decimal("100")) if instrument.amount > 0 else Decimal("0")
 
             # Create stakeholder cash flows
-            stakeholder = StakeholderCashFlows(
+            fields = dict(
                 stakeholder_id=f"{instrument.instrument_type.value}_{payee_name}",
                 stakeholder_name=payee_name,
                 stakeholder_type=instrument.instrument_type.value,
                 initial_investment=instrument.amount,
                 investment_quarter=investment_quarter,
-                quarterly_receipts=quarterly_receipts,
                 total_receipts=total_receipts,
                 irr=irr,
                 npv=npv,
@@ -219,9 +360,29 @@ class StakeholderAnalyzer:
                 roi_percentage=roi_percentage,
                 metadata={"instrument": instrument.instrument_type.value}
             )
+            if compact:
+                # Receipts come off the cent ledger, so whole cents are exact
+                receipt_cents = np.array(
+                    [to_cents(quarterly_receipts.get(q, Decimal("0"))) for q in quarter_index.tolist()],
+                    dtype=np.int64
+                )
+                stakeholder = CompactStakeholderCashFlows(
+                    quarters=quarter_index, receipt_cents=receipt_cents, **fields
+                )
+            else:
+                stakeholder = StakeholderCashFlows(quarterly_receipts=quarterly_receipts, **fields)
 
             stakeholders.append(stakeholder)
 
+        # Solve every stakeholder's IRR and NPV in one batch
+        if stakeholders:
+            quarters, matrix = self._cash_flow_matrix(stakeholder_cash_flows)
+            irrs = self.calculate_irr_batch(matrix, quarters)
+            npvs = self.calculate_npv_batch(matrix, quarters, self.discount_rate)
+            for stakeholder, irr, npv in zip(stakeholders, irrs, npvs):
+                stakeholder.irr = Decimal(str(irr)) if not np.isnan(irr) else None
+                stakeholder.npv = Decimal(str(npv))
+
         # Generate summary statistics
         summary = self._generate_summary(stakeholders)
 
@@ -247,7 +408,7 @@ class StakeholderAnalyzer:
         """
         Calculate Internal Rate of Return using Newton-Raphson method.
 
-        Solves for r where NPV(r) = 0.
+        Solves for r where NPV(r) = 0 (single-row calculate_irr_batch).
 
         Args:
             cash_flows: List of (quarter, amount) tuples
@@ -259,72 +420,232 @@ class StakeholderAnalyzer:
         if not cash_flows or len(cash_flows) < 2:
             return None
 
-        # Check if there's at least one negative (investment) and one positive (return)
-        has_negative = any(cf[1] < 0 for cf in cash_flows)
-        has_positive = any(cf[1] > 0 for cf in cash_flows)
+        quarters, matrix = self._cash_flow_matrix([cash_flows])
+        irr = self.calculate_irr_batch(matrix, quarters)[0]
 
-        if not (has_negative and has_positive):
-            return None
+        return Decimal(str(irr)) if not np.isnan(irr) else None
 
-        # Convert to annual cash flows (quarters → years) and to float for calculation
-        cash_flows_years = [(float(q) / 4.0, float(amt)) for q, amt in cash_flows]
+    def calculate_npv(
+        self,
+        cash_flows: List[Tuple[int, Decimal]],
+        discount_rate: Decimal
+    ) -> Decimal:
+        """
+        Calculate Net Present Value.
 
-        # Newton-Raphson iteration (use float for numerical stability)
-        r = 0.10  # Initial guess: 10%
-        max_iterations = 100
-        precision = 0.00001
+        NPV = Σ (CF_t / (1 + r)^t) where t is in years
 
-        for i in range(max_iterations):
-            # Calculate NPV at current r
-            npv = sum(amt / (1 + r) ** t for t, amt in cash_flows_years)
+        Args:
+            cash_flows: List of (quarter, amount) tuples
+            discount_rate: Annual discount rate
 
-            # Calculate derivative (NPV')
-            npv_prime = sum(-t * amt / (1 + r) ** (t + 1) for t, amt in cash_flows_years)
+        Returns:
+            NPV in currency units
+        """
+        if not cash_flows:
+            return Decimal("0")
 
-            if abs(npv_prime) < precision:
-                return None  # Can't converge
+        quarters, matrix = self._cash_flow_matrix([cash_flows])
+        npv = self.calculate_npv_batch(matrix, quarters, discount_rate)[0]
 
-            # Newton-Raphson step
-            r_new = r - (npv / npv_prime)
+        return Decimal(str(npv))
 
-            # Check convergence
-            if abs(r_new - r) < precision:
-                # Converged - convert back to Decimal
-                return Decimal(str(r_new)) if r_new > -1.0 else None  # IRR must be > -100%
+    @traced("stakeholder.irr", "irr")
+    def calculate_irr_batch(
+        self,
+        cash_flows: np.ndarray,
+        quarters: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate IRR for every row of a cash flow matrix at once.
 
-            r = r_new
+        Runs Newton-Raphson on all rows in parallel (10% initial guess, 1e-5
+        precision, 100 iterations, divergence beyond ±1000%). Rows that stall,
+        diverge or converge to r <= -100% are re-solved by bisection inside
+        the first sign change of NPV over IRR_BRACKET_GRID.
 
-            # Prevent divergence
-            if abs(r) > 10.0:  # IRR > 1000% or < -1000%
-                return None
+        Args:
+            cash_flows: (rows × periods) cash flow matrix (negative = outflow)
+            quarters: Quarter of each column
+
+        Returns:
+            Annualized IRR per row (NaN where undefined)
+        """
+        cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+        years = np.asarray(quarters, dtype=float) / 4.0
 
-        return None  # Didn't converge
+        # IRR needs both an outflow and an inflow
+        valid = (cash_flows < 0).any(axis=1) & (cash_flows > 0).any(axis=1)
 
-    def calculate_npv(
+        irr = self._newton_irr(cash_flows, years, valid)
+
+        unsolved = valid & np.isnan(irr)
+        if unsolved.any():
+            irr[unsolved] = self._bracketed_irr(cash_flows[unsolved], years)
+
+        tracer = current_tracer()
+        if tracer is not None:
+            tracer.count("irr.rows", int(valid.sum()))
+            tracer.count("irr.bracketed_rows", int(unsolved.sum()))
+            tracer.count("irr.failures", int((valid & np.isnan(irr)).sum()))
+
+        return irr
+
+    def calculate_npv_batch(
         self,
-        cash_flows: List[Tuple[int, Decimal]],
+        cash_flows: np.ndarray,
+        quarters: np.ndarray,
         discount_rate: Decimal
-    ) -> Decimal:
+    ) -> np.ndarray:
         """
-        Calculate Net Present Value.
-
-        NPV = Σ (CF_t / (1 + r)^t) where t is in years
+        Calculate NPV for every row of a cash flow matrix at once.
 
         Args:
-            cash_flows: List of (quarter, amount) tuples
+            cash_flows: (rows × periods) cash flow matrix
+            quarters: Quarter of each column
             discount_rate: Annual discount rate
 
         Returns:
-            NPV in currency units
+            NPV per row
+        """
+        cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+        years = np.asarray(quarters, dtype=float) / 4.0
+        discount = (1.0 + float(discount_rate)) ** years
+
+        return (cash_flows / discount[np.newaxis, :]).sum(axis=1)
+
+    def _newton_irr(
+        self,
+        cash_flows: np.ndarray,
+        years: np.ndarray,
+        valid: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized Newton-Raphson IRR.
+
+        Args:
+            cash_flows: (rows × periods) cash flow matrix
+            years: Time of each period in years
+            valid: Rows to solve
+
+        Returns:
+            IRR per row (NaN where not converged)
+        """
+        irr = np.full(cash_flows.shape[0], np.nan)
+        rows = np.flatnonzero(valid)
+        flows = cash_flows[rows]
+        weighted = flows * years
+        rate = np.full(rows.size, IRR_INITIAL_GUESS)
+        row_iterations = 0
+
+        with np.errstate(all="ignore"):
+            for _ in range(IRR_MAX_ITERATIONS):
+                if rows.size == 0:
+                    break
+                row_iterations += rows.size
+
+                # (1 + r)^-t for every row and period in one pass
+                discount = np.exp(-np.log1p(rate)[:, np.newaxis] * years)
+                npv = (flows * discount).sum(axis=1)
+                npv_prime = -(weighted * discount).sum(axis=1) / (1.0 + rate)
+
+                stalled = ~(np.abs(npv_prime) >= IRR_PRECISION)
+                rate_new = rate - npv / npv_prime
+
+                converged = ~stalled & (np.abs(rate_new - rate) < IRR_PRECISION)
+                accepted = converged & (rate_new > -1.0)
+                irr[rows[accepted]] = rate_new[accepted]
+
+                diverged = ~stalled & ~converged & ~(np.abs(rate_new) <= IRR_DIVERGENCE_LIMIT)
+
+                keep = ~(stalled | converged | diverged)
+                rows = rows[keep]
+                flows = flows[keep]
+                weighted = weighted[keep]
+                rate = rate_new[keep]
+
+        count("irr.newton_iterations", row_iterations)
+        return irr
+
+    def _bracketed_irr(
+        self,
+        cash_flows: np.ndarray,
+        years: np.ndarray
+    ) -> np.ndarray:
         """
-        # Convert quarters to years and to float for calculation
-        cash_flows_years = [(float(q) / 4.0, float(amt)) for q, amt in cash_flows]
+        Safeguarded Newton IRR inside the first NPV sign change over IRR_BRACKET_GRID.
+
+        Newton steps that leave the bracket fall back to bisection, and the
+        bracket shrinks every iteration, so each bracketed row converges.
+
+        Args:
+            cash_flows: (rows × periods) cash flow matrix
+            years: Time of each period in years
 
-        # Calculate NPV (use float for numerical operations)
-        npv_float = sum(amt / (1 + float(discount_rate)) ** t for t, amt in cash_flows_years)
+        Returns:
+            IRR per row (NaN where NPV never changes sign on the grid)
+        """
+        num_rows = cash_flows.shape[0]
+        weighted = cash_flows * years
+
+        with np.errstate(all="ignore"):
+            grid_discount = (1.0 + IRR_BRACKET_GRID)[:, np.newaxis] ** -years
+            signs = np.sign(cash_flows @ grid_discount.T)
+            changes = signs[:, :-1] * signs[:, 1:] <= 0
+
+            bracketed = changes.any(axis=1)
+            first = np.argmax(changes, axis=1)
+
+            lo = IRR_BRACKET_GRID[first]
+            hi = IRR_BRACKET_GRID[first + 1]
+            lo_sign = signs[np.arange(num_rows), first]
+            rate = (lo + hi) / 2.0
+
+            iterations = 0
+            for _ in range(IRR_MAX_ITERATIONS):
+                iterations += 1
+                discount = np.exp(-np.log1p(rate)[:, np.newaxis] * years)
+                npv = (cash_flows * discount).sum(axis=1)
+                npv_prime = -(weighted * discount).sum(axis=1) / (1.0 + rate)
+
+                same_side = np.sign(npv) == lo_sign
+                lo = np.where(same_side, rate, lo)
+                hi = np.where(same_side, hi, rate)
+
+                step = rate - npv / npv_prime
+                inside = (step > lo) & (step < hi)
+                rate_new = np.where(inside, step, (lo + hi) / 2.0)
+
+                done = (np.abs(rate_new - rate) < IRR_BISECTION_TOLERANCE) | (hi - lo < IRR_BISECTION_TOLERANCE)
+                rate = rate_new
+                if done.all():
+                    break
+
+        count("irr.bracketed_iterations", iterations * num_rows)
+        return np.where(bracketed, rate, np.nan)
+
+    def _cash_flow_matrix(
+        self,
+        cash_flow_lists: List[List[Tuple[int, Decimal]]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lay out (quarter, amount) lists as a dense matrix on a shared quarter grid.
 
-        # Convert result back to Decimal
-        return Decimal(str(npv_float))
+        Args:
+            cash_flow_lists: One list of (quarter, amount) tuples per row
+
+        Returns:
+            (quarters, rows × quarters matrix) with same-quarter flows summed
+        """
+        quarters = sorted({quarter for cash_flows in cash_flow_lists for quarter, _ in cash_flows})
+        column = {quarter: i for i, quarter in enumerate(quarters)}
+
+        matrix = np.zeros((len(cash_flow_lists), len(quarters)))
+        for row, cash_flows in enumerate(cash_flow_lists):
+            for quarter, amount in cash_flows:
+                matrix[row, column[quarter]] += float(amount)
+
+        return np.array(quarters, dtype=float), matrix
 
     def calculate_payback_period(
         self,
@@ -355,7 +676,7 @@ class StakeholderAnalyzer:
         # Didn't pay back within projection period
         return (None, None)
 
-    def _map_instrument_to_payee(self, instrument) -> str:
+    def map_instrument_to_payee(self, instrument) -> str:
         """
         Map financial instrument to waterfall payee name.
 
@@ -383,9 +704,13 @@ class StakeholderAnalyzer:
 
         return type_to_payee.get(instrument.instrument_type.value, "Unknown Payee")
 
+    def _map_instrument_to_payee(self, instrument) -> str:
+        """Map financial instrument to waterfall payee name (see map_instrument_to_payee)"""
+        return self.map_instrument_to_payee(instrument)
+
     def _extract_quarterly_receipts(
         self,
-        waterfall_result: TimeSeriesWaterfallResult,
+        waterfall_result: Union[TimeSeriesWaterfallResult, WaterfallSummary],
         payee_name: str
     ) -> Dict[int, Decimal]:
         """
@@ -398,18 +723,30 @@ class StakeholderAnalyzer:
         Returns:
             Dict mapping quarter → receipt amount
         """
+        if isinstance(waterfall_result, WaterfallSummary):
+            return waterfall_result.quarterly_receipts(payee_name)
+
         quarterly_receipts: Dict[int, Decimal] = {}
 
         for execution in waterfall_result.quarterly_executions:
-            receipt = execution.payee_payouts.get(payee_name, Decimal("0"))
+            receipt = execution.payee_payout(payee_name)
             if receipt > 0:
                 quarterly_receipts[execution.quarter] = receipt
 
         return quarterly_receipts
 
+    def _executed_quarters(
+        self,
+        waterfall_result: Union[TimeSeriesWaterfallResult, WaterfallSummary]
+    ) -> List[int]:
+        """Quarters the waterfall executed (the compact receipt index)"""
+        if isinstance(waterfall_result, WaterfallSummary):
+            return list(waterfall_result.quarters)
+        return [execution.quarter for execution in waterfall_result.quarterly_executions]
+
     def _generate_summary(
         self,
-        stakeholders: List[StakeholderCashFlows]
+        stakeholders: List[Union[StakeholderCashFlows, CompactStakeholderCashFlows]]
     ) -> Dict[str, Any]:
         """
         Generate summary statistics across all stakeholders.
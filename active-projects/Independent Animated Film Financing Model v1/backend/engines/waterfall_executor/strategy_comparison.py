@@ -0,0 +1,319 @@
+"""
+Strategy Comparison
+
+Compares release strategies across revenue levels in one call. The waterfall
+is compiled once and shared by every (strategy, revenue level) cell; each
+cell projects revenue, runs the aggregate-only waterfall
+(WaterfallExecutor.execute_summary) and analyzes stakeholder returns.
+
+Cells are evaluated in chunks, optionally across a process pool. Chunks are
+taken in strategy-major order, so a worker mostly reuses one cached
+projection shape (see projection_cache) across revenue levels. Results come
+back in grid order and don't depend on the worker count.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.waterfall import WaterfallStructure
+from models.capital_stack import CapitalStack
+from .revenue_projector import RevenueProjector
+from .waterfall_executor import WaterfallExecutor
+from .waterfall_plan import CompiledWaterfallPlan, compile_waterfall
+from .stakeholder_analyzer import StakeholderAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Release strategies compared when none are requested
+DEFAULT_STRATEGIES = ("wide_theatrical", "platform", "streaming_first", "day_and_date")
+
+# StakeholderCashFlows attributes reported for every cell
+STAKEHOLDER_METRICS = (
+    "total_receipts",
+    "cash_on_cash",
+    "irr",
+    "npv",
+    "roi_percentage",
+    "payback_quarter",
+)
+
+# Evaluation chunks handed to each worker process
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class StrategyComparisonCell:
+    """
+    Outcome of one release strategy at one revenue level.
+
+    Attributes:
+        release_strategy: Release strategy projected
+        total_revenue: Total ultimate revenue projected
+        total_fees: Distribution fees and P&A deducted
+        total_distributed: Paid to all waterfall payees
+        stakeholders: Stakeholder ID → metric (STAKEHOLDER_METRICS) → value
+    """
+    release_strategy: str
+    total_revenue: Decimal
+    total_fees: Decimal
+    total_distributed: Decimal
+    stakeholders: Dict[str, Dict[str, Any]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "release_strategy": self.release_strategy,
+            "total_revenue": str(self.total_revenue),
+            "total_fees": str(self.total_fees),
+            "total_distributed": str(self.total_distributed),
+            "stakeholders": {
+                sid: {name: None if value is None else str(value) for name, value in metrics.items()}
+                for sid, metrics in self.stakeholders.items()
+            },
+        }
+
+
+@dataclass
+class StrategyComparisonResult:
+    """
+    Grid of strategy comparison cells.
+
+    Attributes:
+        strategies: Release strategies (rows)
+        revenue_levels: Total revenue levels (columns)
+        cells: One row per strategy of one cell per revenue level
+        stakeholder_ids: Stakeholders in capital stack order
+    """
+    strategies: List[str]
+    revenue_levels: List[Decimal]
+    cells: List[List[StrategyComparisonCell]]
+    stakeholder_ids: List[str] = field(default_factory=list)
+
+    def cell(self, release_strategy: str, total_revenue: Decimal) -> StrategyComparisonCell:
+        """
+        Look up one cell.
+
+        Args:
+            release_strategy: Strategy row
+            total_revenue: Revenue level column
+
+        Returns:
+            StrategyComparisonCell
+
+        Raises:
+            KeyError: If the strategy or revenue level was not compared
+        """
+        try:
+            row = self.strategies.index(release_strategy)
+            column = self.revenue_levels.index(Decimal(str(total_revenue)))
+        except ValueError:
+            raise KeyError(f"No cell for ({release_strategy}, {total_revenue})")
+        return self.cells[row][column]
+
+    def matrix(self, stakeholder_id: str, metric: str) -> List[List[Any]]:
+        """
+        One stakeholder metric across the grid.
+
+        Args:
+            stakeholder_id: Stakeholder ID
+            metric: One of STAKEHOLDER_METRICS
+
+        Returns:
+            Rows (one per strategy) of values (one per revenue level)
+
+        Raises:
+            ValueError: If the metric is not reported
+        """
+        if metric not in STAKEHOLDER_METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Expected one of {STAKEHOLDER_METRICS}")
+        return [[cell.stakeholders[stakeholder_id][metric] for cell in row] for row in self.cells]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "strategies": self.strategies,
+            "revenue_levels": [str(level) for level in self.revenue_levels],
+            "stakeholder_ids": self.stakeholder_ids,
+            "cells": [[cell.to_dict() for cell in row] for row in self.cells],
+        }
+
+
+class StrategyComparator:
+    """
+    Compare release strategies × revenue levels for one deal structure.
+    """
+
+    def __init__(
+        self,
+        waterfall_structure: WaterfallStructure,
+        capital_stack: CapitalStack,
+        discount_rate: Decimal = Decimal("0.12"),
+        plan: Optional[CompiledWaterfallPlan] = None
+    ):
+        """
+        Initialize with deal structures.
+
+        Args:
+            waterfall_structure: Waterfall structure
+            capital_stack: Capital stack
+            discount_rate: Annual discount rate for NPV
+            plan: Precompiled plan for this structure (compiled if not given)
+        """
+        self.waterfall_structure = waterfall_structure
+        self.capital_stack = capital_stack
+        self.discount_rate = discount_rate
+        self.plan = plan or compile_waterfall(waterfall_structure)
+
+    def compare(
+        self,
+        revenue_levels: Sequence[Decimal],
+        strategies: Sequence[str] = DEFAULT_STRATEGIES,
+        distribution_fee_rate: Optional[Decimal] = None,
+        investment_timing: Optional[Dict[str, int]] = None,
+        workers: Optional[int] = None
+    ) -> StrategyComparisonResult:
+        """
+        Evaluate every strategy at every revenue level.
+
+        Args:
+            revenue_levels: Total ultimate revenue levels
+            strategies: Release strategies (RevenueProjector templates)
+            distribution_fee_rate: Override default distribution fee (%)
+            investment_timing: Optional dict mapping stakeholder → investment quarter
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            StrategyComparisonResult with one row per strategy
+
+        Raises:
+            ValueError: If no levels or strategies are given, a level is not
+                positive or a strategy is unknown
+        """
+        levels = [Decimal(str(level)) for level in revenue_levels]
+        strategies = list(strategies)
+        self._validate(levels, strategies)
+
+        grid = [(strategy, level) for strategy in strategies for level in levels]
+        logger.info(
+            f"Comparing {len(strategies)} strategies × {len(levels)} revenue levels "
+            f"(workers={workers or 1})"
+        )
+
+        outcomes = self._evaluate_cells(grid, distribution_fee_rate, investment_timing, workers)
+
+        cells = [outcomes[i * len(levels):(i + 1) * len(levels)] for i in range(len(strategies))]
+        stakeholder_ids = list(cells[0][0].stakeholders)
+        return StrategyComparisonResult(
+            strategies=strategies,
+            revenue_levels=levels,
+            cells=cells,
+            stakeholder_ids=stakeholder_ids
+        )
+
+    def _validate(self, levels: List[Decimal], strategies: List[str]) -> None:
+        """
+        Check the grid axes.
+
+        Args:
+            levels: Revenue levels
+            strategies: Release strategies
+
+        Raises:
+            ValueError: If an axis is empty or invalid
+        """
+        if not levels:
+            raise ValueError("At least one revenue level is required")
+        if not strategies:
+            raise ValueError("At least one release strategy is required")
+        if any(level <= 0 for level in levels):
+            raise ValueError("Revenue levels must be positive")
+
+        known = RevenueProjector().window_templates
+        unknown = [strategy for strategy in strategies if strategy not in known]
+        if unknown:
+            raise ValueError(f"Unknown release strategies {unknown}. Expected any of {sorted(known)}")
+
+    def _evaluate_cells(
+        self,
+        grid: List[Tuple[str, Decimal]],
+        distribution_fee_rate: Optional[Decimal],
+        investment_timing: Optional[Dict[str, int]],
+        workers: Optional[int]
+    ) -> List[StrategyComparisonCell]:
+        """
+        Evaluate grid cells in chunks, optionally in parallel.
+
+        Args:
+            grid: (strategy, revenue level) per cell, strategy-major
+            distribution_fee_rate: Override default distribution fee (%)
+            investment_timing: Optional dict mapping stakeholder → investment quarter
+            workers: Worker processes (None or 1 runs in-process)
+
+        Returns:
+            One cell per grid entry, in grid order
+        """
+        if not workers or workers <= 1 or len(grid) < 2:
+            return self._evaluate_chunk(grid, distribution_fee_rate, investment_timing)
+
+        num_chunks = min(len(grid), workers * CHUNKS_PER_WORKER)
+        bounds = np.linspace(0, len(grid), num_chunks + 1).astype(int)
+        chunks = [grid[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        outcomes: List[StrategyComparisonCell] = []
+        with ProcessPoolExecutor(max_workers=min(workers, num_chunks)) as pool:
+            for chunk_outcomes in pool.map(
+                self._evaluate_chunk,
+                chunks,
+                [distribution_fee_rate] * num_chunks,
+                [investment_timing] * num_chunks
+            ):
+                outcomes.extend(chunk_outcomes)
+        return outcomes
+
+    def _evaluate_chunk(
+        self,
+        grid: List[Tuple[str, Decimal]],
+        distribution_fee_rate: Optional[Decimal],
+        investment_timing: Optional[Dict[str, int]]
+    ) -> List[StrategyComparisonCell]:
+        """
+        Evaluate grid cells in this process.
+
+        Args:
+            grid: (strategy, revenue level) per cell
+            distribution_fee_rate: Override default distribution fee (%)
+            investment_timing: Optional dict mapping stakeholder → investment quarter
+
+        Returns:
+            One cell per grid entry
+        """
+        projector = RevenueProjector()
+        executor = WaterfallExecutor(self.waterfall_structure, self.plan)
+        analyzer = StakeholderAnalyzer(self.capital_stack, self.discount_rate)
+
+        outcomes = []
+        for strategy, level in grid:
+            projection = projector.project(
+                total_ultimate_revenue=level,
+                release_strategy=strategy,
+                project_name=f"{strategy} @ {level}"
+            )
+            summary = executor.execute_summary(projection, distribution_fee_rate)
+            analysis = analyzer.analyze(summary, investment_timing)
+
+            outcomes.append(StrategyComparisonCell(
+                release_strategy=strategy,
+                total_revenue=level,
+                total_fees=summary.total_fees,
+                total_distributed=sum(summary.total_paid_by_payee.values(), Decimal("0")),
+                stakeholders={
+                    s.stakeholder_id: {name: getattr(s, name) for name in STAKEHOLDER_METRICS}
+                    for s in analysis.stakeholders
+                }
+            ))
+        return outcomes
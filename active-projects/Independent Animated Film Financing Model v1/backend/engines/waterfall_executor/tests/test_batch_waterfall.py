@@ -0,0 +1,159 @@
+"""
+Unit Tests for Batch Waterfall Executor
+
+Tests that the vectorized (scenarios × quarters × nodes) waterfall matches the
+Decimal WaterfallExecutor for fixed, percentage and capped nodes.
+"""
+
+import pytest
+from decimal import Decimal
+
+import numpy as np
+
+from engines.waterfall_executor.batch_waterfall import (
+    BatchWaterfallExecutor,
+    BatchWaterfallResult
+)
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.revenue_projector import RevenueProjector, RevenueProjection
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+
+
+@pytest.fixture
+def mixed_waterfall():
+    """Waterfall with fixed, capped percentage and uncapped percentage nodes"""
+    return WaterfallStructure(
+        waterfall_name="Mixed Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                payee="Equity Investors",
+                amount=Decimal("10000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.SENIOR_DEBT,
+                payee="Senior Lender",
+                amount=Decimal("5000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.DEFERRED_PRODUCER_FEE,
+                payee="Producer",
+                percentage=Decimal("20"),
+                capped_at=Decimal("500000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.NET_PROFITS,
+                payee="Equity Investors",
+                percentage=Decimal("50")
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def base_projection():
+    """Create base revenue projection"""
+    projector = RevenueProjector()
+    return projector.project(
+        total_ultimate_revenue=Decimal("30000000"),
+        release_strategy="wide_theatrical",
+        project_name="Test Film"
+    )
+
+
+def _revenue_matrix(projection, scales):
+    """Scale a projection into a (scenarios × quarters) matrix"""
+    quarters = sorted(projection.quarterly_revenue.keys())
+    base = np.array([float(projection.quarterly_revenue[q]) for q in quarters])
+    return np.array(quarters), np.outer(scales, base)
+
+
+class TestBatchWaterfallExecutor:
+    """Test BatchWaterfallExecutor class"""
+
+    def test_node_order_follows_priority(self, mixed_waterfall):
+        """Test nodes are laid out in priority order"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+
+        assert executor.node_ids[0] == "6_Senior Lender"
+        assert executor.node_ids[1] == "8_Equity Investors"
+        assert executor.payee_names == ["Senior Lender", "Equity Investors", "Producer"]
+
+    def test_result_shapes(self, mixed_waterfall, base_projection):
+        """Test result arrays are (scenarios × quarters × nodes/payees)"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+        quarters, revenue = _revenue_matrix(base_projection, [0.5, 1.0, 2.0])
+
+        result = executor.execute(revenue, quarters=quarters)
+
+        assert isinstance(result, BatchWaterfallResult)
+        assert result.num_scenarios == 3
+        assert result.node_payouts.shape == (3, len(quarters), 4)
+        assert result.payee_payouts.shape == (3, len(quarters), 3)
+        assert result.cumulative_recouped.shape == (3, 4)
+
+    @pytest.mark.parametrize("scale", [0.2, 0.6, 1.0, 1.7, 4.0])
+    def test_matches_decimal_executor(self, mixed_waterfall, base_projection, scale):
+        """Test batch payouts match WaterfallExecutor within tolerance"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+        quarters, revenue = _revenue_matrix(base_projection, [scale])
+        batch = executor.execute(revenue, quarters=quarters)
+
+        projection = RevenueProjection(
+            project_name="Scaled Film",
+            projection_start_date="2025-Q1",
+            total_quarters=base_projection.total_quarters,
+            quarterly_revenue={
+                q: amt * Decimal(str(scale)) for q, amt in base_projection.quarterly_revenue.items()
+            },
+            cumulative_revenue={},
+            by_window={},
+            by_market={}
+        )
+        reference = WaterfallExecutor(mixed_waterfall).execute_over_time(projection)
+
+        for node_id, amount in reference.total_recouped_by_node.items():
+            slot = batch.node_ids.index(node_id)
+            assert batch.cumulative_recouped[0, slot] == pytest.approx(float(amount), rel=1e-9, abs=1e-6)
+
+        totals = batch.total_paid_by_payee()[0]
+        for payee, amount in reference.total_paid_by_payee.items():
+            assert totals[batch.payee_index(payee)] == pytest.approx(float(amount), rel=1e-9, abs=1e-6)
+
+    def test_cap_is_respected(self, mixed_waterfall, base_projection):
+        """Test capped percentage node never exceeds its cap"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+        quarters, revenue = _revenue_matrix(base_projection, [10.0])
+
+        result = executor.execute(revenue, quarters=quarters)
+
+        slot = result.node_ids.index("10_Producer")
+        assert result.cumulative_recouped[0, slot] == pytest.approx(500000.0)
+
+    def test_zero_revenue_pays_nothing(self, mixed_waterfall, base_projection):
+        """Test zero revenue scenario produces no payouts"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+        quarters, revenue = _revenue_matrix(base_projection, [0.0])
+
+        result = executor.execute(revenue, quarters=quarters)
+
+        assert result.node_payouts.sum() == 0.0
+
+    def test_pa_expenses_reduce_pool(self, mixed_waterfall, base_projection):
+        """Test P&A expenses are deducted before nodes are paid"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+        quarters, revenue = _revenue_matrix(base_projection, [1.0])
+        pa_expenses = np.full(len(quarters), 100000.0)
+
+        without_pa = executor.execute(revenue, quarters=quarters)
+        with_pa = executor.execute(revenue, quarters=quarters, pa_expenses=pa_expenses)
+
+        assert with_pa.node_payouts.sum() < without_pa.node_payouts.sum()
+
+    def test_payee_index_unknown(self, mixed_waterfall):
+        """Test payee lookup for payee not in waterfall"""
+        executor = BatchWaterfallExecutor(mixed_waterfall)
+        result = executor.execute(np.zeros((1, 2)))
+
+        assert result.payee_index("Nobody") is None
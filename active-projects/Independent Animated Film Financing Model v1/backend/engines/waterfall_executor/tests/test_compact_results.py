@@ -0,0 +1,229 @@
+"""
+Unit Tests for Compact Result Types
+
+Tests that CompactQuarterlyExecution, CompactStakeholderCashFlows and
+CompactMonteCarloScenario expose the same values and to_dict() shapes as
+their dict-based counterparts, at a fraction of the memory.
+"""
+
+import gc
+import tracemalloc
+from dataclasses import replace
+
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.waterfall_executor import (
+    WaterfallExecutor,
+    CompactQuarterlyExecution,
+)
+from engines.waterfall_executor.revenue_projector import RevenueProjector, InvestmentDrawdown
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer, CompactStakeholderCashFlows
+from engines.waterfall_executor.monte_carlo_simulator import (
+    MonteCarloSimulator,
+    RevenueDistribution,
+    CompactMonteCarloScenario,
+)
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with debt, equity, capped producer share and net profits"""
+    return WaterfallStructure(
+        waterfall_name="Compact Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("8000000")),
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("12000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.DEFERRED_PRODUCER_FEE,
+                payee="Producer",
+                percentage=Decimal("15"),
+                capped_at=Decimal("750000")
+            ),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    )
+
+
+@pytest.fixture
+def large_waterfall():
+    """Waterfall of 60 distinct fixed and percentage tiers"""
+    nodes = []
+    for i in range(30):
+        nodes.append(WaterfallNode(
+            priority=RecoupmentPriority.DEFERRED_TALENT, payee=f"Talent {i}", amount=Decimal("150000")
+        ))
+        nodes.append(WaterfallNode(
+            priority=RecoupmentPriority.BACKEND_PARTICIPATION, payee=f"Backend {i}", percentage=Decimal("1")
+        ))
+    return WaterfallStructure(waterfall_name="Large Waterfall", nodes=nodes)
+
+
+@pytest.fixture
+def capital_stack():
+    """Capital stack matching the waterfall payees"""
+    return CapitalStack(
+        stack_name="Compact Stack",
+        project_budget=Decimal("20000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("8000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("12000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def projection():
+    """Projection that recoups the debt and part of the equity"""
+    return RevenueProjector().project(
+        total_ultimate_revenue=Decimal("40000000"),
+        release_strategy="wide_theatrical",
+        project_name="Compact Film"
+    )
+
+
+def _snapshot_bytes(build):
+    """Bytes per item still allocated after build() returns a list"""
+    gc.collect()
+    tracemalloc.start()
+    items = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(items)
+
+
+class TestCompactQuarterlyExecution:
+    """Test execute_over_time(compact=True)"""
+
+    def test_same_values_and_dicts(self, waterfall, projection):
+        """Test compact snapshots match the dict-based ones exactly"""
+        executor = WaterfallExecutor(waterfall)
+        full = executor.execute_over_time(projection)
+        compact = executor.execute_over_time(projection, compact=True)
+
+        assert all(isinstance(qe, CompactQuarterlyExecution) for qe in compact.quarterly_executions)
+        assert compact.to_dict() == full.to_dict()
+        for full_qe, compact_qe in zip(full.quarterly_executions, compact.quarterly_executions):
+            assert compact_qe.expand() == full_qe
+            assert compact_qe.payee_payout("Producer") == full_qe.payee_payout("Producer")
+        assert compact.quarterly_executions[0].payee_payout("Nobody") == Decimal("0")
+
+    def test_investment_tracking(self, waterfall, projection):
+        """Test drawdown fields carry through"""
+        drawdown = InvestmentDrawdown.create(Decimal("20000000"), draw_periods=8)
+        executor = WaterfallExecutor(waterfall)
+
+        full = executor.execute_over_time(projection, investment_drawdown_profile=drawdown)
+        compact = executor.execute_over_time(projection, investment_drawdown_profile=drawdown, compact=True)
+
+        assert compact.total_investment_drawn == full.total_investment_drawn
+        assert [qe.to_dict() for qe in compact.quarterly_executions] == [
+            qe.to_dict() for qe in full.quarterly_executions
+        ]
+
+    def test_reexecute_stays_compact(self, waterfall, projection):
+        """Test reexecute() of a compact run matches the dict-based diff"""
+        executor = WaterfallExecutor(waterfall)
+        edited = dict(projection.quarterly_revenue)
+        edited[3] = edited[3] * 2
+        edited_projection = replace(projection, quarterly_revenue=edited)
+
+        full = executor.reexecute(executor.execute_over_time(projection), edited_projection)
+        compact = executor.reexecute(executor.execute_over_time(projection, compact=True), edited_projection)
+
+        assert isinstance(compact.changed[0], CompactQuarterlyExecution)
+        assert compact.to_dict() == full.to_dict()
+        assert compact.quarters_rerun == full.quarters_rerun
+
+    def test_order_of_magnitude_smaller(self, large_waterfall, projection):
+        """Test a compact snapshot takes under a tenth of the memory"""
+        executor = WaterfallExecutor(large_waterfall)
+        compact = executor.execute_over_time(projection, compact=True).quarterly_executions
+
+        full_bytes = _snapshot_bytes(lambda: [qe.expand() for qe in compact])
+        compact_bytes = _snapshot_bytes(lambda: [
+            CompactQuarterlyExecution(qe.quarter, qe.gross_receipts, qe.plan, qe._cents.copy())
+            for qe in compact
+        ])
+
+        assert compact_bytes * 10 < full_bytes
+
+
+class TestCompactStakeholderCashFlows:
+    """Test StakeholderAnalyzer.analyze(compact=True)"""
+
+    def test_same_analysis(self, waterfall, capital_stack, projection):
+        """Test compact stakeholders serialize like the dict-based ones"""
+        executor = WaterfallExecutor(waterfall)
+        analyzer = StakeholderAnalyzer(capital_stack)
+
+        for result in (executor.execute_over_time(projection), executor.execute_summary(projection)):
+            full = analyzer.analyze(result)
+            compact = analyzer.analyze(result, compact=True)
+
+            assert all(isinstance(s, CompactStakeholderCashFlows) for s in compact.stakeholders)
+            assert compact.summary_statistics == full.summary_statistics
+            assert [s.to_dict() for s in compact.stakeholders] == [s.to_dict() for s in full.stakeholders]
+            assert compact.stakeholders[1].expand() == full.stakeholders[1]
+
+    def test_shared_quarter_index(self, waterfall, capital_stack, projection):
+        """Test every stakeholder shares one quarter index"""
+        result = WaterfallExecutor(waterfall).execute_over_time(projection, compact=True)
+        stakeholders = StakeholderAnalyzer(capital_stack).analyze(result, compact=True).stakeholders
+
+        assert stakeholders[0].quarters is stakeholders[1].quarters
+        assert len(stakeholders[0].receipt_cents) == len(result.quarterly_executions)
+
+
+class TestCompactMonteCarloScenario:
+    """Test compact_scenarios=True"""
+
+    @pytest.fixture
+    def simulator(self, waterfall, capital_stack, projection):
+        """Simulator over the sample structures"""
+        return MonteCarloSimulator(waterfall, capital_stack, projection)
+
+    @pytest.fixture
+    def distribution(self):
+        """Triangular revenue around the base case"""
+        return RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={"min": Decimal("10000000"), "mode": Decimal("40000000"), "max": Decimal("90000000")}
+        )
+
+    def test_batch_matches(self, simulator, distribution):
+        """Test batch scenarios are views of one table with identical dicts"""
+        full = simulator.simulate_batch(distribution, num_simulations=50, seed=3)
+        compact = simulator.simulate_batch(distribution, num_simulations=50, seed=3, compact_scenarios=True)
+
+        assert all(isinstance(s, CompactMonteCarloScenario) for s in compact.scenarios)
+        assert compact.scenarios[0].metrics.base is compact.scenarios[1].metrics.base
+        assert compact.scenarios[0].stakeholder_ids is compact.scenarios[1].stakeholder_ids
+        assert [s.to_dict() for s in compact.scenarios] == [s.to_dict() for s in full.scenarios]
+        assert compact.stakeholder_percentiles == full.stakeholder_percentiles
+
+    def test_simulate_matches_as_float(self, simulator, distribution):
+        """Test simulate() scenarios keep float64 metrics"""
+        full = simulator.simulate(distribution, num_simulations=20, seed=3)
+        compact = simulator.simulate(distribution, num_simulations=20, seed=3, compact_scenarios=True)
+
+        for full_scenario, compact_scenario in zip(full.scenarios, compact.scenarios):
+            assert compact_scenario.total_revenue == full_scenario.total_revenue
+            for sid, metrics in full_scenario.stakeholder_results.items():
+                compact_metrics = compact_scenario.stakeholder_results[sid]
+                assert compact_metrics["fully_recouped"] == metrics["fully_recouped"]
+                for name in ("irr", "cash_on_cash", "total_receipts"):
+                    assert float(compact_metrics[name]) == pytest.approx(float(metrics[name]), rel=1e-12)
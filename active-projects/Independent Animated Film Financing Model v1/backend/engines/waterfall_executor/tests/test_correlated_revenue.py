@@ -0,0 +1,263 @@
+"""
+Unit Tests for Correlated Revenue Model
+
+Tests per-window / per-territory revenue components, Gaussian-copula sampling
+of revenue and timing variables, and their use by MonteCarloSimulator.
+"""
+
+import pytest
+from decimal import Decimal
+
+import numpy as np
+from scipy.stats import spearmanr
+
+from engines.waterfall_executor.correlated_revenue import (
+    CorrelatedRevenueModel,
+    RevenueVariable,
+    TimingVariable
+)
+from engines.waterfall_executor.revenue_projector import (
+    RevenueProjector,
+    MarketRevenue,
+    DistributionWindow
+)
+from engines.waterfall_executor.monte_carlo_simulator import MonteCarloSimulator, RevenueDistribution
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+def _triangular(name, low, mode, high):
+    """Triangular RevenueDistribution"""
+    return RevenueDistribution(
+        variable_name=name,
+        distribution_type="triangular",
+        parameters={"min": Decimal(low), "mode": Decimal(mode), "max": Decimal(high)}
+    )
+
+
+@pytest.fixture
+def components():
+    """Wide theatrical components for $30M"""
+    return RevenueProjector().project_components(Decimal("30000000"))
+
+
+@pytest.fixture
+def model(components):
+    """Correlated theatrical / SVOD / AVOD revenue with a delivery delay"""
+    return CorrelatedRevenueModel(
+        components=components,
+        variables=[
+            RevenueVariable(_triangular("theatrical", "4000000", "15600000", "25000000"), ["theatrical", "pvod"]),
+            RevenueVariable(_triangular("svod", "6000000", "10500000", "14000000"), ["svod"]),
+            RevenueVariable(
+                RevenueDistribution("avod", "normal", {"mean": Decimal("2400000"), "std": Decimal("800000")}),
+                ["avod"]
+            ),
+            TimingVariable("delay", {0: 0.7, 1: 0.2, 2: 0.1}, ["svod", "pay_tv", "avod"]),
+        ],
+        correlation=[
+            [1.0, 0.6, 0.4, -0.3],
+            [0.6, 1.0, 0.5, 0.0],
+            [0.4, 0.5, 1.0, 0.0],
+            [-0.3, 0.0, 0.0, 1.0],
+        ]
+    )
+
+
+@pytest.fixture
+def simulator():
+    """Simulator with senior debt and equity"""
+    waterfall = WaterfallStructure(
+        waterfall_name="Correlated Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("5000000")),
+            WaterfallNode(priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("10000000")),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    )
+    capital_stack = CapitalStack(
+        stack_name="Correlated Stack",
+        project_budget=Decimal("15000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("5000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("10000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+    projection = RevenueProjector().project(
+        total_ultimate_revenue=Decimal("30000000"),
+        release_strategy="wide_theatrical",
+        project_name="Correlated Film"
+    )
+    return MonteCarloSimulator(waterfall, capital_stack, projection)
+
+
+class TestProjectComponents:
+    """Test RevenueProjector.project_components()"""
+
+    def test_components_reproduce_projection(self, components):
+        """Test components sum to the same quarterly revenue as project()"""
+        projection = RevenueProjector().project(Decimal("30000000"))
+        model = CorrelatedRevenueModel(components=components, variables=[])
+
+        base = model.base_revenue()
+
+        for quarter, amount in projection.quarterly_revenue.items():
+            assert base[quarter] == pytest.approx(float(amount), abs=1e-3)
+        assert {c.window_type for c in components} == set(projection.by_window)
+
+    def test_profiles_sum_to_one(self, components):
+        """Test each component's timing profile is normalized"""
+        for component in components:
+            assert sum(component.profile) == pytest.approx(1.0)
+
+    def test_market_components(self):
+        """Test each market splits its own total, offset by release quarter"""
+        markets = [
+            MarketRevenue("North America", Decimal("20000000"), [], release_quarter=0),
+            MarketRevenue(
+                "UK",
+                Decimal("5000000"),
+                [DistributionWindow("theatrical", 0, 2, Decimal("60")), DistributionWindow("svod", 2, 1, Decimal("40"), "lump_sum")],
+                release_quarter=1
+            ),
+        ]
+
+        components = RevenueProjector().project_components(Decimal("0"), markets=markets)
+
+        uk = [c for c in components if c.market_name == "UK"]
+        assert sum(c.amount for c in uk) == Decimal("5000000")
+        assert {c.window_type: c.start_quarter for c in uk} == {"theatrical": 1, "svod": 3}
+        north_america = [c for c in components if c.market_name == "North America"]
+        assert sum(c.amount for c in north_america) == Decimal("20000000")
+
+
+class TestCorrelatedRevenueModel:
+    """Test CorrelatedRevenueModel sampling"""
+
+    def test_sample_shape_and_reproducibility(self, model):
+        """Test samples are (scenarios × quarters) and seed-reproducible"""
+        first = model.sample(1000, np.random.default_rng(3))
+        second = model.sample(1000, np.random.default_rng(3))
+
+        assert first.shape == (1000, model.num_quarters)
+        np.testing.assert_array_equal(first, second)
+        assert (first >= 0).all()
+
+    def test_chunked_sampling_matches_single_draw(self, model):
+        """Test sampling in chunks consumes the stream like one large draw"""
+        rng = np.random.default_rng(5)
+        chunked = np.vstack([model.sample(300, rng), model.sample(200, rng)])
+
+        np.testing.assert_allclose(chunked, model.sample(500, np.random.default_rng(5)))
+
+    def test_marginals(self, model):
+        """Test each revenue variable follows its own marginal"""
+        draws = model.sample_variables(50000, np.random.default_rng(0))
+
+        assert draws["theatrical"].min() >= 4000000
+        assert draws["theatrical"].max() <= 25000000
+        assert draws["theatrical"].mean() == pytest.approx((4e6 + 15.6e6 + 25e6) / 3, rel=0.01)
+        assert draws["avod"].mean() == pytest.approx(2.4e6, rel=0.01)
+        assert set(np.unique(draws["delay"]).tolist()) == {0, 1, 2}
+        assert np.mean(draws["delay"] == 0) == pytest.approx(0.7, abs=0.01)
+
+    def test_rank_correlation_follows_copula(self, model):
+        """Test Spearman correlation matches the Gaussian copula"""
+        draws = model.sample_variables(50000, np.random.default_rng(1))
+
+        rho = spearmanr(draws["theatrical"], draws["svod"])[0]
+
+        assert rho == pytest.approx(6 / np.pi * np.arcsin(0.6 / 2), abs=0.02)
+
+    def test_revenue_variable_sets_group_total(self, components, model):
+        """Test covered windows sum to the drawn total; others stay at base"""
+        rng = np.random.default_rng(2)
+        draws = model.sample_variables(1, rng)
+        revenue = model.sample(1, np.random.default_rng(2))[0]
+
+        uncovered = sum(float(c.amount) for c in components if c.window_type in ("est", "pay_tv"))
+        expected = draws["theatrical"][0] + draws["svod"][0] + draws["avod"][0] + uncovered
+
+        assert revenue.sum() == pytest.approx(expected, rel=1e-12)
+
+    def test_timing_shift_moves_window(self, components):
+        """Test a certain one-quarter delay moves SVOD revenue one quarter later"""
+        delayed = CorrelatedRevenueModel(
+            components=components,
+            variables=[TimingVariable("delay", {1: 1.0}, ["svod"])]
+        )
+        base = CorrelatedRevenueModel(components=components, variables=[]).base_revenue()
+
+        revenue = delayed.sample(1, np.random.default_rng(0))[0]
+        svod = next(c for c in components if c.window_type == "svod")
+
+        assert revenue[svod.start_quarter] == pytest.approx(base[svod.start_quarter] - float(svod.amount))
+        assert revenue.sum() == pytest.approx(base.sum())
+
+    def test_invalid_correlation(self, components):
+        """Test non-positive-definite and mis-shaped matrices are rejected"""
+        variables = [
+            RevenueVariable(_triangular("theatrical", "1", "2", "3"), ["theatrical"]),
+            RevenueVariable(_triangular("svod", "1", "2", "3"), ["svod"]),
+        ]
+
+        with pytest.raises(ValueError, match="positive definite"):
+            CorrelatedRevenueModel(components, variables, correlation=[[1.0, 1.5], [1.5, 1.0]])
+        with pytest.raises(ValueError, match="2x2"):
+            CorrelatedRevenueModel(components, variables, correlation=[[1.0]])
+
+    def test_overlapping_variables_rejected(self, components):
+        """Test a component can't be driven by two revenue variables"""
+        with pytest.raises(ValueError, match="covered by both"):
+            CorrelatedRevenueModel(components, [
+                RevenueVariable(_triangular("all", "1", "2", "3")),
+                RevenueVariable(_triangular("svod", "1", "2", "3"), ["svod"]),
+            ])
+
+    def test_invalid_timing_probabilities(self):
+        """Test timing probabilities must sum to one"""
+        with pytest.raises(ValueError, match="sum to 1"):
+            TimingVariable("delay", {0: 0.5, 1: 0.2})
+
+
+class TestCorrelatedMonteCarlo:
+    """Test MonteCarloSimulator with a CorrelatedRevenueModel"""
+
+    def test_batch_simulation(self, simulator, model):
+        """Test batch mode runs correlated draws and records the model type"""
+        result = simulator.simulate_batch(model, num_simulations=500, seed=4)
+
+        assert result.metadata["distribution"] == "correlated"
+        assert len(result.scenarios) == 500
+        assert result.revenue_percentiles["p10"] <= result.revenue_percentiles["p50"] <= result.revenue_percentiles["p90"]
+
+    def test_batch_independent_of_workers(self, simulator, model):
+        """Test correlated shards are bit-identical across worker counts"""
+        serial = simulator.simulate_batch(model, num_simulations=120, seed=9, shard_size=40)
+        parallel = simulator.simulate_batch(model, num_simulations=120, seed=9, shard_size=40, workers=2)
+
+        assert [s.total_revenue for s in serial.scenarios] == [s.total_revenue for s in parallel.scenarios]
+        assert serial.stakeholder_percentiles == parallel.stakeholder_percentiles
+
+    def test_scalar_matches_batch_statistics(self, simulator, model):
+        """Test Decimal and batch paths agree on the correlated model"""
+        scalar = simulator.simulate(model, num_simulations=300, seed=1)
+        batch = simulator.simulate_batch(model, num_simulations=3000, seed=1, keep_scenarios=False)
+
+        assert float(scalar.revenue_percentiles["p50"]) == pytest.approx(
+            float(batch.revenue_percentiles["p50"]), rel=0.05
+        )
+        assert scalar.metadata["distribution"] == "correlated"
+
+    def test_response_curve_rejected(self, simulator, model):
+        """Test the scale response curve needs a single revenue variable"""
+        with pytest.raises(ValueError, match="response_curve"):
+            simulator.simulate_batch(model, num_simulations=10, response_curve=True)
@@ -0,0 +1,252 @@
+"""
+Unit Tests for Event-Driven Waterfall Engine
+
+Tests dated revenue / drawdown / fee / interest events, their agreement with
+quarterly WaterfallExecutor runs, and period roll-ups.
+"""
+
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+
+from engines.waterfall_executor.event_engine import (
+    EventWaterfallEngine,
+    InterestTerms,
+    ScheduledEvent,
+    add_months,
+    drawdown_events,
+    period_label,
+    revenue_events
+)
+from engines.waterfall_executor.revenue_projector import RevenueProjector, InvestmentDrawdown
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+
+
+START = date(2025, 1, 1)
+
+
+def _receipt(day, amount):
+    """Revenue receipt on a date"""
+    return ScheduledEvent(day, "revenue_receipt", Decimal(amount))
+
+
+@pytest.fixture
+def waterfall():
+    """Senior debt, equity recoupment and a 50% profit split"""
+    return WaterfallStructure(
+        waterfall_name="Event Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("5000000")),
+            WaterfallNode(priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("10000000")),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    )
+
+
+@pytest.fixture
+def projection():
+    """Wide theatrical projection of $30M"""
+    return RevenueProjector().project(Decimal("30000000"), project_name="Event Film")
+
+
+@pytest.fixture
+def interest_engine(waterfall):
+    """Engine with 8% interest on the senior debt"""
+    return EventWaterfallEngine(waterfall, [InterestTerms("6_Senior Lender", Decimal("8"))])
+
+
+class TestRevenueEvents:
+    """Test execution of revenue receipts"""
+
+    def test_quarterly_events_match_execute_over_time(self, waterfall, projection):
+        """Test quarter-dated receipts reproduce the quarterly executor"""
+        quarterly = WaterfallExecutor(waterfall).execute_over_time(projection)
+
+        result = EventWaterfallEngine(waterfall).execute(revenue_events(projection, granularity="quarterly"))
+
+        assert [e.node_payouts for e in result.executions] == [
+            q.node_payouts for q in quarterly.quarterly_executions
+        ]
+        assert result.total_recouped_by_node == quarterly.total_recouped_by_node
+        assert result.executions[1].event_date == date(2025, 4, 1)
+
+    def test_monthly_events_match_totals(self, waterfall, projection):
+        """Test monthly receipts pay out the same totals to the cent"""
+        quarterly = WaterfallExecutor(waterfall).execute_over_time(projection)
+
+        events = revenue_events(projection)
+        result = EventWaterfallEngine(waterfall).execute(events)
+
+        assert len(events) == 3 * len(quarterly.quarterly_executions)
+        assert result.total_receipts == pytest.approx(quarterly.total_receipts, abs=Decimal("0.5"))
+        for payee, amount in quarterly.total_paid_by_payee.items():
+            assert result.total_paid_by_payee[payee] == pytest.approx(amount, abs=Decimal("1"))
+        assert result.final_unrecouped == {}
+
+    def test_same_date_receipts_pooled(self, waterfall):
+        """Test receipts on one date are one pool and unordered input is sorted"""
+        events = [_receipt(date(2025, 3, 1), "100"), _receipt(START, "1000"), _receipt(START, "2000")]
+
+        result = EventWaterfallEngine(waterfall).execute(events)
+
+        assert [e.event_date for e in result.executions] == [START, date(2025, 3, 1)]
+        assert result.executions[0].gross_receipts == Decimal("3000")
+        assert result.executions[0].distribution_fees == Decimal("900.00")
+
+    def test_empty_schedule(self, waterfall):
+        """Test no events yields an empty result"""
+        result = EventWaterfallEngine(waterfall).execute([], start_date=START)
+
+        assert result.executions == []
+        assert result.end_date == START
+        assert result.final_unrecouped["6_Senior Lender"] == Decimal("5000000.00")
+
+
+class TestInterestAccrual:
+    """Test daily interest accrual on debt nodes"""
+
+    def test_one_year_simple_interest(self, interest_engine):
+        """Test a year at 8% on $5M adds $400k to the debt"""
+        result = interest_engine.execute([ScheduledEvent(date(2026, 1, 1), "interest_accrual")], start_date=START)
+
+        assert result.total_interest == {"6_Senior Lender": Decimal("400000.00")}
+        assert result.final_unrecouped["6_Senior Lender"] == Decimal("5400000.00")
+
+    def test_independent_of_event_spacing(self, interest_engine):
+        """Test daily checkpoints accrue exactly what one yearly checkpoint does"""
+        daily = [ScheduledEvent(START + timedelta(days=d), "interest_accrual") for d in range(366)]
+
+        result = interest_engine.execute(daily)
+
+        assert result.total_interest["6_Senior Lender"] == Decimal("400000.00")
+        assert len(result.executions) == 366
+
+    def test_interest_paid_before_principal(self, interest_engine):
+        """Test repayments settle accrued interest first, so principal keeps accruing"""
+        # 365 days: $400k interest; receipt nets $700k → interest + $300k principal
+        events = [
+            _receipt(date(2026, 1, 1), "1000000"),
+            ScheduledEvent(date(2027, 1, 1), "interest_accrual"),
+        ]
+
+        result = interest_engine.execute(events, start_date=START)
+
+        second_year = result.executions[1].interest_accrued["6_Senior Lender"]
+        assert second_year == Decimal("4700000") * Decimal("0.08")
+
+    def test_drawdowns_set_interest_basis(self, waterfall):
+        """Test interest only accrues on drawn principal"""
+        engine = EventWaterfallEngine(waterfall, [InterestTerms("6_Senior Lender", Decimal("10"), day_count=360)])
+        events = [
+            ScheduledEvent(START, "drawdown", Decimal("1000000"), node_id="6_Senior Lender"),
+            ScheduledEvent(START + timedelta(days=180), "drawdown", Decimal("1000000"), node_id="6_Senior Lender"),
+            ScheduledEvent(START + timedelta(days=360), "interest_accrual"),
+        ]
+
+        result = engine.execute(events)
+
+        # 1M for 360 days + 1M for 180 days at 10% / 360
+        assert result.total_interest["6_Senior Lender"] == Decimal("150000.00")
+        assert result.total_investment_drawn == Decimal("2000000.00")
+
+    def test_separate_interest_node(self, waterfall):
+        """Test interest can be collected by its own higher-priority node"""
+        structure = waterfall.model_copy(update={"nodes": [
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT_INTEREST, payee="Senior Lender", amount=None),
+        ] + list(waterfall.nodes)})
+        engine = EventWaterfallEngine(
+            structure,
+            [InterestTerms("6_Senior Lender", Decimal("8"), interest_node_id="5_Senior Lender")]
+        )
+
+        result = engine.execute([_receipt(date(2026, 1, 1), "1000000")], start_date=START)
+
+        payouts = result.executions[0].node_payouts
+        assert payouts["5_Senior Lender"] == Decimal("400000.00")
+        assert payouts["6_Senior Lender"] == Decimal("300000.00")
+
+    def test_invalid_terms(self, waterfall):
+        """Test interest needs a fixed-amount node"""
+        with pytest.raises(ValueError, match="Unknown waterfall node"):
+            EventWaterfallEngine(waterfall, [InterestTerms("6_Nobody", Decimal("8"))])
+        with pytest.raises(ValueError, match="fixed amount"):
+            EventWaterfallEngine(waterfall, [InterestTerms("13_Equity Investors", Decimal("8"))])
+        with pytest.raises(ValueError, match="day_count"):
+            InterestTerms("6_Senior Lender", Decimal("8"), day_count=252)
+
+
+class TestFeesAndDrawdowns:
+    """Test fee and drawdown events"""
+
+    def test_fees_carry_forward(self, waterfall):
+        """Test fees beyond a date's receipts are paid from later receipts"""
+        events = [
+            ScheduledEvent(START, "fee", Decimal("1000"), description="CAM fee"),
+            _receipt(date(2025, 2, 1), "1000"),
+            _receipt(date(2025, 3, 1), "1000"),
+        ]
+
+        result = EventWaterfallEngine(waterfall).execute(events)
+
+        assert [e.expenses for e in result.executions] == [Decimal("0"), Decimal("700.00"), Decimal("300.00")]
+        assert result.executions[2].node_payouts["6_Senior Lender"] == Decimal("400.00")
+        assert result.unpaid_expenses == Decimal("0")
+        assert result.total_fees == Decimal("1600.00")
+
+    def test_drawdown_schedule(self, waterfall):
+        """Test InvestmentDrawdown converts to dated drawdown events"""
+        drawdown = InvestmentDrawdown.create(Decimal("12000000"), draw_periods=12)
+
+        events = drawdown_events(drawdown, START)
+        result = EventWaterfallEngine(waterfall).execute(events)
+
+        assert events[-1].event_date == date(2025, 12, 1)
+        assert result.total_investment_drawn == pytest.approx(Decimal("12000000"), abs=Decimal("0.1"))
+
+    def test_event_before_start_rejected(self, waterfall):
+        """Test events can't precede the schedule start"""
+        with pytest.raises(ValueError, match="precedes start_date"):
+            EventWaterfallEngine(waterfall).execute([_receipt(START, "1")], start_date=date(2025, 6, 1))
+
+    def test_invalid_event(self):
+        """Test unknown event types and negative amounts are rejected"""
+        with pytest.raises(ValueError, match="Unsupported event type"):
+            ScheduledEvent(START, "royalty")
+        with pytest.raises(ValueError, match="non-negative"):
+            ScheduledEvent(START, "fee", Decimal("-1"))
+
+
+class TestPeriodSummary:
+    """Test roll-up to reporting periods"""
+
+    def test_monthly_to_quarterly(self, waterfall, projection):
+        """Test quarterly roll-up of a monthly run sums the months"""
+        result = EventWaterfallEngine(waterfall).execute(revenue_events(projection))
+
+        quarters = result.summarize_by_period("quarterly")
+        months = result.summarize_by_period("monthly")
+
+        assert quarters[0]["period"] == "2025-Q1"
+        assert quarters[0]["gross_receipts"] == sum(m["gross_receipts"] for m in months[:3])
+        assert sum(q["gross_receipts"] for q in quarters) == result.total_receipts
+
+    def test_long_sparse_schedule(self, interest_engine):
+        """Test a 20-year monthly schedule visits only event dates"""
+        events = [_receipt(add_months(START, m), "150000") for m in range(240)]
+
+        result = interest_engine.execute(events)
+
+        assert len(result.executions) == 240
+        assert result.final_unrecouped == {}
+        assert result.total_interest["6_Senior Lender"] > 0
+
+    def test_period_labels(self):
+        """Test label formats per granularity"""
+        day = date(2031, 8, 17)
+
+        assert period_label(day, "daily") == "2031-08-17"
+        assert period_label(day, "monthly") == "2031-08"
+        assert period_label(day, "quarterly") == "2031-Q3"
+        assert add_months(day, 5) == date(2032, 1, 1)
@@ -0,0 +1,198 @@
+"""
+Unit Tests for Incremental Waterfall Re-execution
+
+Tests that WaterfallExecutor.reexecute() resumes from checkpoints, matches a
+full execute_over_time() replay and reports only the affected quarters.
+"""
+
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor, WaterfallDiff
+from engines.waterfall_executor.revenue_projector import RevenueProjection, InvestmentDrawdown
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+
+
+NUM_QUARTERS = 40
+
+
+def _projection(quarterly_revenue):
+    """Projection over explicit quarterly revenue"""
+    return RevenueProjection(
+        project_name="Incremental Film",
+        projection_start_date="2025-Q1",
+        total_quarters=NUM_QUARTERS,
+        quarterly_revenue=dict(quarterly_revenue),
+        cumulative_revenue={},
+        by_window={},
+        by_market={}
+    )
+
+
+def _edit(revenue, quarter, delta):
+    """Copy of revenue with one quarter changed"""
+    edited = dict(revenue)
+    edited[quarter] = edited[quarter] + Decimal(delta)
+    return edited
+
+
+@pytest.fixture
+def revenue():
+    """40 quarters of growing revenue"""
+    return {q: Decimal(700000 + 10000 * q) for q in range(NUM_QUARTERS)}
+
+
+@pytest.fixture
+def fixed_waterfall():
+    """Debt and equity recoupment only (no percentage nodes)"""
+    return WaterfallStructure(
+        waterfall_name="Fixed Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("5000000")),
+            WaterfallNode(priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("10000000")),
+        ]
+    )
+
+
+@pytest.fixture
+def executor():
+    """Executor for debt, equity and a 50% profit split"""
+    return WaterfallExecutor(WaterfallStructure(
+        waterfall_name="Incremental Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("5000000")),
+            WaterfallNode(priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("10000000")),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    ))
+
+
+def _assert_same(diff, full):
+    """Incremental result equals a full replay"""
+    assert diff.result.quarterly_executions == full.quarterly_executions
+    assert diff.result.total_receipts == full.total_receipts
+    assert diff.result.total_fees == full.total_fees
+    assert diff.result.total_paid_by_payee == full.total_paid_by_payee
+    assert diff.result.final_unrecouped == full.final_unrecouped
+
+
+class TestReexecute:
+    """Test WaterfallExecutor.reexecute()"""
+
+    def test_resumes_from_edited_quarter(self, executor, revenue):
+        """Test an edit at quarter 14 re-runs quarters 14..39 only"""
+        previous = executor.execute_over_time(_projection(revenue))
+        edited = _edit(revenue, 14, "250000")
+
+        diff = executor.reexecute(previous, _projection(edited))
+
+        assert isinstance(diff, WaterfallDiff)
+        assert diff.first_changed_quarter == 14
+        assert diff.quarters_rerun == NUM_QUARTERS - 14
+        assert diff.result.quarterly_executions[:14] == previous.quarterly_executions[:14]
+        assert diff.result.quarterly_executions[0] is previous.quarterly_executions[0]
+        _assert_same(diff, executor.execute_over_time(_projection(edited)))
+
+    def test_changed_lists_only_affected_quarters(self, executor, revenue):
+        """Test the diff omits quarters whose execution is identical"""
+        previous = executor.execute_over_time(_projection(revenue))
+
+        diff = executor.reexecute(previous, _projection(_edit(revenue, 39, "1000")))
+
+        assert [qe.quarter for qe in diff.changed] == [39]
+        assert diff.to_dict()["changed"][0]["quarter"] == 39
+
+    def test_converged_tail_reused(self, fixed_waterfall, revenue):
+        """Test the previous tail is spliced in once cumulative state matches again"""
+        executor = WaterfallExecutor(fixed_waterfall)
+        previous = executor.execute_over_time(_projection(revenue))
+        # Both runs are fully recouped well before quarter 30
+        edited = _edit(revenue, 30, "-200000")
+        edited = _edit(edited, 31, "200000")
+
+        diff = executor.reexecute(previous, _projection(edited))
+
+        # Only the two edited quarters run; quarter 32 onwards is reused
+        assert diff.quarters_rerun == 2
+        assert diff.result.quarterly_executions[-1] is previous.quarterly_executions[-1]
+        _assert_same(diff, executor.execute_over_time(_projection(edited)))
+
+    def test_removed_quarter_and_pa_change(self, executor, revenue):
+        """Test zeroed quarters are reported removed and new P&A applies"""
+        previous = executor.execute_over_time(_projection(revenue))
+        edited = dict(revenue)
+        edited[5] = Decimal("0")
+        pa = {20: Decimal("100000")}
+
+        diff = executor.reexecute(previous, _projection(edited), pa_expenses_per_quarter=pa)
+
+        assert diff.removed_quarters == [5]
+        assert diff.first_changed_quarter == 6
+        _assert_same(diff, executor.execute_over_time(_projection(edited), pa_expenses_per_quarter=pa))
+
+    def test_pa_kept_from_previous_run(self, executor, revenue):
+        """Test omitted P&A reuses the previous run's expenses"""
+        pa = {3: Decimal("50000")}
+        previous = executor.execute_over_time(_projection(revenue), pa_expenses_per_quarter=pa)
+        edited = _edit(revenue, 10, "5000")
+
+        diff = executor.reexecute(previous, _projection(edited))
+
+        assert diff.first_changed_quarter == 10
+        _assert_same(diff, executor.execute_over_time(_projection(edited), pa_expenses_per_quarter=pa))
+
+    def test_appended_quarters(self, executor, revenue):
+        """Test new trailing quarters are executed after the unchanged ones"""
+        previous = executor.execute_over_time(_projection(revenue))
+        extended = dict(revenue)
+        extended[NUM_QUARTERS] = Decimal("500000")
+
+        diff = executor.reexecute(previous, _projection(extended))
+
+        assert diff.quarters_rerun == 1
+        assert [qe.quarter for qe in diff.changed] == [NUM_QUARTERS]
+        _assert_same(diff, executor.execute_over_time(_projection(extended)))
+
+    def test_chained_edits_and_noop(self, executor, revenue):
+        """Test reexecute() results can be re-executed again; no edit re-runs nothing"""
+        previous = executor.execute_over_time(_projection(revenue))
+        first = executor.reexecute(previous, _projection(_edit(revenue, 20, "1")))
+
+        second = executor.reexecute(first.result, _projection(_edit(revenue, 20, "1")))
+
+        assert second.quarters_rerun == 0
+        assert second.changed == []
+        assert second.first_changed_quarter is None
+
+    def test_from_quarter_forces_rerun(self, executor, revenue):
+        """Test from_quarter re-runs an unchanged quarter, then reuses the converged tail"""
+        previous = executor.execute_over_time(_projection(revenue))
+
+        diff = executor.reexecute(previous, _projection(revenue), from_quarter=35)
+
+        assert diff.first_changed_quarter == 35
+        assert diff.quarters_rerun == 1
+        assert diff.changed == []
+        assert diff.result.quarterly_executions[36] is previous.quarterly_executions[36]
+
+    def test_investment_tracking_preserved(self, executor, revenue):
+        """Test drawdown tracking carries through re-execution"""
+        drawdown = InvestmentDrawdown.create(Decimal("15000000"), draw_periods=8)
+        previous = executor.execute_over_time(_projection(revenue), investment_drawdown_profile=drawdown)
+        edited = _edit(revenue, 4, "10000")
+
+        diff = executor.reexecute(previous, _projection(edited))
+
+        full = executor.execute_over_time(_projection(edited), investment_drawdown_profile=drawdown)
+        _assert_same(diff, full)
+        assert diff.result.total_investment_drawn == full.total_investment_drawn
+
+    def test_requires_checkpoints(self, executor, revenue):
+        """Test results without checkpoints are rejected"""
+        previous = executor.execute_over_time(_projection(revenue))
+        previous.checkpoints = None
+
+        with pytest.raises(ValueError, match="no checkpoints"):
+            executor.reexecute(previous, _projection(revenue))
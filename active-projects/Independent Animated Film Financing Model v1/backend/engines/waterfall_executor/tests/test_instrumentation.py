@@ -0,0 +1,224 @@
+"""
+Unit Tests for Execution Instrumentation
+
+Tests the opt-in Tracer: spans and counters recorded by the engines inside
+tracing(), OTLP/JSON and Prometheus exports, and the no-op path when
+tracing is disabled.
+"""
+
+import numpy as np
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.instrumentation import (
+    Tracer,
+    tracing,
+    current_tracer,
+    span,
+    count,
+    traced,
+)
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.revenue_projector import RevenueProjector
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer
+from engines.waterfall_executor.monte_carlo_simulator import MonteCarloSimulator, RevenueDistribution
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with debt, equity and net profits"""
+    return WaterfallStructure(
+        waterfall_name="Traced Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("8000000")),
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("12000000")
+            ),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    )
+
+
+@pytest.fixture
+def capital_stack():
+    """Capital stack matching the waterfall payees"""
+    return CapitalStack(
+        stack_name="Traced Stack",
+        project_budget=Decimal("20000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("8000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("12000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def projection():
+    """Projection that recoups every fixed tier"""
+    return RevenueProjector().project(total_ultimate_revenue=Decimal("50000000"))
+
+
+class TestDisabled:
+    """Test hooks outside tracing()"""
+
+    def test_no_active_tracer(self):
+        """Test spans are no-ops and counters are dropped"""
+        assert current_tracer() is None
+        with span("anything", "execution") as opened:
+            assert opened is None
+        count("anything")
+
+    def test_traced_calls_through(self):
+        """Test decorated functions return their result untouched"""
+        @traced("double")
+        def double(x):
+            return 2 * x
+
+        assert double(21) == 42
+
+    def test_tracing_restores_previous(self):
+        """Test nested tracing() blocks restore the outer tracer"""
+        with tracing() as outer:
+            with tracing() as inner:
+                assert current_tracer() is inner
+            assert current_tracer() is outer
+        assert current_tracer() is None
+
+
+class TestEngineHooks:
+    """Test spans and counters recorded by the engines"""
+
+    def test_execution_counters(self, waterfall, projection):
+        """Test quarters and node visits match the executed snapshots"""
+        executor = WaterfallExecutor(waterfall)
+
+        with tracing() as tracer:
+            result = executor.execute_over_time(projection)
+
+        quarters = len(result.quarterly_executions)
+        paid = sum(len(qe.node_payouts) for qe in result.quarterly_executions)
+        assert tracer.counters["waterfall.quarters"] == quarters
+        assert tracer.counters["waterfall.nodes_evaluated"] == paid
+        assert tracer.counters["waterfall.nodes_skipped"] == quarters * executor.plan.num_nodes - paid
+        assert tracer.span_stats["waterfall.execute"].phase == "execution"
+
+    def test_summary_matches_time_series(self, waterfall, projection):
+        """Test execute_summary() records the same node visits"""
+        executor = WaterfallExecutor(waterfall)
+
+        with tracing() as series:
+            executor.execute_over_time(projection)
+        with tracing() as summary:
+            executor.execute_summary(projection)
+
+        assert summary.counters == series.counters
+
+    def test_irr_nested_in_analysis(self, waterfall, capital_stack, projection):
+        """Test the IRR span is a child of the analysis span"""
+        result = WaterfallExecutor(waterfall).execute_summary(projection)
+
+        with tracing() as tracer:
+            analysis = StakeholderAnalyzer(capital_stack).analyze(result)
+
+        spans = {s.name: s for s in tracer.spans}
+        solved = sum(1 for s in analysis.stakeholders if s.irr is not None)
+        assert spans["stakeholder.irr"].parent_id == spans["stakeholder.analyze"].span_id
+        assert spans["stakeholder.analyze"].parent_id is None
+        assert tracer.counters["irr.rows"] == solved + tracer.counters["irr.failures"]
+        assert tracer.counters["irr.newton_iterations"] > 0
+
+    def test_irr_failures(self, capital_stack):
+        """Test rows without a solution are counted, rows without flows are not"""
+        analyzer = StakeholderAnalyzer(capital_stack)
+        cash_flows = np.array([
+            [-100.0, 60.0, 60.0],
+            [-100.0, 1e-9, 1e-9],
+            [0.0, 0.0, 0.0],
+        ])
+
+        with tracing() as tracer:
+            irr = analyzer.calculate_irr_batch(cash_flows, np.array([0.0, 4.0, 8.0]))
+
+        assert tracer.counters["irr.rows"] == 2
+        assert tracer.counters["irr.failures"] == int(np.isnan(irr[:2]).sum())
+
+    def test_monte_carlo_phases(self, waterfall, capital_stack, projection):
+        """Test both simulation paths record every phase"""
+        simulator = MonteCarloSimulator(waterfall, capital_stack, projection)
+        distribution = RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={"min": Decimal("20000000"), "mode": Decimal("50000000"), "max": Decimal("90000000")}
+        )
+
+        with tracing() as tracer:
+            simulator.simulate(distribution, num_simulations=10, seed=1)
+            simulator.simulate_batch(distribution, num_simulations=50, seed=1)
+
+        assert set(tracer.phase_seconds()) == {"projection", "execution", "irr", "aggregation"}
+        assert tracer.counters["monte_carlo.scenarios"] == 60
+        assert tracer.span_stats["monte_carlo.project"].count == 11
+        assert tracer.span_stats["batch_waterfall.execute"].count == 1
+
+
+class TestExports:
+    """Test OTLP and Prometheus output"""
+
+    @pytest.fixture
+    def tracer(self):
+        """Tracer with one nested span and a counter"""
+        tracer = Tracer(service_name="test-service")
+        with tracer.span("outer", quarters=4):
+            with tracer.span("inner", "execution") as inner:
+                inner.set_attribute("compact", True)
+        tracer.count("irr.failures", 2)
+        return tracer
+
+    def test_otlp(self, tracer):
+        """Test spans export with parent links and typed attributes"""
+        payload = tracer.to_otlp()
+        resource = payload["resourceSpans"][0]
+        inner, outer = resource["scopeSpans"][0]["spans"]
+
+        assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "test-service"}
+        assert inner["parentSpanId"] == outer["spanId"]
+        assert outer["parentSpanId"] == ""
+        assert inner["traceId"] == outer["traceId"] == tracer.trace_id
+        assert {"key": "compact", "value": {"boolValue": True}} in inner["attributes"]
+        assert {"key": "quarters", "value": {"intValue": "4"}} in outer["attributes"]
+        assert int(inner["endTimeUnixNano"]) >= int(inner["startTimeUnixNano"])
+
+    def test_prometheus(self, tracer):
+        """Test summaries per span and counters with _total"""
+        lines = tracer.to_prometheus().splitlines()
+
+        assert "# TYPE waterfall_span_duration_seconds summary" in lines
+        assert 'waterfall_span_duration_seconds_count{span="inner",phase="execution"} 1' in lines
+        assert 'waterfall_span_duration_seconds_count{span="outer"} 1' in lines
+        assert "# TYPE waterfall_irr_failures_total counter" in lines
+        assert "waterfall_irr_failures_total 2" in lines
+
+    def test_empty_prometheus(self):
+        """Test an unused tracer exports nothing"""
+        assert Tracer().to_prometheus() == ""
+
+    def test_max_spans(self):
+        """Test spans beyond the limit are only aggregated"""
+        tracer = Tracer(max_spans=2)
+        for _ in range(5):
+            with tracer.span("step"):
+                pass
+
+        assert len(tracer.spans) == 2
+        assert tracer.dropped_spans == 3
+        assert tracer.span_stats["step"].count == 5
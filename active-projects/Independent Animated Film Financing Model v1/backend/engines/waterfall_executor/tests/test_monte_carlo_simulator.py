@@ -7,15 +7,27 @@ and edge cases for Monte Carlo simulations.
 
 import pytest
 from decimal import Decimal
+import pickle
 import random
 
+import numpy as np
+
 from engines.waterfall_executor.monte_carlo_simulator import (
     RevenueDistribution,
     MonteCarloScenario,
     MonteCarloResult,
-    MonteCarloSimulator
+    MonteCarloSimulator,
+    MonteCarloAggregator,
+    ReplicateStatistics,
+    PrecisionTarget,
+    SAMPLING_METHODS,
+    MIN_CONVERGENCE_BATCHES,
+    _evaluate_precision_targets,
+    _uniform_design
 )
 from engines.waterfall_executor.revenue_projector import RevenueProjector
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer
 from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
 from models.capital_stack import CapitalStack, CapitalComponent
 from models.financial_instruments import Equity, SeniorDebt
@@ -502,3 +514,593 @@ class TestMonteCarloSimulator:
 
         assert result.metadata["distribution"] == "triangular"
         assert result.metadata["seed"] == 999
+
+
+class TestMonteCarloBatchMode:
+    """Test vectorized simulate_batch() against the Decimal path"""
+
+    @pytest.fixture
+    def triangular_dist(self):
+        return RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={
+                "min": Decimal("10000000"),
+                "mode": Decimal("30000000"),
+                "max": Decimal("50000000")
+            }
+        )
+
+    def test_batch_result_shape(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test batch mode returns a complete MonteCarloResult"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate_batch(triangular_dist, num_simulations=200, seed=42)
+
+        assert isinstance(result, MonteCarloResult)
+        assert result.num_simulations == 200
+        assert len(result.scenarios) == 200
+        assert result.metadata["method"] == "batch"
+        assert set(result.stakeholder_percentiles) == {
+            "senior_debt_Senior Lender", "equity_Equity Investors"
+        }
+        for percentiles in result.stakeholder_percentiles.values():
+            assert percentiles["irr_p10"] <= percentiles["irr_p50"] <= percentiles["irr_p90"]
+            assert percentiles["coc_p10"] <= percentiles["coc_p50"] <= percentiles["coc_p90"]
+
+    def test_batch_reproducible_with_seed(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test same seed gives identical batch results"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result1 = simulator.simulate_batch(triangular_dist, num_simulations=100, seed=7)
+        result2 = simulator.simulate_batch(triangular_dist, num_simulations=100, seed=7)
+
+        assert result1.stakeholder_percentiles == result2.stakeholder_percentiles
+        assert [s.total_revenue for s in result1.scenarios] == [s.total_revenue for s in result2.scenarios]
+
+    def test_batch_chunking_does_not_change_results(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test chunk size only affects memory, not results"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        whole = simulator.simulate_batch(triangular_dist, num_simulations=150, seed=3)
+        chunked = simulator.simulate_batch(triangular_dist, num_simulations=150, seed=3, chunk_size=16)
+
+        assert whole.stakeholder_percentiles == chunked.stakeholder_percentiles
+        assert whole.probability_of_recoupment == chunked.probability_of_recoupment
+
+    def test_batch_matches_decimal_path(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test each batch scenario matches the Decimal pipeline within tolerance"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+        result = simulator.simulate_batch(triangular_dist, num_simulations=40, seed=11)
+
+        total_revenue = Decimal(base_projection.metadata["total_ultimate_revenue"])
+
+        for scenario in result.scenarios:
+            scaled = simulator._scale_projection(base_projection, scenario.total_revenue / total_revenue)
+            waterfall_result = WaterfallExecutor(simple_waterfall).execute_over_time(scaled)
+            analysis = StakeholderAnalyzer(simple_capital_stack).analyze(waterfall_result)
+
+            for stakeholder in analysis.stakeholders:
+                batch = scenario.stakeholder_results[stakeholder.stakeholder_id]
+                expected_irr = stakeholder.irr if stakeholder.irr else Decimal("0")
+
+                assert abs(batch["irr"] - expected_irr) < Decimal("1e-6")
+                assert float(batch["total_receipts"]) == pytest.approx(float(stakeholder.total_receipts), rel=1e-9)
+                assert batch["fully_recouped"] == (stakeholder.total_receipts >= stakeholder.initial_investment)
+
+    def test_batch_normal_distribution_non_negative(self, simple_waterfall, simple_capital_stack, base_projection):
+        """Test normal draws are clamped at zero in batch mode"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        dist = RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="normal",
+            parameters={"mean": Decimal("5000000"), "std": Decimal("10000000")}
+        )
+
+        result = simulator.simulate_batch(dist, num_simulations=200, seed=5)
+
+        assert all(s.total_revenue >= Decimal("0") for s in result.scenarios)
+
+    def test_batch_unsupported_distribution(self, simple_waterfall, simple_capital_stack, base_projection):
+        """Test batch mode rejects unsupported distributions"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        dist = RevenueDistribution(variable_name="test", distribution_type="invalid_type", parameters={})
+
+        with pytest.raises(ValueError, match="Unsupported distribution type"):
+            simulator.simulate_batch(dist, num_simulations=10)
+
+
+class TestMonteCarloParallel:
+    """Test sharded, process-pool execution of simulate_batch()"""
+
+    @pytest.fixture
+    def triangular_dist(self):
+        return RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={
+                "min": Decimal("10000000"),
+                "mode": Decimal("30000000"),
+                "max": Decimal("50000000")
+            }
+        )
+
+    def test_worker_count_does_not_change_results(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test results are bit-identical for one or several workers"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        serial = simulator.simulate_batch(triangular_dist, num_simulations=120, seed=21, shard_size=25)
+        parallel = simulator.simulate_batch(
+            triangular_dist, num_simulations=120, seed=21, shard_size=25, workers=2
+        )
+
+        assert [s.total_revenue for s in serial.scenarios] == [s.total_revenue for s in parallel.scenarios]
+        assert serial.stakeholder_percentiles == parallel.stakeholder_percentiles
+        assert serial.probability_of_recoupment == parallel.probability_of_recoupment
+        assert parallel.metadata["num_shards"] == 5
+        assert parallel.metadata["workers"] == 2
+
+    def test_shards_draw_independent_streams(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test each shard gets its own child stream"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate_batch(triangular_dist, num_simulations=20, seed=4, shard_size=10)
+        revenues = [s.total_revenue for s in result.scenarios]
+
+        assert revenues[:10] != revenues[10:]
+
+    def test_invalid_shard_size(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test shard size must be positive"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        with pytest.raises(ValueError, match="shard_size"):
+            simulator.simulate_batch(triangular_dist, num_simulations=10, shard_size=0)
+
+    def test_simulate_leaves_global_random_untouched(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test scalar simulate() uses a private generator"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        random.seed(123)
+        expected = random.random()
+
+        random.seed(123)
+        simulator.simulate(triangular_dist, num_simulations=5, seed=42)
+
+        assert random.random() == expected
+
+
+class TestMonteCarloStreaming:
+    """Test streaming aggregation and configurable percentiles"""
+
+    @pytest.fixture
+    def triangular_dist(self):
+        return RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={
+                "min": Decimal("10000000"),
+                "mode": Decimal("30000000"),
+                "max": Decimal("50000000")
+            }
+        )
+
+    def test_custom_percentiles(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test requested percentiles replace the P10/P50/P90 defaults"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate_batch(
+            triangular_dist, num_simulations=200, seed=1, percentiles=[5, 25, 50, 75, 97.5]
+        )
+
+        assert list(result.revenue_percentiles) == ["p5", "p25", "p50", "p75", "p97.5"]
+        for percentiles in result.stakeholder_percentiles.values():
+            assert "irr_p97.5" in percentiles
+            assert "coc_p5" in percentiles
+
+    def test_invalid_percentile(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test percentiles outside 0-100 are rejected"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        with pytest.raises(ValueError, match="Percentile"):
+            simulator.simulate(triangular_dist, num_simulations=5, percentiles=[150])
+
+    def test_scenarios_optional(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test keep_scenarios=False drops raw scenarios but keeps exact results"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        full = simulator.simulate(triangular_dist, num_simulations=30, seed=2)
+        lean = simulator.simulate(triangular_dist, num_simulations=30, seed=2, keep_scenarios=False)
+
+        assert lean.scenarios == []
+        assert lean.revenue_percentiles == full.revenue_percentiles
+        assert lean.stakeholder_percentiles == full.stakeholder_percentiles
+        assert lean.probability_of_recoupment == full.probability_of_recoupment
+
+    def test_streaming_batch_close_to_exact(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test sketch percentiles track exact percentiles; recoupment is exact"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        exact = simulator.simulate_batch(
+            triangular_dist, num_simulations=5000, seed=8, shard_size=1000, keep_scenarios=False
+        )
+        streamed = simulator.simulate_batch(
+            triangular_dist, num_simulations=5000, seed=8, shard_size=1000,
+            keep_scenarios=False, streaming=True
+        )
+
+        assert streamed.scenarios == []
+        assert streamed.metadata["streaming"] is True
+        assert streamed.probability_of_recoupment == exact.probability_of_recoupment
+        for key, value in exact.revenue_percentiles.items():
+            assert float(streamed.revenue_percentiles[key]) == pytest.approx(float(value), rel=0.01)
+        for sid, percentiles in exact.stakeholder_percentiles.items():
+            for key in ("coc_p10", "coc_p50", "coc_p90"):
+                assert float(streamed.stakeholder_percentiles[sid][key]) == pytest.approx(
+                    float(percentiles[key]), rel=0.01, abs=1e-3
+                )
+
+    def test_streaming_independent_of_workers(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test shard aggregators merge deterministically across workers"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        serial = simulator.simulate_batch(
+            triangular_dist, num_simulations=120, seed=21, shard_size=25,
+            keep_scenarios=False, streaming=True
+        )
+        parallel = simulator.simulate_batch(
+            triangular_dist, num_simulations=120, seed=21, shard_size=25, workers=2,
+            keep_scenarios=False, streaming=True
+        )
+
+        assert serial.revenue_percentiles == parallel.revenue_percentiles
+        assert serial.stakeholder_percentiles == parallel.stakeholder_percentiles
+        assert serial.probability_of_recoupment == parallel.probability_of_recoupment
+
+    def test_streaming_scalar_path(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test simulate() streams into the aggregator with exact recoupment counts"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        exact = simulator.simulate(triangular_dist, num_simulations=40, seed=6)
+        streamed = simulator.simulate(
+            triangular_dist, num_simulations=40, seed=6, keep_scenarios=False, streaming=True
+        )
+
+        assert streamed.scenarios == []
+        assert streamed.probability_of_recoupment == exact.probability_of_recoupment
+        assert set(streamed.stakeholder_percentiles) == set(exact.stakeholder_percentiles)
+        revenues = sorted(s.total_revenue for s in exact.scenarios)
+        assert revenues[0] <= streamed.revenue_percentiles["p50"] <= revenues[-1]
+
+
+    def test_streaming_state_independent_of_size(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist, monkeypatch):
+        """Test streaming keeps no per-scenario block lists and fixed-size replicate state"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+        recorded = []
+        add_aggregate = ReplicateStatistics.add_aggregate
+
+        def spy(stats, aggregator):
+            recorded.append(stats)
+            add_aggregate(stats, aggregator)
+
+        def fail(stats, revenues, metrics):
+            raise AssertionError("streaming built per-scenario block arrays")
+
+        monkeypatch.setattr(ReplicateStatistics, "add_aggregate", spy)
+        monkeypatch.setattr(ReplicateStatistics, "add_block", fail)
+
+        sizes = []
+        for num_simulations in (20, 80):
+            recorded.clear()
+            result = simulator.simulate(
+                triangular_dist, num_simulations=num_simulations, seed=3,
+                keep_scenarios=False, streaming=True, replicates=4
+            )
+            stats = recorded[0]
+            assert all(other is stats for other in recorded)
+            assert stats.num_replicates == 4
+            assert result.standard_errors["revenue_percentiles"]["p50"] is not None
+            sizes.append(len(pickle.dumps(stats)))
+
+        assert sizes[0] == sizes[1]
+
+
+class TestMonteCarloAggregator:
+    """Test MonteCarloAggregator class"""
+
+    def test_add_batch_and_merge(self):
+        """Test merged aggregators combine counts and sketches"""
+        metrics = {
+            "equity_Investors": {
+                "irr": np.array([0.1, 0.2]),
+                "cash_on_cash": np.array([1.0, 2.0]),
+                "fully_recouped": np.array([False, True])
+            }
+        }
+        first = MonteCarloAggregator()
+        first.add_batch(np.array([1.0, 2.0]), metrics)
+        second = MonteCarloAggregator()
+        second.add_scenario(
+            Decimal("3"),
+            {"equity_Investors": {"irr": Decimal("0.3"), "cash_on_cash": Decimal("3"), "fully_recouped": True}}
+        )
+
+        first.merge(second)
+
+        assert first.num_scenarios == 3
+        assert first.recouped_counts == {"equity_Investors": 2}
+        assert first.probability_of_recoupment()["equity_Investors"] == Decimal("2") / Decimal("3")
+        assert first.revenue_percentiles([0, 100]) == {"p0": Decimal("1.0"), "p100": Decimal("3.0")}
+        assert first.stakeholder_percentiles([100])["equity_Investors"]["coc_p100"] == Decimal("3.0")
+
+
+class TestMonteCarloSampling:
+    """Test variance-reduction sampling and standard errors"""
+
+    @pytest.fixture
+    def triangular_dist(self):
+        return RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={
+                "min": Decimal("10000000"),
+                "mode": Decimal("30000000"),
+                "max": Decimal("50000000")
+            }
+        )
+
+    @pytest.mark.parametrize("sampling", ["lhs", "sobol"])
+    def test_design_is_stratified(self, sampling):
+        """Test LHS / Sobol put exactly one point in each of n equal strata"""
+        design = _uniform_design(sampling, 64, 2, np.random.default_rng(0))
+
+        assert design.shape == (64, 2)
+        for column in design.T:
+            assert sorted(np.floor(column * 64).astype(int).tolist()) == list(range(64))
+
+    def test_antithetic_pairs(self):
+        """Test antithetic designs pair every uniform with its complement"""
+        design = _uniform_design("antithetic", 7, 3, np.random.default_rng(0))
+
+        assert design.shape == (7, 3)
+        np.testing.assert_allclose(design[0:6:2] + design[1:6:2], 1.0)
+
+    def test_inverse_cdf_marginals(self, triangular_dist):
+        """Test inverse CDF reproduces each distribution's mean and bounds"""
+        u = (np.arange(100000) + 0.5) / 100000
+        uniform = RevenueDistribution("r", "uniform", {"min": Decimal("2"), "max": Decimal("6")})
+        normal = RevenueDistribution("r", "normal", {"mean": Decimal("10"), "std": Decimal("2")})
+
+        triangular = triangular_dist.inverse_cdf(u)
+
+        assert triangular.min() >= 10000000 and triangular.max() <= 50000000
+        assert triangular.mean() == pytest.approx(30000000, rel=1e-4)
+        assert uniform.inverse_cdf(u).mean() == pytest.approx(4.0)
+        assert normal.inverse_cdf(u).std() == pytest.approx(2.0, rel=1e-3)
+
+    @pytest.mark.parametrize("sampling", SAMPLING_METHODS)
+    def test_sampling_batch_statistics(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist, sampling):
+        """Test every sampling method targets the same revenue distribution"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate_batch(
+            triangular_dist, num_simulations=2000, seed=3, sampling=sampling, keep_scenarios=False
+        )
+
+        assert result.metadata["sampling"] == sampling
+        assert result.metadata["replicates"] == 10
+        assert float(result.revenue_percentiles["p50"]) == pytest.approx(30000000, rel=0.02)
+
+    def test_standard_errors_reported(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test standard errors cover every percentile and recoupment probability"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate_batch(triangular_dist, num_simulations=500, seed=4)
+        errors = result.standard_errors
+
+        assert set(errors["revenue_percentiles"]) == set(result.revenue_percentiles)
+        assert errors["revenue_percentiles"]["p50"] > 0
+        for sid, percentiles in result.stakeholder_percentiles.items():
+            assert set(errors["stakeholder_percentiles"][sid]) == set(percentiles)
+        assert set(errors["probability_of_recoupment"]) == set(result.probability_of_recoupment)
+
+    def test_variance_reduction_shrinks_errors(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test LHS and Sobol give far smaller standard errors than i.i.d. draws"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        errors = {
+            sampling: simulator.simulate_batch(
+                triangular_dist, num_simulations=2000, seed=5, sampling=sampling, keep_scenarios=False
+            ).standard_errors["revenue_percentiles"]["p50"]
+            for sampling in ("random", "lhs", "sobol")
+        }
+
+        assert errors["lhs"] * 5 < errors["random"]
+        assert errors["sobol"] * 5 < errors["random"]
+
+    def test_sampling_independent_of_workers(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test replicate blocks split across shards merge deterministically"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        serial = simulator.simulate_batch(
+            triangular_dist, num_simulations=130, seed=2, shard_size=40, sampling="lhs"
+        )
+        parallel = simulator.simulate_batch(
+            triangular_dist, num_simulations=130, seed=2, shard_size=40, sampling="lhs", workers=2
+        )
+
+        assert [s.total_revenue for s in serial.scenarios] == [s.total_revenue for s in parallel.scenarios]
+        assert serial.standard_errors == parallel.standard_errors
+
+    def test_scalar_path_sampling(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test simulate() draws from the design and reports standard errors"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate(triangular_dist, num_simulations=50, seed=7, sampling="antithetic", replicates=5)
+        revenues = [float(s.total_revenue) for s in result.scenarios]
+
+        # Antithetic pairs straddle the median of the (symmetric) triangular
+        assert revenues[0] + revenues[1] == pytest.approx(60000000, rel=1e-9)
+        assert result.metadata["replicates"] == 5
+        assert result.standard_errors["revenue_percentiles"]["p50"] > 0
+
+    def test_invalid_sampling(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test unknown sampling methods and replicate counts are rejected"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        with pytest.raises(ValueError, match="sampling"):
+            simulator.simulate_batch(triangular_dist, num_simulations=10, sampling="halton")
+        with pytest.raises(ValueError, match="replicates"):
+            simulator.simulate(triangular_dist, num_simulations=10, replicates=0)
+
+
+class TestReplicateStatistics:
+    """Test ReplicateStatistics class"""
+
+    def test_single_block_has_no_error(self):
+        """Test standard errors need at least two replicate blocks"""
+        stats = ReplicateStatistics([50])
+        stats.add_block(np.array([1.0, 2.0, 3.0]), {})
+
+        assert stats.standard_errors()["revenue_percentiles"] == {"p50": None}
+
+    def test_between_block_error(self):
+        """Test equal blocks give the standard error of the mean of block medians"""
+        stats = ReplicateStatistics([50])
+        other = ReplicateStatistics([50])
+        stats.add_block(np.array([1.0, 1.0]), {})
+        other.add_block(np.array([3.0, 3.0]), {})
+
+        stats.merge(other)
+
+        # Two block medians 1 and 3: sample std sqrt(2), divided by sqrt(2)
+        assert stats.num_replicates == 2
+        assert float(stats.standard_errors()["revenue_percentiles"]["p50"]) == pytest.approx(1.0)
+
+
+    def test_running_sums_match_block_values(self):
+        """Test running sums reproduce the weighted mean and error of unequal blocks"""
+        stats = ReplicateStatistics([50])
+        blocks = [np.array([1.0e7, 2.0e7, 3.0e7]), np.array([4.0e7]), np.array([2.5e7, 3.0e7, 3.5e7])]
+        for revenues in blocks:
+            stats.add_block(revenues, {})
+
+        medians = np.array([2.0e7, 4.0e7, 3.0e7])
+        weights = np.array([3.0, 1.0, 3.0]) / 7.0
+        mean = weights @ medians
+        expected = np.sqrt(3 / 2 * np.sum(weights ** 2 * (medians - mean) ** 2))
+
+        assert float(stats.estimates()["revenue_percentiles"]["p50"]) == pytest.approx(mean)
+        assert float(stats.standard_errors()["revenue_percentiles"]["p50"]) == pytest.approx(expected)
+
+
+class TestMonteCarloAdaptive:
+    """Test adaptive early stopping on precision targets"""
+
+    @pytest.fixture
+    def triangular_dist(self):
+        return RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={
+                "min": Decimal("10000000"),
+                "mode": Decimal("30000000"),
+                "max": Decimal("50000000")
+            }
+        )
+
+    def test_stops_when_targets_met(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test a loose target stops well before the budget"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate(
+            triangular_dist, num_simulations=3000, seed=1, sampling="lhs", batch_size=50,
+            precision_targets=[PrecisionTarget("revenue_p50", 0.02, relative=True)]
+        )
+        convergence = result.convergence
+
+        assert convergence.converged is True
+        assert convergence.num_simulations == result.num_simulations == len(result.scenarios)
+        assert MIN_CONVERGENCE_BATCHES * 50 <= result.num_simulations < 3000
+        assert result.num_simulations % 50 == 0
+        assert len(convergence.history) == convergence.num_batches == result.metadata["replicates"]
+        target = convergence.targets["revenue_p50"]
+        assert target["met"] and target["half_width"] <= target["tolerance"]
+
+    def test_budget_exhausted(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test an unreachable target spends the full budget and reports it"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate(
+            triangular_dist, num_simulations=300, seed=2, batch_size=50,
+            precision_targets=[PrecisionTarget("revenue_p50", 1.0)]
+        )
+
+        assert result.num_simulations == 300
+        assert result.convergence.converged is False
+        assert result.metadata["max_simulations"] == 300
+        assert result.convergence.targets["revenue_p50"]["half_width"] > 1
+
+    def test_stakeholder_targets(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test stakeholder targets expand to every matching stakeholder"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        result = simulator.simulate(
+            triangular_dist, num_simulations=200, seed=3, batch_size=50,
+            precision_targets=[
+                PrecisionTarget("probability_of_recoupment", 0.5),
+                PrecisionTarget("irr_p50", 0.5, stakeholder="equity")
+            ]
+        )
+
+        labels = set(result.convergence.targets)
+        assert {f"{sid}.probability_of_recoupment" for sid in result.probability_of_recoupment} <= labels
+        assert [label for label in labels if label.endswith("irr_p50")] == [
+            f"{sid}.irr_p50" for sid in result.stakeholder_percentiles if sid.startswith("equity")
+        ]
+
+    def test_relative_target_on_zero_estimate(self):
+        """Test a relative tolerance applies as absolute while the estimate is zero"""
+        stats = ReplicateStatistics([50])
+        for median in (-1.0, 1.0, -1.0, 1.0):
+            stats.add_block(np.array([median]), {})
+
+        report = _evaluate_precision_targets([PrecisionTarget("revenue_p50", 2.0, relative=True)], stats)
+
+        # Block medians ±1 average to zero with a standard error of 1/sqrt(3)
+        entry = report["revenue_p50"]
+        assert entry["estimate"] == 0
+        assert entry["tolerance"] == Decimal("2.0")
+        assert float(entry["half_width"]) == pytest.approx(3.182446 / np.sqrt(3), rel=1e-5)
+        assert entry["met"] is True
+
+    def test_adaptive_run_is_prefix_of_fixed_run(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test early stopping truncates the same seeded stream"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        fixed = simulator.simulate(triangular_dist, num_simulations=400, seed=4)
+        adaptive = simulator.simulate(
+            triangular_dist, num_simulations=400, seed=4, batch_size=50,
+            precision_targets=[PrecisionTarget("probability_of_recoupment", 1.0)]
+        )
+
+        assert adaptive.num_simulations == MIN_CONVERGENCE_BATCHES * 50
+        assert [s.total_revenue for s in adaptive.scenarios] == [
+            s.total_revenue for s in fixed.scenarios[:adaptive.num_simulations]
+        ]
+        assert fixed.convergence is None
+
+    def test_invalid_targets(self, simple_waterfall, simple_capital_stack, base_projection, triangular_dist):
+        """Test unknown metrics, unmatched stakeholders and bad tolerances are rejected"""
+        simulator = MonteCarloSimulator(simple_waterfall, simple_capital_stack, base_projection)
+
+        with pytest.raises(ValueError, match="Unsupported precision target"):
+            simulator.simulate(triangular_dist, num_simulations=10, precision_targets=[PrecisionTarget("irr_p75", 0.1)])
+        with pytest.raises(ValueError, match="matches no stakeholder"):
+            simulator.simulate(
+                triangular_dist, num_simulations=10, batch_size=5,
+                precision_targets=[PrecisionTarget("irr_p50", 0.1, stakeholder="mezzanine")]
+            )
+        with pytest.raises(ValueError, match="tolerance"):
+            PrecisionTarget("irr_p50", 0)
@@ -0,0 +1,160 @@
+"""
+Unit Tests for Projection Cache
+
+Tests the LRU projection shape cache and its use by RevenueProjector.project().
+"""
+
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.projection_cache import (
+    ProjectionCache,
+    ProjectionShape,
+    projection_cache_key
+)
+from engines.waterfall_executor.revenue_projector import RevenueProjector, DistributionWindow
+
+
+def _shape(num_windows=1):
+    """Trivial one-quarter shape"""
+    return ProjectionShape(
+        quarterly=((0, Decimal("1")),),
+        by_window=(("theatrical", Decimal("1")),),
+        windows_active=((0, ("theatrical",)),),
+        num_windows=num_windows
+    )
+
+
+@pytest.fixture
+def projector():
+    """Projector with its own cache"""
+    return RevenueProjector(cache=ProjectionCache(maxsize=8))
+
+
+class TestProjectionCache:
+    """Test ProjectionCache LRU behaviour"""
+
+    def test_hits_and_misses(self):
+        """Test lookups are counted"""
+        cache = ProjectionCache()
+
+        assert cache.get("a") is None
+        cache.put("a", _shape())
+        assert cache.get("a") is not None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_least_recently_used_evicted(self):
+        """Test the oldest unused entry goes first when full"""
+        cache = ProjectionCache(maxsize=2)
+        cache.put("a", _shape(1))
+        cache.put("b", _shape(2))
+        cache.get("a")
+        cache.put("c", _shape(3))
+
+        assert cache.get("b") is None
+        assert cache.get("a").num_windows == 1
+        assert len(cache) == 2
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_size_disables(self):
+        """Test maxsize 0 never stores"""
+        cache = ProjectionCache(maxsize=0)
+        cache.put("a", _shape())
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Test clear drops entries and counters"""
+        cache = ProjectionCache()
+        cache.put("a", _shape())
+        cache.get("a")
+        cache.clear()
+
+        assert cache.stats()["hits"] == 0
+        assert len(cache) == 0
+
+    def test_negative_size_rejected(self):
+        """Test maxsize must be non-negative"""
+        with pytest.raises(ValueError, match="non-negative"):
+            ProjectionCache(maxsize=-1)
+
+    def test_key_is_canonical(self):
+        """Test equal windows hash equally and any change alters the key"""
+        windows = [DistributionWindow("theatrical", 0, 2, Decimal("60")), DistributionWindow("svod", 2, 1, Decimal("40"), "lump_sum")]
+        copy = [DistributionWindow("theatrical", 0, 2, Decimal("60")), DistributionWindow("svod", 2, 1, Decimal("40"), "lump_sum")]
+        moved = [DistributionWindow("theatrical", 0, 2, Decimal("60")), DistributionWindow("svod", 3, 1, Decimal("40"), "lump_sum")]
+
+        assert projection_cache_key(windows, None, None) == projection_cache_key(copy, None, None)
+        assert projection_cache_key(windows, None, None) != projection_cache_key(moved, None, None)
+        assert projection_cache_key(windows, None, None) != projection_cache_key(windows, Decimal("0.3"), None)
+
+
+class TestCachedProjection:
+    """Test RevenueProjector.project() through the cache"""
+
+    def test_same_shape_for_any_total(self, projector):
+        """Test projecting a new total reuses the cached shape"""
+        first = projector.project(Decimal("30000000"))
+        second = projector.project(Decimal("45000000"))
+
+        assert projector.cache_stats()["misses"] == 1
+        assert projector.cache_stats()["hits"] == 1
+        for quarter, amount in first.quarterly_revenue.items():
+            assert second.quarterly_revenue[quarter] == pytest.approx(amount * Decimal("1.5"), abs=Decimal("1e-6"))
+        assert sum(second.quarterly_revenue.values()) == Decimal("45000000")
+
+    def test_matches_uncached_projection(self, projector):
+        """Test cached and uncached projections agree"""
+        uncached = RevenueProjector(cache=ProjectionCache(maxsize=0))
+        kwargs = dict(
+            total_ultimate_revenue=Decimal("12345678.91"),
+            theatrical_box_office=Decimal("3000000"),
+            svod_license_fee=Decimal("2500000"),
+            release_strategy="platform"
+        )
+
+        projector.project(**kwargs)
+        cached = projector.project(**kwargs)
+        expected = uncached.project(**kwargs)
+
+        assert projector.cache_stats()["hits"] == 1
+        assert cached.by_window == expected.by_window
+        assert cached.quarterly_revenue == expected.quarterly_revenue
+        assert [d["windows_active"] for d in cached.quarterly_detail] == [
+            d["windows_active"] for d in expected.quarterly_detail
+        ]
+
+    def test_adjustments_keyed_by_ratio(self, projector):
+        """Test box office adjustments share a shape only at the same ratio"""
+        projector.project(Decimal("20000000"), theatrical_box_office=Decimal("5000000"))
+        scaled = projector.project(Decimal("40000000"), theatrical_box_office=Decimal("10000000"))
+        other = projector.project(Decimal("40000000"), theatrical_box_office=Decimal("5000000"))
+
+        assert projector.cache_stats()["hits"] == 1
+        assert scaled.by_window["theatrical"] == Decimal("10000000")
+        assert other.by_window["theatrical"] == Decimal("5000000")
+
+    def test_strategies_and_custom_windows_cached_separately(self, projector):
+        """Test strategy and custom windows select distinct shapes"""
+        custom = [DistributionWindow("theatrical", 0, 4, Decimal("100"), "s_curve")]
+
+        wide = projector.project(Decimal("10000000"))
+        streaming = projector.project(Decimal("10000000"), release_strategy="streaming_first")
+        single = projector.project(Decimal("10000000"), custom_windows=custom)
+
+        assert projector.cache_stats()["misses"] == 3
+        assert wide.by_window != streaming.by_window
+        assert set(single.by_window) == {"theatrical"}
+
+    def test_cached_detail_not_shared(self, projector):
+        """Test mutating one projection doesn't leak into later ones"""
+        first = projector.project(Decimal("10000000"))
+        first.quarterly_detail[0]["windows_active"].append("bogus")
+
+        second = projector.project(Decimal("10000000"))
+
+        assert "bogus" not in second.quarterly_detail[0]["windows_active"]
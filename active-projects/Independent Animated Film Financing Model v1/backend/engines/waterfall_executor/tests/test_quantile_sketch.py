@@ -0,0 +1,117 @@
+"""
+Unit Tests for Quantile Sketch
+
+Tests t-digest accuracy against exact percentiles, merging, bounded memory
+and edge cases.
+"""
+
+import pickle
+import pytest
+from decimal import Decimal
+
+import numpy as np
+
+from engines.waterfall_executor.quantile_sketch import QuantileSketch
+
+
+def _rank_error(sorted_values, estimate, q):
+    """Distance between the estimate's empirical rank and q"""
+    return abs(np.searchsorted(sorted_values, estimate) / sorted_values.size - q)
+
+
+@pytest.fixture
+def values():
+    """Skewed sample resembling a revenue distribution"""
+    return np.random.default_rng(0).lognormal(mean=17.0, sigma=0.6, size=200000)
+
+
+class TestQuantileSketch:
+    """Test QuantileSketch class"""
+
+    @pytest.mark.parametrize("q", [0.01, 0.1, 0.5, 0.9, 0.99])
+    def test_matches_exact_percentiles(self, values, q):
+        """Test estimates are within 0.5% rank of the exact percentile"""
+        sketch = QuantileSketch()
+        for chunk in np.array_split(values, 37):
+            sketch.update(chunk)
+
+        assert _rank_error(np.sort(values), sketch.quantile(q), q) < 0.005
+
+    def test_memory_is_bounded(self, values):
+        """Test centroid count depends on compression, not sample size"""
+        sketch = QuantileSketch(compression=100)
+        sketch.update(values)
+
+        assert sketch.count == values.size
+        assert sketch.num_centroids <= 100
+
+    def test_merge_matches_single_sketch(self, values):
+        """Test merged shard sketches summarise the union"""
+        shards = [QuantileSketch() for _ in range(4)]
+        for sketch, chunk in zip(shards, np.array_split(values, 4)):
+            sketch.update(chunk)
+
+        merged = QuantileSketch()
+        for sketch in shards:
+            merged.merge(sketch)
+
+        assert merged.count == values.size
+        assert merged.min == values.min()
+        assert merged.max == values.max()
+        for q in (0.1, 0.5, 0.9):
+            assert _rank_error(np.sort(values), merged.quantile(q), q) < 0.005
+
+    def test_merge_leaves_argument_unchanged(self, values):
+        """Test merging does not compress or otherwise change the merged sketch"""
+        merged = QuantileSketch()
+        merged.update(values[:1000])
+        other = QuantileSketch()
+        other.update(values[1000:5000])
+        other.update(values[5000:5100])
+        other.update(7.0)
+        before = pickle.dumps(other)
+
+        merged.merge(other)
+
+        assert pickle.dumps(other) == before
+        assert merged.count == 5101
+        assert merged.min == min(values[:5100].min(), 7.0)
+
+    def test_scalar_updates(self):
+        """Test single float and Decimal values are accepted"""
+        sketch = QuantileSketch()
+        for value in range(1, 101):
+            sketch.update(Decimal(value) if value % 2 else float(value))
+
+        assert sketch.count == 100
+        assert sketch.quantile(0.0) == 1.0
+        assert sketch.quantile(1.0) == 100.0
+        assert sketch.quantile(0.5) == pytest.approx(50.5, abs=0.5)
+
+    def test_nan_ignored(self):
+        """Test NaN values are skipped"""
+        sketch = QuantileSketch()
+        sketch.update(np.array([1.0, np.nan, 3.0]))
+        sketch.update(float("nan"))
+
+        assert sketch.count == 2
+
+    def test_empty_sketch(self):
+        """Test empty sketch returns NaN"""
+        assert np.isnan(QuantileSketch().quantile(0.5))
+
+    def test_picklable(self, values):
+        """Test sketches survive pickling (process-pool shards)"""
+        sketch = QuantileSketch()
+        sketch.update(values[:5000])
+
+        restored = pickle.loads(pickle.dumps(sketch))
+
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+    def test_invalid_arguments(self):
+        """Test invalid compression and quantile are rejected"""
+        with pytest.raises(ValueError, match="compression"):
+            QuantileSketch(compression=1)
+        with pytest.raises(ValueError, match="Quantile"):
+            QuantileSketch().quantile(1.5)
@@ -0,0 +1,245 @@
+"""
+Unit Tests for Revenue-Scale Response Curve
+
+Tests that the piecewise-linear response curve reproduces WaterfallExecutor
+on scaled projections, and its use by Monte Carlo and sensitivity analysis.
+"""
+
+import pytest
+from decimal import Decimal
+
+import numpy as np
+
+from engines.waterfall_executor.revenue_scale_curve import (
+    RevenueScaleCurve,
+    build_revenue_scale_curve
+)
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.revenue_projector import RevenueProjector, RevenueProjection
+from engines.waterfall_executor.monte_carlo_simulator import MonteCarloSimulator, RevenueDistribution
+from engines.waterfall_executor.sensitivity_analyzer import SensitivityAnalyzer, SensitivityVariable
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with fixed, capped percentage and uncapped percentage nodes"""
+    return WaterfallStructure(
+        waterfall_name="Curve Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                priority=RecoupmentPriority.SENIOR_DEBT,
+                payee="Senior Lender",
+                amount=Decimal("5000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                payee="Equity Investors",
+                amount=Decimal("10000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.DEFERRED_PRODUCER_FEE,
+                payee="Producer",
+                percentage=Decimal("20"),
+                capped_at=Decimal("500000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.NET_PROFITS,
+                payee="Equity Investors",
+                percentage=Decimal("50")
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def capital_stack():
+    """Capital stack matching the waterfall payees"""
+    return CapitalStack(
+        stack_name="Curve Stack",
+        project_budget=Decimal("15000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("5000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("10000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def base_projection():
+    """Create base revenue projection"""
+    return RevenueProjector().project(
+        total_ultimate_revenue=Decimal("30000000"),
+        release_strategy="wide_theatrical",
+        project_name="Curve Film"
+    )
+
+
+def _scaled(projection, scale):
+    """Scale every quarter of a projection"""
+    return RevenueProjection(
+        project_name=projection.project_name,
+        projection_start_date=projection.projection_start_date,
+        total_quarters=projection.total_quarters,
+        quarterly_revenue={q: amt * scale for q, amt in projection.quarterly_revenue.items()},
+        cumulative_revenue={},
+        by_window={},
+        by_market={}
+    )
+
+
+class TestRevenueScaleCurve:
+    """Test build_revenue_scale_curve() and RevenueScaleCurve"""
+
+    def test_breakpoints_ascending(self, waterfall, base_projection):
+        """Test curve has ordered segments starting at zero"""
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=4.0)
+
+        assert isinstance(curve, RevenueScaleCurve)
+        assert curve.breakpoints[0] == 0.0
+        assert np.all(np.diff(curve.breakpoints) > 0)
+        assert curve.breakpoints[-1] < 4.0
+        assert curve.num_segments > 1
+
+    @pytest.mark.parametrize("scale", ["0", "0.1", "0.35", "0.5", "0.72", "1", "1.9", "4"])
+    def test_matches_executor(self, waterfall, base_projection, scale):
+        """Test curve receipts match the quarterly executor within cents"""
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=4.0)
+        reference = WaterfallExecutor(waterfall).execute_summary(_scaled(base_projection, Decimal(scale)))
+
+        summary = curve.summary(Decimal(scale))
+
+        assert summary.quarters == reference.quarters
+        for payee, amount in reference.total_paid_by_payee.items():
+            assert abs(summary.total_paid_by_payee[payee] - amount) <= Decimal("0.50")
+        for payee, receipts in reference.payee_receipts.items():
+            for expected, actual in zip(receipts, summary.payee_receipts[payee]):
+                assert abs(actual - expected) <= Decimal("0.05")
+        assert summary.final_unrecouped.keys() == reference.final_unrecouped.keys()
+
+    def test_vectorized_evaluation(self, waterfall, base_projection):
+        """Test array evaluation matches one-at-a-time evaluation"""
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=2.0)
+        scales = np.linspace(0.0, 2.0, 9)
+
+        totals = curve.total_paid_by_payee(scales)
+
+        assert totals.shape == (9, len(curve.payee_names))
+        for i, scale in enumerate(scales):
+            np.testing.assert_allclose(totals[i], curve.total_paid_by_payee(np.array([scale]))[0])
+
+    def test_cap_is_respected(self, waterfall, base_projection):
+        """Test capped producer share never exceeds its cap"""
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=10.0)
+
+        recouped = curve.recouped_by_node(np.array([10.0]))[0]
+
+        assert recouped[curve.node_ids.index("10_Producer")] == pytest.approx(500000.0)
+
+    def test_scale_out_of_range(self, waterfall, base_projection):
+        """Test evaluating beyond the traced range is rejected"""
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=2.0)
+
+        with pytest.raises(ValueError, match="Scale factors"):
+            curve.payee_receipts(np.array([2.5]))
+
+    def test_max_segments(self, waterfall, base_projection):
+        """Test tracing gives up once the segment budget is exceeded"""
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=4.0)
+
+        capped = build_revenue_scale_curve(
+            waterfall, base_projection, max_scale=4.0, max_segments=curve.num_segments - 1
+        )
+        exact = build_revenue_scale_curve(
+            waterfall, base_projection, max_scale=4.0, max_segments=curve.num_segments
+        )
+
+        assert capped is None
+        assert exact.num_segments == curve.num_segments
+
+    def test_invalid_max_scale(self, waterfall, base_projection):
+        """Test max_scale must be positive"""
+        with pytest.raises(ValueError, match="max_scale"):
+            build_revenue_scale_curve(waterfall, base_projection, max_scale=0)
+
+
+class TestResponseCurveCallers:
+    """Test Monte Carlo and sensitivity analysis on the response curve"""
+
+    def test_monte_carlo_response_curve(self, waterfall, capital_stack, base_projection):
+        """Test batch Monte Carlo via the curve matches the quarterly batch path"""
+        simulator = MonteCarloSimulator(waterfall, capital_stack, base_projection)
+        distribution = RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={"min": Decimal("5000000"), "mode": Decimal("30000000"), "max": Decimal("60000000")}
+        )
+
+        quarterly = simulator.simulate_batch(distribution, num_simulations=200, seed=9)
+        curve = simulator.simulate_batch(distribution, num_simulations=200, seed=9, response_curve=True)
+
+        assert curve.metadata["response_curve"] is True
+        for expected, actual in zip(quarterly.scenarios, curve.scenarios):
+            for sid, result in expected.stakeholder_results.items():
+                assert abs(actual.stakeholder_results[sid]["total_receipts"] - result["total_receipts"]) <= Decimal("1")
+                assert abs(actual.stakeholder_results[sid]["irr"] - result["irr"]) < Decimal("1e-6")
+
+    def test_monte_carlo_small_shard_runs_directly(self, waterfall, capital_stack, base_projection):
+        """Test shards with fewer scenarios than curve segments skip the curve"""
+        simulator = MonteCarloSimulator(waterfall, capital_stack, base_projection)
+        distribution = RevenueDistribution(
+            variable_name="total_revenue",
+            distribution_type="triangular",
+            parameters={"min": Decimal("5000000"), "mode": Decimal("30000000"), "max": Decimal("60000000")}
+        )
+        curve = build_revenue_scale_curve(waterfall, base_projection, max_scale=2.0)
+        num_simulations = curve.num_segments - 1
+
+        quarterly = simulator.simulate_batch(distribution, num_simulations=num_simulations, seed=4)
+        direct = simulator.simulate_batch(
+            distribution, num_simulations=num_simulations, seed=4, response_curve=True
+        )
+
+        # Exact agreement: the curve would only agree to within cents
+        for expected, actual in zip(quarterly.scenarios, direct.scenarios):
+            assert actual.stakeholder_results == expected.stakeholder_results
+
+    def test_sensitivity_uses_curve_for_revenue(self, waterfall, capital_stack, base_projection):
+        """Test revenue tornado cases match explicitly rescaled scenarios"""
+        analyzer = SensitivityAnalyzer(waterfall, capital_stack, base_projection)
+        variable = SensitivityVariable(
+            variable_name="total_revenue",
+            base_value=Decimal("30000000"),
+            low_value=Decimal("15000000"),
+            high_value=Decimal("45000000")
+        )
+
+        results = analyzer.analyze([variable], target_metrics=["overall_recovery_rate"])
+        low_case = results["overall_recovery_rate"][0].low_case["overall_recovery_rate"]
+
+        expected = analyzer._run_scenario(
+            analyzer._adjust_projection(base_projection, "total_revenue", Decimal("15000000"))
+        )["overall_recovery_rate"]
+
+        assert abs(low_case - expected) < Decimal("1e-6")
+
+    def test_sensitivity_skips_costly_curve(self, waterfall, capital_stack, base_projection):
+        """Test a curve needing more segments than revenue cases isn't built"""
+        analyzer = SensitivityAnalyzer(waterfall, capital_stack, base_projection)
+        variable = SensitivityVariable(
+            variable_name="total_revenue",
+            base_value=Decimal("30000000"),
+            low_value=Decimal("15000000"),
+            high_value=Decimal("45000000")
+        )
+
+        assert analyzer._build_revenue_curve([variable]) is None
@@ -0,0 +1,301 @@
+"""
+Unit Tests for Sensitivity Engine
+
+Tests parameter handlers, tornado / sweep / grid analyses and Sobol / Morris
+global sensitivity indices.
+"""
+
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.sensitivity_engine import SensitivityEngine, PARAMETER_KINDS, _ScenarioInputs
+from engines.waterfall_executor.sensitivity_analyzer import SensitivityAnalyzer, SensitivityVariable
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.revenue_projector import RevenueProjector
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with senior debt, equity recoupment and net profits"""
+    return WaterfallStructure(
+        waterfall_name="Engine Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("5000000")),
+            WaterfallNode(priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("10000000")),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    )
+
+
+@pytest.fixture
+def capital_stack():
+    """Capital stack matching the waterfall payees"""
+    return CapitalStack(
+        stack_name="Engine Stack",
+        project_budget=Decimal("15000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("5000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("10000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def base_projection():
+    """Create base revenue projection"""
+    return RevenueProjector().project(
+        total_ultimate_revenue=Decimal("30000000"),
+        release_strategy="wide_theatrical",
+        project_name="Engine Film"
+    )
+
+
+@pytest.fixture
+def engine(waterfall, capital_stack, base_projection):
+    """Sensitivity engine on the base case"""
+    return SensitivityEngine(waterfall, capital_stack, base_projection)
+
+
+@pytest.fixture
+def variables():
+    """One variable per parameter handler"""
+    return [
+        SensitivityVariable("total_revenue", Decimal("30000000"), Decimal("15000000"), Decimal("45000000")),
+        SensitivityVariable("fee_rate", Decimal("30"), Decimal("20"), Decimal("40"), "distribution_fee_rate"),
+        SensitivityVariable("p_and_a", Decimal("0"), Decimal("0"), Decimal("4000000"), "pa_expenses"),
+        SensitivityVariable("svod_delay", Decimal("0"), Decimal("0"), Decimal("4"), "window_timing", "svod"),
+        SensitivityVariable("senior_amount", Decimal("5000000"), Decimal("4000000"), Decimal("7000000"), "node_amount", "6_Senior Lender"),
+        SensitivityVariable("senior_rate", Decimal("8"), Decimal("4"), Decimal("16"), "interest_rate", "senior_debt"),
+    ]
+
+
+class TestParameterHandlers:
+    """Test each parameter handler against a directly adjusted scenario"""
+
+    def test_base_case_matches_analyzer(self, engine, variables, waterfall, capital_stack, base_projection):
+        """Test all variables at base reproduce the unmodified scenario"""
+        expected = SensitivityAnalyzer(waterfall, capital_stack, base_projection)._run_scenario(base_projection)
+
+        assert engine.evaluate(variables, [v.base_value for v in variables]) == expected
+
+    def test_revenue_matches_rescaled_projection(self, engine, waterfall, capital_stack, base_projection):
+        """Test the revenue handler matches an explicitly rescaled projection"""
+        variable = SensitivityVariable("total_revenue", Decimal("30000000"), Decimal("15000000"), Decimal("45000000"))
+        analyzer = SensitivityAnalyzer(waterfall, capital_stack, base_projection)
+
+        expected = analyzer._run_scenario(
+            analyzer._adjust_projection(base_projection, "total_revenue", Decimal("15000000"))
+        )
+        actual = engine.evaluate([variable], [Decimal("15000000")])
+
+        assert abs(actual["equity_irr"] - expected["equity_irr"]) < Decimal("1e-9")
+        assert abs(actual["overall_recovery_rate"] - expected["overall_recovery_rate"]) < Decimal("1e-6")
+
+    def test_fee_rate_matches_executor_override(self, engine, variables, capital_stack, base_projection):
+        """Test the fee handler passes the override to the waterfall"""
+        summary = WaterfallExecutor(engine.waterfall).execute_summary(
+            base_projection, distribution_fee_rate=Decimal("40")
+        )
+
+        assert engine.evaluate([variables[1]], [Decimal("40")]) == engine._metrics_from_waterfall(summary)
+
+    def test_node_amount_matches_modified_waterfall(self, engine, variables, waterfall, capital_stack, base_projection):
+        """Test the node handler matches a waterfall built with the new amount"""
+        modified = waterfall.model_copy(update={"nodes": [
+            waterfall.nodes[0].model_copy(update={"fixed_amount": Decimal("7000000")})
+        ] + waterfall.nodes[1:]})
+        expected = SensitivityAnalyzer(modified, capital_stack, base_projection)._run_scenario(base_projection)
+
+        assert engine.evaluate([variables[4]], [Decimal("7000000")]) == expected
+
+    def test_interest_rate_scales_debt_amount(self, engine, variables):
+        """Test a new rate rescales the senior node by the simple-interest ratio"""
+        factor = (Decimal("1") + Decimal("0.16") * 2) / (Decimal("1") + Decimal("0.08") * 2)
+        node_variable = variables[4]
+
+        assert engine.evaluate([variables[5]], [Decimal("16")]) == engine.evaluate(
+            [node_variable], [Decimal("5000000") * factor]
+        )
+
+    def test_interest_rate_with_shared_payee(self, base_projection):
+        """Test two loans on one payee scale its node once, not once per loan"""
+        waterfall = WaterfallStructure(
+            waterfall_name="Two Loan Waterfall",
+            default_distribution_fee_rate=Decimal("30.0"),
+            nodes=[
+                WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("10000000")),
+                WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+            ]
+        )
+        capital_stack = CapitalStack(
+            stack_name="Two Loan Stack",
+            project_budget=Decimal("15000000"),
+            components=[
+                CapitalComponent(
+                    instrument=SeniorDebt(amount=Decimal("5000000"), interest_rate=Decimal("8.0"), term_months=24),
+                    position=1
+                ),
+                CapitalComponent(
+                    instrument=SeniorDebt(amount=Decimal("5000000"), interest_rate=Decimal("8.0"), term_months=24),
+                    position=2
+                ),
+                CapitalComponent(
+                    instrument=Equity(amount=Decimal("5000000"), ownership_percentage=Decimal("100")),
+                    position=3
+                ),
+            ]
+        )
+        engine = SensitivityEngine(waterfall, capital_stack, base_projection)
+        node_id = waterfall.nodes[0].node_id
+        rate = SensitivityVariable("senior_rate", Decimal("8"), Decimal("4"), Decimal("12"), "interest_rate", "senior_debt")
+        amount = SensitivityVariable("senior_amount", Decimal("10000000"), Decimal("5000000"), Decimal("15000000"), "node_amount", node_id)
+
+        inputs = _ScenarioInputs(amounts=engine._base_amounts.copy(), starts=engine._base_starts.copy())
+        engine._apply_interest_rate(inputs, rate, Decimal("12"))
+
+        # 10M x (1 + 0.12 x 2) / (1 + 0.08 x 2)
+        assert inputs.node_amounts[node_id].quantize(Decimal("0.01")) == Decimal("10689655.17")
+        assert engine.evaluate([rate], [Decimal("12")]) == engine.evaluate([amount], [inputs.node_amounts[node_id]])
+
+    def test_window_timing_delays_revenue(self, engine, variables):
+        """Test a later SVOD window lowers equity IRR without changing recovery"""
+        base = engine.evaluate([variables[3]], [Decimal("0")])
+        delayed = engine.evaluate([variables[3]], [Decimal("4")])
+
+        assert delayed["equity_irr"] < base["equity_irr"]
+        assert delayed["overall_recovery_rate"] == pytest.approx(base["overall_recovery_rate"])
+
+    def test_pa_expenses_reduce_recovery(self, engine, variables):
+        """Test P&A comes off the top before recoupment"""
+        base = engine.evaluate([variables[2]], [Decimal("0")])
+        loaded = engine.evaluate([variables[2]], [Decimal("4000000")])
+
+        assert loaded["overall_recovery_rate"] < base["overall_recovery_rate"]
+
+    def test_unsupported_type(self, engine):
+        """Test variables without a handler are rejected instead of ignored"""
+        variable = SensitivityVariable("budget", Decimal("1"), Decimal("0"), Decimal("2"), "cost")
+
+        with pytest.raises(ValueError, match="Unsupported sensitivity variable type"):
+            engine.analyze([variable], ["equity_irr"])
+
+    def test_invalid_targets(self, engine):
+        """Test unknown nodes and windows are rejected"""
+        with pytest.raises(ValueError, match="no waterfall node"):
+            engine.evaluate([SensitivityVariable("n", Decimal("1"), Decimal("0"), Decimal("2"), "node_amount", "missing")], [Decimal("1")])
+        with pytest.raises(ValueError, match="no fixed amount"):
+            engine.evaluate([SensitivityVariable("n", Decimal("1"), Decimal("0"), Decimal("2"), "node_amount", "13_Equity Investors")], [Decimal("1")])
+        with pytest.raises(ValueError, match="no revenue window"):
+            engine.evaluate([SensitivityVariable("t", Decimal("0"), Decimal("0"), Decimal("2"), "window_timing", "airline")], [Decimal("1")])
+
+    def test_every_kind_documented(self):
+        """Test the handler list covers the requested parameters"""
+        assert set(PARAMETER_KINDS) == {
+            "revenue", "distribution_fee_rate", "pa_expenses", "window_timing", "node_amount", "interest_rate"
+        }
+
+
+class TestTornadoSweepGrid:
+    """Test one-at-a-time, sweep and grid analyses"""
+
+    def test_tornado_sorted_and_nonzero(self, engine, variables):
+        """Test every handler moves the metric and results are sorted by impact"""
+        results = engine.analyze(variables, ["equity_irr"])["equity_irr"]
+
+        scores = [r.impact_score for r in results]
+        assert scores == sorted(scores, reverse=True)
+        assert all(score > 0 for score in scores)
+
+        tornado = engine.generate_tornado_chart_data(results, "equity_irr")
+        assert tornado.variables == [r.variable.variable_name for r in results]
+
+    def test_sweep_endpoints_match_tornado(self, engine, variables):
+        """Test sweep endpoints equal the tornado low and high cases"""
+        tornado = {r.variable.variable_name: r for r in engine.analyze(variables, ["equity_irr"])["equity_irr"]}
+        sweeps = engine.sweep(variables, ["equity_irr"], num_points=5)
+
+        for name, sweep in sweeps.items():
+            assert len(sweep.values) == 5
+            assert sweep.metrics["equity_irr"][0] == tornado[name].low_case["equity_irr"]
+            assert sweep.metrics["equity_irr"][-1] == tornado[name].high_case["equity_irr"]
+
+    def test_spider_chart_data(self, engine, variables):
+        """Test spider data reports relative input changes around the base"""
+        sweeps = engine.sweep(variables[:2], ["equity_irr"], num_points=3)
+
+        spider = engine.generate_spider_chart_data(sweeps, "equity_irr")
+
+        assert spider.variables == ["total_revenue", "fee_rate"]
+        assert spider.input_changes["total_revenue"] == [Decimal("-0.5"), Decimal("0"), Decimal("0.5")]
+        assert spider.metric_values["total_revenue"][1] == spider.base_value
+
+    def test_grid(self, engine, variables):
+        """Test grid is (x points × y points) with the base case at the centre"""
+        grid = engine.grid(variables[0], variables[1], ["equity_irr"], num_points=3)
+        base = engine.evaluate(variables[:2], [variables[0].base_value, variables[1].base_value])
+
+        assert len(grid.metrics["equity_irr"]) == 3
+        assert all(len(row) == 3 for row in grid.metrics["equity_irr"])
+        assert grid.metrics["equity_irr"][1][1] == base["equity_irr"]
+
+    def test_parallel_matches_serial(self, engine, variables):
+        """Test worker processes return the same results in the same order"""
+        serial = engine.sweep(variables, ["equity_irr"], num_points=3)
+        parallel = engine.sweep(variables, ["equity_irr"], num_points=3, workers=2)
+
+        assert {name: s.metrics for name, s in serial.items()} == {name: s.metrics for name, s in parallel.items()}
+
+    def test_invalid_points(self, engine, variables):
+        """Test sweeps need at least two points"""
+        with pytest.raises(ValueError, match="num_points"):
+            engine.sweep(variables, ["equity_irr"], num_points=1)
+
+
+class TestGlobalIndices:
+    """Test Sobol indices and Morris screening"""
+
+    def test_sobol_ranks_revenue_over_inert_variable(self, engine, variables):
+        """Test revenue dominates and a fixed-range variable has zero indices"""
+        inert = SensitivityVariable("fixed_fee", Decimal("30"), Decimal("30"), Decimal("30"), "distribution_fee_rate")
+
+        indices = engine.sobol_indices([variables[0], inert], ["overall_recovery_rate"], num_samples=64, seed=1)
+        by_name = {index.variable_name: index for index in indices["overall_recovery_rate"]}
+
+        assert indices["overall_recovery_rate"][0].variable_name == "total_revenue"
+        assert by_name["total_revenue"].total_order > Decimal("0.9")
+        assert by_name["fixed_fee"].total_order == 0
+        assert by_name["fixed_fee"].first_order == 0
+
+    def test_sobol_reproducible(self, engine, variables):
+        """Test the same seed gives the same indices"""
+        first = engine.sobol_indices(variables[:3], ["equity_irr"], num_samples=16, seed=3)
+        second = engine.sobol_indices(variables[:3], ["equity_irr"], num_samples=16, seed=3)
+
+        assert first == second
+
+    def test_morris_screening(self, engine, variables):
+        """Test Morris effects rank an inert variable last with zero effect"""
+        inert = SensitivityVariable("fixed_fee", Decimal("30"), Decimal("30"), Decimal("30"), "distribution_fee_rate")
+
+        effects = engine.morris_screening(
+            [variables[0], variables[1], inert], ["overall_recovery_rate"], num_trajectories=6, seed=2
+        )["overall_recovery_rate"]
+
+        assert effects[-1].variable_name == "fixed_fee"
+        assert effects[-1].mu_star == 0
+        assert effects[0].mu_star > 0
+
+    def test_morris_invalid_levels(self, engine, variables):
+        """Test Morris needs an even number of levels"""
+        with pytest.raises(ValueError, match="num_levels"):
+            engine.morris_screening(variables, ["equity_irr"], num_levels=3)
@@ -8,6 +8,8 @@ cash-on-cash multiples, and payback periods.
 import pytest
 from decimal import Decimal
 
+import numpy as np
+
 from engines.waterfall_executor.stakeholder_analyzer import (
     StakeholderCashFlows,
     StakeholderAnalysisResult,
@@ -466,3 +468,77 @@ class TestStakeholderAnalyzer:
                            / stakeholder.initial_investment * Decimal("100"))
 
             assert stakeholder.roi_percentage == expected_roi
+
+
+class TestBatchReturns:
+    """Test vectorized IRR/NPV on cash flow matrices"""
+
+    def test_irr_batch_matches_scalar(self, simple_capital_stack):
+        """Test each row matches calculate_irr on the same cash flows"""
+        analyzer = StakeholderAnalyzer(simple_capital_stack)
+        quarters = np.array([0, 4, 8, 12])
+        matrix = np.array([
+            [-10000000, 3000000, 4000000, 5000000],
+            [-10000000, 0, 15000000, 0],
+            [-10000000, 0, 5000000, 0],
+            [-10000000, 0, 0, 0],
+        ])
+
+        irrs = analyzer.calculate_irr_batch(matrix, quarters)
+
+        for row, irr in zip(matrix, irrs):
+            expected = analyzer.calculate_irr(
+                [(int(q), Decimal(str(amount))) for q, amount in zip(quarters, row) if amount != 0]
+            )
+            if expected is None:
+                assert np.isnan(irr)
+            else:
+                assert irr == pytest.approx(float(expected), abs=1e-9)
+
+    def test_irr_batch_bracketed_fallback(self, simple_capital_stack):
+        """Test rows where Newton-Raphson diverges are solved by bisection"""
+        analyzer = StakeholderAnalyzer(simple_capital_stack)
+
+        # 99% loss over 10 years: Newton from 10% overshoots below -100%
+        irr = analyzer.calculate_irr_batch(np.array([[-10000000, 100000]]), np.array([0, 40]))[0]
+
+        assert irr == pytest.approx(0.01 ** 0.1 - 1, abs=1e-9)
+
+    def test_irr_batch_undefined_rows(self, simple_capital_stack):
+        """Test rows without both outflows and inflows return NaN"""
+        analyzer = StakeholderAnalyzer(simple_capital_stack)
+
+        irrs = analyzer.calculate_irr_batch(
+            np.array([[-100.0, -50.0], [100.0, 50.0], [0.0, 0.0]]),
+            np.array([0, 4])
+        )
+
+        assert np.all(np.isnan(irrs))
+
+    def test_npv_batch(self, simple_capital_stack):
+        """Test NPV rows against the closed form"""
+        analyzer = StakeholderAnalyzer(simple_capital_stack)
+
+        npvs = analyzer.calculate_npv_batch(
+            np.array([[-10000000, 12000000], [-10000000, 11000000]]),
+            np.array([0, 4]),
+            Decimal("0.10")
+        )
+
+        assert npvs[0] == pytest.approx(-10000000 + 12000000 / 1.1)
+        assert npvs[1] == pytest.approx(0.0, abs=1e-6)
+
+    def test_analyze_uses_batch_results(self, simple_capital_stack, waterfall_result_profitable):
+        """Test analyze() IRRs equal per-stakeholder scalar IRRs"""
+        analyzer = StakeholderAnalyzer(simple_capital_stack)
+        result = analyzer.analyze(waterfall_result_profitable)
+
+        for stakeholder in result.stakeholders:
+            cash_flows = [(stakeholder.investment_quarter, -stakeholder.initial_investment)]
+            cash_flows += list(stakeholder.quarterly_receipts.items())
+            expected = analyzer.calculate_irr(cash_flows)
+
+            if expected is None:
+                assert stakeholder.irr is None
+            else:
+                assert abs(stakeholder.irr - expected) < Decimal("1e-9")
@@ -0,0 +1,144 @@
+"""
+Unit Tests for Strategy Comparison
+
+Tests that StrategyComparator evaluates every release strategy at every
+revenue level, matches running each cell on its own, and returns the same
+grid for any worker count.
+"""
+
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.strategy_comparison import (
+    StrategyComparator,
+    DEFAULT_STRATEGIES,
+    STAKEHOLDER_METRICS,
+)
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.revenue_projector import RevenueProjector
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+REVENUE_LEVELS = [Decimal("15000000"), Decimal("40000000"), Decimal("90000000")]
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with debt, equity and net profits"""
+    return WaterfallStructure(
+        waterfall_name="Comparison Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(priority=RecoupmentPriority.SENIOR_DEBT, payee="Senior Lender", amount=Decimal("8000000")),
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT, payee="Equity Investors", amount=Decimal("12000000")
+            ),
+            WaterfallNode(priority=RecoupmentPriority.NET_PROFITS, payee="Equity Investors", percentage=Decimal("50")),
+        ]
+    )
+
+
+@pytest.fixture
+def capital_stack():
+    """Capital stack matching the waterfall payees"""
+    return CapitalStack(
+        stack_name="Comparison Stack",
+        project_budget=Decimal("20000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("8000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("12000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def comparator(waterfall, capital_stack):
+    """Comparator over the sample structures"""
+    return StrategyComparator(waterfall, capital_stack)
+
+
+class TestCompare:
+    """Test StrategyComparator.compare()"""
+
+    def test_grid_shape(self, comparator):
+        """Test one row per strategy and one cell per revenue level"""
+        result = comparator.compare(REVENUE_LEVELS)
+
+        assert result.strategies == list(DEFAULT_STRATEGIES)
+        assert result.revenue_levels == REVENUE_LEVELS
+        assert [len(row) for row in result.cells] == [3, 3, 3, 3]
+        assert result.stakeholder_ids == ["senior_debt_Senior Lender", "equity_Equity Investors"]
+        assert set(result.cells[0][0].stakeholders["equity_Equity Investors"]) == set(STAKEHOLDER_METRICS)
+
+    def test_matches_single_runs(self, comparator, waterfall, capital_stack):
+        """Test each cell equals projecting and executing it on its own"""
+        result = comparator.compare(REVENUE_LEVELS, strategies=["platform", "day_and_date"])
+
+        projection = RevenueProjector().project(
+            total_ultimate_revenue=REVENUE_LEVELS[1],
+            release_strategy="day_and_date"
+        )
+        single = WaterfallExecutor(waterfall).execute_over_time(projection)
+        analysis = StakeholderAnalyzer(capital_stack).analyze(single)
+        equity = analysis.stakeholders[1]
+
+        cell = result.cell("day_and_date", Decimal("40000000"))
+        assert cell.total_fees == single.total_fees
+        assert cell.stakeholders[equity.stakeholder_id]["total_receipts"] == equity.total_receipts
+        assert cell.stakeholders[equity.stakeholder_id]["irr"] == equity.irr
+
+    def test_strategies_differ(self, comparator):
+        """Test release timing changes equity IRR at the same revenue"""
+        result = comparator.compare([Decimal("60000000")])
+        irr = [row[0] for row in result.matrix("equity_Equity Investors", "irr")]
+
+        assert len(set(irr)) > 1
+
+    def test_workers_do_not_change_results(self, comparator):
+        """Test the process pool returns the in-process grid"""
+        in_process = comparator.compare(REVENUE_LEVELS)
+        parallel = comparator.compare(REVENUE_LEVELS, workers=2)
+
+        assert parallel.to_dict() == in_process.to_dict()
+
+
+class TestValidation:
+    """Test compare() input checks"""
+
+    def test_unknown_strategy(self, comparator):
+        """Test unknown strategies are rejected"""
+        with pytest.raises(ValueError, match="Unknown release strategies"):
+            comparator.compare(REVENUE_LEVELS, strategies=["drive_in"])
+
+    def test_empty_levels(self, comparator):
+        """Test at least one revenue level is required"""
+        with pytest.raises(ValueError, match="revenue level"):
+            comparator.compare([])
+
+    def test_non_positive_level(self, comparator):
+        """Test revenue levels must be positive"""
+        with pytest.raises(ValueError, match="positive"):
+            comparator.compare([Decimal("0")])
+
+    def test_unknown_metric(self, comparator):
+        """Test matrix() rejects unreported metrics"""
+        result = comparator.compare(REVENUE_LEVELS[:1], strategies=["platform"])
+
+        with pytest.raises(ValueError, match="Unknown metric"):
+            result.matrix("equity_Equity Investors", "moic")
+
+    def test_missing_cell(self, comparator):
+        """Test cell() raises KeyError outside the grid"""
+        result = comparator.compare(REVENUE_LEVELS[:1], strategies=["platform"])
+
+        with pytest.raises(KeyError):
+            result.cell("wide_theatrical", REVENUE_LEVELS[0])
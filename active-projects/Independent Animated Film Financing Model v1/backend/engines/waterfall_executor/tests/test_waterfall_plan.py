@@ -0,0 +1,215 @@
+"""
+Unit Tests for Compiled Waterfall Plan
+
+Tests plan compilation (node order, interned IDs, ledger slots), the
+integer-cent ledger, and reuse of one plan by WaterfallExecutor.
+"""
+
+import dataclasses
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.waterfall_plan import (
+    CompiledWaterfallPlan,
+    compile_waterfall,
+    to_cents,
+    from_cents,
+    rate_ratio,
+    apply_ratio,
+    UNPAID
+)
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.revenue_projector import RevenueProjector
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with fixed, capped percentage and uncapped percentage nodes"""
+    return WaterfallStructure(
+        waterfall_name="Plan Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                payee="Equity Investors",
+                amount=Decimal("1000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.SENIOR_DEBT,
+                payee="Senior Lender",
+                amount=Decimal("500000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.DEFERRED_PRODUCER_FEE,
+                payee="Producer",
+                percentage=Decimal("12.5"),
+                capped_at=Decimal("50000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.NET_PROFITS,
+                payee="Equity Investors",
+                percentage=Decimal("50")
+            ),
+        ]
+    )
+
+
+class TestCentHelpers:
+    """Test cent conversion and rounding helpers"""
+
+    def test_round_trip(self):
+        """Test dollars → cents → dollars"""
+        assert to_cents(Decimal("1234.56")) == 123456
+        assert from_cents(123456) == Decimal("1234.56")
+
+    def test_to_cents_rounds_half_even(self):
+        """Test sub-cent amounts round half-even"""
+        assert to_cents(Decimal("0.125")) == 12
+        assert to_cents(Decimal("0.135")) == 14
+
+    def test_rate_ratio_is_exact(self):
+        """Test percentages become exact fractions"""
+        assert rate_ratio(Decimal("12.5")) == (25, 200)
+        assert rate_ratio(None) == (0, 1)
+
+    def test_apply_ratio_rounds_half_even(self):
+        """Test ratio application rounds half-even"""
+        assert apply_ratio(5, 1, 2) == 2
+        assert apply_ratio(7, 1, 2) == 4
+        assert apply_ratio(100, 1, 3) == 33
+
+
+class TestCompileWaterfall:
+    """Test compile_waterfall()"""
+
+    def test_nodes_sorted_by_priority(self, waterfall):
+        """Test plan lays nodes out in priority order"""
+        plan = compile_waterfall(waterfall)
+
+        assert plan.node_ids == ("6_Senior Lender", "8_Equity Investors", "10_Producer", "13_Equity Investors")
+        assert plan.payee_names == ("Senior Lender", "Equity Investors", "Producer")
+        assert plan.node_payees == (0, 1, 2, 1)
+
+    def test_vectors(self, waterfall):
+        """Test fixed, percentage and cap vectors are in cents / exact ratios"""
+        plan = compile_waterfall(waterfall)
+
+        assert plan.fixed_cents == (50000000, 100000000, 0, 0)
+        assert plan.pct_numerators == (0, 0, 25, 50)
+        assert plan.pct_denominators == (1, 1, 200, 100)
+        assert plan.cap_cents == (0, 0, 5000000, 0)
+        assert plan.fee_ratio == (30, 100)
+
+    def test_duplicate_node_ids_share_slot(self):
+        """Test nodes with the same priority and payee share a ledger slot"""
+        structure = WaterfallStructure(
+            waterfall_name="Duplicate",
+            nodes=[
+                WaterfallNode(priority=RecoupmentPriority.EQUITY, payee="Equity", amount=Decimal("100")),
+                WaterfallNode(priority=RecoupmentPriority.EQUITY, payee="Equity", amount=Decimal("200")),
+            ]
+        )
+
+        plan = compile_waterfall(structure)
+
+        assert plan.num_nodes == 2
+        assert plan.num_slots == 1
+        assert plan.node_slots == (0, 0)
+
+    def test_plan_is_immutable(self, waterfall):
+        """Test compiled plan cannot be modified"""
+        plan = compile_waterfall(waterfall)
+
+        assert isinstance(plan, CompiledWaterfallPlan)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            plan.fixed_cents = ()
+
+
+class TestRunQuarter:
+    """Test the integer-cent ledger"""
+
+    def test_fixed_nodes_recoup_in_order(self, waterfall):
+        """Test senior debt recoups before equity"""
+        plan = compile_waterfall(waterfall)
+        ledger = plan.new_ledger()
+        payouts = plan.new_payouts()
+
+        remaining = plan.run_quarter(to_cents(Decimal("600000")), ledger, payouts)
+
+        assert payouts[0] == 50000000
+        assert payouts[1] == 10000000
+        assert payouts[2] == UNPAID
+        assert remaining == 0
+
+    def test_cap_is_respected_across_quarters(self, waterfall):
+        """Test capped node stops once cap is reached"""
+        plan = compile_waterfall(waterfall)
+        ledger = plan.new_ledger()
+        payouts = plan.new_payouts()
+
+        for _ in range(3):
+            plan.run_quarter(to_cents(Decimal("2000000")), ledger, payouts)
+
+        assert ledger[plan.node_slots[2]] == 5000000
+        assert payouts[2] == UNPAID
+
+    def test_buffer_reused_without_stale_values(self, waterfall):
+        """Test payouts from an earlier quarter don't leak into a later one"""
+        plan = compile_waterfall(waterfall)
+        ledger = plan.new_ledger()
+        payouts = plan.new_payouts()
+
+        plan.run_quarter(to_cents(Decimal("3000000")), ledger, payouts)
+        plan.run_quarter(0, ledger, payouts)
+
+        assert payouts == [UNPAID] * plan.num_nodes
+
+
+class TestExecutorWithPlan:
+    """Test WaterfallExecutor running on a compiled plan"""
+
+    def test_results_are_whole_cents(self, waterfall):
+        """Test every payout is a whole number of cents"""
+        projection = RevenueProjector().project(
+            total_ultimate_revenue=Decimal("7777777.77"),
+            release_strategy="wide_theatrical",
+            project_name="Cents Film"
+        )
+
+        result = WaterfallExecutor(waterfall).execute_over_time(projection)
+
+        for execution in result.quarterly_executions:
+            for amount in execution.node_payouts.values():
+                assert amount == amount.quantize(Decimal("0.01"))
+
+    def test_shared_plan_gives_same_result(self, waterfall):
+        """Test executors sharing one plan match a freshly compiled executor"""
+        projection = RevenueProjector().project(
+            total_ultimate_revenue=Decimal("5000000"),
+            release_strategy="wide_theatrical",
+            project_name="Shared Plan"
+        )
+        plan = compile_waterfall(waterfall)
+
+        first = WaterfallExecutor(waterfall, plan).execute_over_time(projection)
+        second = WaterfallExecutor(waterfall, plan).execute_over_time(projection)
+        fresh = WaterfallExecutor(waterfall).execute_over_time(projection)
+
+        assert first.total_paid_by_payee == second.total_paid_by_payee == fresh.total_paid_by_payee
+        assert first.final_unrecouped == fresh.final_unrecouped
+
+    def test_process_quarter_updates_state(self, waterfall):
+        """Test process_quarter still updates a caller-owned state dict"""
+        executor = WaterfallExecutor(waterfall)
+        state = {}
+
+        execution = executor.process_quarter(
+            quarter=0,
+            gross_receipts=Decimal("500000"),
+            cumulative_state=state
+        )
+
+        assert execution.distribution_fees == Decimal("150000.00")
+        assert state["6_Senior Lender"] == Decimal("350000.00")
+        assert execution.unrecouped_balances["6_Senior Lender"] == Decimal("150000.00")
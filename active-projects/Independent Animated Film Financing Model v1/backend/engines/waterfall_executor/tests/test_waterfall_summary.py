@@ -0,0 +1,143 @@
+"""
+Unit Tests for Summary-Only Waterfall Execution
+
+Tests that WaterfallExecutor.execute_summary() reproduces the aggregates of
+execute_over_time() and feeds StakeholderAnalyzer identically.
+"""
+
+import pytest
+from decimal import Decimal
+
+from engines.waterfall_executor.waterfall_executor import WaterfallExecutor, WaterfallSummary
+from engines.waterfall_executor.revenue_projector import RevenueProjector
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer
+from models.waterfall import WaterfallStructure, WaterfallNode, RecoupmentPriority
+from models.capital_stack import CapitalStack, CapitalComponent
+from models.financial_instruments import Equity, SeniorDebt
+
+
+@pytest.fixture
+def waterfall():
+    """Waterfall with debt, equity and a capped producer share"""
+    return WaterfallStructure(
+        waterfall_name="Summary Waterfall",
+        default_distribution_fee_rate=Decimal("30.0"),
+        nodes=[
+            WaterfallNode(
+                priority=RecoupmentPriority.SENIOR_DEBT,
+                payee="Senior Lender",
+                amount=Decimal("8000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.EQUITY_RECOUPMENT,
+                payee="Equity Investors",
+                amount=Decimal("12000000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.DEFERRED_PRODUCER_FEE,
+                payee="Producer",
+                percentage=Decimal("15"),
+                capped_at=Decimal("750000")
+            ),
+            WaterfallNode(
+                priority=RecoupmentPriority.NET_PROFITS,
+                payee="Equity Investors",
+                percentage=Decimal("50")
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def capital_stack():
+    """Capital stack matching the waterfall payees"""
+    return CapitalStack(
+        stack_name="Summary Stack",
+        project_budget=Decimal("20000000"),
+        components=[
+            CapitalComponent(
+                instrument=SeniorDebt(amount=Decimal("8000000"), interest_rate=Decimal("8.0"), term_months=24),
+                position=1
+            ),
+            CapitalComponent(
+                instrument=Equity(amount=Decimal("12000000"), ownership_percentage=Decimal("100")),
+                position=2
+            ),
+        ]
+    )
+
+
+@pytest.fixture(params=[Decimal("10000000"), Decimal("40000000"), Decimal("90000000")])
+def projection(request):
+    """Revenue projections below, around and above full recoupment"""
+    return RevenueProjector().project(
+        total_ultimate_revenue=request.param,
+        release_strategy="wide_theatrical",
+        project_name="Summary Film"
+    )
+
+
+class TestExecuteSummary:
+    """Test WaterfallExecutor.execute_summary()"""
+
+    def test_matches_full_execution(self, waterfall, projection):
+        """Test summary totals equal execute_over_time() totals"""
+        executor = WaterfallExecutor(waterfall)
+
+        full = executor.execute_over_time(projection)
+        summary = executor.execute_summary(projection)
+
+        assert isinstance(summary, WaterfallSummary)
+        assert summary.total_receipts == full.total_receipts
+        assert summary.total_fees == full.total_fees
+        assert summary.total_recouped_by_node == full.total_recouped_by_node
+        assert summary.total_paid_by_payee == full.total_paid_by_payee
+        assert summary.final_unrecouped == full.final_unrecouped
+        assert summary.quarters == [qe.quarter for qe in full.quarterly_executions]
+
+    def test_dense_payee_receipts(self, waterfall, projection):
+        """Test per-payee receipts are aligned with executed quarters"""
+        executor = WaterfallExecutor(waterfall)
+
+        full = executor.execute_over_time(projection)
+        summary = executor.execute_summary(projection)
+
+        for payee, receipts in summary.payee_receipts.items():
+            assert len(receipts) == len(summary.quarters)
+            expected = [qe.payee_payouts.get(payee, Decimal("0")) for qe in full.quarterly_executions]
+            assert receipts == expected
+
+    def test_pa_expenses(self, waterfall, projection):
+        """Test P&A expenses are applied the same way as the full path"""
+        executor = WaterfallExecutor(waterfall)
+        pa_expenses = {q: Decimal("250000") for q in range(4)}
+
+        full = executor.execute_over_time(projection, pa_expenses_per_quarter=pa_expenses)
+        summary = executor.execute_summary(projection, pa_expenses_per_quarter=pa_expenses)
+
+        assert summary.total_fees == full.total_fees
+        assert summary.total_paid_by_payee == full.total_paid_by_payee
+
+    def test_stakeholder_analysis_matches(self, waterfall, capital_stack, projection):
+        """Test StakeholderAnalyzer gives the same returns from a summary"""
+        executor = WaterfallExecutor(waterfall)
+        analyzer = StakeholderAnalyzer(capital_stack)
+
+        full = analyzer.analyze(executor.execute_over_time(projection))
+        summary = analyzer.analyze(executor.execute_summary(projection))
+
+        for expected, actual in zip(full.stakeholders, summary.stakeholders):
+            assert actual.stakeholder_id == expected.stakeholder_id
+            assert actual.quarterly_receipts == expected.quarterly_receipts
+            assert actual.irr == expected.irr
+            assert actual.npv == expected.npv
+            assert actual.payback_quarter == expected.payback_quarter
+
+    def test_to_dict(self, waterfall, projection):
+        """Test summary serialization"""
+        summary = WaterfallExecutor(waterfall).execute_summary(projection)
+
+        data = summary.to_dict()
+
+        assert data["metadata"]["mode"] == "summary"
+        assert len(data["payee_receipts"]["Senior Lender"]) == len(data["quarters"])
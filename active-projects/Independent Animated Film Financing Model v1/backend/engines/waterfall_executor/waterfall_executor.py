@@ -3,16 +3,33 @@ Waterfall Executor
 
 Executes waterfall structures over time-series revenue, tracking cumulative
 recoupment and generating investor payout schedules.
+
+The structure is compiled once into a CompiledWaterfallPlan; quarters run on
+its integer-cent ledger (see waterfall_plan.py for rounding rules). Runs that
+keep many quarterly snapshots can store them as CompactQuarterlyExecution
+(cent arrays indexed by the plan) instead of per-quarter dicts.
 """
 
 import logging
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 from decimal import Decimal
 from copy import deepcopy
 
+import numpy as np
+
 from models.waterfall import WaterfallStructure, RecoupmentPriority
 from .revenue_projector import RevenueProjection, InvestmentDrawdown, s_curve_distribution
+from .instrumentation import Tracer, traced, current_tracer
+from .waterfall_plan import (
+    CompiledWaterfallPlan,
+    compile_waterfall,
+    to_cents,
+    from_cents,
+    apply_ratio,
+    UNPAID
+)
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +92,299 @@ class QuarterlyWaterfallExecution:
             result["cumulative_investment_drawn"] = str(self.cumulative_investment_drawn)
         return result
 
+    def payee_payout(self, payee_name: str) -> Decimal:
+        """Payout to one payee this quarter (0 if unpaid)"""
+        return self.payee_payouts.get(payee_name, Decimal("0"))
+
+
+class CompactQuarterlyExecution:
+    """
+    Array-backed waterfall execution for a single quarter.
+
+    Same attributes and to_dict() as QuarterlyWaterfallExecution, but all
+    amounts live in one int64 cent buffer indexed by the compiled plan and
+    the dict views are built on access. Produced by
+    execute_over_time(compact=True) for runs that keep many snapshots; use
+    expand() for a QuarterlyWaterfallExecution.
+
+    Buffer layout:
+        [fee, P&A, remaining pool | payout per node | payout per payee | ledger per slot]
+        Skipped nodes and payees with no paid node hold UNPAID.
+
+    Attributes:
+        quarter: Quarter number
+        gross_receipts: Gross revenue this quarter
+        plan: Compiled plan the buffer is indexed by (shared across quarters)
+        investment_drawn: Investment drawn this quarter (optional)
+        cumulative_investment_drawn: Cumulative investment drawn to date (optional)
+    """
+
+    __slots__ = (
+        "quarter",
+        "gross_receipts",
+        "plan",
+        "investment_drawn",
+        "cumulative_investment_drawn",
+        "_cents",
+    )
+
+    # Scalar amounts at the head of the buffer (fee, P&A, remaining pool)
+    HEADER = 3
+
+    def __init__(
+        self,
+        quarter: int,
+        gross_receipts: Decimal,
+        plan: CompiledWaterfallPlan,
+        cents: np.ndarray,
+        investment_drawn: Optional[Decimal] = None,
+        cumulative_investment_drawn: Optional[Decimal] = None
+    ):
+        """
+        Initialize from a packed cent buffer (see pack()).
+
+        Args:
+            quarter: Quarter number
+            gross_receipts: Gross revenue this quarter
+            plan: Compiled plan the buffer is indexed by
+            cents: int64 buffer in the layout above
+            investment_drawn: Investment drawn this quarter
+            cumulative_investment_drawn: Cumulative investment drawn to date
+        """
+        self.quarter = quarter
+        self.gross_receipts = gross_receipts
+        self.plan = plan
+        self.investment_drawn = investment_drawn
+        self.cumulative_investment_drawn = cumulative_investment_drawn
+        self._cents = cents
+
+    @classmethod
+    def pack(
+        cls,
+        quarter: int,
+        gross_receipts: Decimal,
+        plan: CompiledWaterfallPlan,
+        fee_cents: int,
+        pa_cents: int,
+        pool_cents: int,
+        payouts: List[int],
+        ledger: List[int],
+        investment_drawn: Optional[Decimal] = None,
+        cumulative_investment_drawn: Optional[Decimal] = None
+    ) -> "CompactQuarterlyExecution":
+        """
+        Snapshot a quarter from the plan's payout buffer and ledger.
+
+        Args:
+            quarter: Quarter number
+            gross_receipts: Gross revenue this quarter
+            plan: Compiled plan
+            fee_cents: Distribution fees deducted
+            pa_cents: P&A expenses deducted
+            pool_cents: Pool left after the nodes were paid
+            payouts: Cents paid per node (UNPAID if skipped)
+            ledger: Cumulative cents per ledger slot
+            investment_drawn: Investment drawn this quarter
+            cumulative_investment_drawn: Cumulative investment drawn to date
+
+        Returns:
+            CompactQuarterlyExecution
+        """
+        payee_cents = [UNPAID] * len(plan.payee_names)
+        for payment, p in zip(payouts, plan.node_payees):
+            if payment != UNPAID:
+                payee_cents[p] = payment if payee_cents[p] == UNPAID else payee_cents[p] + payment
+
+        cents = np.array([fee_cents, pa_cents, pool_cents, *payouts, *payee_cents, *ledger], dtype=np.int64)
+        return cls(quarter, gross_receipts, plan, cents, investment_drawn, cumulative_investment_drawn)
+
+    @property
+    def distribution_fees(self) -> Decimal:
+        """Distribution fees deducted"""
+        return from_cents(int(self._cents[0]))
+
+    @property
+    def pa_expenses(self) -> Decimal:
+        """P&A expenses deducted"""
+        return from_cents(int(self._cents[1]))
+
+    @property
+    def remaining_pool(self) -> Decimal:
+        """Pool left after the nodes were paid"""
+        return from_cents(int(self._cents[2]))
+
+    @property
+    def node_payout_cents(self) -> np.ndarray:
+        """Cents paid per plan node (UNPAID if skipped), a view of the buffer"""
+        start = self.HEADER
+        return self._cents[start:start + self.plan.num_nodes]
+
+    @property
+    def payee_payout_cents(self) -> np.ndarray:
+        """Cents paid per plan payee (UNPAID if none of its nodes were paid), a view of the buffer"""
+        start = self.HEADER + self.plan.num_nodes
+        return self._cents[start:start + len(self.plan.payee_names)]
+
+    @property
+    def ledger_cents(self) -> np.ndarray:
+        """Cumulative cents per plan ledger slot, a view of the buffer"""
+        return self._cents[self.HEADER + self.plan.num_nodes + len(self.plan.payee_names):]
+
+    @property
+    def node_payouts(self) -> Dict[str, Decimal]:
+        """Node ID → payout this quarter"""
+        node_ids = self.plan.node_ids
+        return {
+            node_ids[i]: from_cents(payment)
+            for i, payment in enumerate(self.node_payout_cents.tolist())
+            if payment != UNPAID
+        }
+
+    @property
+    def payee_payouts(self) -> Dict[str, Decimal]:
+        """Payee → total payout this quarter"""
+        payee_names = self.plan.payee_names
+        return {
+            payee_names[p]: from_cents(payment)
+            for p, payment in enumerate(self.payee_payout_cents.tolist())
+            if payment != UNPAID
+        }
+
+    @property
+    def cumulative_recouped(self) -> Dict[str, Decimal]:
+        """Node ID → cumulative recouped to date"""
+        return {
+            slot_id: from_cents(cents)
+            for slot_id, cents in zip(self.plan.slot_ids, self.ledger_cents.tolist())
+        }
+
+    @property
+    def cumulative_paid(self) -> Dict[str, Decimal]:
+        """Payee → cumulative paid to date"""
+        plan = self.plan
+        ledger = self.ledger_cents.tolist()
+        paid_cents: Dict[str, int] = {}
+        for slot, p in zip(plan.node_slots, plan.node_payees):
+            payee = plan.payee_names[p]
+            paid_cents[payee] = paid_cents.get(payee, 0) + ledger[slot]
+        return {payee: from_cents(cents) for payee, cents in paid_cents.items()}
+
+    @property
+    def unrecouped_balances(self) -> Dict[str, Decimal]:
+        """Node ID → remaining to recoup"""
+        return {
+            node_id: from_cents(remaining)
+            for node_id, remaining in self.plan.unrecouped_cents(self.ledger_cents.tolist()).items()
+        }
+
+    def payee_payout(self, payee_name: str) -> Decimal:
+        """Payout to one payee this quarter (0 if unpaid)"""
+        try:
+            payment = int(self.payee_payout_cents[self.plan.payee_names.index(payee_name)])
+        except ValueError:
+            return Decimal("0")
+        return from_cents(payment) if payment != UNPAID else Decimal("0")
+
+    def expand(self) -> QuarterlyWaterfallExecution:
+        """Equivalent dict-based QuarterlyWaterfallExecution"""
+        return QuarterlyWaterfallExecution(
+            quarter=self.quarter,
+            gross_receipts=self.gross_receipts,
+            distribution_fees=self.distribution_fees,
+            pa_expenses=self.pa_expenses,
+            remaining_pool=self.remaining_pool,
+            node_payouts=self.node_payouts,
+            payee_payouts=self.payee_payouts,
+            cumulative_recouped=self.cumulative_recouped,
+            cumulative_paid=self.cumulative_paid,
+            unrecouped_balances=self.unrecouped_balances,
+            investment_drawn=self.investment_drawn,
+            cumulative_investment_drawn=self.cumulative_investment_drawn
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (same shape as QuarterlyWaterfallExecution)"""
+        return self.expand().to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactQuarterlyExecution):
+            return NotImplemented
+        return (
+            self.quarter == other.quarter
+            and self.gross_receipts == other.gross_receipts
+            and self.plan.node_ids == other.plan.node_ids
+            and np.array_equal(self._cents, other._cents)
+            and self.investment_drawn == other.investment_drawn
+            and self.cumulative_investment_drawn == other.cumulative_investment_drawn
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactQuarterlyExecution(quarter={self.quarter}, gross_receipts={self.gross_receipts}, "
+            f"nodes={self.plan.num_nodes})"
+        )
+
+
+# Either quarterly snapshot type (same attributes and to_dict())
+QuarterlyExecution = Union[QuarterlyWaterfallExecution, CompactQuarterlyExecution]
+
+
+@dataclass
+class WaterfallCheckpoints:
+    """
+    Recoupment state around every executed quarter of a run.
+
+    Kept by execute_over_time() so reexecute() can resume from the first
+    changed quarter instead of replaying from zero.
+
+    Attributes:
+        distribution_fee_rate: Fee override used for the run
+        pa_expenses_per_quarter: P&A expenses used for the run
+        investment_drawdown: Drawdown profile used for the run
+        compact: Quarterly snapshots are CompactQuarterlyExecution
+        quarters: Executed quarters (non-zero gross receipts)
+        gross_receipts: Gross receipts per executed quarter
+        pa_expenses: P&A expenses per executed quarter
+        ledgers: Cent ledger before each executed quarter, plus the final one
+            (compact runs share each snapshot's ledger_cents view)
+        cumulative_investment: Investment drawn before each executed quarter, plus the final total
+    """
+    distribution_fee_rate: Optional[Decimal]
+    pa_expenses_per_quarter: Dict[int, Decimal]
+    investment_drawdown: Optional[InvestmentDrawdown]
+    compact: bool = False
+
+    quarters: List[int] = field(default_factory=list)
+    gross_receipts: List[Decimal] = field(default_factory=list)
+    pa_expenses: List[Decimal] = field(default_factory=list)
+    ledgers: List[Sequence[int]] = field(default_factory=list)
+    cumulative_investment: List[Decimal] = field(default_factory=list)
+
+    def ledger(self, index: int) -> List[int]:
+        """Cent ledger checkpoint index as a list of ints"""
+        ledger = self.ledgers[index]
+        return ledger.tolist() if isinstance(ledger, np.ndarray) else list(ledger)
+
+    def inputs(self) -> List[Tuple[int, Decimal, Decimal]]:
+        """(quarter, gross receipts, P&A) per executed quarter"""
+        return list(zip(self.quarters, self.gross_receipts, self.pa_expenses))
+
+    def truncated(self, index: int, pa_expenses_per_quarter: Dict[int, Decimal]) -> "WaterfallCheckpoints":
+        """Checkpoints up to (not including) executed quarter index, for a resumed run"""
+        return WaterfallCheckpoints(
+            distribution_fee_rate=self.distribution_fee_rate,
+            pa_expenses_per_quarter=pa_expenses_per_quarter,
+            investment_drawdown=self.investment_drawdown,
+            compact=self.compact,
+            quarters=self.quarters[:index],
+            gross_receipts=self.gross_receipts[:index],
+            pa_expenses=self.pa_expenses[:index],
+            ledgers=self.ledgers[:index + 1],
+            cumulative_investment=self.cumulative_investment[:index + 1]
+        )
+
 
 @dataclass
 class TimeSeriesWaterfallResult:
@@ -85,7 +395,7 @@ class TimeSeriesWaterfallResult:
         project_name: Project identifier
         waterfall_structure: Reference to original waterfall
         revenue_projection: Revenue projection used
-        quarterly_executions: List of quarterly results
+        quarterly_executions: List of quarterly results (compact when run with compact=True)
         total_receipts: Total gross receipts
         total_fees: Total fees deducted
         total_recouped_by_node: Node ID → total recouped
@@ -94,12 +404,13 @@ class TimeSeriesWaterfallResult:
         investment_drawdown: Optional investment drawdown profile used (S-curve modeling)
         total_investment_drawn: Total investment drawn (if drawdown profile provided)
         metadata: Execution notes
+        checkpoints: Per-quarter recoupment state for reexecute() (not serialized)
     """
     project_name: str
     waterfall_structure: WaterfallStructure
     revenue_projection: RevenueProjection
 
-    quarterly_executions: List[QuarterlyWaterfallExecution]
+    quarterly_executions: List[QuarterlyExecution]
 
     total_receipts: Decimal
     total_fees: Decimal
@@ -114,6 +425,8 @@ class TimeSeriesWaterfallResult:
 
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    checkpoints: Optional[WaterfallCheckpoints] = field(default=None, repr=False)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         result = {
@@ -135,6 +448,94 @@ class TimeSeriesWaterfallResult:
         return result
 
 
+@dataclass
+class WaterfallSummary:
+    """
+    Aggregate-only waterfall execution (no per-quarter snapshots).
+
+    Produced by WaterfallExecutor.execute_summary() for callers that only
+    need totals and per-payee receipts (Monte Carlo, sensitivity, optimizer).
+
+    Attributes:
+        project_name: Project identifier
+        quarters: Executed quarters (quarters with non-zero gross receipts)
+        payee_receipts: Payee → receipts per executed quarter (aligned with quarters)
+        total_receipts: Total gross receipts
+        total_fees: Total fees and P&A deducted
+        total_recouped_by_node: Node ID → total recouped
+        total_paid_by_payee: Payee → total paid
+        final_unrecouped: What didn't recoup
+        metadata: Execution notes
+    """
+    project_name: str
+    quarters: List[int]
+    payee_receipts: Dict[str, List[Decimal]]
+
+    total_receipts: Decimal
+    total_fees: Decimal
+    total_recouped_by_node: Dict[str, Decimal]
+    total_paid_by_payee: Dict[str, Decimal]
+
+    final_unrecouped: Dict[str, Decimal]
+
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def quarterly_receipts(self, payee_name: str) -> Dict[int, Decimal]:
+        """Quarter → receipt for a payee (quarters with positive receipts only)"""
+        receipts = self.payee_receipts.get(payee_name)
+        if receipts is None:
+            return {}
+        return {q: amount for q, amount in zip(self.quarters, receipts) if amount > 0}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        return {
+            "project_name": self.project_name,
+            "quarters": self.quarters,
+            "payee_receipts": {k: [str(v) for v in values] for k, values in self.payee_receipts.items()},
+            "total_receipts": str(self.total_receipts),
+            "total_fees": str(self.total_fees),
+            "total_recouped_by_node": {k: str(v) for k, v in self.total_recouped_by_node.items()},
+            "total_paid_by_payee": {k: str(v) for k, v in self.total_paid_by_payee.items()},
+            "final_unrecouped": {k: str(v) for k, v in self.final_unrecouped.items()},
+            "metadata": self.metadata
+        }
+
+
+@dataclass
+class WaterfallDiff:
+    """
+    What changed between two time-series executions.
+
+    Produced by WaterfallExecutor.reexecute().
+
+    Attributes:
+        result: Full updated result (unchanged quarters are shared with the previous one)
+        changed: New or changed quarterly executions, in quarter order
+        removed_quarters: Quarters executed before but not any more
+        first_changed_quarter: Earliest quarter that was re-run (None if nothing was)
+        quarters_rerun: Number of quarters actually executed
+    """
+    result: TimeSeriesWaterfallResult
+    changed: List[QuarterlyExecution]
+    removed_quarters: List[int]
+    first_changed_quarter: Optional[int]
+    quarters_rerun: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization (changes only)"""
+        return {
+            "changed": [qe.to_dict() for qe in self.changed],
+            "removed_quarters": self.removed_quarters,
+            "first_changed_quarter": self.first_changed_quarter,
+            "quarters_rerun": self.quarters_rerun,
+            "total_receipts": str(self.result.total_receipts),
+            "total_fees": str(self.result.total_fees),
+            "total_paid_by_payee": {k: str(v) for k, v in self.result.total_paid_by_payee.items()},
+            "final_unrecouped": {k: str(v) for k, v in self.result.final_unrecouped.items()}
+        }
+
+
 class WaterfallExecutor:
     """
     Execute waterfall structure over time-series revenue.
@@ -143,22 +544,30 @@ class WaterfallExecutor:
     recoupment and stopping nodes when fully recouped.
     """
 
-    def __init__(self, waterfall_structure: WaterfallStructure):
+    def __init__(
+        self,
+        waterfall_structure: WaterfallStructure,
+        plan: Optional[CompiledWaterfallPlan] = None
+    ):
         """
         Initialize with waterfall structure from Phase 2A.
 
         Args:
             waterfall_structure: WaterfallStructure from backend/models/waterfall.py
+            plan: Precompiled plan for this structure (compiled if not given)
         """
         self.waterfall = waterfall_structure
+        self.plan = plan or compile_waterfall(waterfall_structure)
         logger.info(f"WaterfallExecutor initialized with waterfall: {waterfall_structure.waterfall_name}")
 
+    @traced("waterfall.execute", "execution")
     def execute_over_time(
         self,
         revenue_projection: RevenueProjection,
         distribution_fee_rate: Optional[Decimal] = None,
         pa_expenses_per_quarter: Optional[Dict[int, Decimal]] = None,
-        investment_drawdown_profile: Optional[InvestmentDrawdown] = None
+        investment_drawdown_profile: Optional[InvestmentDrawdown] = None,
+        compact: bool = False
     ) -> TimeSeriesWaterfallResult:
         """
         Execute waterfall quarter-by-quarter with optional investment drawdown tracking.
@@ -168,39 +577,196 @@ class WaterfallExecutor:
             distribution_fee_rate: Override default distribution fee (%)
             pa_expenses_per_quarter: Optional P&A expenses by quarter
             investment_drawdown_profile: Optional S-curve investment drawdown schedule
+            compact: Keep quarterly snapshots as CompactQuarterlyExecution
+                (same attributes and to_dict(), a fraction of the memory)
 
         Returns:
-            TimeSeriesWaterfallResult with quarterly detail and optional investment tracking
+            TimeSeriesWaterfallResult with quarterly detail, optional investment
+            tracking and checkpoints for reexecute()
+        """
+        checkpoints = WaterfallCheckpoints(
+            distribution_fee_rate=distribution_fee_rate,
+            pa_expenses_per_quarter=dict(pa_expenses_per_quarter or {}),
+            investment_drawdown=investment_drawdown_profile,
+            compact=compact,
+            ledgers=[tuple(self.plan.new_ledger())],
+            cumulative_investment=[Decimal("0")]
+        )
+
+        quarterly_executions: List[QuarterlyExecution] = []
+        self._run_quarters(
+            revenue_projection,
+            self._executed_quarters(revenue_projection),
+            0,
+            checkpoints,
+            quarterly_executions
+        )
+
+        return self._assemble_result(revenue_projection, quarterly_executions, checkpoints)
+
+    @traced("waterfall.reexecute", "execution")
+    def reexecute(
+        self,
+        previous: TimeSeriesWaterfallResult,
+        revenue_projection: RevenueProjection,
+        pa_expenses_per_quarter: Optional[Dict[int, Decimal]] = None,
+        from_quarter: Optional[int] = None
+    ) -> WaterfallDiff:
         """
-        # Initialize cumulative state
-        cumulative_recouped: Dict[str, Decimal] = {}
-        for node in self.waterfall.nodes:
-            node_id = f"{node.priority.value}_{node.payee_name}"
-            cumulative_recouped[node_id] = Decimal("0")
-
-        # Initialize investment tracking if profile provided
-        cumulative_investment = Decimal("0")
+        Re-execute after an edit, replaying only the quarters it affects.
+
+        Resumes from the checkpoint before the first quarter whose receipts
+        or P&A changed (or from_quarter, if earlier). Once the cumulative
+        state matches the previous run again and every later input is
+        unchanged, the previous quarters are reused as they are. Fee rate,
+        drawdown profile and snapshot type (compact or not) are those of the
+        previous run.
+
+        Args:
+            previous: Result of execute_over_time() (or an earlier reexecute())
+            revenue_projection: Edited revenue projection
+            pa_expenses_per_quarter: P&A expenses by quarter (None = as in the previous run)
+            from_quarter: Re-run from this quarter even if its inputs are unchanged
+
+        Returns:
+            WaterfallDiff with the updated result and only the affected quarters
+
+        Raises:
+            ValueError: If previous has no checkpoints
+        """
+        old = previous.checkpoints
+        if old is None:
+            raise ValueError("Previous result has no checkpoints; run execute_over_time() first")
+
+        if pa_expenses_per_quarter is None:
+            pa_expenses_per_quarter = old.pa_expenses_per_quarter
+        pa_expenses_per_quarter = dict(pa_expenses_per_quarter)
+
+        quarters = self._executed_quarters(revenue_projection)
+        inputs = [
+            (q, revenue_projection.quarterly_revenue[q], pa_expenses_per_quarter.get(q, Decimal("0")))
+            for q in quarters
+        ]
+        old_inputs = old.inputs()
+
+        # Inputs match the previous run up to start...
+        start = 0
+        while start < min(len(inputs), len(old_inputs)) and inputs[start] == old_inputs[start]:
+            start += 1
+        if from_quarter is not None:
+            start = min(start, bisect_left(quarters, from_quarter))
+
+        # ...and from same_tail[i] onwards, aligned from the end
+        offset = len(old_inputs) - len(inputs)
+        same_tail = [False] * len(inputs) + [offset >= 0]
+        for i in range(len(inputs) - 1, -1, -1):
+            j = i + offset
+            same_tail[i] = same_tail[i + 1] and j >= 0 and inputs[i] == old_inputs[j]
+
+        checkpoints = old.truncated(start, pa_expenses_per_quarter)
+        quarterly_executions = previous.quarterly_executions[:start]
+        quarters_rerun = self._run_quarters(
+            revenue_projection,
+            quarters,
+            start,
+            checkpoints,
+            quarterly_executions,
+            splice=(previous.quarterly_executions, old, same_tail, offset)
+        )
+
+        result = self._assemble_result(revenue_projection, quarterly_executions, checkpoints)
+
+        old_by_quarter = {qe.quarter: qe for qe in previous.quarterly_executions}
+        changed = [
+            qe for qe in quarterly_executions[start:start + quarters_rerun]
+            if old_by_quarter.get(qe.quarter) != qe
+        ]
+
+        logger.info(
+            f"Re-executed waterfall from executed quarter {start}: "
+            f"{quarters_rerun} quarters run, {len(changed)} changed"
+        )
+
+        return WaterfallDiff(
+            result=result,
+            changed=changed,
+            removed_quarters=sorted(set(old.quarters) - set(quarters)),
+            first_changed_quarter=quarters[start] if quarters_rerun else None,
+            quarters_rerun=quarters_rerun
+        )
+
+    def _executed_quarters(self, revenue_projection: RevenueProjection) -> List[int]:
+        """Quarters with non-zero gross receipts, in order"""
+        return [
+            q for q in sorted(revenue_projection.quarterly_revenue.keys())
+            if revenue_projection.quarterly_revenue[q] != 0
+        ]
+
+    def _run_quarters(
+        self,
+        revenue_projection: RevenueProjection,
+        quarters: List[int],
+        start: int,
+        checkpoints: WaterfallCheckpoints,
+        quarterly_executions: List[QuarterlyExecution],
+        splice: Optional[Tuple[List[QuarterlyExecution], WaterfallCheckpoints, List[bool], int]] = None
+    ) -> int:
+        """
+        Execute quarters[start:] from the last checkpoint.
+
+        Args:
+            revenue_projection: Revenue projection
+            quarters: Executed quarters of the projection
+            start: Index of the first quarter to execute
+            checkpoints: Checkpoints up to start, extended in place
+            quarterly_executions: Executions up to start, extended in place
+            splice: (previous executions, previous checkpoints, same_tail,
+                offset) to reuse the previous run's tail once it converges
+
+        Returns:
+            Number of quarters executed
+        """
+        plan = self.plan
+        fee_ratio = plan.resolve_fee_ratio(checkpoints.distribution_fee_rate)
+        pa_expenses_per_quarter = checkpoints.pa_expenses_per_quarter
+        investment_drawdown_profile = checkpoints.investment_drawdown
+
+        # Cumulative state lives in the plan's cent ledger for the whole run
+        ledger = checkpoints.ledger(-1)
+        payouts = plan.new_payouts()
+        cumulative_investment = checkpoints.cumulative_investment[-1]
+
+        # Map investment draws to quarters
         investment_draws_by_quarter: Dict[int, Decimal] = {}
         if investment_drawdown_profile:
-            # Map investment draws to quarters
             for i, draw in enumerate(investment_drawdown_profile.quarterly_draws):
                 investment_draws_by_quarter[i] = draw
 
-        # Process each quarter
-        quarterly_executions = []
-        total_receipts = Decimal("0")
-        total_fees_sum = Decimal("0")
-
-        for quarter in sorted(revenue_projection.quarterly_revenue.keys()):
+        tracer = current_tracer()
+        executed = 0
+        for index in range(start, len(quarters)):
+            if splice is not None and index > start:
+                old_executions, old, same_tail, offset = splice
+                j = index + offset
+                if (
+                    same_tail[index]
+                    and ledger == old.ledger(j)
+                    and cumulative_investment == old.cumulative_investment[j]
+                ):
+                    # Same state and same inputs from here on: the rest is unchanged
+                    quarterly_executions.extend(old_executions[j:])
+                    checkpoints.quarters.extend(old.quarters[j:])
+                    checkpoints.gross_receipts.extend(old.gross_receipts[j:])
+                    checkpoints.pa_expenses.extend(old.pa_expenses[j:])
+                    checkpoints.ledgers.extend(old.ledgers[j + 1:])
+                    checkpoints.cumulative_investment.extend(old.cumulative_investment[j + 1:])
+                    break
+
+            quarter = quarters[index]
             gross_receipts = revenue_projection.quarterly_revenue[quarter]
 
-            if gross_receipts == 0:
-                continue
-
             # P&A expenses this quarter
-            pa_expenses = Decimal("0")
-            if pa_expenses_per_quarter and quarter in pa_expenses_per_quarter:
-                pa_expenses = pa_expenses_per_quarter[quarter]
+            pa_expenses = pa_expenses_per_quarter.get(quarter, Decimal("0"))
 
             # Investment draw this quarter (if tracking)
             investment_draw = None
@@ -209,19 +775,57 @@ class WaterfallExecutor:
                 cumulative_investment += investment_draw
 
             # Process this quarter
-            quarterly_execution = self.process_quarter(
+            execution = self._execute_quarter(
                 quarter=quarter,
                 gross_receipts=gross_receipts,
-                cumulative_state=cumulative_recouped,
-                distribution_fee_rate=distribution_fee_rate,
+                ledger=ledger,
+                payouts=payouts,
+                fee_ratio=fee_ratio,
                 pa_expenses=pa_expenses,
                 investment_draw=investment_draw,
-                cumulative_investment=cumulative_investment if investment_drawdown_profile else None
+                cumulative_investment=cumulative_investment if investment_drawdown_profile else None,
+                compact=checkpoints.compact
             )
+            quarterly_executions.append(execution)
+            if tracer is not None:
+                _count_nodes(tracer, payouts)
 
-            quarterly_executions.append(quarterly_execution)
-            total_receipts += gross_receipts
-            total_fees_sum += quarterly_execution.distribution_fees + quarterly_execution.pa_expenses
+            checkpoints.quarters.append(quarter)
+            checkpoints.gross_receipts.append(gross_receipts)
+            checkpoints.pa_expenses.append(pa_expenses)
+            checkpoints.ledgers.append(execution.ledger_cents if checkpoints.compact else tuple(ledger))
+            checkpoints.cumulative_investment.append(cumulative_investment)
+            executed += 1
+
+        return executed
+
+    def _assemble_result(
+        self,
+        revenue_projection: RevenueProjection,
+        quarterly_executions: List[QuarterlyExecution],
+        checkpoints: WaterfallCheckpoints
+    ) -> TimeSeriesWaterfallResult:
+        """
+        Build a TimeSeriesWaterfallResult from executed quarters.
+
+        Args:
+            revenue_projection: Revenue projection executed
+            quarterly_executions: Quarterly results in order
+            checkpoints: Checkpoints of the run (final ledger last)
+
+        Returns:
+            TimeSeriesWaterfallResult
+        """
+        plan = self.plan
+        distribution_fee_rate = checkpoints.distribution_fee_rate
+        investment_drawdown_profile = checkpoints.investment_drawdown
+        cumulative_investment = checkpoints.cumulative_investment[-1]
+
+        total_receipts = Decimal("0")
+        total_fees_sum = Decimal("0")
+        for execution in quarterly_executions:
+            total_receipts += execution.gross_receipts
+            total_fees_sum += execution.distribution_fees + execution.pa_expenses
 
         # Aggregate totals
         total_recouped_by_node: Dict[str, Decimal] = {}
@@ -233,17 +837,11 @@ class WaterfallExecutor:
             total_recouped_by_node = final_execution.cumulative_recouped.copy()
             total_paid_by_payee = final_execution.cumulative_paid.copy()
 
-        # Calculate final unrecouped
-        final_unrecouped: Dict[str, Decimal] = {}
-        for node in self.waterfall.nodes:
-            node_id = f"{node.priority.value}_{node.payee_name}"
-            target_amount = node.fixed_amount or Decimal("0")  # Use 0 if None (for percentage-based nodes)
-
-            if node.fixed_amount:  # Only track unrecouped for fixed-amount nodes
-                recouped = total_recouped_by_node.get(node_id, Decimal("0"))
-                remaining = target_amount - recouped
-                if remaining > 0:
-                    final_unrecouped[node_id] = remaining
+        # Calculate final unrecouped (fixed-amount nodes only)
+        final_unrecouped = {
+            node_id: from_cents(remaining)
+            for node_id, remaining in plan.unrecouped_cents(checkpoints.ledger(-1)).items()
+        }
 
         # Prepare metadata
         metadata_dict = {
@@ -265,7 +863,8 @@ class WaterfallExecutor:
             final_unrecouped=final_unrecouped,
             investment_drawdown=investment_drawdown_profile,
             total_investment_drawn=cumulative_investment if investment_drawdown_profile else None,
-            metadata=metadata_dict
+            metadata=metadata_dict,
+            checkpoints=checkpoints
         )
 
         log_msg = (
@@ -278,6 +877,109 @@ class WaterfallExecutor:
 
         return result
 
+    @traced("waterfall.execute", "execution")
+    def execute_summary(
+        self,
+        revenue_projection: RevenueProjection,
+        distribution_fee_rate: Optional[Decimal] = None,
+        pa_expenses_per_quarter: Optional[Dict[int, Decimal]] = None
+    ) -> WaterfallSummary:
+        """
+        Execute waterfall quarter-by-quarter keeping only aggregates.
+
+        Same results as execute_over_time() but skips the per-quarter
+        QuarterlyWaterfallExecution snapshots; payee receipts accumulate in
+        dense cent arrays and are converted once at the end. Use
+        execute_over_time() when quarterly detail is needed (API responses).
+
+        Args:
+            revenue_projection: Revenue projection from RevenueProjector
+            distribution_fee_rate: Override default distribution fee (%)
+            pa_expenses_per_quarter: Optional P&A expenses by quarter
+
+        Returns:
+            WaterfallSummary with totals and per-payee quarterly receipts
+        """
+        plan = self.plan
+        fee_ratio = plan.resolve_fee_ratio(distribution_fee_rate)
+        node_payees = plan.node_payees
+
+        ledger = plan.new_ledger()
+        payouts = plan.new_payouts()
+
+        quarters = [
+            q for q in sorted(revenue_projection.quarterly_revenue.keys())
+            if revenue_projection.quarterly_revenue[q] != 0
+        ]
+        receipts_cents = [[0] * len(quarters) for _ in plan.payee_names]
+
+        total_receipts = Decimal("0")
+        total_fee_cents = 0
+        tracer = current_tracer()
+
+        for column, quarter in enumerate(quarters):
+            gross_receipts = revenue_projection.quarterly_revenue[quarter]
+
+            pa_cents = 0
+            if pa_expenses_per_quarter and quarter in pa_expenses_per_quarter:
+                pa_cents = to_cents(pa_expenses_per_quarter[quarter])
+
+            gross_cents = to_cents(gross_receipts)
+            fee_cents = apply_ratio(gross_cents, *fee_ratio)
+
+            plan.run_quarter(gross_cents - fee_cents - pa_cents, ledger, payouts)
+            if tracer is not None:
+                _count_nodes(tracer, payouts)
+
+            for i, payment in enumerate(payouts):
+                if payment > 0:
+                    receipts_cents[node_payees[i]][column] += payment
+
+            total_receipts += gross_receipts
+            total_fee_cents += fee_cents + pa_cents
+
+        total_recouped_by_node: Dict[str, Decimal] = {}
+        total_paid_by_payee: Dict[str, Decimal] = {}
+        if quarters:
+            total_recouped_by_node = {
+                slot_id: from_cents(ledger[slot]) for slot, slot_id in enumerate(plan.slot_ids)
+            }
+            # Same aggregation as QuarterlyWaterfallExecution.cumulative_paid
+            paid_cents: Dict[str, int] = {}
+            for i, slot in enumerate(plan.node_slots):
+                payee = plan.payee_names[node_payees[i]]
+                paid_cents[payee] = paid_cents.get(payee, 0) + ledger[slot]
+            total_paid_by_payee = {payee: from_cents(cents) for payee, cents in paid_cents.items()}
+
+        summary = WaterfallSummary(
+            project_name=revenue_projection.project_name,
+            quarters=quarters,
+            payee_receipts={
+                payee: [from_cents(cents) for cents in receipts_cents[p]]
+                for p, payee in enumerate(plan.payee_names)
+            },
+            total_receipts=total_receipts,
+            total_fees=from_cents(total_fee_cents),
+            total_recouped_by_node=total_recouped_by_node,
+            total_paid_by_payee=total_paid_by_payee,
+            final_unrecouped={
+                node_id: from_cents(remaining)
+                for node_id, remaining in plan.unrecouped_cents(ledger).items()
+            },
+            metadata={
+                "num_quarters": len(quarters),
+                "distribution_fee_rate": str(distribution_fee_rate) if distribution_fee_rate else "default",
+                "mode": "summary"
+            }
+        )
+
+        logger.debug(
+            f"Executed waterfall summary over {len(quarters)} quarters: "
+            f"${total_receipts:,.0f} total receipts"
+        )
+
+        return summary
+
     def process_quarter(
         self,
         quarter: int,
@@ -294,7 +996,7 @@ class WaterfallExecutor:
         Args:
             quarter: Quarter number
             gross_receipts: Gross revenue this quarter
-            cumulative_state: Cumulative recoupment state (node_id → amount)
+            cumulative_state: Cumulative recoupment state (node_id → amount), updated in place
             distribution_fee_rate: Distribution fee percentage
             pa_expenses: P&A expenses this quarter
             investment_draw: Investment drawn this quarter (optional, for S-curve modeling)
@@ -303,96 +1005,119 @@ class WaterfallExecutor:
         Returns:
             QuarterlyWaterfallExecution with this quarter's results
         """
-        # Calculate distribution fees
-        dist_fee_rate = distribution_fee_rate or self.waterfall.default_distribution_fee_rate or Decimal("0")
-        distribution_fees = gross_receipts * (dist_fee_rate / Decimal("100"))
+        plan = self.plan
+        ledger = [to_cents(cumulative_state.get(slot_id, Decimal("0"))) for slot_id in plan.slot_ids]
+
+        execution = self._execute_quarter(
+            quarter=quarter,
+            gross_receipts=gross_receipts,
+            ledger=ledger,
+            payouts=plan.new_payouts(),
+            fee_ratio=plan.resolve_fee_ratio(distribution_fee_rate),
+            pa_expenses=pa_expenses,
+            investment_draw=investment_draw,
+            cumulative_investment=cumulative_investment
+        )
+
+        cumulative_state.update(execution.cumulative_recouped)
+
+        return execution
+
+    def _execute_quarter(
+        self,
+        quarter: int,
+        gross_receipts: Decimal,
+        ledger: List[int],
+        payouts: List[int],
+        fee_ratio: Tuple[int, int],
+        pa_expenses: Decimal,
+        investment_draw: Optional[Decimal],
+        cumulative_investment: Optional[Decimal],
+        compact: bool = False
+    ) -> QuarterlyExecution:
+        """
+        Run one quarter on the cent ledger and snapshot it.
+
+        Args:
+            quarter: Quarter number
+            gross_receipts: Gross revenue this quarter
+            ledger: Cumulative cents per plan slot, updated in place
+            payouts: Plan payout buffer
+            fee_ratio: Distribution fee as (numerator, denominator)
+            pa_expenses: P&A expenses this quarter
+            investment_draw: Investment drawn this quarter
+            cumulative_investment: Cumulative investment drawn to date
+            compact: Snapshot as CompactQuarterlyExecution
+
+        Returns:
+            QuarterlyWaterfallExecution (or CompactQuarterlyExecution) with this quarter's results
+        """
+        plan = self.plan
+
+        gross_cents = to_cents(gross_receipts)
+        fee_cents = apply_ratio(gross_cents, *fee_ratio)
+        pa_cents = to_cents(pa_expenses)
 
-        # Remaining pool after fees
-        remaining_pool = gross_receipts - distribution_fees - pa_expenses
+        remaining_pool = plan.run_quarter(gross_cents - fee_cents - pa_cents, ledger, payouts)
+
+        if compact:
+            return CompactQuarterlyExecution.pack(
+                quarter=quarter,
+                gross_receipts=gross_receipts,
+                plan=plan,
+                fee_cents=fee_cents,
+                pa_cents=pa_cents,
+                pool_cents=remaining_pool,
+                payouts=payouts,
+                ledger=ledger,
+                investment_drawn=investment_draw,
+                cumulative_investment_drawn=cumulative_investment
+            )
 
-        # Process waterfall nodes
         node_payouts: Dict[str, Decimal] = {}
         payee_payouts: Dict[str, Decimal] = {}
+        for i, payment in enumerate(payouts):
+            if payment == UNPAID:
+                continue
+            amount = from_cents(payment)
+            node_payouts[plan.node_ids[i]] = amount
+            payee = plan.payee_names[plan.node_payees[i]]
+            payee_payouts[payee] = payee_payouts.get(payee, Decimal("0")) + amount
+
+        cumulative_recouped = {
+            slot_id: from_cents(ledger[slot]) for slot, slot_id in enumerate(plan.slot_ids)
+        }
 
-        # Get nodes sorted by priority
-        sorted_nodes = sorted(self.waterfall.nodes, key=lambda n: n.priority.value)
-
-        for node in sorted_nodes:
-            if remaining_pool <= 0:
-                break
-
-            node_id = f"{node.priority.value}_{node.payee_name}"
-
-            # Calculate remaining to recoup
-            if node.fixed_amount:
-                # Fixed amount node
-                target_amount = node.fixed_amount
-                already_recouped = cumulative_state.get(node_id, Decimal("0"))
-                remaining_to_recoup = target_amount - already_recouped
-
-                if remaining_to_recoup <= 0:
-                    # Already fully recouped
-                    continue
-
-                # Pay lesser of (available_pool, remaining_to_recoup)
-                payment = min(remaining_pool, remaining_to_recoup)
-
-            else:
-                # Percentage-based node (e.g., profit splits)
-                if node.percentage_of_receipts:
-                    payment = remaining_pool * (node.percentage_of_receipts / Decimal("100"))
-
-                    # Apply cap if exists
-                    if node.capped_at:
-                        already_recouped = cumulative_state.get(node_id, Decimal("0"))
-                        remaining_cap = node.capped_at - already_recouped
-                        if remaining_cap <= 0:
-                            continue
-                        payment = min(payment, remaining_cap)
-                else:
-                    # No amount or percentage - skip
-                    continue
-
-            # Record payment
-            node_payouts[node_id] = payment
-            payee_payouts[node.payee_name] = payee_payouts.get(node.payee_name, Decimal("0")) + payment
-
-            # Update cumulative state
-            cumulative_state[node_id] = cumulative_state.get(node_id, Decimal("0")) + payment
-
-            # Reduce available pool
-            remaining_pool -= payment
-
-        # Calculate unrecouped balances
-        unrecouped_balances: Dict[str, Decimal] = {}
-        for node in sorted_nodes:
-            node_id = f"{node.priority.value}_{node.payee_name}"
-            if node.fixed_amount:
-                recouped = cumulative_state.get(node_id, Decimal("0"))
-                remaining = node.fixed_amount - recouped
-                if remaining > 0:
-                    unrecouped_balances[node_id] = remaining
+        unrecouped_balances = {
+            node_id: from_cents(remaining)
+            for node_id, remaining in plan.unrecouped_cents(ledger).items()
+        }
 
         # Calculate cumulative paid by payee
         cumulative_paid: Dict[str, Decimal] = {}
-        for node in sorted_nodes:
-            node_id = f"{node.priority.value}_{node.payee_name}"
-            amount = cumulative_state.get(node_id, Decimal("0"))
-            cumulative_paid[node.payee_name] = cumulative_paid.get(node.payee_name, Decimal("0")) + amount
+        for i, node_id in enumerate(plan.node_ids):
+            payee = plan.payee_names[plan.node_payees[i]]
+            cumulative_paid[payee] = cumulative_paid.get(payee, Decimal("0")) + cumulative_recouped[node_id]
 
-        execution = QuarterlyWaterfallExecution(
+        return QuarterlyWaterfallExecution(
             quarter=quarter,
             gross_receipts=gross_receipts,
-            distribution_fees=distribution_fees,
-            pa_expenses=pa_expenses,
-            remaining_pool=remaining_pool,
+            distribution_fees=from_cents(fee_cents),
+            pa_expenses=from_cents(pa_cents),
+            remaining_pool=from_cents(remaining_pool),
             node_payouts=node_payouts,
             payee_payouts=payee_payouts,
-            cumulative_recouped=cumulative_state.copy(),
+            cumulative_recouped=cumulative_recouped,
             cumulative_paid=cumulative_paid,
             unrecouped_balances=unrecouped_balances,
             investment_drawn=investment_draw,
             cumulative_investment_drawn=cumulative_investment
         )
 
-        return execution
+
+def _count_nodes(tracer: Tracer, payouts: List[int]) -> None:
+    """Record one executed quarter's paid and skipped node visits"""
+    skipped = payouts.count(UNPAID)
+    tracer.count("waterfall.quarters")
+    tracer.count("waterfall.nodes_evaluated", len(payouts) - skipped)
+    tracer.count("waterfall.nodes_skipped", skipped)
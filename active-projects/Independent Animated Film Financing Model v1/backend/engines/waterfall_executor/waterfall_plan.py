@@ -0,0 +1,274 @@
+"""
+Compiled Waterfall Plan
+
+Compiles a WaterfallStructure once into an immutable execution plan: nodes in
+priority order, interned node IDs, ledger slot and payee indices, and
+fixed-amount / percentage / cap vectors. Quarters then run on an integer-cent
+ledger, so WaterfallExecutor, BatchWaterfallExecutor and their callers
+(Monte Carlo, sensitivity, optimizer) can reuse one plan across thousands of
+executions without re-sorting nodes or rebuilding IDs.
+
+Rounding:
+    Amounts are held as integer cents. Distribution fees and percentage
+    payments are exact rational multiples of the pool, rounded half-even to
+    the cent. Fixed amounts, caps and P&A expenses are rounded half-even to
+    the cent when compiled or converted.
+"""
+
+import logging
+import sys
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.waterfall import WaterfallStructure
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal("0.01")
+
+# Largest amount (in cents) the plan accepts, so batch callers can use int64
+MAX_CENTS = int(np.iinfo(np.int64).max)
+
+# Payout marker for nodes that were skipped in a quarter
+UNPAID = -1
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a dollar amount to integer cents (half-even)"""
+    return int(Decimal(amount).quantize(CENT, rounding=ROUND_HALF_EVEN).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents to a dollar Decimal"""
+    return Decimal(cents).scaleb(-2)
+
+
+def rate_ratio(percentage: Optional[Decimal]) -> Tuple[int, int]:
+    """
+    Express a percentage as an exact integer fraction.
+
+    Args:
+        percentage: Percentage (e.g. 12.5 for 12.5%)
+
+    Returns:
+        (numerator, denominator) of percentage / 100, or (0, 1) if unset
+    """
+    if not percentage:
+        return 0, 1
+    numerator, denominator = Decimal(percentage).as_integer_ratio()
+    return numerator, denominator * 100
+
+
+def apply_ratio(cents: int, numerator: int, denominator: int) -> int:
+    """Multiply cents by numerator / denominator, rounding half-even"""
+    quotient, remainder = divmod(cents * numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+@dataclass(frozen=True)
+class CompiledWaterfallPlan:
+    """
+    Immutable execution plan for a waterfall structure.
+
+    Node vectors are in priority order (stable sort, as WaterfallExecutor has
+    always processed nodes). Nodes that share priority and payee share one
+    ledger slot, matching the "{priority}_{payee}" node ID keying.
+
+    Attributes:
+        waterfall_name: Name of the compiled waterfall
+        node_ids: Node ID for each node
+        slot_ids: Node ID for each ledger slot
+        payee_names: Payee name for each payee index
+        node_slots: Ledger slot for each node
+        node_payees: Payee index for each node
+        fixed_cents: Fixed amount per node in cents (0 if not fixed)
+        pct_numerators: Percentage of pool per node as numerator (0 if none)
+        pct_denominators: Percentage of pool per node as denominator
+        cap_cents: Cap per node in cents (0 if uncapped)
+        fee_ratio: Default distribution fee as (numerator, denominator)
+    """
+    waterfall_name: str
+
+    node_ids: Tuple[str, ...]
+    slot_ids: Tuple[str, ...]
+    payee_names: Tuple[str, ...]
+
+    node_slots: Tuple[int, ...]
+    node_payees: Tuple[int, ...]
+    fixed_cents: Tuple[int, ...]
+    pct_numerators: Tuple[int, ...]
+    pct_denominators: Tuple[int, ...]
+    cap_cents: Tuple[int, ...]
+
+    fee_ratio: Tuple[int, int]
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the plan"""
+        return len(self.node_ids)
+
+    @property
+    def num_slots(self) -> int:
+        """Number of ledger slots"""
+        return len(self.slot_ids)
+
+    def resolve_fee_ratio(self, distribution_fee_rate: Optional[Decimal] = None) -> Tuple[int, int]:
+        """Fee ratio for an override rate, falling back to the waterfall default"""
+        if distribution_fee_rate:
+            return rate_ratio(distribution_fee_rate)
+        return self.fee_ratio
+
+    def new_ledger(self) -> List[int]:
+        """Empty cumulative ledger (cents recouped per slot)"""
+        return [0] * self.num_slots
+
+    def new_payouts(self) -> List[int]:
+        """Payout buffer (cents per node) for run_quarter()"""
+        return [UNPAID] * self.num_nodes
+
+    def run_quarter(
+        self,
+        pool: int,
+        ledger: List[int],
+        payouts: List[int],
+        fixed_cents: Optional[Sequence[int]] = None
+    ) -> int:
+        """
+        Pay one quarter's pool through the nodes in priority order.
+
+        Updates the ledger in place and writes each node's payment (or UNPAID
+        if the node was skipped) into the preallocated payouts buffer.
+
+        Args:
+            pool: Cents available after fees and P&A
+            ledger: Cumulative cents recouped per slot
+            payouts: Buffer of length num_nodes
+            fixed_cents: Per-node fixed targets overriding the compiled ones
+                (e.g. debt grown by accrued interest)
+
+        Returns:
+            Cents left in the pool
+        """
+        node_slots = self.node_slots
+        if fixed_cents is None:
+            fixed_cents = self.fixed_cents
+        pct_numerators = self.pct_numerators
+        pct_denominators = self.pct_denominators
+        cap_cents = self.cap_cents
+
+        for i in range(self.num_nodes):
+            payouts[i] = UNPAID
+            if pool <= 0:
+                continue
+
+            slot = node_slots[i]
+            fixed = fixed_cents[i]
+
+            if fixed:
+                remaining = fixed - ledger[slot]
+                if remaining <= 0:
+                    continue
+                payment = pool if pool < remaining else remaining
+            elif pct_numerators[i]:
+                payment = apply_ratio(pool, pct_numerators[i], pct_denominators[i])
+                cap = cap_cents[i]
+                if cap:
+                    remaining_cap = cap - ledger[slot]
+                    if remaining_cap <= 0:
+                        continue
+                    if remaining_cap < payment:
+                        payment = remaining_cap
+            else:
+                continue
+
+            payouts[i] = payment
+            ledger[slot] += payment
+            pool -= payment
+
+        return pool
+
+    def unrecouped_cents(
+        self,
+        ledger: List[int],
+        fixed_cents: Optional[Sequence[int]] = None
+    ) -> Dict[str, int]:
+        """Node ID → cents still to recoup, for fixed-amount nodes"""
+        if fixed_cents is None:
+            fixed_cents = self.fixed_cents
+        unrecouped: Dict[str, int] = {}
+        for i in range(self.num_nodes):
+            fixed = fixed_cents[i]
+            if fixed:
+                remaining = fixed - ledger[self.node_slots[i]]
+                if remaining > 0:
+                    unrecouped[self.node_ids[i]] = remaining
+        return unrecouped
+
+
+def compile_waterfall(waterfall_structure: WaterfallStructure) -> CompiledWaterfallPlan:
+    """
+    Compile a waterfall structure into an execution plan.
+
+    Args:
+        waterfall_structure: WaterfallStructure from backend/models/waterfall.py
+
+    Returns:
+        CompiledWaterfallPlan
+
+    Raises:
+        ValueError: If an amount does not fit the integer-cent ledger
+    """
+    sorted_nodes = sorted(waterfall_structure.nodes, key=lambda n: n.priority.value)
+
+    node_ids: List[str] = []
+    slot_index: Dict[str, int] = {}
+    payee_index: Dict[str, int] = {}
+    node_slots: List[int] = []
+    node_payees: List[int] = []
+    fixed_cents: List[int] = []
+    pct_numerators: List[int] = []
+    pct_denominators: List[int] = []
+    cap_cents: List[int] = []
+
+    for node in sorted_nodes:
+        node_id = sys.intern(f"{node.priority.value}_{node.payee_name}")
+        node_ids.append(node_id)
+        node_slots.append(slot_index.setdefault(node_id, len(slot_index)))
+        node_payees.append(payee_index.setdefault(node.payee_name, len(payee_index)))
+
+        fixed = to_cents(node.fixed_amount) if node.fixed_amount else 0
+        cap = to_cents(node.capped_at) if node.capped_at else 0
+        for amount in (fixed, cap):
+            if abs(amount) > MAX_CENTS:
+                raise ValueError(f"Node {node_id} amount exceeds the cent ledger range")
+
+        numerator, denominator = rate_ratio(node.percentage_of_receipts)
+
+        fixed_cents.append(fixed)
+        pct_numerators.append(numerator)
+        pct_denominators.append(denominator)
+        cap_cents.append(cap)
+
+    plan = CompiledWaterfallPlan(
+        waterfall_name=waterfall_structure.waterfall_name,
+        node_ids=tuple(node_ids),
+        slot_ids=tuple(slot_index),
+        payee_names=tuple(payee_index),
+        node_slots=tuple(node_slots),
+        node_payees=tuple(node_payees),
+        fixed_cents=tuple(fixed_cents),
+        pct_numerators=tuple(pct_numerators),
+        pct_denominators=tuple(pct_denominators),
+        cap_cents=tuple(cap_cents),
+        fee_ratio=rate_ratio(waterfall_structure.default_distribution_fee_rate)
+    )
+
+    logger.debug(f"Compiled waterfall plan: {plan.waterfall_name} ({plan.num_nodes} nodes)")
+
+    return plan
@@ -269,6 +269,120 @@ class TestOptimizeCapitalStackEndpoint:
             assert "num_starts" in data["convergence_info"]
             assert "convergence_std" in data["convergence_info"]
 
+    def test_optimize_surrogate_mode(self, client):
+        """Test optimization with the surrogate mode"""
+        payload = {
+            "project_budget": "30000000",
+            "template_structure": {
+                "senior_debt": "12000000",
+                "gap_financing": "4500000",
+                "mezzanine_debt": "3000000",
+                "equity": "7500000",
+                "tax_incentives": "2500000",
+                "presales": "500000",
+                "grants": "0"
+            },
+            "use_surrogate": True
+        }
+
+        response = client.post("/api/v1/scenarios/optimize-capital-stack", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["solver_status"] == "SUCCESS"
+        assert 0 < data["num_evaluations"] <= 40
+        assert sum(float(v) for v in data["allocations"].values()) == pytest.approx(100.0)
+
+    def test_optimize_analytic_gradient_mode(self, client):
+        """Test optimization with exact gradients of the smooth score"""
+        payload = {
+            "project_budget": "30000000",
+            "template_structure": {
+                "senior_debt": "12000000",
+                "gap_financing": "4500000",
+                "mezzanine_debt": "3000000",
+                "equity": "7500000",
+                "tax_incentives": "2500000",
+                "presales": "500000",
+                "grants": "0"
+            },
+            "use_analytic_gradient": True
+        }
+
+        response = client.post("/api/v1/scenarios/optimize-capital-stack", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["solver_status"] == "SUCCESS"
+        assert sum(float(v) for v in data["allocations"].values()) == pytest.approx(100.0)
+
+    def test_optimize_pareto_front(self, client):
+        """Test NSGA-II returns a front of distinct non-dominated structures"""
+        payload = {
+            "project_budget": "30000000",
+            "template_structure": {
+                "senior_debt": "12000000",
+                "gap_financing": "4500000",
+                "mezzanine_debt": "3000000",
+                "equity": "7500000",
+                "tax_incentives": "2500000",
+                "presales": "500000",
+                "grants": "0"
+            },
+            "population_size": 40,
+            "generations": 10,
+            "seed": 7
+        }
+
+        response = client.post("/api/v1/scenarios/optimize-pareto", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["objective_names"] == ["equity_irr", "cost_of_capital", "dilution", "risk"]
+        assert data["num_evaluations"] == 40 * 11
+        assert len(data["solutions"]) > 1
+        for solution in data["solutions"]:
+            assert sum(float(v) for v in solution["allocations"].values()) == pytest.approx(100.0)
+
+    def test_optimize_pareto_odd_population(self, client):
+        """Test the Pareto endpoint rejects odd population sizes"""
+        payload = {
+            "project_budget": "30000000",
+            "template_structure": {"senior_debt": "15000000", "equity": "15000000"},
+            "population_size": 41
+        }
+
+        response = client.post("/api/v1/scenarios/optimize-pareto", json=payload)
+
+        assert response.status_code == 422
+
+    def test_optimize_pareto_size_capped(self, client):
+        """Test the Pareto endpoint rejects oversized searches"""
+        for settings in [{"population_size": 502}, {"generations": 201}]:
+            payload = {
+                "project_budget": "30000000",
+                "template_structure": {"senior_debt": "15000000", "equity": "15000000"},
+                **settings
+            }
+
+            response = client.post("/api/v1/scenarios/optimize-pareto", json=payload)
+
+            assert response.status_code == 422
+
+    def test_optimize_pareto_infeasible_bounds(self, client):
+        """Test bounds admitting no allocation are a client error"""
+        payload = {
+            "project_budget": "30000000",
+            "template_structure": {"senior_debt": "15000000", "equity": "15000000"},
+            "bounds": {"equity_max_pct": "30", "senior_debt_max_pct": "30"},
+            "population_size": 10,
+            "generations": 2
+        }
+
+        response = client.post("/api/v1/scenarios/optimize-pareto", json=payload)
+
+        assert response.status_code == 400
+
     def test_optimize_invalid_weights(self, client):
         """Test optimization rejects invalid weight totals"""
         payload = {
@@ -1032,6 +1146,70 @@ class TestEndpointIntegration:
             assert data["base_total_revenue"] == config["revenue"]
 
 
+class TestCompareStrategiesEndpoint:
+    """Tests for /api/v1/waterfall/compare-strategies endpoint"""
+
+    def test_compare_default_strategies(self, client):
+        """Test every default strategy is compared at every revenue level"""
+        payload = {
+            "project_id": "test_proj_cmp",
+            "waterfall_id": "waterfall_cmp",
+            "revenue_levels": ["30000000", "60000000", "90000000"]
+        }
+
+        response = client.post("/api/v1/waterfall/compare-strategies", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["release_strategies"] == ["wide_theatrical", "platform", "streaming_first", "day_and_date"]
+        assert len(data["total_distributed"]) == 4
+        assert all(len(row) == 3 for row in data["total_distributed"])
+        assert "equity_Equity Investors" in data["stakeholder_metrics"]
+
+        irr = data["stakeholder_metrics"]["equity_Equity Investors"]["irr"]
+        assert len(irr) == 4 and all(len(row) == 3 for row in irr)
+
+    def test_compare_more_revenue_pays_more(self, client):
+        """Test senior debt receipts do not fall as revenue rises"""
+        payload = {
+            "project_id": "test_proj_cmp",
+            "waterfall_id": "waterfall_cmp",
+            "revenue_levels": ["10000000", "20000000", "40000000"],
+            "release_strategies": ["streaming_first"]
+        }
+
+        response = client.post("/api/v1/waterfall/compare-strategies", json=payload)
+
+        assert response.status_code == 200
+        receipts = response.json()["stakeholder_metrics"]["senior_debt_Senior Lender"]["total_receipts"][0]
+        assert [Decimal(str(r)) for r in receipts] == sorted(Decimal(str(r)) for r in receipts)
+
+    def test_compare_unknown_strategy(self, client):
+        """Test unknown release strategies are rejected"""
+        payload = {
+            "project_id": "test_proj_cmp",
+            "waterfall_id": "waterfall_cmp",
+            "revenue_levels": ["50000000"],
+            "release_strategies": ["drive_in"]
+        }
+
+        response = client.post("/api/v1/waterfall/compare-strategies", json=payload)
+
+        assert response.status_code == 400
+
+    def test_compare_requires_revenue_levels(self, client):
+        """Test an empty revenue level list fails validation"""
+        payload = {
+            "project_id": "test_proj_cmp",
+            "waterfall_id": "waterfall_cmp",
+            "revenue_levels": []
+        }
+
+        response = client.post("/api/v1/waterfall/compare-strategies", json=payload)
+
+        assert response.status_code == 422
+
+
 # === Fixtures ===
 
 @pytest.fixture
@@ -0,0 +1,192 @@
+"""
+Benchmark Suite Tests
+
+Tests the synthetic fixtures, case timing, JSON baselines and the
+regression comparison of the waterfall benchmark suite.
+"""
+
+import pytest
+from decimal import Decimal
+
+from benchmarks import (
+    NODE_COUNTS,
+    QUARTER_COUNTS,
+    TARGETS,
+    BenchmarkCase,
+    build_suite,
+    compare_reports,
+    format_comparison,
+    load_report,
+    regressions,
+    run_suite,
+    save_report,
+    synthetic_projection,
+    synthetic_waterfall,
+    time_case,
+)
+from benchmarks.__main__ import main
+from engines.waterfall_executor import WaterfallExecutor
+
+
+def _report(**medians):
+    """Minimal report with the given median seconds per case"""
+    return {
+        "version": 1,
+        "results": {
+            name: {"min": value, "median": value, "mean": value}
+            for name, value in medians.items()
+        }
+    }
+
+
+class TestFixtures:
+    """Test the synthetic structures"""
+
+    @pytest.mark.parametrize("num_nodes", NODE_COUNTS)
+    def test_waterfall_size_and_unique_ids(self, num_nodes):
+        """Test every size has the requested nodes with distinct ids"""
+        waterfall = synthetic_waterfall(num_nodes)
+
+        assert len(waterfall.nodes) == num_nodes
+        assert len({node.node_id for node in waterfall.nodes}) == num_nodes
+
+    def test_fixed_recoupment_independent_of_size(self):
+        """Test total fixed recoupment is the same at every size"""
+        totals = {
+            sum(node.fixed_amount for node in synthetic_waterfall(n).nodes if node.fixed_amount)
+            for n in NODE_COUNTS
+        }
+
+        assert max(totals) - min(totals) < Decimal("1")
+
+    @pytest.mark.parametrize("num_quarters", QUARTER_COUNTS)
+    def test_projection_recoups_waterfall(self, num_quarters):
+        """Test the base projection spans the quarters and pays the equity"""
+        projection = synthetic_projection(num_quarters)
+        result = WaterfallExecutor(synthetic_waterfall(5)).execute_over_time(projection)
+
+        assert len(projection.quarterly_revenue) == num_quarters
+        assert sum(projection.quarterly_revenue.values()) == Decimal("60000000")
+        assert result.total_paid_by_payee["Equity Investors"] > 0
+
+
+class TestSuite:
+    """Test case registration"""
+
+    def test_full_matrix(self):
+        """Test every target crossed with every size"""
+        cases = build_suite()
+        names = [case.name for case in cases]
+
+        assert {case.target for case in cases} == set(TARGETS)
+        assert len(names) == len(set(names))
+        assert len(cases) == 4 * len(NODE_COUNTS) * len(QUARTER_COUNTS) + len(QUARTER_COUNTS) + 3
+        assert "execute_over_time[nodes=500,quarters=240]" in names
+        assert "slate_execute[projects=1000]" in names
+
+    def test_quick_and_filter(self):
+        """Test quick drops the largest sizes and filter matches names"""
+        quick = build_suite(quick=True)
+        filtered = build_suite(name_filter="revenue_project")
+
+        assert all(case.params.get("nodes", 0) != 500 for case in quick)
+        assert [case.name for case in filtered] == [
+            "revenue_project[quarters=20]",
+            "revenue_project[quarters=80]",
+            "revenue_project[quarters=240]",
+        ]
+
+    def test_smallest_cases_run(self):
+        """Test each target's smallest case times end to end"""
+        cases = [
+            case for case in build_suite(quick=True)
+            if case.params.get("nodes", 5) == 5
+            and case.params.get("quarters", 20) == 20
+            and case.params.get("projects", 10) == 10
+        ]
+
+        report = run_suite(cases, repeat=1, min_round_time=0)
+
+        assert len(report["results"]) == len(TARGETS)
+        assert all(stats["median"] > 0 for stats in report["results"].values())
+
+
+class TestTiming:
+    """Test time_case()"""
+
+    def test_rounds_sized_by_clock(self):
+        """Test a fast call is batched to fill a round"""
+        ticks = iter(range(1000))
+        case = BenchmarkCase("noop", "noop", setup=lambda: lambda: None)
+
+        stats = time_case(case, repeat=3, min_round_time=4, clock=lambda: next(ticks))
+
+        # Warm-up takes 1 tick, so each round makes 4 calls in 1 tick
+        assert stats.number == 4
+        assert stats.rounds == 3
+        assert stats.median == 0.25
+
+    def test_slow_case_stops_at_budget(self):
+        """Test a warm-up over the budget is the only sample"""
+        ticks = iter(range(0, 1000, 20))
+        case = BenchmarkCase("slow", "slow", setup=lambda: lambda: None)
+
+        stats = time_case(case, repeat=5, max_case_time=10, clock=lambda: next(ticks))
+
+        assert stats.rounds == 1
+        assert stats.median == 20
+
+    def test_invalid_repeat(self):
+        """Test repeat must be positive"""
+        with pytest.raises(ValueError, match="repeat"):
+            time_case(BenchmarkCase("noop", "noop", setup=lambda: lambda: None), repeat=0)
+
+
+class TestCompare:
+    """Test baseline comparison"""
+
+    def test_statuses(self):
+        """Test regressions, improvements, new and missing cases"""
+        baseline = _report(a=1.0, b=1.0, c=1.0, gone=1.0)
+        current = _report(a=1.25, b=0.5, c=1.05, added=1.0)
+
+        statuses = {c.name: c.status for c in compare_reports(baseline, current, threshold=0.10)}
+
+        assert statuses == {
+            "a": "regression", "b": "improvement", "c": "unchanged",
+            "gone": "missing", "added": "new"
+        }
+
+    def test_threshold(self):
+        """Test the threshold decides what counts as a regression"""
+        comparisons = compare_reports(_report(a=1.0), _report(a=1.25), threshold=0.30)
+
+        assert regressions(comparisons) == []
+        assert "1.25x" in format_comparison(comparisons)
+
+    def test_invalid_arguments(self):
+        """Test negative thresholds and unknown metrics are rejected"""
+        with pytest.raises(ValueError, match="threshold"):
+            compare_reports(_report(), _report(), threshold=-0.1)
+        with pytest.raises(ValueError, match="metric"):
+            compare_reports(_report(), _report(), metric="max")
+
+    def test_round_trip_and_cli_exit_status(self, tmp_path, capsys):
+        """Test saved reports reload and compare exits 1 on a regression"""
+        baseline_path = tmp_path / "baseline.json"
+        current_path = tmp_path / "current.json"
+        save_report(_report(a=1.0), baseline_path)
+        save_report(_report(a=2.0), current_path)
+
+        assert load_report(baseline_path)["results"]["a"]["median"] == 1.0
+        assert main(["compare", str(baseline_path), str(baseline_path)]) == 0
+        assert main(["compare", str(baseline_path), str(current_path)]) == 1
+        assert "regression" in capsys.readouterr().out
+
+    def test_load_rejects_other_json(self, tmp_path):
+        """Test files that aren't reports are rejected"""
+        path = tmp_path / "other.json"
+        path.write_text('{"results": {}, "version": 99}')
+
+        with pytest.raises(ValueError, match="version"):
+            load_report(path)
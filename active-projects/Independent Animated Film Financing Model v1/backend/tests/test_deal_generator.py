@@ -0,0 +1,152 @@
+"""
+Deal Generator Tests
+
+Tests the seeded synthetic generator of capital stacks, waterfalls, deal
+blocks, incentive policies and project slates.
+"""
+
+import json
+import pytest
+from decimal import Decimal
+
+from benchmarks import DealGenerator, write_policies, write_slate
+from benchmarks.__main__ import main
+from engines.incentive_calculator.calculator import IncentiveCalculator, JurisdictionSpend
+from engines.incentive_calculator.policy_loader import PolicyLoader
+from engines.incentive_calculator.policy_registry import PolicyRegistry
+from engines.waterfall_executor import WaterfallExecutor
+from engines.waterfall_executor.stakeholder_analyzer import StakeholderAnalyzer
+from models.financial_instruments import Equity
+
+
+@pytest.fixture
+def generator():
+    """Generator with a fixed seed"""
+    return DealGenerator(seed=11)
+
+
+class TestDeterminism:
+    """Test seeding"""
+
+    def test_same_seed_same_project(self, generator):
+        """Test equal seeds generate identical projects"""
+        assert generator.project(3).to_dict() == DealGenerator(seed=11).project(3).to_dict()
+
+    def test_project_independent_of_slate(self, generator):
+        """Test project i is the same alone or inside a slate"""
+        slate = list(generator.slate(3, start=2))
+
+        assert [p.project_id for p in slate] == ["SYN-11-000002", "SYN-11-000003", "SYN-11-000004"]
+        assert slate[1].to_dict() == generator.project(3).to_dict()
+
+    def test_different_seeds_differ(self, generator):
+        """Test seeds select different structures"""
+        assert generator.project(0).budget != DealGenerator(seed=12).project(0).budget
+
+
+class TestCapitalStack:
+    """Test capital_stack()"""
+
+    def test_funds_budget_exactly(self, generator):
+        """Test instrument amounts sum to the budget with equity at 100%"""
+        stack = generator.capital_stack(Decimal("37500000"), 40)
+        equity = [c.instrument for c in stack.components if isinstance(c.instrument, Equity)]
+
+        assert len(stack.components) == 40
+        assert stack.total_capital_raised() == Decimal("37500000")
+        assert sum(e.ownership_percentage for e in equity) == Decimal("100")
+
+    def test_invalid_size(self, generator):
+        """Test a stack needs at least one instrument"""
+        with pytest.raises(ValueError, match="num_instruments"):
+            generator.capital_stack(Decimal("1000000"), 0)
+
+
+class TestWaterfall:
+    """Test waterfall()"""
+
+    def test_node_count_and_unique_ledgers(self, generator):
+        """Test the requested size with one (priority, payee) per node"""
+        project = generator.project(0, num_instruments=30, num_nodes=400)
+        nodes = project.waterfall.nodes
+
+        assert len(nodes) == 400
+        assert len({(node.priority, node.payee_name) for node in nodes}) == 400
+
+    def test_below_min_nodes(self, generator):
+        """Test too few nodes for the stack is rejected"""
+        stack = generator.capital_stack(Decimal("20000000"), 10)
+
+        with pytest.raises(ValueError, match="num_nodes"):
+            generator.waterfall(stack, generator.min_nodes(stack) - 1)
+
+    def test_executes_within_receipts(self, generator):
+        """Test payouts never exceed receipts and every instrument is a stakeholder"""
+        for project in generator.slate(10):
+            result = WaterfallExecutor(project.waterfall).execute_over_time(project.projection())
+            analysis = StakeholderAnalyzer(project.capital_stack).analyze(result)
+
+            paid = sum(result.total_paid_by_payee.values())
+            assert paid <= result.total_receipts - result.total_fees + Decimal("0.01")
+            assert len(analysis.stakeholders) == len(project.capital_stack.components)
+
+
+class TestDealsAndPolicies:
+    """Test deal_blocks() and incentive_policies()"""
+
+    def test_deal_blocks(self, generator):
+        """Test license deals are added with unique ids"""
+        stack = generator.capital_stack(Decimal("20000000"), 8)
+        deals = generator.deal_blocks(stack, num_license_deals=5)
+        ids = [deal.deal_id for deal in deals]
+
+        assert len(ids) == len(set(ids))
+        assert sum(1 for deal in deals if deal.deal_type.value == "streamer_license") == 5
+
+    def test_policies_load_and_calculate(self, generator, tmp_path):
+        """Test written policies load through PolicyLoader and calculate"""
+        policies = generator.incentive_policies(24)
+        write_policies(policies, tmp_path)
+
+        registry = PolicyRegistry(PolicyLoader(tmp_path))
+        calculator = IncentiveCalculator(registry)
+        policy = policies[0]
+        result = calculator.calculate_single_jurisdiction(
+            policy.policy_id,
+            JurisdictionSpend(
+                jurisdiction=policy.jurisdiction,
+                policy_ids=[policy.policy_id],
+                qualified_spend=Decimal("8000000"),
+                total_spend=Decimal("10000000"),
+                labor_spend=Decimal("4000000")
+            ),
+            policy.monetization_methods[0]
+        )
+
+        assert len(registry.get_all()) == 24
+        assert result.gross_credit > 0
+
+
+class TestSlateOutput:
+    """Test JSON lines output"""
+
+    def test_write_slate(self, generator, tmp_path):
+        """Test one JSON project per line"""
+        path = tmp_path / "slate.jsonl"
+
+        assert write_slate(generator.slate(4), path) == 4
+        lines = path.read_text().splitlines()
+        assert json.loads(lines[2])["project_id"] == "SYN-11-000002"
+
+    def test_cli_generate(self, tmp_path):
+        """Test the generate command writes the slate and policies"""
+        path = tmp_path / "slate.jsonl"
+
+        assert main([
+            "generate", "--projects", "3", "--seed", "5", "--output", str(path),
+            "--policies", "4", "--policies-dir", str(tmp_path / "policies")
+        ]) == 0
+        projects = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(projects) == 3
+        assert all(project["policy_ids"] for project in projects)
+        assert len(list((tmp_path / "policies").glob("*.json"))) == 4